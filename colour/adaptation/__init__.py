@@ -8,23 +8,28 @@ from . import dataset
 from .vonkries import (
     chromatic_adaptation_matrix_VonKries,
     chromatic_adaptation_VonKries)
-from .fairchild1990 import chromatic_adaptation_Fairchild1990
+from .fairchild1990 import (
+    chromatic_adaptation_Fairchild1990,
+    Fairchild1990_Adapter)
 from .cmccat2000 import (
     CMCCAT2000_InductionFactors,
     CMCCAT2000_VIEWING_CONDITIONS,
     chromatic_adaptation_forward_CMCCAT2000,
     chromatic_adaptation_reverse_CMCCAT2000,
-    chromatic_adaptation_CMCCAT2000)
-from .cie1994 import chromatic_adaptation_CIE1994
+    chromatic_adaptation_CMCCAT2000,
+    CMCCAT2000_Adapter)
+from .cie1994 import chromatic_adaptation_CIE1994, CIE1994_Adapter
 
 __all__ = []
 __all__ += dataset.__all__
 __all__ += ['chromatic_adaptation_matrix_VonKries',
             'chromatic_adaptation_VonKries']
-__all__ += ['chromatic_adaptation_Fairchild1990']
+__all__ += ['chromatic_adaptation_Fairchild1990',
+            'Fairchild1990_Adapter']
 __all__ += ['CMCCAT2000_InductionFactors',
             'CMCCAT2000_VIEWING_CONDITIONS',
             'chromatic_adaptation_forward_CMCCAT2000',
             'chromatic_adaptation_reverse_CMCCAT2000',
-            'chromatic_adaptation_CMCCAT2000']
-__all__ += ['chromatic_adaptation_CIE1994']
+            'chromatic_adaptation_CMCCAT2000',
+            'CMCCAT2000_Adapter']
+__all__ += ['chromatic_adaptation_CIE1994', 'CIE1994_Adapter']
@@ -8,6 +8,7 @@ CIE 1994 Chromatic Adaptation Model
 Defines CIE 1994 chromatic adaptation model objects:
 
 -   :func:`chromatic_adaptation_CIE1994`
+-   :class:`CIE1994_Adapter`
 
 See Also
 --------
@@ -47,7 +48,8 @@ __all__ = ['CIE1994_XYZ_TO_RGB_MATRIX',
            'beta_2',
            'exponential_factors',
            'K_coefficient',
-           'corresponding_colour']
+           'corresponding_colour',
+           'CIE1994_Adapter']
 
 CIE1994_XYZ_TO_RGB_MATRIX = VON_KRIES_CAT
 """
@@ -486,3 +488,380 @@ def corresponding_colour(RGB_1, xez_1, xez_2, bRGB_o1, bRGB_o2, Y_o, K, n=1):
     RGB_2 = tstack((R_2, G_2, B_2))
 
     return RGB_2
+
+
+def _scaled_power(RGB, n, divisor, exponents, multiplier):
+    """
+    Returns :math:`multiplier((RGB + n) / divisor)^{exponents} - n` evaluated
+    in place as an exponential of a logarithm, which is faster than
+    :func:`numpy.power` definition with an array of exponents.
+    """
+
+    x = np.empty(np.broadcast(RGB, divisor, exponents, multiplier).shape)
+    np.add(RGB, n, out=x)
+    x /= divisor
+    np.log(x, out=x)
+    x *= exponents
+    np.exp(x, out=x)
+    x *= multiplier
+    x -= n
+
+    return x
+
+
+class CIE1994_Adapter(object):
+    """
+    Implements the CIE 1994 chromatic adaptation model for given viewing
+    conditions.
+
+    The viewing conditions dependent terms, i.e. the intermediate values
+    :math:`\\xi`, :math:`\eta`, :math:`\zeta`, the effective adapting
+    responses, the exponential factors and the coefficient :math:`K`, are
+    folded once into per cone response gains, offsets and exponents so that
+    :meth:`CIE1994_Adapter.forward` and :meth:`CIE1994_Adapter.reverse`
+    methods only perform the per stimulus computations.
+
+    Parameters
+    ----------
+    xy_o1 : array_like
+        Chromaticity coordinates :math:`x_{o1}` and :math:`y_{o1}` of test
+        illuminant and background.
+    xy_o2 : array_like
+        Chromaticity coordinates :math:`x_{o2}` and :math:`y_{o2}` of reference
+        illuminant and background.
+    Y_o : numeric or array_like
+        Luminance factor :math:`Y_o` of achromatic background as percentage in
+        domain [18, 100].
+    E_o1 : numeric or array_like
+        Test illuminance :math:`E_{o1}` in :math:`cd/m^2`.
+    E_o2 : numeric or array_like
+        Reference illuminance :math:`E_{o2}` in :math:`cd/m^2`.
+    n : numeric or array_like, optional
+        Noise component in fundamental primary system.
+
+    Attributes
+    ----------
+    xy_o1
+    xy_o2
+    Y_o
+    E_o1
+    E_o2
+    n
+
+    Methods
+    -------
+    forward
+    reverse
+
+    Notes
+    -----
+    -   The viewing conditions dependent terms are recomputed whenever one of
+        the viewing conditions attributes is set.
+    -   :meth:`CIE1994_Adapter.reverse` method inverts the corresponding
+        colour equations, it is not defined by *CIE 109-1994*.
+
+    Examples
+    --------
+    >>> xy_o1 = np.array([0.4476, 0.4074])
+    >>> xy_o2 = np.array([0.3127, 0.3290])
+    >>> adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+    >>> XYZ_1 = np.array([28.00, 21.26, 5.27])
+    >>> adapter.forward(XYZ_1)  # doctest: +ELLIPSIS
+    array([ 24.0337952...,  21.1562121...,  17.6430119...])
+    >>> adapter.reverse(  # doctest: +ELLIPSIS
+    ...     np.array([24.03379521, 21.15621214, 17.64301199]))
+    array([ 28.  ,  21.26,   5.27])
+    """
+
+    def __init__(self, xy_o1, xy_o2, Y_o, E_o1, E_o2, n=1):
+        self._state = None
+        self._xy_o1 = None
+        self.xy_o1 = xy_o1
+        self._xy_o2 = None
+        self.xy_o2 = xy_o2
+        self._Y_o = None
+        self.Y_o = Y_o
+        self._E_o1 = None
+        self.E_o1 = E_o1
+        self._E_o2 = None
+        self.E_o2 = E_o2
+        self._n = None
+        self.n = n
+
+    @property
+    def xy_o1(self):
+        """
+        Property for **self._xy_o1** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._xy_o1.
+        """
+
+        return self._xy_o1
+
+    @xy_o1.setter
+    def xy_o1(self, value):
+        """
+        Setter for **self._xy_o1** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._xy_o1 = np.asarray(value)
+        self._state = None
+
+    @property
+    def xy_o2(self):
+        """
+        Property for **self._xy_o2** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._xy_o2.
+        """
+
+        return self._xy_o2
+
+    @xy_o2.setter
+    def xy_o2(self, value):
+        """
+        Setter for **self._xy_o2** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._xy_o2 = np.asarray(value)
+        self._state = None
+
+    @property
+    def Y_o(self):
+        """
+        Property for **self._Y_o** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._Y_o.
+        """
+
+        return self._Y_o
+
+    @Y_o.setter
+    def Y_o(self, value):
+        """
+        Setter for **self._Y_o** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._Y_o = np.asarray(value)
+        self._state = None
+
+    @property
+    def E_o1(self):
+        """
+        Property for **self._E_o1** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._E_o1.
+        """
+
+        return self._E_o1
+
+    @E_o1.setter
+    def E_o1(self, value):
+        """
+        Setter for **self._E_o1** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._E_o1 = np.asarray(value)
+        self._state = None
+
+    @property
+    def E_o2(self):
+        """
+        Property for **self._E_o2** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._E_o2.
+        """
+
+        return self._E_o2
+
+    @E_o2.setter
+    def E_o2(self, value):
+        """
+        Setter for **self._E_o2** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._E_o2 = np.asarray(value)
+        self._state = None
+
+    @property
+    def n(self):
+        """
+        Property for **self._n** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._n.
+        """
+
+        return self._n
+
+    @n.setter
+    def n(self, value):
+        """
+        Setter for **self._n** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._n = np.asarray(value)
+        self._state = None
+
+    def _viewing_conditions_state(self):
+        """
+        Returns the viewing conditions dependent terms and caches them if not
+        existing.
+
+        Returns
+        -------
+        dict
+            Viewing conditions dependent terms.
+        """
+
+        if self._state is not None:
+            return self._state
+
+        Y_o, n = self._Y_o, self._n
+
+        if np.any(Y_o < 18) or np.any(Y_o > 100):
+            warning(('"Y_o" luminance factor must be in [18, 100] domain, '
+                     'unpredictable results may occur!'))
+
+        xez_1 = intermediate_values(self._xy_o1)
+        xez_2 = intermediate_values(self._xy_o2)
+
+        RGB_o1 = effective_adapting_responses(xez_1, Y_o, self._E_o1)
+        RGB_o2 = effective_adapting_responses(xez_2, Y_o, self._E_o2)
+
+        bRGB_o1 = exponential_factors(RGB_o1)
+        bRGB_o2 = exponential_factors(RGB_o2)
+
+        K = K_coefficient(xez_1, xez_2, bRGB_o1, bRGB_o2, Y_o, n)
+
+        # Folding :func:`corresponding_colour` definition viewing conditions
+        # dependent terms.
+        Y_o = Y_o[..., np.newaxis]
+        n = n[..., np.newaxis]
+        self._state = {
+            'n': n,
+            'offsets': Y_o * xez_1 + n,
+            'gains': ((Y_o * xez_2 + n) *
+                      np.asarray(K)[..., np.newaxis] ** (1 / bRGB_o2)),
+            'exponents': bRGB_o1 / bRGB_o2}
+
+        return self._state
+
+    def forward(self, XYZ_1):
+        """
+        Adapts given stimulus *CIE XYZ_1* tristimulus values from test viewing
+        conditions to reference viewing conditions.
+
+        Parameters
+        ----------
+        XYZ_1 : array_like
+            *CIE XYZ_1* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        ndarray
+            Adapted *CIE XYZ_2* tristimulus values of test stimulus.
+
+        Examples
+        --------
+        >>> xy_o1 = np.array([0.4476, 0.4074])
+        >>> xy_o2 = np.array([0.3127, 0.3290])
+        >>> adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+        >>> XYZ_1 = np.array([28.00, 21.26, 5.27])
+        >>> adapter.forward(XYZ_1)  # doctest: +ELLIPSIS
+        array([ 24.0337952...,  21.1562121...,  17.6430119...])
+        """
+
+        state = self._viewing_conditions_state()
+
+        RGB_2 = _scaled_power(XYZ_to_RGB_CIE1994(XYZ_1),
+                              state['n'],
+                              state['offsets'],
+                              state['exponents'],
+                              state['gains'])
+
+        return RGB_to_XYZ_CIE1994(RGB_2)
+
+    def reverse(self, XYZ_2):
+        """
+        Adapts given stimulus *CIE XYZ_2* tristimulus values from reference
+        viewing conditions to test viewing conditions.
+
+        Parameters
+        ----------
+        XYZ_2 : array_like
+            Adapted *CIE XYZ_2* tristimulus values of test stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ_1* tristimulus values of test sample / stimulus.
+
+        Examples
+        --------
+        >>> xy_o1 = np.array([0.4476, 0.4074])
+        >>> xy_o2 = np.array([0.3127, 0.3290])
+        >>> adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+        >>> XYZ_2 = np.array([24.03379521, 21.15621214, 17.64301199])
+        >>> adapter.reverse(XYZ_2)  # doctest: +ELLIPSIS
+        array([ 28.  ,  21.26,   5.27])
+        """
+
+        state = self._viewing_conditions_state()
+
+        RGB_1 = _scaled_power(XYZ_to_RGB_CIE1994(XYZ_2),
+                              state['n'],
+                              state['gains'],
+                              1 / state['exponents'],
+                              state['offsets'])
+
+        return RGB_to_XYZ_CIE1994(RGB_1)
@@ -12,6 +12,7 @@ Defines CMCCAT2000 chromatic adaptation model objects:
 -   :func:`chromatic_adaptation_forward_CMCCAT2000`
 -   :func:`chromatic_adaptation_reverse_CMCCAT2000`
 -   :func:`chromatic_adaptation_CMCCAT2000`
+-   :class:`CMCCAT2000_Adapter`
 
 See Also
 --------
@@ -49,7 +50,8 @@ __all__ = ['CMCCAT2000_INVERSE_CAT',
            'CMCCAT2000_VIEWING_CONDITIONS',
            'chromatic_adaptation_forward_CMCCAT2000',
            'chromatic_adaptation_reverse_CMCCAT2000',
-           'chromatic_adaptation_CMCCAT2000']
+           'chromatic_adaptation_CMCCAT2000',
+           'CMCCAT2000_Adapter']
 
 CMCCAT2000_INVERSE_CAT = np.linalg.inv(CMCCAT2000_CAT)
 """
@@ -322,3 +324,310 @@ def chromatic_adaptation_CMCCAT2000(
     else:
         return chromatic_adaptation_reverse_CMCCAT2000(
             XYZ, XYZ_w, XYZ_wr, L_A1, L_A2, surround)
+
+
+class CMCCAT2000_Adapter(object):
+    """
+    Implements the CMCCAT2000 chromatic adaptation model for given viewing
+    conditions.
+
+    The viewing conditions dependent terms, i.e. the degree of adaptation
+    :math:`D` and the whitepoints cone responses, are folded once into the
+    forward and reverse chromatic adaptation matrices so that
+    :meth:`CMCCAT2000_Adapter.forward` and :meth:`CMCCAT2000_Adapter.reverse`
+    methods only perform a matrix product per stimulus.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        Test viewing condition *CIE XYZ* tristimulus values of the whitepoint.
+    XYZ_wr : array_like
+        Reference viewing condition *CIE XYZ* tristimulus values of the
+        whitepoint.
+    L_A1 : numeric or array_like
+        Luminance of test adapting field :math:`L_{A1}` in :math:`cd/m^2`.
+    L_A2 : numeric or array_like
+        Luminance of reference adapting field :math:`L_{A2}` in :math:`cd/m^2`.
+    surround : CMCCAT2000_InductionFactors, optional
+        Surround viewing conditions induction factors.
+
+    Attributes
+    ----------
+    XYZ_w
+    XYZ_wr
+    L_A1
+    L_A2
+    surround
+
+    Methods
+    -------
+    forward
+    reverse
+
+    Notes
+    -----
+    -   The chromatic adaptation matrices are recomputed whenever one of the
+        viewing conditions attributes is set.
+    -   Viewing conditions given as arrays yield arrays of matrices broadcast
+        against the stimuli leading dimensions.
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([111.15, 100.00, 35.20])
+    >>> XYZ_wr = np.array([94.81, 100.00, 107.30])
+    >>> adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+    >>> XYZ = np.array([22.48, 22.74, 8.54])
+    >>> adapter.forward(XYZ)  # doctest: +ELLIPSIS
+    array([ 19.5269832...,  23.0683396...,  24.9717522...])
+    >>> adapter.reverse(  # doctest: +ELLIPSIS
+    ...     np.array([19.52698326, 23.06833960, 24.97175229]))
+    array([ 22.48,  22.74,   8.54])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 XYZ_wr,
+                 L_A1,
+                 L_A2,
+                 surround=CMCCAT2000_VIEWING_CONDITIONS.get('Average')):
+        self._state = None
+        self._XYZ_w = None
+        self.XYZ_w = XYZ_w
+        self._XYZ_wr = None
+        self.XYZ_wr = XYZ_wr
+        self._L_A1 = None
+        self.L_A1 = L_A1
+        self._L_A2 = None
+        self.L_A2 = L_A2
+        self._surround = None
+        self.surround = surround
+
+    @property
+    def XYZ_w(self):
+        """
+        Property for **self._XYZ_w** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._XYZ_w.
+        """
+
+        return self._XYZ_w
+
+    @XYZ_w.setter
+    def XYZ_w(self, value):
+        """
+        Setter for **self._XYZ_w** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._XYZ_w = np.asarray(value)
+        self._state = None
+
+    @property
+    def XYZ_wr(self):
+        """
+        Property for **self._XYZ_wr** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._XYZ_wr.
+        """
+
+        return self._XYZ_wr
+
+    @XYZ_wr.setter
+    def XYZ_wr(self, value):
+        """
+        Setter for **self._XYZ_wr** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._XYZ_wr = np.asarray(value)
+        self._state = None
+
+    @property
+    def L_A1(self):
+        """
+        Property for **self._L_A1** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._L_A1.
+        """
+
+        return self._L_A1
+
+    @L_A1.setter
+    def L_A1(self, value):
+        """
+        Setter for **self._L_A1** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._L_A1 = np.asarray(value)
+        self._state = None
+
+    @property
+    def L_A2(self):
+        """
+        Property for **self._L_A2** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._L_A2.
+        """
+
+        return self._L_A2
+
+    @L_A2.setter
+    def L_A2(self, value):
+        """
+        Setter for **self._L_A2** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._L_A2 = np.asarray(value)
+        self._state = None
+
+    @property
+    def surround(self):
+        """
+        Property for **self._surround** private attribute.
+
+        Returns
+        -------
+        CMCCAT2000_InductionFactors
+            self._surround.
+        """
+
+        return self._surround
+
+    @surround.setter
+    def surround(self, value):
+        """
+        Setter for **self._surround** private attribute.
+
+        Parameters
+        ----------
+        value : CMCCAT2000_InductionFactors
+            Attribute value.
+        """
+
+        self._surround = value
+        self._state = None
+
+    def _viewing_conditions_state(self):
+        """
+        Returns the viewing conditions dependent chromatic adaptation matrices
+        and caches them if not existing.
+
+        Returns
+        -------
+        dict
+            Viewing conditions dependent chromatic adaptation matrices.
+        """
+
+        if self._state is not None:
+            return self._state
+
+        RGB_w = dot_vector(CMCCAT2000_CAT, self._XYZ_w)
+        RGB_wr = dot_vector(CMCCAT2000_CAT, self._XYZ_wr)
+
+        L_A1, L_A2 = self._L_A1, self._L_A2
+        D = (self._surround.F *
+             (0.08 * np.log10(0.5 * (L_A1 + L_A2)) +
+              0.76 - 0.45 * (L_A1 - L_A2) / (L_A1 + L_A2)))
+
+        D = np.clip(D, 0, 1)
+        a = D * self._XYZ_w[..., 1] / self._XYZ_wr[..., 1]
+
+        gains = (a[..., np.newaxis] * (RGB_wr / RGB_w) +
+                 1 - D[..., np.newaxis])
+
+        self._state = {
+            'forward': np.einsum('ij,...j,jk->...ik',
+                                 CMCCAT2000_INVERSE_CAT,
+                                 gains,
+                                 CMCCAT2000_CAT),
+            'reverse': np.einsum('ij,...j,jk->...ik',
+                                 CMCCAT2000_INVERSE_CAT,
+                                 1 / gains,
+                                 CMCCAT2000_CAT)}
+
+        return self._state
+
+    def forward(self, XYZ):
+        """
+        Adapts given stimulus *CIE XYZ* tristimulus values from test viewing
+        conditions to reference viewing conditions.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of the stimulus to adapt.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ_c* tristimulus values of the stimulus corresponding
+            colour.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([111.15, 100.00, 35.20])
+        >>> XYZ_wr = np.array([94.81, 100.00, 107.30])
+        >>> adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+        >>> XYZ = np.array([22.48, 22.74, 8.54])
+        >>> adapter.forward(XYZ)  # doctest: +ELLIPSIS
+        array([ 19.5269832...,  23.0683396...,  24.9717522...])
+        """
+
+        return dot_vector(self._viewing_conditions_state()['forward'], XYZ)
+
+    def reverse(self, XYZ_c):
+        """
+        Adapts given stimulus corresponding colour *CIE XYZ* tristimulus
+        values from reference viewing conditions to test viewing conditions.
+
+        Parameters
+        ----------
+        XYZ_c : array_like
+            *CIE XYZ* tristimulus values of the stimulus to adapt.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ_c* tristimulus values of the adapted stimulus.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([111.15, 100.00, 35.20])
+        >>> XYZ_wr = np.array([94.81, 100.00, 107.30])
+        >>> adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+        >>> XYZ_c = np.array([19.53, 23.07, 24.97])
+        >>> adapter.reverse(XYZ_c)  # doctest: +ELLIPSIS
+        array([ 22.4839876...,  22.7419485...,   8.5393392...])
+        """
+
+        return dot_vector(self._viewing_conditions_state()['reverse'], XYZ_c)
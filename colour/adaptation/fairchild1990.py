@@ -8,6 +8,7 @@ Fairchild (1990) Chromatic Adaptation Model
 Defines Fairchild (1990) chromatic adaptation model objects:
 
 -   :func:`chromatic_adaptation_Fairchild1990`
+-   :class:`Fairchild1990_Adapter`
 
 See Also
 --------
@@ -43,7 +44,8 @@ __all__ = ['FAIRCHILD1990_XYZ_TO_RGB_MATRIX',
            'chromatic_adaptation_Fairchild1990',
            'XYZ_to_RGB_Fairchild1990',
            'RGB_to_XYZ_Fairchild1990',
-           'degrees_of_adaptation']
+           'degrees_of_adaptation',
+           'Fairchild1990_Adapter']
 
 FAIRCHILD1990_XYZ_TO_RGB_MATRIX = VON_KRIES_CAT
 """
@@ -260,3 +262,271 @@ def degrees_of_adaptation(LMS, Y_n, v=1 / 3, discount_illuminant=False):
     p_LMS = tstack((p_L, p_M, p_S))
 
     return p_LMS
+
+
+class Fairchild1990_Adapter(object):
+    """
+    Implements the Fairchild (1990) chromatic adaptation model for given
+    viewing conditions.
+
+    The viewing conditions dependent terms, i.e. the whitepoints cone
+    responses, are folded once into the forward and reverse chromatic
+    adaptation matrices so that :meth:`Fairchild1990_Adapter.forward` and
+    :meth:`Fairchild1990_Adapter.reverse` methods only perform a matrix
+    product per stimulus.
+
+    Parameters
+    ----------
+    XYZ_n : array_like
+        Test viewing condition *CIE XYZ_n* tristimulus values of whitepoint.
+    XYZ_r : array_like
+        Reference viewing condition *CIE XYZ_r* tristimulus values of
+        whitepoint.
+    Y_n : numeric or array_like
+        Luminance :math:`Y_n` of test adapting stimulus in :math:`cd/m^2`.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_n
+    XYZ_r
+    Y_n
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    reverse
+
+    Notes
+    -----
+    -   The chromatic adaptation matrices are recomputed whenever one of the
+        viewing conditions attributes is set.
+    -   In :func:`chromatic_adaptation_Fairchild1990` definition, the same
+        degrees of adaptation :math:`p_L`, :math:`p_M` and :math:`p_S` scale
+        the test and reference cone responses and the :math:`C` matrix is
+        applied along with its inverse: both cancel out, the adaptation thus
+        reduces to the von Kries scaling of the cone responses by the
+        reference and test whitepoints cone responses ratio. :math:`Y_n` and
+        *discount_illuminant* attributes are kept for parity with that
+        definition but do not affect the adaptation.
+    -   Viewing conditions given as arrays yield arrays of matrices broadcast
+        against the stimuli leading dimensions.
+
+    Examples
+    --------
+    >>> XYZ_n = np.array([111.15, 100.00, 35.20])
+    >>> XYZ_r = np.array([94.81, 100.00, 107.30])
+    >>> adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+    >>> XYZ_1 = np.array([19.53, 23.07, 24.97])
+    >>> adapter.forward(XYZ_1)  # doctest: +ELLIPSIS
+    array([ 23.3252634...,  23.3245581...,  76.1159375...])
+    >>> adapter.reverse(  # doctest: +ELLIPSIS
+    ...     np.array([23.32526349, 23.32455819, 76.11593750]))
+    array([ 19.53,  23.07,  24.97])
+    """
+
+    def __init__(self, XYZ_n, XYZ_r, Y_n, discount_illuminant=False):
+        self._state = None
+        self._XYZ_n = None
+        self.XYZ_n = XYZ_n
+        self._XYZ_r = None
+        self.XYZ_r = XYZ_r
+        self._Y_n = None
+        self.Y_n = Y_n
+        self._discount_illuminant = None
+        self.discount_illuminant = discount_illuminant
+
+    @property
+    def XYZ_n(self):
+        """
+        Property for **self._XYZ_n** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._XYZ_n.
+        """
+
+        return self._XYZ_n
+
+    @XYZ_n.setter
+    def XYZ_n(self, value):
+        """
+        Setter for **self._XYZ_n** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._XYZ_n = np.asarray(value)
+        self._state = None
+
+    @property
+    def XYZ_r(self):
+        """
+        Property for **self._XYZ_r** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._XYZ_r.
+        """
+
+        return self._XYZ_r
+
+    @XYZ_r.setter
+    def XYZ_r(self, value):
+        """
+        Setter for **self._XYZ_r** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._XYZ_r = np.asarray(value)
+        self._state = None
+
+    @property
+    def Y_n(self):
+        """
+        Property for **self._Y_n** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._Y_n.
+        """
+
+        return self._Y_n
+
+    @Y_n.setter
+    def Y_n(self, value):
+        """
+        Setter for **self._Y_n** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._Y_n = np.asarray(value)
+        self._state = None
+
+    @property
+    def discount_illuminant(self):
+        """
+        Property for **self._discount_illuminant** private attribute.
+
+        Returns
+        -------
+        bool
+            self._discount_illuminant.
+        """
+
+        return self._discount_illuminant
+
+    @discount_illuminant.setter
+    def discount_illuminant(self, value):
+        """
+        Setter for **self._discount_illuminant** private attribute.
+
+        Parameters
+        ----------
+        value : bool
+            Attribute value.
+        """
+
+        self._discount_illuminant = value
+        self._state = None
+
+    def _viewing_conditions_state(self):
+        """
+        Returns the viewing conditions dependent chromatic adaptation matrices
+        and caches them if not existing.
+
+        Returns
+        -------
+        dict
+            Viewing conditions dependent chromatic adaptation matrices.
+        """
+
+        if self._state is not None:
+            return self._state
+
+        LMS_n = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, self._XYZ_n)
+        LMS_r = dot_vector(FAIRCHILD1990_XYZ_TO_RGB_MATRIX, self._XYZ_r)
+
+        self._state = {
+            'forward': np.einsum('ij,...j,jk->...ik',
+                                 FAIRCHILD1990_RGB_TO_XYZ_MATRIX,
+                                 LMS_r / LMS_n,
+                                 FAIRCHILD1990_XYZ_TO_RGB_MATRIX),
+            'reverse': np.einsum('ij,...j,jk->...ik',
+                                 FAIRCHILD1990_RGB_TO_XYZ_MATRIX,
+                                 LMS_n / LMS_r,
+                                 FAIRCHILD1990_XYZ_TO_RGB_MATRIX)}
+
+        return self._state
+
+    def forward(self, XYZ_1):
+        """
+        Adapts given stimulus *CIE XYZ_1* tristimulus values from test viewing
+        conditions to reference viewing conditions.
+
+        Parameters
+        ----------
+        XYZ_1 : array_like
+            *CIE XYZ_1* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        ndarray
+            Adapted *CIE XYZ_2* tristimulus values of stimulus.
+
+        Examples
+        --------
+        >>> XYZ_n = np.array([111.15, 100.00, 35.20])
+        >>> XYZ_r = np.array([94.81, 100.00, 107.30])
+        >>> adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+        >>> XYZ_1 = np.array([19.53, 23.07, 24.97])
+        >>> adapter.forward(XYZ_1)  # doctest: +ELLIPSIS
+        array([ 23.3252634...,  23.3245581...,  76.1159375...])
+        """
+
+        return dot_vector(self._viewing_conditions_state()['forward'], XYZ_1)
+
+    def reverse(self, XYZ_2):
+        """
+        Adapts given stimulus *CIE XYZ_2* tristimulus values from reference
+        viewing conditions to test viewing conditions.
+
+        Parameters
+        ----------
+        XYZ_2 : array_like
+            *CIE XYZ_2* tristimulus values of the adapted stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ_1* tristimulus values of test sample / stimulus.
+
+        Examples
+        --------
+        >>> XYZ_n = np.array([111.15, 100.00, 35.20])
+        >>> XYZ_r = np.array([94.81, 100.00, 107.30])
+        >>> adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+        >>> XYZ_2 = np.array([23.32526349, 23.32455819, 76.11593750])
+        >>> adapter.reverse(XYZ_2)  # doctest: +ELLIPSIS
+        array([ 19.53,  23.07,  24.97])
+        """
+
+        return dot_vector(self._viewing_conditions_state()['reverse'], XYZ_2)
@@ -11,7 +11,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.adaptation import chromatic_adaptation_CIE1994
+from colour.adaptation import (
+    chromatic_adaptation_CIE1994,
+    CIE1994_Adapter)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -21,7 +23,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestChromaticAdaptationCIE1994']
+__all__ = ['TestChromaticAdaptationCIE1994',
+           'TestCIE1994_Adapter']
 
 
 class TestChromaticAdaptationCIE1994(unittest.TestCase):
@@ -135,5 +138,87 @@ class TestChromaticAdaptationCIE1994(unittest.TestCase):
             chromatic_adaptation_CIE1994(XYZ_1, xy_o1, xy_o2, Y_o, E_o1, E_o2)
 
 
+class TestCIE1994_Adapter(unittest.TestCase):
+    """
+    Defines :class:`colour.adaptation.cie1994.CIE1994_Adapter` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('xy_o1', 'xy_o2', 'Y_o', 'E_o1', 'E_o2', 'n')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CIE1994_Adapter))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CIE1994_Adapter))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.adaptation.cie1994.CIE1994_Adapter.forward`
+        method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((2, 3, 3)) * 100
+        xy_o1 = np.array([0.4476, 0.4074])
+        xy_o2 = np.array([0.3127, 0.3290])
+        adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_CIE1994(XYZ, xy_o1, xy_o2, 20, 1000, 1000),
+            decimal=10)
+
+        E_o1 = np.array([[100, 200, 300], [400, 500, 600]])
+        np.testing.assert_almost_equal(
+            CIE1994_Adapter(xy_o1, xy_o2, 20, E_o1, 1000).forward(XYZ),
+            chromatic_adaptation_CIE1994(XYZ, xy_o1, xy_o2, 20, E_o1, 1000),
+            decimal=10)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.adaptation.cie1994.CIE1994_Adapter.reverse`
+        method.
+        """
+
+        XYZ = np.reshape(np.tile(np.array([[28.00, 21.26, 5.27],
+                                          [19.53, 23.07, 24.97]]), (3, 1)),
+                         (2, 3, 3))
+        xy_o1 = np.array([0.4476, 0.4074])
+        xy_o2 = np.array([0.3127, 0.3290])
+        adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+        np.testing.assert_almost_equal(
+            adapter.reverse(adapter.forward(XYZ)),
+            XYZ,
+            decimal=10)
+
+    def test_viewing_conditions_state(self):
+        """
+        Tests :class:`colour.adaptation.cie1994.CIE1994_Adapter` class
+        viewing conditions dependent terms invalidation.
+        """
+
+        XYZ = np.array([19.53, 23.07, 24.97])
+        xy_o1 = np.array([0.4476, 0.4074])
+        xy_o2 = np.array([0.3127, 0.3290])
+        adapter = CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+        adapter.forward(XYZ)
+        adapter.Y_o = 40
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_CIE1994(XYZ, xy_o1, xy_o2, 40, 1000, 1000),
+            decimal=10)
+
+
 if __name__ == '__main__':
     unittest.main()
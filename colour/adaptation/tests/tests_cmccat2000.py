@@ -13,7 +13,8 @@ from itertools import permutations
 
 from colour.adaptation.cmccat2000 import (
     chromatic_adaptation_forward_CMCCAT2000,
-    chromatic_adaptation_reverse_CMCCAT2000)
+    chromatic_adaptation_reverse_CMCCAT2000,
+    CMCCAT2000_Adapter)
 
 from colour.utilities import ignore_numpy_errors
 
@@ -25,7 +26,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['TestChromaticAdaptationForwardCMCCAT2000',
-           'TestChromaticAdaptationReverseCMCCAT2000']
+           'TestChromaticAdaptationReverseCMCCAT2000',
+           'TestCMCCAT2000_Adapter']
 
 
 class TestChromaticAdaptationForwardCMCCAT2000(unittest.TestCase):
@@ -248,5 +250,88 @@ chromatic_adaptation_reverse_CMCCAT2000` definition nan support.
                 XYZ_c, XYZ_w, XYZ_wr, L_A1, L_A2)
 
 
+class TestCMCCAT2000_Adapter(unittest.TestCase):
+    """
+    Defines :class:`colour.adaptation.cmccat2000.CMCCAT2000_Adapter` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'XYZ_wr', 'L_A1', 'L_A2', 'surround')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CMCCAT2000_Adapter))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CMCCAT2000_Adapter))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.adaptation.cmccat2000.CMCCAT2000_Adapter.forward`
+        method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((2, 3, 3)) * 100
+        XYZ_w = np.array([111.15, 100.00, 35.20])
+        XYZ_wr = np.array([94.81, 100.00, 107.30])
+        adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_forward_CMCCAT2000(
+                XYZ, XYZ_w, XYZ_wr, 200, 200),
+            decimal=10)
+
+        L_A1 = np.array([[100, 200, 300], [400, 500, 600]])
+        np.testing.assert_almost_equal(
+            CMCCAT2000_Adapter(XYZ_w, XYZ_wr, L_A1, 200).forward(XYZ),
+            chromatic_adaptation_forward_CMCCAT2000(
+                XYZ, XYZ_w, XYZ_wr, L_A1, 200),
+            decimal=10)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.adaptation.cmccat2000.CMCCAT2000_Adapter.reverse`
+        method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((2, 3, 3)) * 100
+        XYZ_w = np.array([111.15, 100.00, 35.20])
+        XYZ_wr = np.array([94.81, 100.00, 107.30])
+        adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+        np.testing.assert_almost_equal(
+            adapter.reverse(adapter.forward(XYZ)),
+            XYZ,
+            decimal=10)
+
+    def test_viewing_conditions_state(self):
+        """
+        Tests :class:`colour.adaptation.cmccat2000.CMCCAT2000_Adapter` class
+        viewing conditions dependent terms invalidation.
+        """
+
+        XYZ = np.array([19.53, 23.07, 24.97])
+        XYZ_w = np.array([111.15, 100.00, 35.20])
+        XYZ_wr = np.array([94.81, 100.00, 107.30])
+        adapter = CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+        adapter.forward(XYZ)
+        adapter.L_A1 = 100
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_forward_CMCCAT2000(
+                XYZ, XYZ_w, XYZ_wr, 100, 200),
+            decimal=10)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -11,7 +11,9 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.adaptation import chromatic_adaptation_Fairchild1990
+from colour.adaptation import (
+    chromatic_adaptation_Fairchild1990,
+    Fairchild1990_Adapter)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -21,7 +23,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestChromaticAdaptationFairchild1990']
+__all__ = ['TestChromaticAdaptationFairchild1990',
+           'TestFairchild1990_Adapter']
 
 
 class TestChromaticAdaptationFairchild1990(unittest.TestCase):
@@ -127,5 +130,86 @@ chromatic_adaptation_Fairchild1990` definition nan support.
                 warning(traceback.format_exc())
 
 
+class TestFairchild1990_Adapter(unittest.TestCase):
+    """
+    Defines :class:`colour.adaptation.fairchild1990.Fairchild1990_Adapter`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_n', 'XYZ_r', 'Y_n', 'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Fairchild1990_Adapter))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(Fairchild1990_Adapter))
+
+    def test_forward(self):
+        """
+        Tests :meth:`colour.adaptation.fairchild1990.\
+Fairchild1990_Adapter.forward` method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((2, 3, 3)) * 100
+        XYZ_n = np.array([111.15, 100.00, 35.20])
+        XYZ_r = np.array([94.81, 100.00, 107.30])
+        adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_Fairchild1990(XYZ, XYZ_n, XYZ_r, 200),
+            decimal=10)
+
+        XYZ_n = XYZ_n * np.array([[[1.0]], [[0.5]]])
+        np.testing.assert_almost_equal(
+            Fairchild1990_Adapter(XYZ_n, XYZ_r, 200).forward(XYZ),
+            chromatic_adaptation_Fairchild1990(XYZ, XYZ_n, XYZ_r, 200),
+            decimal=10)
+
+    def test_reverse(self):
+        """
+        Tests :meth:`colour.adaptation.fairchild1990.\
+Fairchild1990_Adapter.reverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).random_sample((2, 3, 3)) * 100
+        XYZ_n = np.array([111.15, 100.00, 35.20])
+        XYZ_r = np.array([94.81, 100.00, 107.30])
+        adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+        np.testing.assert_almost_equal(
+            adapter.reverse(adapter.forward(XYZ)),
+            XYZ,
+            decimal=10)
+
+    def test_viewing_conditions_state(self):
+        """
+        Tests :class:`colour.adaptation.fairchild1990.Fairchild1990_Adapter`
+        class viewing conditions dependent terms invalidation.
+        """
+
+        XYZ = np.array([19.53, 23.07, 24.97])
+        XYZ_n = np.array([111.15, 100.00, 35.20])
+        XYZ_r = np.array([94.81, 100.00, 107.30])
+        adapter = Fairchild1990_Adapter(XYZ_n, XYZ_r, 200)
+        adapter.forward(XYZ)
+        adapter.XYZ_r = np.array([95.05, 100.00, 108.88])
+        np.testing.assert_almost_equal(
+            adapter.forward(XYZ),
+            chromatic_adaptation_Fairchild1990(
+                XYZ, XYZ_n, np.array([95.05, 100.00, 108.88]), 200),
+            decimal=10)
+
+
 if __name__ == '__main__':
     unittest.main()
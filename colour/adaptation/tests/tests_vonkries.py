@@ -12,6 +12,7 @@ import unittest
 from itertools import permutations
 
 from colour.adaptation import (
+    CHROMATIC_ADAPTATION_TRANSFORMS,
     chromatic_adaptation_matrix_VonKries,
     chromatic_adaptation_VonKries)
 from colour.utilities import ignore_numpy_errors
@@ -127,6 +128,55 @@ chromatic_adaptation_matrix_VonKries` definition n-dimensional arrays support.
             M,
             decimal=7)
 
+    def test_batched_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition with distinct whitepoints
+        pairs.
+        """
+
+        XYZ_w = np.random.RandomState(4).random_sample((5, 3)) + 0.1
+        XYZ_wr = np.random.RandomState(8).random_sample((5, 3)) + 0.1
+        for transform in ('CAT02', 'Bradford', 'Von Kries'):
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w,
+                                                     XYZ_wr,
+                                                     transform),
+                np.array([chromatic_adaptation_matrix_VonKries(
+                    XYZ_w[i], XYZ_wr[i], transform) for i in range(5)]),
+                decimal=7)
+
+    def test_cached_chromatic_adaptation_matrix_VonKries(self):
+        """
+        Tests :func:`colour.adaptation.vonkries.\
+chromatic_adaptation_matrix_VonKries` definition cached matrices.
+        """
+
+        XYZ_w = np.array([1.09846607, 1.00000000, 0.35582280])
+        XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+        M = chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr)
+        M_c = np.copy(M)
+        M *= 0
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr),
+            M_c,
+            decimal=7)
+
+        CAT = CHROMATIC_ADAPTATION_TRANSFORMS['CAT02']
+        try:
+            CHROMATIC_ADAPTATION_TRANSFORMS['CAT02'] = np.identity(3)
+            np.testing.assert_almost_equal(
+                chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr),
+                np.diagflat(XYZ_wr / XYZ_w),
+                decimal=7)
+        finally:
+            CHROMATIC_ADAPTATION_TRANSFORMS['CAT02'] = CAT
+
+        np.testing.assert_almost_equal(
+            chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr),
+            M_c,
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_chromatic_adaptation_matrix_VonKries(self):
         """
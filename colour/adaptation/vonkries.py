@@ -27,7 +27,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
-from colour.utilities import dot_matrix, dot_vector, row_as_diagonal
+from colour.utilities import dot_matrix, dot_vector
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -39,6 +39,52 @@ __status__ = 'Production'
 __all__ = ['chromatic_adaptation_matrix_VonKries',
            'chromatic_adaptation_VonKries']
 
+_CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES_CACHE = {}
+
+_CHROMATIC_ADAPTATION_MATRICES_CACHE = {}
+
+_CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE = 256
+
+
+def _chromatic_adaptation_transform_matrices(transform):
+    """
+    Returns given *chromatic adaptation* transform matrix and its inverse and
+    caches the latter if not existing.
+
+    Parameters
+    ----------
+    transform : unicode
+        Chromatic adaptation transform.
+
+    Returns
+    -------
+    tuple
+        *Chromatic adaptation* transform matrix and its inverse.
+
+    Raises
+    ------
+    KeyError
+        If chromatic adaptation method is not defined.
+    """
+
+    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+
+    if M is None:
+        raise KeyError(
+            '"{0}" chromatic adaptation transform is not defined! Supported '
+            'methods: "{1}".'.format(transform,
+                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+
+    # The cached inverse is discarded if the transform matrix has been
+    # replaced in :attr:`colour.CHROMATIC_ADAPTATION_TRANSFORMS` attribute.
+    key = transform.lower()
+    cached = _CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES_CACHE.get(key)
+    if cached is None or cached[0] is not M:
+        cached = (M, np.linalg.inv(M))
+        _CHROMATIC_ADAPTATION_TRANSFORMS_INVERSES_CACHE[key] = cached
+
+    return cached
+
 
 def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     """
@@ -67,6 +113,15 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     KeyError
         If chromatic adaptation method is not defined.
 
+    Notes
+    -----
+    -   The matrices computed for single whitepoints pairs are cached, thus
+        repeated calls with the same whitepoints and transform only cost a
+        lookup.
+    -   Given arrays of whitepoints of shape (N, 3), the (N, 3, 3)
+        *chromatic adaptation* matrices are computed in a single vectorised
+        call.
+
     Examples
     --------
     >>> XYZ_w = np.array([1.09846607, 1.00000000, 0.35582280])
@@ -87,25 +142,51 @@ def chromatic_adaptation_matrix_VonKries(XYZ_w, XYZ_wr, transform='CAT02'):
     array([[ 0.8446794..., -0.1179355...,  0.3948940...],
            [-0.1366408...,  1.1041236...,  0.1291981...],
            [ 0.0798671..., -0.1349315...,  3.1928829...]])
+
+    Computing multiple matrices at once:
+
+    >>> XYZ_w = np.array([[1.09846607, 1.00000000, 0.35582280],
+    ...                   [0.96421199, 1.00000000, 0.82518828]])
+    >>> XYZ_wr = np.array([0.95042855, 1.00000000, 1.08890037])
+    >>> chromatic_adaptation_matrix_VonKries(  # doctest: +ELLIPSIS
+    ...     XYZ_w, XYZ_wr)
+    array([[[  8.6876536...e-01,  -1.4165393...e-01,   3.8719610...e-01],
+            [ -1.0300724...e-01,   1.0584014...e+00,   1.5386461...e-01],
+            [  7.8167406...e-03,   2.6787499...e-02,   2.9608177...e+00]],
+    <BLANKLINE>
+           [[  9.5991641...e-01,  -2.9317408...e-02,   6.5661427...e-02],
+            [ -2.1195420...e-02,   9.9887267...e-01,   2.6132466...e-02],
+            [  1.3707502...e-03,   4.4359296...e-03,   1.3126007...e+00]]])
     """
 
-    M = CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+    M, M_i = _chromatic_adaptation_transform_matrices(transform)
 
-    if M is None:
-        raise KeyError(
-            '"{0}" chromatic adaptation transform is not defined! Supported '
-            'methods: "{1}".'.format(transform,
-                                     CHROMATIC_ADAPTATION_TRANSFORMS.keys()))
+    XYZ_w = np.asarray(XYZ_w)
+    XYZ_wr = np.asarray(XYZ_wr)
+
+    is_cacheable = XYZ_w.shape == (3,) and XYZ_wr.shape == (3,)
+    if is_cacheable:
+        key = (transform.lower(),
+               tuple(XYZ_w.tolist()),
+               tuple(XYZ_wr.tolist()))
+        cached = _CHROMATIC_ADAPTATION_MATRICES_CACHE.get(key)
+        if cached is not None and cached[0] is M:
+            return np.copy(cached[1])
 
     rgb_w = np.einsum('...i,...ij->...j', XYZ_w, np.transpose(M))
     rgb_wr = np.einsum('...i,...ij->...j', XYZ_wr, np.transpose(M))
 
     D = rgb_wr / rgb_w
 
-    D = row_as_diagonal(D)
+    # Scaling the rows of the transform matrix is equivalent to multiplying
+    # it by the diagonal matrix of the cone responses ratios.
+    cat = dot_matrix(M_i, D[..., np.newaxis] * M)
 
-    cat = dot_matrix(np.linalg.inv(M), D)
-    cat = dot_matrix(cat, M)
+    if is_cacheable:
+        if (len(_CHROMATIC_ADAPTATION_MATRICES_CACHE) >=
+                _CHROMATIC_ADAPTATION_MATRICES_CACHE_SIZE):
+            _CHROMATIC_ADAPTATION_MATRICES_CACHE.clear()
+        _CHROMATIC_ADAPTATION_MATRICES_CACHE[key] = (M, np.copy(cat))
 
     return cat
 
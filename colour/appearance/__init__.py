@@ -13,6 +13,7 @@ from .ciecam02 import (
     CIECAM02_InductionFactors,
     CIECAM02_VIEWING_CONDITIONS,
     CIECAM02_Specification,
+    CIECAM02_Model,
     XYZ_to_CIECAM02,
     CIECAM02_to_XYZ)
 from .llab import (  # noqa
@@ -35,6 +36,7 @@ __all__ += ['ATD95_Specification', 'XYZ_to_ATD95']
 __all__ += ['CIECAM02_InductionFactors',
             'CIECAM02_VIEWING_CONDITIONS',
             'CIECAM02_Specification',
+            'CIECAM02_Model',
             'XYZ_to_CIECAM02',
             'CIECAM02_to_XYZ']
 __all__ += ['LLAB_VIEWING_CONDITIONS', 'LLAB_Specification', 'XYZ_to_LLAB']
@@ -8,6 +8,7 @@ ATD (1995) Colour Vision Model
 Defines ATD (1995) colour vision model objects:
 
 -   :class:`ATD95_Specification`
+-   :attr:`ATD95_CORRELATES_DEPENDENCIES`
 -   :func:`XYZ_to_ATD95`
 
 See Also
@@ -36,6 +37,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.utilities.array import tsplit, tstack
 
 __author__ = 'Colour Developers'
@@ -47,6 +51,7 @@ __status__ = 'Production'
 
 __all__ = ['ATD95_ReferenceSpecification',
            'ATD95_Specification',
+           'ATD95_CORRELATES_DEPENDENCIES',
            'XYZ_to_ATD95',
            'luminance_to_retinal_illuminance',
            'XYZ_to_LMS_ATD95',
@@ -131,7 +136,28 @@ class ATD95_Specification(
     """
 
 
-def XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma=300):
+ATD95_CORRELATES_DEPENDENCIES = {
+    'h': (),
+    'C': (),
+    'Q': (),
+    'A_1': (),
+    'T_1': (),
+    'D_1': (),
+    'A_2': (),
+    'T_2': (),
+    'D_2': ()}
+"""
+ATD (1995) colour vision model correlates dependency graph mapping the
+correlates to the correlates they directly depend on. The first and second
+stages responses are computed together by the opponent colour dimensions,
+only the final *brightness*, *saturation* and *hue* computations are
+selective.
+
+ATD95_CORRELATES_DEPENDENCIES : dict
+"""
+
+
+def XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma=300, correlates=None):
     """
     Computes the ATD (1995) colour vision model correlates.
 
@@ -150,11 +176,20 @@ def XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma=300):
         Application specific weight :math:`k_2`.
     sigma : numeric or array_like, optional
         Constant :math:`\sigma` varied to predict different types of data.
+    correlates : array_like, optional
+        **{'h', 'C', 'Q', 'A_1', 'T_1', 'D_1', 'A_2', 'T_2', 'D_2'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Returns
     -------
     ATD95_Specification
-        ATD (1995) colour vision model specification.
+        ATD (1995) colour vision model specification, the correlates that
+        have not been requested are *None*.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
 
     Warning
     -------
@@ -168,6 +203,9 @@ def XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma=300):
         set to 1.0 while :math:`k_2` is set to 0.0. For related colors such as
         typical colorimetric applications, :math:`k_1` is set to 0.0 and
         :math:`k_2` is set to a value between 15 and 50 *(Guth, 1995)*.
+    -   Only the requested correlates are computed as described by
+        :attr:`ATD95_CORRELATES_DEPENDENCIES` attribute, the opponent colour
+        dimensions are always computed.
 
     Examples
     --------
@@ -180,8 +218,15 @@ def XYZ_to_ATD95(XYZ, XYZ_0, Y_0, k_1, k_2, sigma=300):
     ATD95_Specification(h=1.9089869..., C=1.2064060..., Q=0.1814003..., \
 A_1=0.1787931... T_1=0.0286942..., D_1=0.0107584..., A_2=0.0192182..., \
 T_2=0.0205377..., D_2=0.0107584...)
+    >>> XYZ_to_ATD95(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_0, Y_0, k_1, k_2, correlates=('h',))
+    ATD95_Specification(h=1.9089869..., C=None, Q=None, A_1=None, T_1=None, \
+D_1=None, A_2=None, T_2=None, D_2=None)
     """
 
+    required = correlates_dependencies(
+        correlates, ATD95_CORRELATES_DEPENDENCIES, ATD95_Specification)
+
     Y_0 = np.asarray(Y_0)
     k_1 = np.asarray(k_1)
     k_2 = np.asarray(k_2)
@@ -201,22 +246,29 @@ T_2=0.0205377..., D_2=0.0107584...)
     A_1, T_1, D_1, A_2, T_2, D_2 = tsplit(
         opponent_colour_dimensions(LMS_g))
 
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *brightness* :math:`Br`.
-    # -------------------------------------------------------------------------
-    Br = (A_1 ** 2 + T_1 ** 2 + D_1 ** 2) ** 0.5
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`C`.
-    # -------------------------------------------------------------------------
-    C = (T_2 ** 2 + D_2 ** 2) ** 0.5 / A_2
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* :math:`H`.
-    # -------------------------------------------------------------------------
-    H = T_2 / D_2
-
-    return ATD95_Specification(H, C, Br, A_1, T_1, D_1, A_2, T_2, D_2)
+    H = C = Br = None
+
+    if 'Q' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *brightness* :math:`Br`.
+        # ---------------------------------------------------------------------
+        Br = (A_1 ** 2 + T_1 ** 2 + D_1 ** 2) ** 0.5
+
+    if 'C' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *saturation* :math:`C`.
+        # ---------------------------------------------------------------------
+        C = (T_2 ** 2 + D_2 ** 2) ** 0.5 / A_2
+
+    if 'h' in required:
+        # ---------------------------------------------------------------------
+        # Computing the *hue* :math:`H`.
+        # ---------------------------------------------------------------------
+        H = T_2 / D_2
+
+    return specification_correlates(
+        ATD95_Specification(H, C, Br, A_1, T_1, D_1, A_2, T_2, D_2),
+        correlates)
 
 
 def luminance_to_retinal_illuminance(XYZ, Y_c):
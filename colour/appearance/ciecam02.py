@@ -10,6 +10,8 @@ Defines CIECAM02 colour appearance model objects:
 -   :class:`CIECAM02_InductionFactors`
 -   :attr:`CIECAM02_VIEWING_CONDITIONS`
 -   :class:`CIECAM02_Specification`
+-   :attr:`CIECAM02_CORRELATES_DEPENDENCIES`
+-   :class:`CIECAM02_Model`
 -   :func:`XYZ_to_CIECAM02`
 -   :func:`CIECAM02_to_XYZ`
 
@@ -41,14 +43,19 @@ import numpy as np
 from collections import namedtuple
 
 from colour.adaptation import CAT02_CAT
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.appearance.hunt import (
     HPE_TO_XYZ_MATRIX,
     XYZ_TO_HPE_MATRIX,
     luminance_level_adaptation_factor)
 from colour.utilities import (
+    DEFAULT_TILE_SIZE,
     CaseInsensitiveMapping,
     dot_matrix,
     dot_vector,
+    tiles,
     tsplit,
     tstack)
 
@@ -64,6 +71,8 @@ __all__ = ['CAT02_INVERSE_CAT',
            'CIECAM02_VIEWING_CONDITIONS',
            'HUE_DATA_FOR_HUE_QUADRATURE',
            'CIECAM02_Specification',
+           'CIECAM02_CORRELATES_DEPENDENCIES',
+           'CIECAM02_Model',
            'XYZ_to_CIECAM02',
            'CIECAM02_to_XYZ',
            'chromatic_induction_factors',
@@ -162,12 +171,900 @@ class CIECAM02_Specification(
     """
 
 
+CIECAM02_CORRELATES_DEPENDENCIES = {
+    'J': ('A',),
+    'C': ('J', 'h', 'ab'),
+    'h': ('ab',),
+    's': ('M', 'Q'),
+    'Q': ('J',),
+    'M': ('C',),
+    'H': ('h',),
+    'A': (),
+    'ab': ()}
+"""
+CIECAM02 colour appearance model correlates dependency graph mapping the
+correlates and intermediate terms to the terms they directly depend on: *A*
+is the achromatic response and *ab* the opponent colour dimensions. The
+post-adaptation non linear response compression is always computed.
+
+CIECAM02_CORRELATES_DEPENDENCIES : dict
+"""
+
+
+class CIECAM02_Model(object):
+    """
+    Implements the CIECAM02 colour appearance model for given viewing
+    conditions.
+
+    The viewing conditions dependent terms, i.e. the viewing condition
+    dependent parameters, the degree of adaptation :math:`D`, the adapted
+    whitepoint and its achromatic response :math:`A_w`, are computed once and
+    cached so that :meth:`CIECAM02_Model.forward` and
+    :meth:`CIECAM02_Model.reverse` methods only perform the per stimulus
+    computations.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white in domain [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    Y_b : numeric or array_like
+        Adapting field *Y* tristimulus value :math:`Y_b`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+
+    Methods
+    -------
+    forward
+    reverse
+    forward_image
+    reverse_image
+
+    Notes
+    -----
+    -   The cached terms are recomputed whenever one of the viewing conditions
+        attributes is set.
+    -   :meth:`CIECAM02_Model.forward_image` and
+        :meth:`CIECAM02_Model.reverse_image` methods implement a fused image
+        mode trading the helper definitions chain for a single pass per tile.
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> specification = model.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=array(278.0607358...), \
+HC=None)
+    >>> model.reverse(  # doctest: +ELLIPSIS
+    ...     specification.J, specification.C, specification.h)
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CIECAM02_VIEWING_CONDITIONS.get('Average'),
+                 discount_illuminant=False):
+        self._state = None
+        self._XYZ_w = None
+        self.XYZ_w = XYZ_w
+        self._L_A = None
+        self.L_A = L_A
+        self._Y_b = None
+        self.Y_b = Y_b
+        self._surround = None
+        self.surround = surround
+        self._discount_illuminant = None
+        self.discount_illuminant = discount_illuminant
+
+    @property
+    def XYZ_w(self):
+        """
+        Property for **self._XYZ_w** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._XYZ_w.
+        """
+
+        return self._XYZ_w
+
+    @XYZ_w.setter
+    def XYZ_w(self, value):
+        """
+        Setter for **self._XYZ_w** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        self._XYZ_w = np.asarray(value)
+        self._state = None
+
+    @property
+    def L_A(self):
+        """
+        Property for **self._L_A** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._L_A.
+        """
+
+        return self._L_A
+
+    @L_A.setter
+    def L_A(self, value):
+        """
+        Setter for **self._L_A** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._L_A = np.asarray(value)
+        self._state = None
+
+    @property
+    def Y_b(self):
+        """
+        Property for **self._Y_b** private attribute.
+
+        Returns
+        -------
+        numeric or ndarray
+            self._Y_b.
+        """
+
+        return self._Y_b
+
+    @Y_b.setter
+    def Y_b(self, value):
+        """
+        Setter for **self._Y_b** private attribute.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Attribute value.
+        """
+
+        self._Y_b = np.asarray(value)
+        self._state = None
+
+    @property
+    def surround(self):
+        """
+        Property for **self._surround** private attribute.
+
+        Returns
+        -------
+        CIECAM02_InductionFactors
+            self._surround.
+        """
+
+        return self._surround
+
+    @surround.setter
+    def surround(self, value):
+        """
+        Setter for **self._surround** private attribute.
+
+        Parameters
+        ----------
+        value : CIECAM02_InductionFactors
+            Attribute value.
+        """
+
+        self._surround = value
+        self._state = None
+
+    @property
+    def discount_illuminant(self):
+        """
+        Property for **self._discount_illuminant** private attribute.
+
+        Returns
+        -------
+        bool
+            self._discount_illuminant.
+        """
+
+        return self._discount_illuminant
+
+    @discount_illuminant.setter
+    def discount_illuminant(self, value):
+        """
+        Setter for **self._discount_illuminant** private attribute.
+
+        Parameters
+        ----------
+        value : bool
+            Attribute value.
+        """
+
+        self._discount_illuminant = value
+        self._state = None
+
+    def _viewing_conditions_state(self):
+        """
+        Returns the viewing conditions dependent terms and caches them if not
+        existing.
+
+        Returns
+        -------
+        dict
+            Viewing conditions dependent terms.
+        """
+
+        if self._state is not None:
+            return self._state
+
+        _X_w, Y_w, _Z_w = tsplit(self._XYZ_w)
+
+        n, F_L, N_bb, N_cb, z = tsplit(viewing_condition_dependent_parameters(
+            self._Y_b, Y_w, self._L_A))
+
+        # Converting *CIE XYZ* tristimulus values to CMCCAT2000 transform
+        # sharpened *RGB* values.
+        RGB_w = dot_vector(CAT02_CAT, self._XYZ_w)
+
+        # Computing degree of adaptation :math:`D`.
+        D = (degree_of_adaptation(self._surround.F, self._L_A)
+             if not self._discount_illuminant else 1)
+
+        # Computing full chromatic adaptation.
+        RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_pw = RGB_to_rgb(RGB_wc)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            RGB_pw, F_L)
+
+        # Computing achromatic responses for the whitepoint.
+        A_w = achromatic_response_forward(RGB_aw, N_bb)
+
+        self._state = {'Y_w': Y_w,
+                       'n': n,
+                       'F_L': F_L,
+                       'N_bb': N_bb,
+                       'N_cb': N_cb,
+                       'z': z,
+                       'RGB_w': RGB_w,
+                       'D': D,
+                       'A_w': A_w}
+
+        return self._state
+
+    def forward(self, XYZ, correlates=None):
+        """
+        Computes the CIECAM02 colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+        correlates : array_like, optional
+            **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+            Correlates to compute, all the correlates are computed if not
+            given.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            CIECAM02 colour appearance model specification, the correlates
+            that have not been requested are *None*.
+
+        Raises
+        ------
+        ValueError
+            If a correlate is not supported.
+
+        See Also
+        --------
+        XYZ_to_CIECAM02
+
+        Notes
+        -----
+        -   Only the requested correlates and the terms they depend on as
+            described by :attr:`CIECAM02_CORRELATES_DEPENDENCIES` attribute
+            are computed.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> model.forward(XYZ)  # doctest: +ELLIPSIS
+        CIECAM02_Specification(J=41.7310911..., C=0.1047077..., \
+h=219.0484326..., s=2.3603053..., Q=195.3713259..., M=0.1088421..., \
+H=array(278.0607358...), HC=None)
+        >>> model.forward(XYZ, ('J', 'h'))  # doctest: +ELLIPSIS
+        CIECAM02_Specification(J=41.7310911..., C=None, h=219.0484326..., \
+s=None, Q=None, M=None, H=None, HC=None)
+        """
+
+        required = correlates_dependencies(correlates,
+                                           CIECAM02_CORRELATES_DEPENDENCIES,
+                                           CIECAM02_Specification)
+
+        state = self._viewing_conditions_state()
+        surround = self._surround
+        F_L = state['F_L']
+        N_bb = state['N_bb']
+        A_w = state['A_w']
+
+        J = C = h = s = Q = M = H = None
+
+        # Converting *CIE XYZ* tristimulus values to CMCCAT2000 transform
+        # sharpened *RGB* values.
+        RGB = dot_vector(CAT02_CAT, XYZ)
+
+        # Computing full chromatic adaptation.
+        RGB_c = full_chromatic_adaptation_forward(
+            RGB, state['RGB_w'], state['Y_w'], state['D'])
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_p = RGB_to_rgb(RGB_c)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, F_L)
+
+        if 'ab' in required:
+            # Converting to preliminary cartesian coordinates.
+            a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        if 'h' in required:
+            # -----------------------------------------------------------------
+            # Computing the *hue* angle :math:`h`.
+            h = hue_angle(a, b)
+
+        if 'H' in required:
+            # -----------------------------------------------------------------
+            # Computing hue :math:`h` quadrature :math:`H`.
+            H = hue_quadrature(h)
+            # TODO: Compute hue composition.
+
+        if 'A' in required:
+            # Computing achromatic responses for the stimulus.
+            A = achromatic_response_forward(RGB_a, N_bb)
+
+        if 'J' in required:
+            # -----------------------------------------------------------------
+            # Computing the correlate of *Lightness* :math:`J`.
+            # -----------------------------------------------------------------
+            J = lightness_correlate(A, A_w, surround.c, state['z'])
+
+        if 'Q' in required:
+            # -----------------------------------------------------------------
+            # Computing the correlate of *brightness* :math:`Q`.
+            # -----------------------------------------------------------------
+            Q = brightness_correlate(surround.c, J, A_w, F_L)
+
+        if 'C' in required:
+            # Computing eccentricity factor *e_t*.
+            e_t = eccentricity_factor(h)
+
+            # -----------------------------------------------------------------
+            # Computing the correlate of *chroma* :math:`C`.
+            # -----------------------------------------------------------------
+            C = chroma_correlate(
+                J, state['n'], surround.N_c, state['N_cb'], e_t, a, b, RGB_a)
+
+        if 'M' in required:
+            # -----------------------------------------------------------------
+            # Computing the correlate of *colourfulness* :math:`M`.
+            # -----------------------------------------------------------------
+            M = colourfulness_correlate(C, F_L)
+
+        if 's' in required:
+            # -----------------------------------------------------------------
+            # Computing the correlate of *saturation* :math:`s`.
+            # -----------------------------------------------------------------
+            s = saturation_correlate(M, Q)
+
+        return specification_correlates(
+            CIECAM02_Specification(J, C, h, s, Q, M, H, None), correlates)
+
+    def reverse(self, J, C, h):
+        """
+        Converts given CIECAM02 specification to *CIE XYZ* tristimulus
+        values.
+
+        Parameters
+        ----------
+        J : numeric or array_like
+            Correlate of *Lightness* :math:`J`.
+        C : numeric or array_like
+            Correlate of *chroma* :math:`C`.
+        h : numeric or array_like
+            *Hue* angle :math:`h` in degrees.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values in range [0, 100].
+
+        See Also
+        --------
+        CIECAM02_to_XYZ
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        >>> J = 41.731091132513917
+        >>> C = 0.1047077571711053
+        >>> h = 219.04843265827190
+        >>> model.reverse(J, C, h)  # doctest: +ELLIPSIS
+        array([ 19.01...,  20...  ,  21.78...])
+        """
+
+        state = self._viewing_conditions_state()
+        surround = self._surround
+        N_bb = state['N_bb']
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, state['n'])
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_reverse(
+            state['A_w'], J, surround.c, state['z'])
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, state['N_cb'], e_t, t, A, N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, state['F_L'])
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_c = rgb_to_RGB(RGB_p)
+
+        # Applying reverse full chromatic adaptation.
+        RGB = full_chromatic_adaptation_reverse(
+            RGB_c, state['RGB_w'], state['Y_w'], state['D'])
+
+        # Converting CMCCAT2000 transform sharpened *RGB* values to *CIE XYZ*
+        # tristimulus values.
+        XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
+
+        return XYZ
+
+    def _is_scalar_viewing_conditions(self):
+        """
+        Returns if the viewing conditions are scalar, i.e. a single
+        reference white and scalar adapting field and surround parameters.
+
+        Returns
+        -------
+        bool
+            Is scalar viewing conditions.
+        """
+
+        return (self._XYZ_w.shape == (3,) and
+                np.ndim(self._L_A) == 0 and
+                np.ndim(self._Y_b) == 0 and
+                all(np.ndim(factor) == 0 for factor in self._surround))
+
+    def _fused_parameters(self):
+        """
+        Returns the parameters of the fused image mode, i.e. the merged
+        matrices and the correlates scalar factors.
+
+        Returns
+        -------
+        dict
+            Fused image mode parameters.
+        """
+
+        state = self._viewing_conditions_state()
+        surround = self._surround
+        Y_w, D, RGB_w = state['Y_w'], state['D'], state['RGB_w']
+        F_L, A_w, n = state['F_L'], state['A_w'], state['n']
+
+        # Merging the CAT02 transform, full chromatic adaptation and
+        # *Hunt-Pointer-Estevez* colourspace conversion into a single matrix.
+        RGB_to_rgb_matrix = dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT)
+        D_RGB = Y_w * D / RGB_w + 1 - D
+        M_f = dot_matrix(RGB_to_rgb_matrix,
+                         D_RGB[..., np.newaxis] * CAT02_CAT)
+
+        D_RGB_r = Y_w * (D / RGB_w) + 1 - D
+        M_r = dot_matrix(CAT02_INVERSE_CAT,
+                         dot_matrix(CAT02_CAT, HPE_TO_XYZ_MATRIX) /
+                         D_RGB_r[..., np.newaxis])
+
+        return {'XYZ_to_x_matrix': M_f * F_L / 100,
+                'x_to_XYZ_matrix': M_r * 100 / F_L,
+                'c': surround.c,
+                'cz': surround.c * state['z'],
+                'N_bb': state['N_bb'],
+                'A_w': A_w,
+                'k_t': (50000 / 13) * surround.N_c * state['N_cb'],
+                'k_C': (1.64 - 0.29 ** n) ** 0.73,
+                'k_Q': (4 / surround.c) * (A_w + 4) * F_L ** 0.25,
+                'F_L_4': F_L ** 0.25}
+
+    def forward_image(self, XYZ, correlates=None, tile_size=DEFAULT_TILE_SIZE):
+        """
+        Computes given CIECAM02 colour appearance model correlates from given
+        *CIE XYZ* tristimulus values using the fused image mode.
+
+        The CAT02 transform, full chromatic adaptation and
+        *Hunt-Pointer-Estevez* colourspace conversion are merged into a single
+        matrix, the arrays are processed in tiles with scratch buffers reused
+        across the tiles and only the requested correlates and their
+        dependencies are computed.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+        correlates : array_like, optional
+            **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+            Correlates to compute, all the correlates are computed if not
+            given.
+        tile_size : integer, optional
+            Tiles size in pixels.
+
+        Returns
+        -------
+        CIECAM02_Specification
+            CIECAM02 colour appearance model specification, the correlates
+            that have not been requested are *None*.
+
+        Raises
+        ------
+        ValueError
+            If a correlate is not supported.
+
+        Notes
+        -----
+        -   The fused image mode requires scalar viewing conditions,
+            :meth:`CIECAM02_Model.forward` method is used otherwise.
+        -   The working memory is bounded by the tiles size: besides the
+            requested correlates, no full size intermediate array is
+            allocated.
+        -   Results match :meth:`CIECAM02_Model.forward` method up to floating
+            point rounding.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        >>> XYZ = np.array([19.01, 20.00, 21.78])
+        >>> model.forward_image(XYZ, ('J', 'h'))  # doctest: +ELLIPSIS
+        CIECAM02_Specification(J=array(41.7310911...), C=None, \
+h=array(219.0484326...), s=None, Q=None, M=None, H=None, HC=None)
+        """
+
+        required = correlates_dependencies(correlates,
+                                           CIECAM02_CORRELATES_DEPENDENCIES,
+                                           CIECAM02_Specification)
+
+        if not self._is_scalar_viewing_conditions():
+            return self.forward(XYZ, correlates)
+
+        if correlates is None:
+            correlates = [field for field in CIECAM02_Specification._fields
+                          if field in required]
+        parameters = self._fused_parameters()
+        M_x = parameters['XYZ_to_x_matrix']
+        cz, N_bb, A_w = (parameters['cz'], parameters['N_bb'],
+                         parameters['A_w'])
+
+        XYZ = np.asarray(XYZ, dtype=np.float_)
+        shape = XYZ.shape[:-1]
+        XYZ = np.reshape(XYZ, (-1, 3))
+        size = XYZ.shape[0]
+        tile_size = max(min(int(tile_size), size), 1)
+
+        outputs = dict((correlate, np.empty(size))
+                       for correlate in correlates)
+
+        # Allocating the scratch buffers reused across the tiles.
+        buffers_3 = [np.empty(3 * tile_size) for _ in range(2)]
+        buffers = dict((term, np.empty(tile_size)) for term in
+                       ('a', 'b', 'h', 'A', 'J', 'Q', 'C', 'M', 'e_t', 't'))
+        swap = np.empty(tile_size)
+
+        for tile in tiles(size, tile_size):
+            k = tile.stop - tile.start
+
+            def buffer(term):
+                """
+                Returns the output tile for given term if requested,
+                otherwise its scratch buffer.
+                """
+
+                if term in outputs:
+                    return outputs[term][tile]
+                return buffers[term][:k]
+
+            rgb = np.reshape(buffers_3[0][:3 * k], (3, k))
+            rgb_t = np.reshape(buffers_3[1][:3 * k], (3, k))
+            tmp = swap[:k]
+
+            # Converting *CIE XYZ* tristimulus values to scaled
+            # *Hunt-Pointer-Estevez* colourspace values.
+            np.dot(M_x, XYZ[tile].T, out=rgb)
+
+            # Applying forward post-adaptation non linear response
+            # compression.
+            np.power(rgb, 0.42, out=rgb)
+            np.add(rgb, 27.13, out=rgb_t)
+            rgb *= 400
+            rgb /= rgb_t
+            rgb += 0.1
+            R, G, B = rgb
+
+            if 'ab' in required:
+                a, b = buffer('a'), buffer('b')
+                np.multiply(G, 12 / 11, out=a)
+                np.subtract(R, a, out=a)
+                np.multiply(B, 1 / 11, out=tmp)
+                a += tmp
+                np.add(R, G, out=b)
+                np.multiply(B, 2, out=tmp)
+                b -= tmp
+                b /= 9
+
+            if 'h' in required:
+                h = buffer('h')
+                np.arctan2(b, a, out=h)
+                np.degrees(h, out=h)
+                np.remainder(h, 360, out=h)
+
+            if 'A' in required:
+                A = buffer('A')
+                np.multiply(R, 2, out=A)
+                A += G
+                np.multiply(B, 1 / 20, out=tmp)
+                A += tmp
+                A -= 0.305
+                A *= N_bb
+
+            if 'J' in required:
+                J = buffer('J')
+                np.divide(A, A_w, out=J)
+                np.power(J, cz, out=J)
+                J *= 100
+
+            if 'Q' in required:
+                Q = buffer('Q')
+                np.divide(J, 100, out=Q)
+                np.sqrt(Q, out=Q)
+                Q *= parameters['k_Q']
+
+            if 'C' in required:
+                e_t, t, C = buffer('e_t'), buffer('t'), buffer('C')
+                np.multiply(h, np.pi / 180, out=e_t)
+                e_t += 2
+                np.cos(e_t, out=e_t)
+                e_t += 3.8
+                e_t *= 1 / 4
+
+                np.hypot(a, b, out=t)
+                t *= e_t
+                t *= parameters['k_t']
+                np.multiply(B, 21 / 20, out=tmp)
+                tmp += R
+                tmp += G
+                t /= tmp
+
+                np.power(t, 0.9, out=C)
+                np.divide(J, 100, out=tmp)
+                np.sqrt(tmp, out=tmp)
+                C *= tmp
+                C *= parameters['k_C']
+
+            if 'M' in required:
+                M = buffer('M')
+                np.multiply(C, parameters['F_L_4'], out=M)
+
+            if 's' in required:
+                s = outputs['s'][tile]
+                np.divide(M, Q, out=s)
+                np.sqrt(s, out=s)
+                s *= 100
+
+            if 'H' in required:
+                outputs['H'][tile] = hue_quadrature(h)
+
+        return CIECAM02_Specification(
+            *[np.reshape(outputs[field], shape) if field in outputs else None
+              for field in CIECAM02_Specification._fields])
+
+    def reverse_image(self, J, C, h, tile_size=DEFAULT_TILE_SIZE):
+        """
+        Converts given CIECAM02 specification to *CIE XYZ* tristimulus values
+        using the fused image mode.
+
+        The opponent colour dimensions are computed without branching, the
+        *Hunt-Pointer-Estevez* colourspace conversion, reverse full chromatic
+        adaptation and inverse CAT02 transform are merged into a single
+        matrix and the arrays are processed in tiles with scratch buffers
+        reused across the tiles.
+
+        Parameters
+        ----------
+        J : numeric or array_like
+            Correlate of *Lightness* :math:`J`.
+        C : numeric or array_like
+            Correlate of *chroma* :math:`C`.
+        h : numeric or array_like
+            *Hue* angle :math:`h` in degrees.
+        tile_size : integer, optional
+            Tiles size in pixels.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values in range [0, 100].
+
+        Notes
+        -----
+        -   The fused image mode requires scalar viewing conditions,
+            :meth:`CIECAM02_Model.reverse` method is used otherwise.
+        -   Results match :meth:`CIECAM02_Model.reverse` method up to floating
+            point rounding.
+
+        Examples
+        --------
+        >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+        >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        >>> J = 41.731091132513917
+        >>> C = 0.1047077571711053
+        >>> h = 219.04843265827190
+        >>> model.reverse_image(J, C, h)  # doctest: +ELLIPSIS
+        array([ 19.01...,  20...  ,  21.78...])
+        """
+
+        if not self._is_scalar_viewing_conditions():
+            return self.reverse(J, C, h)
+
+        parameters = self._fused_parameters()
+        M_r = parameters['x_to_XYZ_matrix']
+
+        J, C, h = np.broadcast_arrays(J, C, h)
+        shape = J.shape
+        J, C, h = [np.ravel(np.asarray(x, dtype=np.float_)) for x in (J, C, h)]
+        size = J.shape[0]
+        tile_size = max(min(int(tile_size), size), 1)
+
+        XYZ = np.empty((size, 3))
+
+        # Computing the constant terms with :math:`P_3 = 21 / 20`.
+        P_3 = 21 / 20
+        k_n = (2 + P_3) * (460 / 1403)
+        k_cos = (2 + P_3) * (220 / 1403)
+        k_sin = P_3 * (6300 / 1403) - (27 / 1403)
+        M_a = np.array([[460, 451, 288],
+                        [460, -891, -261],
+                        [460, -220, -6300]]) / 1403
+
+        buffers_3 = [np.empty(3 * tile_size) for _ in range(3)]
+        t, e_t, A, P_1, cos_hr, sin_hr, tmp = [np.empty(tile_size)
+                                               for _ in range(7)]
+
+        for tile in tiles(size, tile_size):
+            k = tile.stop - tile.start
+
+            P2ab = np.reshape(buffers_3[0][:3 * k], (3, k))
+            rgb = np.reshape(buffers_3[1][:3 * k], (3, k))
+            t_k, e_t_k, A_k, P_1_k = t[:k], e_t[:k], A[:k], P_1[:k]
+            cos_hr_k, sin_hr_k, tmp_k = cos_hr[:k], sin_hr[:k], tmp[:k]
+            P_2, a, b = P2ab
+            J_k, C_k, h_k = J[tile], C[tile], h[tile]
+
+            # Computing temporary magnitude quantity :math:`t`.
+            np.divide(J_k, 100, out=tmp_k)
+            np.sqrt(tmp_k, out=tmp_k)
+            tmp_k *= parameters['k_C']
+            np.divide(C_k, tmp_k, out=t_k)
+            np.power(t_k, 1 / 0.9, out=t_k)
+
+            # Computing eccentricity factor *e_t*.
+            np.multiply(h_k, np.pi / 180, out=e_t_k)
+            e_t_k += 2
+            np.cos(e_t_k, out=e_t_k)
+            e_t_k += 3.8
+            e_t_k *= 1 / 4
+
+            # Computing achromatic response :math:`A` for the stimulus.
+            np.divide(J_k, 100, out=A_k)
+            np.power(A_k, 1 / parameters['cz'], out=A_k)
+            A_k *= parameters['A_w']
+
+            # Computing *P_1* and *P_2*.
+            np.multiply(e_t_k, parameters['k_t'], out=P_1_k)
+            P_1_k /= t_k
+            np.divide(A_k, parameters['N_bb'], out=P_2)
+            P_2 += 0.305
+
+            # Computing opponent colour dimensions :math:`a` and :math:`b`,
+            # both branches of the reference implementation reduce to
+            # :math:`a = n cos(h) / d` and :math:`b = n sin(h) / d`.
+            np.radians(h_k, out=tmp_k)
+            np.cos(tmp_k, out=cos_hr_k)
+            np.sin(tmp_k, out=sin_hr_k)
+            np.multiply(cos_hr_k, k_cos, out=tmp_k)
+            tmp_k += P_1_k
+            np.multiply(sin_hr_k, k_sin, out=a)
+            tmp_k += a
+            np.multiply(P_2, k_n, out=a)
+            a /= tmp_k
+            np.multiply(a, sin_hr_k, out=b)
+            a *= cos_hr_k
+
+            # Computing post-adaptation non linear response compression
+            # matrix.
+            np.dot(M_a, P2ab, out=rgb)
+
+            # Applying reverse post-adaptation non linear response
+            # compression.
+            sign = P2ab
+            rgb_t = np.reshape(buffers_3[2][:3 * k], (3, k))
+            rgb -= 0.1
+            np.sign(rgb, out=sign)
+            np.abs(rgb, out=rgb)
+            np.subtract(400, rgb, out=rgb_t)
+            rgb *= 27.13
+            rgb /= rgb_t
+            np.power(rgb, 1 / 0.42, out=rgb)
+            rgb *= sign
+
+            np.dot(rgb.T, M_r.T, out=XYZ[tile])
+
+        return np.reshape(XYZ, shape + (3,))
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
                     Y_b,
                     surround=CIECAM02_VIEWING_CONDITIONS.get('Average'),
-                    discount_illuminant=False):
+                    discount_illuminant=False,
+                    correlates=None):
     """
     Computes the CIECAM02 colour appearance model correlates from given
     *CIE XYZ* tristimulus values.
@@ -189,11 +1086,20 @@ def XYZ_to_CIECAM02(XYZ,
         Surround viewing conditions induction factors.
     discount_illuminant : bool, optional
         Truth value indicating if the illuminant should be discounted.
+    correlates : array_like, optional
+        **{'J', 'C', 'h', 's', 'Q', 'M', 'H'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Returns
     -------
     CIECAM02_Specification
-        CIECAM02 colour appearance model specification.
+        CIECAM02 colour appearance model specification, the correlates that
+        have not been requested are *None*.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
 
     Warning
     -------
@@ -203,6 +1109,11 @@ def XYZ_to_CIECAM02(XYZ,
     -----
     -   Input *CIE XYZ* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_w* tristimulus values are in domain [0, 100].
+    -   Only the requested correlates and the terms they depend on as
+        described by :attr:`CIECAM02_CORRELATES_DEPENDENCIES` attribute are
+        computed, e.g. the *Lightness* :math:`J` only requires the achromatic
+        response while the *chroma* :math:`C` also requires the opponent
+        colour dimensions and *hue* angle :math:`h`.
 
     Examples
     --------
@@ -215,84 +1126,15 @@ def XYZ_to_CIECAM02(XYZ,
     CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
 s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=array(278.0607358...), \
 HC=None)
+    >>> XYZ_to_CIECAM02(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_w, L_A, Y_b, surround, correlates=('J',))
+    CIECAM02_Specification(J=41.7310911..., C=None, h=None, s=None, Q=None, \
+M=None, H=None, HC=None)
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(viewing_condition_dependent_parameters(
-        Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to CMCCAT2000 transform
-    # sharpened *RGB* values.
-    RGB = dot_vector(CAT02_CAT, XYZ)
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F,
-                             L_A) if not discount_illuminant else 1
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(
-        RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(
-        RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(
-        RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-    # -------------------------------------------------------------------------
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *Lightness* :math:`J`.
-    # -------------------------------------------------------------------------
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *brightness* :math:`Q`.
-    # -------------------------------------------------------------------------
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *chroma* :math:`C`.
-    # -------------------------------------------------------------------------
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *colourfulness* :math:`M`.
-    # -------------------------------------------------------------------------
-    M = colourfulness_correlate(C, F_L)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`s`.
-    # -------------------------------------------------------------------------
-    s = saturation_correlate(M, Q)
-
-    return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+    return CIECAM02_Model(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).forward(
+            XYZ, correlates)
 
 
 def CIECAM02_to_XYZ(J,
@@ -354,66 +1196,8 @@ def CIECAM02_to_XYZ(J,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
-
-    n, F_L, N_bb, N_cb, z = tsplit(viewing_condition_dependent_parameters(
-        Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to CMCCAT2000 transform
-    # sharpened *RGB* values.
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
-
-    # Computation full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
-
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(
-        P_2, a, b)
-
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_reverse(
-        RGB_a, F_L)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
-
-    # Applying reverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_reverse(RGB_c, RGB_w, Y_w, D)
-
-    # Converting CMCCAT2000 transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
-
-    return XYZ
+    return CIECAM02_Model(
+        XYZ_w, L_A, Y_b, surround, discount_illuminant).reverse(J, C, h)
 
 
 def chromatic_induction_factors(n):
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Colour Appearance Models Correlates Selection
+=============================================
+
+Defines the objects selecting the correlates computed by the colour
+appearance models:
+
+-   :func:`correlates_dependencies`
+-   :func:`specification_correlates`
+
+Each colour appearance model declares the direct dependencies of its
+correlates and intermediate terms as a graph, the terms required to compute a
+given set of correlates are the transitive closure of that graph.
+"""
+
+from __future__ import division, unicode_literals
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['correlates_dependencies',
+           'specification_correlates']
+
+
+def correlates_dependencies(correlates, dependencies, specification):
+    """
+    Returns given colour appearance model correlates and the terms they
+    depend on.
+
+    Parameters
+    ----------
+    correlates : array_like
+        Correlates to compute, all the correlates of the specification
+        declared in the dependency graph are used if *None*.
+    dependencies : dict
+        Dependency graph mapping the colour appearance model correlates and
+        intermediate terms to the terms they directly depend on.
+    specification : type
+        Colour appearance model specification *namedtuple* class.
+
+    Returns
+    -------
+    set
+        Correlates and terms required to compute them.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
+
+    Examples
+    --------
+    >>> from colour.appearance import RLAB_Specification
+    >>> dependencies = {'J': (), 'a': (), 'b': (), 'h': ('a', 'b')}
+    >>> sorted(correlates_dependencies(
+    ...     ('h',), dependencies, RLAB_Specification))
+    ['a', 'b', 'h']
+    """
+
+    supported = tuple(field for field in specification._fields
+                      if field in dependencies)
+
+    if correlates is None:
+        correlates = supported
+
+    for correlate in correlates:
+        if correlate not in supported:
+            raise ValueError(
+                ('"{0}" correlate is not supported, supported correlates: '
+                 '"{1}".').format(correlate, supported))
+
+    required = set()
+    terms = list(correlates)
+    while terms:
+        term = terms.pop()
+        if term not in required:
+            required.add(term)
+            terms.extend(dependencies[term])
+
+    return required
+
+
+def specification_correlates(specification, correlates):
+    """
+    Returns given colour appearance model specification with the correlates
+    not in given correlates set to *None*.
+
+    Parameters
+    ----------
+    specification : namedtuple
+        Colour appearance model specification.
+    correlates : array_like
+        Correlates to keep, all the correlates are kept if *None*.
+
+    Returns
+    -------
+    namedtuple
+        Colour appearance model specification.
+
+    Examples
+    --------
+    >>> from colour.appearance import RLAB_Specification
+    >>> specification_correlates(
+    ...     RLAB_Specification(1, 2, 3, 4, None, 6, 7), ('J', 'h'))
+    RLAB_Specification(J=1, C=None, h=3, s=None, HC=None, a=None, b=None)
+    """
+
+    if correlates is None:
+        return specification
+
+    return type(specification)(
+        *[value if field in correlates else None
+          for field, value in zip(specification._fields, specification)])
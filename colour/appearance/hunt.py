@@ -10,6 +10,7 @@ Defines Hunt colour appearance model objects:
 -   :class:`Hunt_InductionFactors`
 -   :attr:`HUNT_VIEWING_CONDITIONS`
 -   :class:`Hunt_Specification`
+-   :attr:`HUNT_CORRELATES_DEPENDENCIES`
 -   :func:`XYZ_to_Hunt`
 
 See Also
@@ -31,6 +32,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.utilities import (
     CaseInsensitiveMapping,
     dot_vector,
@@ -52,6 +56,7 @@ __all__ = ['Hunt_InductionFactors',
            'HPE_TO_XYZ_MATRIX',
            'Hunt_ReferenceSpecification',
            'Hunt_Specification',
+           'HUNT_CORRELATES_DEPENDENCIES',
            'XYZ_to_Hunt',
            'luminance_level_adaptation_factor',
            'illuminant_scotopic_luminance',
@@ -236,6 +241,25 @@ class Hunt_Specification(
     """
 
 
+HUNT_CORRELATES_DEPENDENCIES = {
+    'J': ('Q',),
+    'C': ('s', 'Q'),
+    'h': ('colour_difference_signals',),
+    's': ('chromatic_responses',),
+    'Q': ('achromatic_signals', 'chromatic_responses'),
+    'M': ('C',),
+    'colour_difference_signals': (),
+    'chromatic_responses': ('h',),
+    'achromatic_signals': ()}
+"""
+Hunt colour appearance model correlates dependency graph mapping the
+correlates and intermediate terms to the terms they directly depend on. The
+test sample and reference white chromatic adaptation is always computed.
+
+HUNT_CORRELATES_DEPENDENCIES : dict
+"""
+
+
 def XYZ_to_Hunt(XYZ,
                 XYZ_w,
                 XYZ_b,
@@ -248,7 +272,8 @@ def XYZ_to_Hunt(XYZ,
                 S=None,
                 S_w=None,
                 helson_judd_effect=False,
-                discount_illuminant=True):
+                discount_illuminant=True,
+                correlates=None):
     """
     Computes the Hunt colour appearance model correlates.
 
@@ -290,6 +315,9 @@ def XYZ_to_Hunt(XYZ,
         accounted for.
     discount_illuminant : bool, optional
        Truth value indicating if the illuminant should be discounted.
+    correlates : array_like, optional
+        **{'J', 'C', 'h', 's', 'Q', 'M'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Warning
     -------
@@ -301,16 +329,28 @@ def XYZ_to_Hunt(XYZ,
     -   Input *CIE XYZ_b* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_w* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_p* tristimulus values are in domain [0, 100].
+    -   The viewing conditions, e.g. :math:`L_A`, :math:`L_{AS}`,
+        :math:`T_{cp}`, *CIE XYZ_b*, *CIE XYZ_p*, :math:`p`, :math:`S` and
+        :math:`S_w`, can be given per element of the stimulus, e.g. as local
+        adaptation maps, and are broadcast against it.
+    -   Only the requested correlates and the terms they depend on as
+        described by :attr:`HUNT_CORRELATES_DEPENDENCIES` attribute are
+        computed, e.g. the *hue* angle :math:`h_S` only requires the colour
+        difference signals while the *Lightness* :math:`J` requires the
+        achromatic signals and the overall chromatic responses of both the
+        stimulus and the reference white.
 
     Returns
     -------
     Hunt_Specification
-        Hunt colour appearance model specification.
+        Hunt colour appearance model specification, the correlates that have
+        not been requested are *None*.
 
     Raises
     ------
     ValueError
-        If an illegal arguments combination is specified.
+        If an illegal arguments combination is specified or if a correlate is
+        not supported.
 
     Examples
     --------
@@ -324,8 +364,15 @@ def XYZ_to_Hunt(XYZ,
     ...     XYZ, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w)
     Hunt_Specification(J=30.0462678..., C=0.1210508..., h=269.2737594..., \
 s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
+    >>> XYZ_to_Hunt(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w, correlates=('h',))
+    Hunt_Specification(J=None, C=None, h=269.2737594..., s=None, Q=None, \
+M=None, H=None, HC=None)
     """
 
+    required = correlates_dependencies(
+        correlates, HUNT_CORRELATES_DEPENDENCIES, Hunt_Specification)
+
     _X, Y, _Z = tsplit(XYZ)
     X_b, Y_b, _Z_b = tsplit(XYZ_b)
     _X_w, Y_w, _Z_w = tsplit(XYZ_w)
@@ -340,11 +387,13 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
         warning('Unspecified proximal field "XYZ_p" argument, using '
                 'background "XYZ_b" as approximation!')
 
-    if surround.N_cb is None:
+    N_cb = surround.N_cb
+    if N_cb is None:
         N_cb = 0.725 * (Y_w / Y_b) ** 0.2
         warning('Unspecified "N_cb" argument, using approximation: '
                 '"{0}"'.format(N_cb))
-    if surround.N_bb is None:
+    N_bb = surround.N_bb
+    if N_bb is None:
         N_bb = 0.725 * (Y_w / Y_b) ** 0.2
         warning('Unspecified "N_bb" argument, using approximation: '
                 '"{0}"'.format(N_bb))
@@ -401,69 +450,82 @@ s=0.0199093..., Q=22.2097654..., M=0.1238964..., H=None, HC=None)
                                   helson_judd_effect,
                                   discount_illuminant)
 
-    # Computing opponent colour dimensions.
-    # Computing achromatic post adaptation signals.
-    A_a = achromatic_post_adaptation_signal(rgb_a)
-    A_aw = achromatic_post_adaptation_signal(rgb_aw)
-
-    # Computing colour difference signals.
-    C = colour_difference_signals(rgb_a)
-    C_w = colour_difference_signals(rgb_aw)
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* angle :math:`h_s`.
-    # -------------------------------------------------------------------------
-    h = hue_angle(C)
-    # hue_w = hue_angle(C_w)
-    # TODO: Implement hue quadrature & composition computation.
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`s`.
-    # -------------------------------------------------------------------------
-    # Computing eccentricity factors.
-    e_s = eccentricity_factor(h)
-
-    # Computing low luminance tritanopia factor :math:`F_t`.
-    F_t = low_luminance_tritanopia_factor(L_A)
-
-    M_yb = yellowness_blueness_response(C, e_s, surround.N_c, N_cb, F_t)
-    M_rg = redness_greenness_response(C, e_s, surround.N_c, N_cb)
-    M_yb_w = yellowness_blueness_response(C_w, e_s, surround.N_c, N_cb, F_t)
-    M_rg_w = redness_greenness_response(C_w, e_s, surround.N_c, N_cb)
-
-    # Computing overall chromatic response.
-    M = overall_chromatic_response(M_yb, M_rg)
-    M_w = overall_chromatic_response(M_yb_w, M_rg_w)
-
-    s = saturation_correlate(M, rgb_a)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *brightness* :math:`Q`.
-    # -------------------------------------------------------------------------
-    # Computing achromatic signal :math:`A`.
-    A = achromatic_signal(L_AS, S, S_w, N_bb, A_a)
-    A_w = achromatic_signal(L_AS, S_w, S_w, N_bb, A_aw)
-
-    Q = brightness_correlate(A, A_w, M, surround.N_b)
-    brightness_w = brightness_correlate(A_w, A_w, M_w, surround.N_b)
-    # TODO: Implement whiteness-blackness :math:`Q_{wb}` computation.
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *Lightness* :math:`J`.
-    # -------------------------------------------------------------------------
-    J = lightness_correlate(Y_b, Y_w, Q, brightness_w)
+    J = C_94 = h = s = Q = M_94 = None
 
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *chroma* :math:`C_{94}`.
-    # -------------------------------------------------------------------------
-    C_94 = chroma_correlate(s, Y_b, Y_w, Q, brightness_w)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *colourfulness* :math:`M_{94}`.
-    # -------------------------------------------------------------------------
-    M_94 = colourfulness_correlate(F_L, C_94)
-
-    return Hunt_Specification(J, C_94, h, s, Q, M_94, None, None)
+    # Computing opponent colour dimensions.
+    if 'achromatic_signals' in required:
+        # Computing achromatic post adaptation signals.
+        A_a = achromatic_post_adaptation_signal(rgb_a)
+        A_aw = achromatic_post_adaptation_signal(rgb_aw)
+
+    if 'colour_difference_signals' in required:
+        # Computing colour difference signals.
+        C = colour_difference_signals(rgb_a)
+        C_w = colour_difference_signals(rgb_aw)
+
+    if 'h' in required:
+        # ---------------------------------------------------------------------
+        # Computing the *hue* angle :math:`h_s`.
+        # ---------------------------------------------------------------------
+        h = hue_angle(C)
+        # hue_w = hue_angle(C_w)
+        # TODO: Implement hue quadrature & composition computation.
+
+    if 'chromatic_responses' in required:
+        # Computing eccentricity factors.
+        e_s = eccentricity_factor(h)
+
+        # Computing low luminance tritanopia factor :math:`F_t`.
+        F_t = low_luminance_tritanopia_factor(L_A)
+
+        M_yb = yellowness_blueness_response(C, e_s, surround.N_c, N_cb, F_t)
+        M_rg = redness_greenness_response(C, e_s, surround.N_c, N_cb)
+        M_yb_w = yellowness_blueness_response(
+            C_w, e_s, surround.N_c, N_cb, F_t)
+        M_rg_w = redness_greenness_response(C_w, e_s, surround.N_c, N_cb)
+
+        # Computing overall chromatic response.
+        M = overall_chromatic_response(M_yb, M_rg)
+        M_w = overall_chromatic_response(M_yb_w, M_rg_w)
+
+    if 's' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *saturation* :math:`s`.
+        # ---------------------------------------------------------------------
+        s = saturation_correlate(M, rgb_a)
+
+    if 'Q' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *brightness* :math:`Q`.
+        # ---------------------------------------------------------------------
+        # Computing achromatic signal :math:`A`.
+        A = achromatic_signal(L_AS, S, S_w, N_bb, A_a)
+        A_w = achromatic_signal(L_AS, S_w, S_w, N_bb, A_aw)
+
+        Q = brightness_correlate(A, A_w, M, surround.N_b)
+        brightness_w = brightness_correlate(A_w, A_w, M_w, surround.N_b)
+        # TODO: Implement whiteness-blackness :math:`Q_{wb}` computation.
+
+    if 'J' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *Lightness* :math:`J`.
+        # ---------------------------------------------------------------------
+        J = lightness_correlate(Y_b, Y_w, Q, brightness_w)
+
+    if 'C' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *chroma* :math:`C_{94}`.
+        # ---------------------------------------------------------------------
+        C_94 = chroma_correlate(s, Y_b, Y_w, Q, brightness_w)
+
+    if 'M' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *colourfulness* :math:`M_{94}`.
+        # ---------------------------------------------------------------------
+        M_94 = colourfulness_correlate(F_L, C_94)
+
+    return specification_correlates(
+        Hunt_Specification(J, C_94, h, s, Q, M_94, None, None), correlates)
 
 
 def luminance_level_adaptation_factor(L_A):
@@ -648,15 +710,16 @@ def chromatic_adaptation(XYZ,
 
     # Computing chromatic adaptation factors.
     if not discount_illuminant:
-        F_rgb = ((1 + (L_A ** (1 / 3)) + h_rgb) /
-                 (1 + (L_A ** (1 / 3)) + (1 / h_rgb)))
+        L_A_p = (L_A ** (1 / 3))[..., np.newaxis]
+        F_rgb = (1 + L_A_p + h_rgb) / (1 + L_A_p + (1 / h_rgb))
     else:
         F_rgb = np.ones(h_rgb.shape)
 
     # Computing Helson-Judd effect parameters.
     if helson_judd_effect:
-        D_rgb = (f_n((Y_b / Y_w) * F_L * F_rgb[..., 1]) -
-                 f_n((Y_b / Y_w) * F_L * F_rgb))
+        Y_bw_F_L = ((Y_b / Y_w) * F_L)[..., np.newaxis]
+        D_rgb = (f_n(Y_bw_F_L * F_rgb[..., 1:2]) -
+                 f_n(Y_bw_F_L * F_rgb))
     else:
         D_rgb = np.zeros(F_rgb.shape)
 
@@ -716,7 +779,7 @@ def adjusted_reference_white_signals(rgb_p, rgb_b, rgb_w, p):
     rgb_p = np.asarray(rgb_p)
     rgb_b = np.asarray(rgb_b)
     rgb_w = np.asarray(rgb_w)
-    p = np.asarray(p)
+    p = np.asarray(p)[..., np.newaxis]
 
     p_rgb = rgb_p / rgb_b
     rgb_w = (rgb_w * (((1 - p) * p_rgb + (1 + p) / p_rgb) ** 0.5) /
@@ -10,6 +10,7 @@ Defines LLAB(l:c) colour appearance model objects:
 -   :class:`LLAB_InductionFactors`
 -   :attr:`LLAB_VIEWING_CONDITIONS`
 -   :class:`LLAB_Specification`
+-   :attr:`LLAB_CORRELATES_DEPENDENCIES`
 -   :func:`XYZ_to_LLAB`
 
 See Also
@@ -39,6 +40,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.utilities import CaseInsensitiveMapping, dot_vector, tsplit, tstack
 
 __author__ = 'Colour Developers'
@@ -54,6 +58,7 @@ __all__ = ['LLAB_InductionFactors',
            'LLAB_RGB_TO_XYZ_MATRIX',
            'LLAB_ReferenceSpecification',
            'LLAB_Specification',
+           'LLAB_CORRELATES_DEPENDENCIES',
            'XYZ_to_LLAB',
            'XYZ_to_RGB_LLAB',
            'chromatic_adaptation',
@@ -217,13 +222,33 @@ class LLAB_Specification(
     """
 
 
+LLAB_CORRELATES_DEPENDENCIES = {
+    'J': (),
+    'C': (),
+    'h': (),
+    's': ('C',),
+    'M': ('C',),
+    'a': ('final_opponent_signals',),
+    'b': ('final_opponent_signals',),
+    'final_opponent_signals': ('M', 'h')}
+"""
+LLAB(l:c) colour appearance model correlates dependency graph mapping the
+correlates and intermediate terms to the terms they directly depend on. The
+chromatic adaptation and opponent colour dimensions, yielding the *Lightness*
+:math:`L_L`, are always computed.
+
+LLAB_CORRELATES_DEPENDENCIES : dict
+"""
+
+
 def XYZ_to_LLAB(
         XYZ,
         XYZ_0,
         Y_b,
         L,
         surround=LLAB_VIEWING_CONDITIONS.get(
-            'Reference Samples & Images, Average Surround, Subtending < 4')):
+            'Reference Samples & Images, Average Surround, Subtending < 4'),
+        correlates=None):
     """
     Computes the LLAB(l:c) colour appearance model correlates.
 
@@ -240,11 +265,20 @@ def XYZ_to_LLAB(
         Absolute luminance :math:`L` of reference white in :math:`cd/m^2`.
     surround : LLAB_InductionFactors, optional
          Surround viewing conditions induction factors.
+    correlates : array_like, optional
+        **{'J', 'C', 'h', 's', 'M', 'a', 'b'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Returns
     -------
     LLAB_Specification
-        LLAB(l:c) colour appearance model specification.
+        LLAB(l:c) colour appearance model specification, the correlates that
+        have not been requested are *None*.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
 
     Warning
     -------
@@ -254,6 +288,10 @@ def XYZ_to_LLAB(
     -----
     -   Input *CIE XYZ* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_0* tristimulus values are in domain [0, 100].
+    -   Only the requested correlates and the terms they depend on as
+        described by :attr:`LLAB_CORRELATES_DEPENDENCIES` attribute are
+        computed, e.g. the final opponent signals :math:`A_L` and :math:`B_L`
+        require the *colourfulness* :math:`C_L` and *hue* angle :math:`h_L`.
 
     Examples
     --------
@@ -265,8 +303,15 @@ def XYZ_to_LLAB(
     >>> XYZ_to_LLAB(XYZ, XYZ_0, Y_b, L, surround)  # doctest: +ELLIPSIS
     LLAB_Specification(J=37.3668650..., C=0.0089496..., h=270..., \
 s=0.0002395..., M=0.0190185..., HC=None, a=-3.4936555..., b=-0.0190185...)
+    >>> XYZ_to_LLAB(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_0, Y_b, L, surround, correlates=('J', 'C'))
+    LLAB_Specification(J=37.3668650..., C=0.0089496..., h=None, s=None, \
+M=None, HC=None, a=None, b=None)
     """
 
+    required = correlates_dependencies(
+        correlates, LLAB_CORRELATES_DEPENDENCIES, LLAB_Specification)
+
     _X, Y, _Z = tsplit(XYZ)
     RGB = XYZ_to_RGB_LLAB(XYZ)
     RGB_0 = XYZ_to_RGB_LLAB(XYZ_0)
@@ -285,35 +330,43 @@ s=0.0002395..., M=0.0190185..., HC=None, a=-3.4936555..., b=-0.0190185...)
     L_L, a, b = tsplit(opponent_colour_dimensions(
         XYZ_r, Y_b, surround.F_S, surround.F_L))
 
-    # Computing perceptual correlates.
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *chroma* :math:`Ch_L`.
-    # -------------------------------------------------------------------------
-    Ch_L = chroma_correlate(a, b)
+    Ch_L = h_L = s_L = C_L = A_L = B_L = None
 
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *colourfulness* :math:`C_L`.
-    # -------------------------------------------------------------------------
-    C_L = colourfulness_correlate(L, L_L, Ch_L, surround.F_C)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`s_L`.
-    # -------------------------------------------------------------------------
-    s_L = saturation_correlate(Ch_L, L_L)
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* angle :math:`h_L`.
-    # -------------------------------------------------------------------------
-    h_L = hue_angle(a, b)
-    h_Lr = np.radians(h_L)
-    # TODO: Implement hue composition computation.
-
-    # -------------------------------------------------------------------------
-    # Computing final opponent signals.
-    # -------------------------------------------------------------------------
-    A_L, B_L = tsplit(final_opponent_signals(C_L, h_Lr))
-
-    return LLAB_Specification(L_L, Ch_L, h_L, s_L, C_L, None, A_L, B_L)
+    # Computing perceptual correlates.
+    if 'C' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *chroma* :math:`Ch_L`.
+        # ---------------------------------------------------------------------
+        Ch_L = chroma_correlate(a, b)
+
+    if 'M' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *colourfulness* :math:`C_L`.
+        # ---------------------------------------------------------------------
+        C_L = colourfulness_correlate(L, L_L, Ch_L, surround.F_C)
+
+    if 's' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *saturation* :math:`s_L`.
+        # ---------------------------------------------------------------------
+        s_L = saturation_correlate(Ch_L, L_L)
+
+    if 'h' in required:
+        # ---------------------------------------------------------------------
+        # Computing the *hue* angle :math:`h_L`.
+        # ---------------------------------------------------------------------
+        h_L = hue_angle(a, b)
+        # TODO: Implement hue composition computation.
+
+    if 'final_opponent_signals' in required:
+        # ---------------------------------------------------------------------
+        # Computing final opponent signals.
+        # ---------------------------------------------------------------------
+        A_L, B_L = tsplit(final_opponent_signals(C_L, np.radians(h_L)))
+
+    return specification_correlates(
+        LLAB_Specification(L_L, Ch_L, h_L, s_L, C_L, None, A_L, B_L),
+        correlates)
 
 
 def XYZ_to_RGB_LLAB(XYZ):
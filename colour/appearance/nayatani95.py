@@ -8,6 +8,7 @@ Nayatani (1995) Colour Appearance Model
 Defines Nayatani (1995) colour appearance model objects:
 
 -   :class:`Nayatani95_Specification`
+-   :attr:`NAYATANI95_CORRELATES_DEPENDENCIES`
 -   :func:`XYZ_to_Nayatani95`
 
 See Also
@@ -31,6 +32,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.adaptation.cie1994 import (
     CIE1994_XYZ_TO_RGB_MATRIX,
     beta_1,
@@ -49,6 +53,7 @@ __status__ = 'Production'
 __all__ = ['NAYATANI95_XYZ_TO_RGB_MATRIX',
            'Nayatani95_ReferenceSpecification',
            'Nayatani95_Specification',
+           'NAYATANI95_CORRELATES_DEPENDENCIES',
            'XYZ_to_Nayatani95',
            'illuminance_to_luminance',
            'XYZ_to_RGB_Nayatani95',
@@ -149,12 +154,34 @@ class Nayatani95_Specification(
     """
 
 
+NAYATANI95_CORRELATES_DEPENDENCIES = {
+    'Lstar_P': ('achromatic_response',),
+    'C': ('Lstar_P', 's'),
+    'h': ('chromatic_responses',),
+    's': ('h', 'chromatic_responses'),
+    'Q': ('achromatic_response',),
+    'M': ('C', 'ideal_white_brightness'),
+    'Lstar_N': ('Q', 'ideal_white_brightness'),
+    'achromatic_response': (),
+    'chromatic_responses': (),
+    'ideal_white_brightness': ()}
+"""
+Nayatani (1995) colour appearance model correlates dependency graph mapping
+the correlates and intermediate terms to the terms they directly depend on:
+*chromatic_responses* are the tritanopic and protanopic responses. The
+stimulus and adapting field cone responses are always computed.
+
+NAYATANI95_CORRELATES_DEPENDENCIES : dict
+"""
+
+
 def XYZ_to_Nayatani95(XYZ,
                       XYZ_n,
                       Y_o,
                       E_o,
                       E_or,
-                      n=1):
+                      n=1,
+                      correlates=None):
     """
     Computes the Nayatani (1995) colour appearance model correlates.
 
@@ -175,11 +202,20 @@ def XYZ_to_Nayatani95(XYZ,
         [1000, 3000]
     n : numeric or array_like, optional
         Noise term used in the non linear chromatic adaptation model.
+    correlates : array_like, optional
+        **{'Lstar_P', 'C', 'h', 's', 'Q', 'M', 'Lstar_N'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Returns
     -------
     Nayatani95_Specification
-        Nayatani (1995) colour appearance model specification.
+        Nayatani (1995) colour appearance model specification, the
+        correlates that have not been requested are *None*.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
 
     Warning
     -------
@@ -189,6 +225,12 @@ def XYZ_to_Nayatani95(XYZ,
     -----
     -   Input *CIE XYZ* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_n* tristimulus values are in domain [0, 100].
+    -   Only the requested correlates and the terms they depend on as
+        described by :attr:`NAYATANI95_CORRELATES_DEPENDENCIES` attribute are
+        computed, e.g. the achromatic *Lightness* :math:`L_p^\\star` only
+        requires the achromatic response while the *colourfulness* :math:`M`
+        also requires the tritanopic and protanopic responses and the
+        *brightness* of ideal white.
 
     Examples
     --------
@@ -201,8 +243,16 @@ def XYZ_to_Nayatani95(XYZ,
     Nayatani95_Specification(Lstar_P=49.9998829..., C=0.0133550..., \
 h=257.5232268..., s=0.0133550..., Q=62.6266734..., M=0.0167262..., H=None, \
 HC=None, Lstar_N=50.0039154...)
+    >>> XYZ_to_Nayatani95(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_n, Y_o, E_o, E_or, correlates=('Lstar_P',))
+    Nayatani95_Specification(Lstar_P=49.9998829..., C=None, h=None, s=None, \
+Q=None, M=None, H=None, HC=None, Lstar_N=None)
     """
 
+    required = correlates_dependencies(
+        correlates, NAYATANI95_CORRELATES_DEPENDENCIES,
+        Nayatani95_Specification)
+
     Y_o = np.asarray(Y_o)
     E_o = np.asarray(E_o)
     E_or = np.asarray(E_or)
@@ -232,74 +282,80 @@ HC=None, Lstar_N=50.0039154...)
     eR = scaling_coefficient(R, xi)
     eG = scaling_coefficient(G, eta)
 
+    Lstar_P = C = theta = S = B_r = M = Lstar_N = None
+
     # Computing opponent colour dimensions.
-    # Computing achromatic response :math:`Q`:
-    Q_response = achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n)
-
-    # Computing tritanopic response :math:`t`:
-    t_response = tritanopic_response(RGB, bRGB_o, xez, n)
-
-    # Computing protanopic response :math:`p`:
-    p_response = protanopic_response(RGB, bRGB_o, xez, n)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *brightness* :math:`B_r`.
-    # -------------------------------------------------------------------------
-    B_r = brightness_correlate(bRGB_o, bL_or, Q_response)
-
-    # Computing *brightness* :math:`B_{rw}` of ideal white.
-    brightness_ideal_white = ideal_white_brightness_correlate(
-        bRGB_o, xez, bL_or, n)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of achromatic *Lightness* :math:`L_p^\star`.
-    # -------------------------------------------------------------------------
-    Lstar_P = (
-        achromatic_lightness_correlate(Q_response))
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of normalised achromatic *Lightness*
-    # :math:`L_n^\star`.
-    # -------------------------------------------------------------------------
-    Lstar_N = (
-        normalised_achromatic_lightness_correlate(B_r, brightness_ideal_white))
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* angle :math:`\\theta`.
-    # -------------------------------------------------------------------------
-    theta = hue_angle(p_response, t_response)
-    # TODO: Implement hue quadrature & composition computation.
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`S`.
-    # -------------------------------------------------------------------------
-    S_RG, S_YB = tsplit(saturation_components(
-        theta, bL_or, t_response, p_response))
-    S = saturation_correlate(S_RG, S_YB)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *chroma* :math:`C`.
-    # -------------------------------------------------------------------------
-    # C_RG, C_YB = tsplit(chroma_components(Lstar_P, S_RG, S_YB))
-    C = chroma_correlate(Lstar_P, S)
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *colourfulness* :math:`M`.
-    # -------------------------------------------------------------------------
-    # TODO: Investigate components usage.
-    # M_RG, M_YB = tsplit(colourfulness_components(C_RG, C_YB,
-    # brightness_ideal_white))
-    M = colourfulness_correlate(C, brightness_ideal_white)
-
-    return Nayatani95_Specification(Lstar_P,
-                                    C,
-                                    theta,
-                                    S,
-                                    B_r,
-                                    M,
-                                    None,
-                                    None,
-                                    Lstar_N)
+    if 'achromatic_response' in required:
+        # Computing achromatic response :math:`Q`:
+        Q_response = achromatic_response(RGB, bRGB_o, xez, bL_or, eR, eG, n)
+
+    if 'chromatic_responses' in required:
+        # Computing tritanopic response :math:`t`:
+        t_response = tritanopic_response(RGB, bRGB_o, xez, n)
+
+        # Computing protanopic response :math:`p`:
+        p_response = protanopic_response(RGB, bRGB_o, xez, n)
+
+    if 'Q' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *brightness* :math:`B_r`.
+        # ---------------------------------------------------------------------
+        B_r = brightness_correlate(bRGB_o, bL_or, Q_response)
+
+    if 'ideal_white_brightness' in required:
+        # Computing *brightness* :math:`B_{rw}` of ideal white.
+        brightness_ideal_white = ideal_white_brightness_correlate(
+            bRGB_o, xez, bL_or, n)
+
+    if 'Lstar_P' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of achromatic *Lightness* :math:`L_p^\star`.
+        # ---------------------------------------------------------------------
+        Lstar_P = achromatic_lightness_correlate(Q_response)
+
+    if 'Lstar_N' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of normalised achromatic *Lightness*
+        # :math:`L_n^\star`.
+        # ---------------------------------------------------------------------
+        Lstar_N = normalised_achromatic_lightness_correlate(
+            B_r, brightness_ideal_white)
+
+    if 'h' in required:
+        # ---------------------------------------------------------------------
+        # Computing the *hue* angle :math:`\\theta`.
+        # ---------------------------------------------------------------------
+        theta = hue_angle(p_response, t_response)
+        # TODO: Implement hue quadrature & composition computation.
+
+    if 's' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *saturation* :math:`S`.
+        # ---------------------------------------------------------------------
+        S_RG, S_YB = tsplit(saturation_components(
+            theta, bL_or, t_response, p_response))
+        S = saturation_correlate(S_RG, S_YB)
+
+    if 'C' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *chroma* :math:`C`.
+        # ---------------------------------------------------------------------
+        # C_RG, C_YB = tsplit(chroma_components(Lstar_P, S_RG, S_YB))
+        C = chroma_correlate(Lstar_P, S)
+
+    if 'M' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *colourfulness* :math:`M`.
+        # ---------------------------------------------------------------------
+        # TODO: Investigate components usage.
+        # M_RG, M_YB = tsplit(colourfulness_components(C_RG, C_YB,
+        # brightness_ideal_white))
+        M = colourfulness_correlate(C, brightness_ideal_white)
+
+    return specification_correlates(
+        Nayatani95_Specification(
+            Lstar_P, C, theta, S, B_r, M, None, None, Lstar_N),
+        correlates)
 
 
 def illuminance_to_luminance(E, Y_f):
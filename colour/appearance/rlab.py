@@ -10,6 +10,7 @@ Defines RLAB colour appearance model objects:
 -   :attr:`RLAB_VIEWING_CONDITIONS`
 -   :attr:`RLAB_D_FACTOR`
 -   :class:`RLAB_Specification`
+-   :attr:`RLAB_CORRELATES_DEPENDENCIES`
 -   :func:`XYZ_to_RLAB`
 
 See Also
@@ -32,6 +33,9 @@ from __future__ import division, unicode_literals
 import numpy as np
 from collections import namedtuple
 
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
 from colour.appearance.hunt import XYZ_TO_HPE_MATRIX, XYZ_to_rgb
 from colour.utilities import (
     CaseInsensitiveMapping,
@@ -52,6 +56,7 @@ __all__ = ['R_MATRIX',
            'RLAB_D_FACTOR',
            'RLAB_ReferenceSpecification',
            'RLAB_Specification',
+           'RLAB_CORRELATES_DEPENDENCIES',
            'XYZ_to_RLAB']
 
 R_MATRIX = np.array(
@@ -162,11 +167,28 @@ class RLAB_Specification(
     """
 
 
+RLAB_CORRELATES_DEPENDENCIES = {
+    'J': (),
+    'C': ('a', 'b'),
+    'h': ('a', 'b'),
+    's': ('J', 'C'),
+    'a': (),
+    'b': ()}
+"""
+RLAB colour appearance model correlates dependency graph mapping the
+correlates to the correlates they directly depend on. The reference
+tristimulus values are always computed.
+
+RLAB_CORRELATES_DEPENDENCIES : dict
+"""
+
+
 def XYZ_to_RLAB(XYZ,
                 XYZ_n,
                 Y_n,
                 sigma=RLAB_VIEWING_CONDITIONS.get('Average'),
-                D=RLAB_D_FACTOR.get('Hard Copy Images')):
+                D=RLAB_D_FACTOR.get('Hard Copy Images'),
+                correlates=None):
     """
     Computes the RLAB model color appearance correlates.
 
@@ -184,11 +206,20 @@ def XYZ_to_RLAB(XYZ,
         for reference.
     D : numeric or array_like, optional
         *Discounting-the-Illuminant* factor in domain [0, 1].
+    correlates : array_like, optional
+        **{'J', 'C', 'h', 's', 'a', 'b'}**,
+        Correlates to compute, all the correlates are computed if not given.
 
     Returns
     -------
     RLAB_Specification
-        RLAB colour appearance model specification.
+        RLAB colour appearance model specification, the correlates that have
+        not been requested are *None*.
+
+    Raises
+    ------
+    ValueError
+        If a correlate is not supported.
 
     Warning
     -------
@@ -198,6 +229,10 @@ def XYZ_to_RLAB(XYZ,
     -----
     -   Input *CIE XYZ* tristimulus values are in domain [0, 100].
     -   Input *CIE XYZ_n* tristimulus values are in domain [0, 100].
+    -   Only the requested correlates and the correlates they depend on as
+        described by :attr:`RLAB_CORRELATES_DEPENDENCIES` attribute are
+        computed, e.g. the *saturation* :math:`s^R` requires the *Lightness*
+        :math:`L^R` and *chroma* :math:`C^R`.
 
     Examples
     --------
@@ -209,8 +244,15 @@ def XYZ_to_RLAB(XYZ,
     >>> XYZ_to_RLAB(XYZ, XYZ_n, Y_n, sigma, D)  # doctest: +ELLIPSIS
     RLAB_Specification(J=49.8347069..., C=54.8700585..., h=286.4860208..., \
 s=1.1010410..., HC=None, a=15.5711021..., b=-52.6142956...)
+    >>> XYZ_to_RLAB(  # doctest: +ELLIPSIS
+    ...     XYZ, XYZ_n, Y_n, sigma, D, correlates=('J',))
+    RLAB_Specification(J=49.8347069..., C=None, h=None, s=None, HC=None, \
+a=None, b=None)
     """
 
+    required = correlates_dependencies(
+        correlates, RLAB_CORRELATES_DEPENDENCIES, RLAB_Specification)
+
     Y_n = np.asarray(Y_n)
     D = np.asarray(D)
     sigma = np.asarray(sigma)
@@ -229,30 +271,41 @@ s=1.1010410..., HC=None, a=15.5711021..., b=-52.6142956...)
     XYZ_ref = dot_vector(M, XYZ)
 
     X_ref, Y_ref, Z_ref = tsplit(XYZ_ref)
+    Y_ref_sigma = Y_ref ** sigma
+
+    LR = CR = hR = sR = aR = bR = None
 
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *Lightness* :math:`L^R`.
-    # -------------------------------------------------------------------------
-    LR = 100 * (Y_ref ** sigma)
+    if 'J' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *Lightness* :math:`L^R`.
+        # ---------------------------------------------------------------------
+        LR = 100 * Y_ref_sigma
 
     # Computing opponent colour dimensions :math:`a^R` and :math:`b^R`.
-    aR = 430 * ((X_ref ** sigma) - (Y_ref ** sigma))
-    bR = 170 * ((Y_ref ** sigma) - (Z_ref ** sigma))
-
-    # -------------------------------------------------------------------------
-    # Computing the *hue* angle :math:`h^R`.
-    # -------------------------------------------------------------------------
-    hR = np.degrees(np.arctan2(bR, aR)) % 360
-    # TODO: Implement hue composition computation.
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *chroma* :math:`C^R`.
-    # -------------------------------------------------------------------------
-    CR = np.sqrt((aR ** 2) + (bR ** 2))
-
-    # -------------------------------------------------------------------------
-    # Computing the correlate of *saturation* :math:`s^R`.
-    # -------------------------------------------------------------------------
-    sR = CR / LR
-
-    return RLAB_Specification(LR, CR, hR, sR, None, aR, bR)
+    if 'a' in required:
+        aR = 430 * ((X_ref ** sigma) - Y_ref_sigma)
+
+    if 'b' in required:
+        bR = 170 * (Y_ref_sigma - (Z_ref ** sigma))
+
+    if 'h' in required:
+        # ---------------------------------------------------------------------
+        # Computing the *hue* angle :math:`h^R`.
+        # ---------------------------------------------------------------------
+        hR = np.degrees(np.arctan2(bR, aR)) % 360
+        # TODO: Implement hue composition computation.
+
+    if 'C' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *chroma* :math:`C^R`.
+        # ---------------------------------------------------------------------
+        CR = np.sqrt((aR ** 2) + (bR ** 2))
+
+    if 's' in required:
+        # ---------------------------------------------------------------------
+        # Computing the correlate of *saturation* :math:`s^R`.
+        # ---------------------------------------------------------------------
+        sR = CR / LR
+
+    return specification_correlates(
+        RLAB_Specification(LR, CR, hR, sR, None, aR, bR), correlates)
@@ -37,7 +37,9 @@ class ColourAppearanceModelTest(object):
     output_specification_from_data
     check_specification_attribute
     check_model_consistency
+    check_specification_correlate
     test_forward_examples
+    test_correlates
     """
 
     FIXTURE_BASENAME = None
@@ -58,6 +60,12 @@ class ColourAppearanceModelTest(object):
     model test sub-class.
     """
 
+    CORRELATES_DEPENDENCIES = None
+    """
+    Correlates dependency graph of the colour appearance model being tested,
+    the correlates selection is not tested if *None*.
+    """
+
     @staticmethod
     def load_fixtures(file_name, fixtures_directory='fixtures'):
         """
@@ -92,7 +100,7 @@ class ColourAppearanceModelTest(object):
             return result
 
     @abstractmethod
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the colour appearance model output specification from given
         fixture data.
@@ -101,6 +109,8 @@ class ColourAppearanceModelTest(object):
         ----------
         data : list
             Tested colour appearance model fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -175,6 +185,33 @@ class ColourAppearanceModelTest(object):
                    specification_attr,
                    data[data_attr])
 
+    def check_specification_correlate(self, data, correlate):
+        """
+        Tests the colour appearance model specification computed with given
+        correlate selected.
+
+        Parameters
+        ----------
+        data : dict.
+            Fixture case data.
+        correlate : unicode.
+            Selected correlate.
+
+        Returns
+        -------
+        None
+        """
+
+        specification = self.output_specification_from_data(data)
+        selected = self.output_specification_from_data(data, (correlate,))
+
+        for field, value, selected_value in zip(
+                specification._fields, specification, selected):
+            if field == correlate:
+                np.testing.assert_equal(selected_value, value)
+            else:
+                assert selected_value is None
+
     def fixtures(self):
         """
         Returns the fixtures case for tested colour appearance model and
@@ -226,3 +263,26 @@ class ColourAppearanceModelTest(object):
 
         for test in self.check_model_consistency(data, self.OUTPUT_ATTRIBUTES):
             yield test
+
+    def test_correlates(self):
+        """
+        Tests the colour appearance model implementation correlates
+        selection.
+
+        Returns
+        -------
+        tuple
+        """
+
+        if self.CORRELATES_DEPENDENCIES is None:
+            return
+
+        data = self.fixtures()[0]
+        np.testing.assert_raises(ValueError,
+                                 self.output_specification_from_data,
+                                 data,
+                                 ('Undefined',))
+
+        for correlate in self.output_specification_from_data(data)._fields:
+            if correlate in self.CORRELATES_DEPENDENCIES:
+                yield self.check_specification_correlate, data, correlate
@@ -11,6 +11,7 @@ import numpy as np
 from itertools import permutations
 
 from colour.appearance import XYZ_to_ATD95
+from colour.appearance.atd95 import ATD95_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -32,6 +33,8 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'atd95.csv'
 
+    CORRELATES_DEPENDENCIES = ATD95_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {
         'H': 'h',
         'C': 'C',
@@ -43,7 +46,7 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
         'T_2': 'T_2',
         'D_2': 'D_2'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the ATD (1995) colour vision model output specification from
         given data.
@@ -52,6 +55,8 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -67,7 +72,8 @@ class TestATD95ColourAppearanceModel(ColourAppearanceModelTest):
                                      data['Y_02'],
                                      data['K_1'],
                                      data['K_2'],
-                                     data['sigma'])
+                                     data['sigma'],
+                                     correlates)
 
         return specification
 
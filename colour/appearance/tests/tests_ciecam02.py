@@ -8,12 +8,16 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (
     CIECAM02_InductionFactors,
+    CIECAM02_VIEWING_CONDITIONS,
+    CIECAM02_Model,
     XYZ_to_CIECAM02,
     CIECAM02_to_XYZ)
+from colour.appearance.ciecam02 import CIECAM02_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tsplit, tstack
 
@@ -25,7 +29,8 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['TestCIECAM02ColourAppearanceModelForward',
-           'TestCIECAM02ColourAppearanceModelReverse']
+           'TestCIECAM02ColourAppearanceModelReverse',
+           'TestCIECAM02_Model']
 
 
 class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
@@ -36,6 +41,8 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'ciecam02.csv'
 
+    CORRELATES_DEPENDENCIES = CIECAM02_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {'J': 'J',
                          'C': 'C',
                          'h': 'h',
@@ -44,7 +51,7 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
                          'M': 'M',
                          'H': 'H'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the CIECAM02 colour appearance model output specification
         from given data.
@@ -53,6 +60,8 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -70,7 +79,8 @@ class TestCIECAM02ColourAppearanceModelForward(ColourAppearanceModelTest):
                                         CIECAM02_InductionFactors(
                                             data['F'],
                                             data['c'],
-                                            data['N_c']))
+                                            data['N_c']),
+                                        correlates=correlates)
 
         return specification
 
@@ -189,3 +199,190 @@ class TestCIECAM02ColourAppearanceModelReverse(ColourAppearanceModelTest):
             Y_b = case[0]
             surround = CIECAM02_InductionFactors(case[0], case[0], case[0])
             CIECAM02_to_XYZ(J, C, h, XYZ_w, L_A, Y_b, surround)
+
+
+class TestCIECAM02_Model(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.CIECAM02_Model` class units
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w',
+                               'L_A',
+                               'Y_b',
+                               'surround',
+                               'discount_illuminant')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CIECAM02_Model))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward',
+                            'reverse',
+                            'forward_image',
+                            'reverse_image')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CIECAM02_Model))
+
+    def test_forward(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.forward`
+        method.
+        """
+
+        XYZ = np.reshape(
+            np.random.RandomState(4).random_sample(48) * 100, (4, 4, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        surround = CIECAM02_VIEWING_CONDITIONS['Dim']
+
+        model = CIECAM02_Model(XYZ_w, 318.31, 20.0, surround)
+        for _ in range(2):
+            np.testing.assert_almost_equal(
+                np.array(model.forward(XYZ)[:-1]),
+                np.array(XYZ_to_CIECAM02(
+                    XYZ, XYZ_w, 318.31, 20.0, surround)[:-1]),
+                decimal=7)
+
+        model.L_A = 64
+        model.discount_illuminant = True
+        np.testing.assert_almost_equal(
+            np.array(model.forward(XYZ)[:-1]),
+            np.array(XYZ_to_CIECAM02(
+                XYZ, XYZ_w, 64, 20.0, surround, True)[:-1]),
+            decimal=7)
+
+    def test_reverse(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.reverse`
+        method.
+        """
+
+        XYZ = np.reshape(
+            np.random.RandomState(4).random_sample(48) * 50 + 10, (4, 4, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+
+        model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification.J, specification.C, specification.h),
+            XYZ,
+            decimal=7)
+
+        model.XYZ_w = np.array([96.42, 100.00, 82.49])
+        model.Y_b = 18
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification.J, specification.C, specification.h),
+            XYZ,
+            decimal=7)
+        np.testing.assert_almost_equal(
+            model.reverse(specification.J, specification.C, specification.h),
+            CIECAM02_to_XYZ(specification.J,
+                            specification.C,
+                            specification.h,
+                            model.XYZ_w,
+                            318.31,
+                            18),
+            decimal=7)
+
+    def test_forward_image(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.forward_image`
+        method.
+        """
+
+        XYZ = np.reshape(
+            np.random.RandomState(4).random_sample(75) * 50 + 10, (5, 5, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+
+        model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+        specification = model.forward(XYZ)
+        for tile_size in (1, 7, 25, 64):
+            np.testing.assert_almost_equal(
+                np.array(model.forward_image(XYZ, tile_size=tile_size)[:-1]),
+                np.array(specification[:-1]),
+                decimal=7)
+
+        specification_image = model.forward_image(XYZ, ('J', 'h'))
+        np.testing.assert_almost_equal(
+            specification_image.J, specification.J, decimal=7)
+        np.testing.assert_almost_equal(
+            specification_image.h, specification.h, decimal=7)
+        for correlate in ('C', 's', 'Q', 'M', 'H', 'HC'):
+            self.assertIsNone(getattr(specification_image, correlate))
+
+        np.testing.assert_almost_equal(
+            model.forward_image(XYZ[0, 0], ('s',)).s,
+            specification.s[0, 0],
+            decimal=7)
+
+        model = CIECAM02_Model(np.tile(XYZ_w, (5, 5, 1)),
+                               np.tile(318.31, (5, 5)),
+                               np.tile(20.0, (5, 5)))
+        specification_image = model.forward_image(XYZ, ('M',))
+        np.testing.assert_almost_equal(
+            specification_image.M, specification.M, decimal=7)
+        self.assertIsNone(specification_image.J)
+
+    def test_raise_exception_forward_image(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.forward_image`
+        method raised exception.
+        """
+
+        model = CIECAM02_Model(np.array([95.05, 100.00, 108.88]), 318.31, 20)
+        self.assertRaises(ValueError,
+                          model.forward_image,
+                          np.array([19.01, 20.00, 21.78]),
+                          ('J', 'Z'))
+
+    def test_reverse_image(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.reverse_image`
+        method.
+        """
+
+        XYZ = np.reshape(
+            np.random.RandomState(4).random_sample(75) * 50 + 10, (5, 5, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+
+        model = CIECAM02_Model(
+            XYZ_w, 318.31, 20.0, CIECAM02_VIEWING_CONDITIONS['Dark'])
+        specification = model.forward(XYZ)
+        for tile_size in (1, 7, 25, 64):
+            np.testing.assert_almost_equal(
+                model.reverse_image(specification.J,
+                                    specification.C,
+                                    specification.h,
+                                    tile_size=tile_size),
+                XYZ,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            model.reverse_image(50, 0, 0),
+            model.reverse(50, 0, 0),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_image(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.forward_image`
+        and :func:`colour.appearance.ciecam02.CIECAM02_Model.reverse_image`
+        methods nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        model = CIECAM02_Model(np.array([95.05, 100.00, 108.88]), 318.31, 20)
+        model.forward_image(cases)
+        model.reverse_image(cases[..., 0], cases[..., 1], cases[..., 2])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.appearance.correlates` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from colour.appearance import RLAB_Specification
+from colour.appearance.correlates import (
+    correlates_dependencies,
+    specification_correlates)
+from colour.appearance.rlab import RLAB_CORRELATES_DEPENDENCIES
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestCorrelatesDependencies',
+           'TestSpecificationCorrelates']
+
+
+class TestCorrelatesDependencies(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.correlates.correlates_dependencies`
+    definition unit tests methods.
+    """
+
+    def test_correlates_dependencies(self):
+        """
+        Tests :func:`colour.appearance.correlates.correlates_dependencies`
+        definition.
+        """
+
+        self.assertSetEqual(
+            correlates_dependencies(
+                ('J',), RLAB_CORRELATES_DEPENDENCIES, RLAB_Specification),
+            set(('J',)))
+
+        self.assertSetEqual(
+            correlates_dependencies(
+                ('s',), RLAB_CORRELATES_DEPENDENCIES, RLAB_Specification),
+            set(('s', 'J', 'C', 'a', 'b')))
+
+        self.assertSetEqual(
+            correlates_dependencies(
+                None, RLAB_CORRELATES_DEPENDENCIES, RLAB_Specification),
+            set(('J', 'C', 'h', 's', 'a', 'b')))
+
+        self.assertSetEqual(
+            correlates_dependencies(
+                (), RLAB_CORRELATES_DEPENDENCIES, RLAB_Specification),
+            set())
+
+    def test_raise_exception_correlates_dependencies(self):
+        """
+        Tests :func:`colour.appearance.correlates.correlates_dependencies`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          correlates_dependencies,
+                          ('HC',),
+                          RLAB_CORRELATES_DEPENDENCIES,
+                          RLAB_Specification)
+
+        self.assertRaises(ValueError,
+                          correlates_dependencies,
+                          ('Undefined',),
+                          RLAB_CORRELATES_DEPENDENCIES,
+                          RLAB_Specification)
+
+
+class TestSpecificationCorrelates(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.correlates.specification_correlates`
+    definition unit tests methods.
+    """
+
+    def test_specification_correlates(self):
+        """
+        Tests :func:`colour.appearance.correlates.specification_correlates`
+        definition.
+        """
+
+        specification = RLAB_Specification(1, 2, 3, 4, None, 6, 7)
+
+        self.assertIs(specification_correlates(specification, None),
+                      specification)
+
+        self.assertTupleEqual(
+            specification_correlates(specification, ('C', 'b')),
+            RLAB_Specification(None, 2, None, None, None, None, 7))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,11 @@ from __future__ import division, unicode_literals
 import numpy as np
 from itertools import permutations
 
-from colour.appearance import Hunt_InductionFactors, XYZ_to_Hunt
+from colour.appearance import (
+    HUNT_VIEWING_CONDITIONS,
+    Hunt_InductionFactors,
+    XYZ_to_Hunt)
+from colour.appearance.hunt import HUNT_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -32,6 +36,8 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'hunt.csv'
 
+    CORRELATES_DEPENDENCIES = HUNT_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {'J': 'J',
                          'C_94': 'C',
                          'h_S': 'h',
@@ -39,7 +45,7 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
                          'Q': 'Q',
                          'M94': 'M'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the Hunt colour appearance model output specification
         from given data.
@@ -48,6 +54,8 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -66,10 +74,56 @@ class TestHuntColourAppearanceModel(ColourAppearanceModelTest):
                                     Hunt_InductionFactors(
                                         data['N_c'],
                                         data['N_b']),
-                                    CCT_w=data['T'])
+                                    CCT_w=data['T'],
+                                    correlates=correlates)
 
         return specification
 
+    @ignore_numpy_errors
+    def test_per_element_viewing_conditions(self):
+        """
+        Tests :func:`colour.appearance.hunt.XYZ_to_Hunt` definition with per
+        element viewing conditions.
+        """
+
+        random_state = np.random.RandomState(4)
+        shape = (3, 4)
+        XYZ = random_state.random_sample(shape + (3,)) * 50 + 5
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        XYZ_b = random_state.random_sample(shape + (3,)) * 20 + 80
+        XYZ_p = random_state.random_sample(shape + (3,)) * 20 + 70
+        L_A = random_state.random_sample(shape) * 300 + 10
+        CCT_w = random_state.random_sample(shape) * 3000 + 4000
+        p = random_state.random_sample(shape) * 0.4 - 0.2
+        S = XYZ[..., 1] * 0.9
+        S_w = np.full(shape, 100.0)
+        surround = HUNT_VIEWING_CONDITIONS['Normal Scenes']
+
+        for helson_judd_effect in (False, True):
+            for discount_illuminant in (False, True):
+                specification = XYZ_to_Hunt(
+                    XYZ, XYZ_w, XYZ_b, L_A, surround,
+                    CCT_w=CCT_w, XYZ_p=XYZ_p, p=p, S=S, S_w=S_w,
+                    helson_judd_effect=helson_judd_effect,
+                    discount_illuminant=discount_illuminant)
+
+                for index in np.ndindex(shape):
+                    element_specification = XYZ_to_Hunt(
+                        XYZ[index], XYZ_w, XYZ_b[index], L_A[index],
+                        surround,
+                        CCT_w=CCT_w[index], XYZ_p=XYZ_p[index], p=p[index],
+                        S=S[index], S_w=S_w[index],
+                        helson_judd_effect=helson_judd_effect,
+                        discount_illuminant=discount_illuminant)
+
+                    for value, element_value in zip(
+                            specification, element_specification):
+                        if value is None:
+                            continue
+
+                        np.testing.assert_almost_equal(
+                            value[index], element_value, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Hunt(self):
         """
@@ -17,6 +17,7 @@ except ImportError:
 from itertools import permutations
 
 from colour.appearance import LLAB_InductionFactors, XYZ_to_LLAB, llab
+from colour.appearance.llab import LLAB_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors
 
@@ -38,6 +39,8 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'llab.csv'
 
+    CORRELATES_DEPENDENCIES = LLAB_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {'L_L': 'J',
                          'Ch_L': 'C',
                          'h_L': 'h',
@@ -46,7 +49,7 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
                          'A_L': 'a',
                          'B_L': 'b'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the LLAB(l:c) colour appearance model output specification
         from given data.
@@ -55,6 +58,8 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -72,7 +77,8 @@ class TestLLABColourAppearanceModel(ColourAppearanceModelTest):
                                     LLAB_InductionFactors(1,
                                                           data['F_S'],
                                                           data['F_L'],
-                                                          data['F_C']))
+                                                          data['F_C']),
+                                    correlates)
 
         return specification
 
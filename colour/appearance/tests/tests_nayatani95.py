@@ -11,6 +11,7 @@ import numpy as np
 from itertools import permutations
 
 from colour.appearance import XYZ_to_Nayatani95
+from colour.appearance.nayatani95 import NAYATANI95_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -32,6 +33,8 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'nayatani95.csv'
 
+    CORRELATES_DEPENDENCIES = NAYATANI95_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {'Lstar_P': 'Lstar_P',
                          'C': 'C',
                          'theta': 'h',
@@ -40,7 +43,7 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
                          'M': 'M',
                          'Lstar_N': 'Lstar_N'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the Nayatani (1995) colour appearance model output
         specification from given data.
@@ -49,6 +52,8 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -63,7 +68,8 @@ class TestNayatani95ColourAppearanceModel(ColourAppearanceModelTest):
                                           XYZ_n,
                                           data['Y_o'],
                                           data['E_o'],
-                                          data['E_or'])
+                                          data['E_or'],
+                                          correlates=correlates)
 
         return specification
 
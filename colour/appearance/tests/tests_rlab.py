@@ -11,6 +11,7 @@ import numpy as np
 from itertools import permutations
 
 from colour.appearance import XYZ_to_RLAB
+from colour.appearance.rlab import RLAB_CORRELATES_DEPENDENCIES
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import ignore_numpy_errors, tstack
 
@@ -32,6 +33,8 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
 
     FIXTURE_BASENAME = 'rlab.csv'
 
+    CORRELATES_DEPENDENCIES = RLAB_CORRELATES_DEPENDENCIES
+
     OUTPUT_ATTRIBUTES = {'LR': 'J',
                          'CR': 'C',
                          'hR': 'h',
@@ -39,7 +42,7 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
                          'aR': 'a',
                          'bR': 'b'}
 
-    def output_specification_from_data(self, data):
+    def output_specification_from_data(self, data, correlates=None):
         """
         Returns the RLAB colour appearance model output specification
         from given data.
@@ -48,6 +51,8 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
         ----------
         data : list
             Fixture data.
+        correlates : array_like, optional
+            Correlates to compute.
 
         Returns
         -------
@@ -62,7 +67,8 @@ class TestRLABColourAppearanceModel(ColourAppearanceModelTest):
                                     XYZ_n,
                                     data['Y_n2'],
                                     data['sigma'],
-                                    data['D'])
+                                    data['D'],
+                                    correlates)
 
         return specification
 
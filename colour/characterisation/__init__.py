@@ -5,8 +5,17 @@ from __future__ import absolute_import
 
 from .dataset import *  # noqa
 from . import dataset
-from .fitting import first_order_colour_fit
+from .fitting import (
+    first_order_colour_fit,
+    POLYNOMIAL_EXPANSION_METHODS,
+    polynomial_expansion,
+    colour_fitting_matrix,
+    apply_colour_fitting_matrix)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['first_order_colour_fit']
+__all__ += ['first_order_colour_fit',
+            'POLYNOMIAL_EXPANSION_METHODS',
+            'polynomial_expansion',
+            'colour_fitting_matrix',
+            'apply_colour_fitting_matrix']
@@ -5,19 +5,41 @@
 Colour Fitting
 ==============
 
-Defines various objects for colour fitting, like colour matching two images.
+Defines various objects for colour fitting, like colour matching two images:
+
+-   :func:`first_order_colour_fit`
+-   :func:`polynomial_expansion`
+-   :func:`colour_fitting_matrix`
+-   :func:`apply_colour_fitting_matrix`
+
+The :func:`colour_fitting_matrix` definition solves stacked independent
+fits, e.g. one fit per image tile for a spatially varying correction, in a
+single vectorised least-squares computation, the colour arrays being
+optionally expanded with polynomial or root-polynomial terms beforehand.
 
 See Also
 --------
 `Colour Fitting IPython Notebook
 <http://nbviewer.ipython.org/github/colour-science/colour-ipython/\
 blob/master/notebooks/characterisation/fitting.ipynb>`_
+
+References
+----------
+.. [1]  Finlayson, G. D., Mackiewicz, M., & Hurlbert, A. (2015). Color
+        Correction Using Root-Polynomial Regression. IEEE Transactions on
+        Image Processing, 24(5), 1460–1470. doi:10.1109/TIP.2015.2405336
 """
 
 from __future__ import division, unicode_literals
 
 import numpy as np
 
+from colour.utilities import (
+    CaseInsensitiveMapping,
+    DEFAULT_TILE_SIZE,
+    tiled_apply,
+    tstack)
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -25,7 +47,14 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['first_order_colour_fit']
+__all__ = ['first_order_colour_fit',
+           'POLYNOMIAL_EXPANSION_DEGREES',
+           'polynomial_expansion_Finlayson2015',
+           'root_polynomial_expansion_Finlayson2015',
+           'POLYNOMIAL_EXPANSION_METHODS',
+           'polynomial_expansion',
+           'colour_fitting_matrix',
+           'apply_colour_fitting_matrix']
 
 
 def first_order_colour_fit(m_1, m_2):
@@ -108,3 +137,444 @@ def first_order_colour_fit(m_1, m_2):
     """
 
     return np.transpose(np.linalg.lstsq(m_1, m_2)[0])
+
+
+POLYNOMIAL_EXPANSION_DEGREES = (1, 2, 3)
+"""
+Supported polynomial and root-polynomial expansions degrees.
+
+POLYNOMIAL_EXPANSION_DEGREES : tuple
+"""
+
+
+def _expansion_degree(degree):
+    """
+    Checks that given expansion degree is supported.
+    """
+
+    if degree not in POLYNOMIAL_EXPANSION_DEGREES:
+        raise ValueError(
+            ('"{0}" expansion degree is not supported, it must be one of '
+             '{1}!').format(degree, POLYNOMIAL_EXPANSION_DEGREES))
+
+
+def polynomial_expansion_Finlayson2015(RGB, degree=2):
+    """
+    Performs the polynomial expansion of given *RGB* colourspace array
+    according to *Finlayson, Mackiewicz and Hurlbert (2015)* method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    degree : integer, optional
+        **{1, 2, 3}**,
+        Expansion degree.
+
+    Returns
+    -------
+    ndarray
+        Expanded *RGB* colourspace array of shape (..., 3), (..., 9) or
+        (..., 19) for respectively degree 1, 2 and 3.
+
+    Raises
+    ------
+    ValueError
+        If the expansion degree is not supported.
+
+    References
+    ----------
+    .. [1]  Finlayson, G. D., Mackiewicz, M., & Hurlbert, A. (2015). Color
+            Correction Using Root-Polynomial Regression. IEEE Transactions on
+            Image Processing, 24(5), 1460–1470. doi:10.1109/TIP.2015.2405336
+
+    Examples
+    --------
+    >>> RGB = np.array([1, 2, 4])
+    >>> polynomial_expansion_Finlayson2015(RGB)
+    array([  1.,   2.,   4.,   1.,   4.,  16.,   2.,   8.,   4.])
+    """
+
+    _expansion_degree(degree)
+
+    RGB = np.asarray(RGB, dtype=np.float_)
+    R, G, B = RGB[..., 0], RGB[..., 1], RGB[..., 2]
+
+    terms = [R, G, B]
+    if degree >= 2:
+        terms += [R ** 2, G ** 2, B ** 2, R * G, G * B, R * B]
+    if degree >= 3:
+        terms += [R ** 3, G ** 3, B ** 3,
+                  R * G ** 2, G * B ** 2, R * B ** 2,
+                  G * R ** 2, B * G ** 2, B * R ** 2,
+                  R * G * B]
+
+    return tstack(terms)
+
+
+def root_polynomial_expansion_Finlayson2015(RGB, degree=2):
+    """
+    Performs the root-polynomial expansion of given *RGB* colourspace array
+    according to *Finlayson, Mackiewicz and Hurlbert (2015)* method.
+
+    Unlike the polynomial expansion terms, the root-polynomial expansion
+    terms scale linearly with the exposure, the fitting is thus invariant to
+    the exposure changes.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    degree : integer, optional
+        **{1, 2, 3}**,
+        Expansion degree.
+
+    Returns
+    -------
+    ndarray
+        Expanded *RGB* colourspace array of shape (..., 3), (..., 6) or
+        (..., 13) for respectively degree 1, 2 and 3.
+
+    Raises
+    ------
+    ValueError
+        If the expansion degree is not supported.
+
+    Notes
+    -----
+    -   The roots of the negative products are computed on their absolute
+        values and their sign is preserved.
+
+    References
+    ----------
+    .. [2]  Finlayson, G. D., Mackiewicz, M., & Hurlbert, A. (2015). Color
+            Correction Using Root-Polynomial Regression. IEEE Transactions on
+            Image Processing, 24(5), 1460–1470. doi:10.1109/TIP.2015.2405336
+
+    Examples
+    --------
+    >>> RGB = np.array([1, 4, 16])
+    >>> root_polynomial_expansion_Finlayson2015(RGB)
+    array([  1.,   4.,  16.,   2.,   8.,   4.])
+    """
+
+    _expansion_degree(degree)
+
+    RGB = np.asarray(RGB, dtype=np.float_)
+    R, G, B = RGB[..., 0], RGB[..., 1], RGB[..., 2]
+
+    def root(a, n):
+        """
+        Returns the sign preserving :math:`n`-th root of given array.
+        """
+
+        return np.sign(a) * np.abs(a) ** (1 / n)
+
+    terms = [R, G, B]
+    if degree >= 2:
+        terms += [root(R * G, 2), root(G * B, 2), root(R * B, 2)]
+    if degree >= 3:
+        terms += [root(R * G ** 2, 3), root(G * B ** 2, 3),
+                  root(R * B ** 2, 3), root(G * R ** 2, 3),
+                  root(B * G ** 2, 3), root(B * R ** 2, 3),
+                  root(R * G * B, 3)]
+
+    return tstack(terms)
+
+
+POLYNOMIAL_EXPANSION_METHODS = CaseInsensitiveMapping(
+    {'Polynomial': polynomial_expansion_Finlayson2015,
+     'Root-Polynomial': root_polynomial_expansion_Finlayson2015})
+"""
+Supported *RGB* colourspace arrays expansion methods.
+
+POLYNOMIAL_EXPANSION_METHODS : CaseInsensitiveMapping
+    **{'Polynomial', 'Root-Polynomial'}**
+"""
+
+
+def polynomial_expansion(RGB, method='Polynomial', degree=1):
+    """
+    Performs the expansion of given *RGB* colourspace array using given
+    method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    method : unicode, optional
+        **{'Polynomial', 'Root-Polynomial'}**,
+        Expansion method.
+    degree : integer, optional
+        **{1, 2, 3}**,
+        Expansion degree, the degree 1 expansion of both methods is the
+        *RGB* colourspace array itself.
+
+    Returns
+    -------
+    ndarray
+        Expanded *RGB* colourspace array of shape (..., T) with :math:`T` the
+        expansion terms count.
+
+    Examples
+    --------
+    >>> RGB = np.array([1, 4, 16])
+    >>> polynomial_expansion(RGB, 'Root-Polynomial', degree=2)
+    array([  1.,   4.,  16.,   2.,   8.,   4.])
+    """
+
+    return POLYNOMIAL_EXPANSION_METHODS.get(method)(RGB, degree)
+
+
+def colour_fitting_matrix(m_1,
+                          m_2,
+                          method='Polynomial',
+                          degree=1,
+                          rcond=1e-15):
+    """
+    Computes the colour fitting matrix, or stacked colour fitting matrices,
+    fitting given :math:`m_1` colour array onto :math:`m_2` colour array
+    using multiple linear regression on the :math:`m_1` colour array
+    expansion.
+
+    The stacked fits, e.g. one fit per image tile for a spatially varying
+    correction, are independent and solved at once using the pseudo-inverse
+    of the stacked expanded :math:`m_1` colour arrays.
+
+    Parameters
+    ----------
+    m_1 : array_like
+        Test array :math:`m_1` of shape (n, 3) or stacked test arrays of
+        shape (..., n, 3) to fit onto array :math:`m_2`.
+    m_2 : array_like
+        Reference array of shape (n, 3) or stacked reference arrays of shape
+        (..., n, 3) the array :math:`m_1` will be colour fitted against.
+    method : unicode, optional
+        **{'Polynomial', 'Root-Polynomial'}**,
+        :math:`m_1` colour array expansion method.
+    degree : integer, optional
+        **{1, 2, 3}**,
+        :math:`m_1` colour array expansion degree.
+    rcond : numeric, optional
+        Cutoff for the small singular values of the expanded :math:`m_1`
+        colour arrays, relative to their largest singular value, the
+        rank-deficient fits, e.g. with fewer samples than expansion terms or
+        with degenerate samples, are thus solved in the least-norm sense.
+
+    Returns
+    -------
+    ndarray
+        Colour fitting matrix of shape (3, T) or stacked colour fitting
+        matrices of shape (..., 3, T) with :math:`T` the expansion terms
+        count.
+
+    Raises
+    ------
+    ValueError
+        If the :math:`m_1` and :math:`m_2` colour arrays shapes do not match.
+
+    Notes
+    -----
+    -   The degree 1 *Polynomial* fitting matrix is the
+        :func:`first_order_colour_fit` definition colour fitting matrix.
+    -   The :math:`m_1` and :math:`m_2` colour arrays leading dimensions are
+        broadcast against each other, e.g. a single test array can be fitted
+        onto stacked reference arrays.
+
+    Examples
+    --------
+    >>> m_1 = np.array([
+    ...     [0.17224810, 0.09170660, 0.06416938],
+    ...     [0.49189645, 0.27802050, 0.21923399],
+    ...     [0.10999751, 0.18658946, 0.29938611],
+    ...     [0.11666120, 0.14327905, 0.05713804],
+    ...     [0.18988879, 0.18227649, 0.36056247],
+    ...     [0.12501329, 0.42223442, 0.37027445],
+    ...     [0.64785606, 0.22396782, 0.03365194],
+    ...     [0.06761093, 0.11076896, 0.39779139],
+    ...     [0.49101797, 0.09448929, 0.11623839],
+    ...     [0.11622386, 0.04425753, 0.14469986],
+    ...     [0.36867946, 0.44545230, 0.06028681],
+    ...     [0.61632937, 0.32323906, 0.02437089],
+    ...     [0.03016472, 0.06153243, 0.29014596],
+    ...     [0.11103655, 0.30553067, 0.08149137],
+    ...     [0.41162190, 0.05816656, 0.04845934],
+    ...     [0.73339206, 0.53075188, 0.02475212],
+    ...     [0.47347718, 0.08834792, 0.30310315],
+    ...     [0.00000000, 0.25187016, 0.35062450],
+    ...     [0.76809639, 0.78486240, 0.77808297],
+    ...     [0.53822392, 0.54307997, 0.54710883],
+    ...     [0.35458526, 0.35318419, 0.35524431],
+    ...     [0.17976704, 0.18000531, 0.17991488],
+    ...     [0.09351417, 0.09510603, 0.09675027],
+    ...     [0.03405071, 0.03295077, 0.03702047]])
+    >>> m_2 = np.array([
+    ...     [0.15579559, 0.09715755, 0.07514556],
+    ...     [0.39113140, 0.25943419, 0.21266708],
+    ...     [0.12824821, 0.18463570, 0.31508023],
+    ...     [0.12028974, 0.13455659, 0.07408400],
+    ...     [0.19368988, 0.21158946, 0.37955964],
+    ...     [0.19957425, 0.36085439, 0.40678123],
+    ...     [0.48896605, 0.20691688, 0.05816533],
+    ...     [0.09775522, 0.16710693, 0.47147724],
+    ...     [0.39358649, 0.12233400, 0.10526425],
+    ...     [0.10780332, 0.07258529, 0.16151473],
+    ...     [0.27502671, 0.34705454, 0.09728099],
+    ...     [0.43980441, 0.26880559, 0.05430533],
+    ...     [0.05887212, 0.11126272, 0.38552469],
+    ...     [0.12705825, 0.25787860, 0.13566464],
+    ...     [0.35612929, 0.07933258, 0.05118732],
+    ...     [0.48131976, 0.42082843, 0.07120612],
+    ...     [0.34665585, 0.15170714, 0.24969804],
+    ...     [0.08261116, 0.24588716, 0.48707733],
+    ...     [0.66054904, 0.65941137, 0.66376412],
+    ...     [0.48051509, 0.47870296, 0.48230082],
+    ...     [0.33045354, 0.32904184, 0.33228886],
+    ...     [0.18001305, 0.17978567, 0.18004416],
+    ...     [0.10283975, 0.10424680, 0.10384975],
+    ...     [0.04742204, 0.04772203, 0.04914226]])
+    >>> colour_fitting_matrix(m_1, m_2)  # doctest: +ELLIPSIS
+    array([[ 0.6982266...,  0.0307162...,  0.1621042...],
+           [ 0.0689349...,  0.6757961...,  0.1643038...],
+           [-0.0631495...,  0.0921247...,  0.9713415...]])
+    >>> colour_fitting_matrix(m_1, m_2, 'Root-Polynomial', degree=2).shape
+    (3, 6)
+    """
+
+    m_1 = np.asarray(m_1, dtype=np.float_)
+    m_2 = np.asarray(m_2, dtype=np.float_)
+
+    if m_1.ndim < 2 or m_1.shape[-1] != 3 or m_1.shape[-2:] != m_2.shape[-2:]:
+        raise ValueError(
+            ('"m_1" colour array shape "{0}" is not compatible with "m_2" '
+             'colour array shape "{1}"!').format(m_1.shape, m_2.shape))
+
+    m_1_e = polynomial_expansion(m_1, method, degree)
+
+    # Stacked pseudo-inverses computed from the stacked singular values
+    # decompositions as :func:`numpy.linalg.pinv` definition does.
+    u, s, vh = np.linalg.svd(m_1_e, full_matrices=False)
+    cutoff = s > rcond * np.max(s, axis=-1)[..., np.newaxis]
+    s = np.where(cutoff, 1 / np.where(cutoff, s, 1), 0)
+
+    return np.einsum('...kt,...k,...kc->...ct',
+                     vh, s, np.einsum('...nk,...nc->...kc', u, m_2))
+
+
+def _apply_colour_fitting_matrix(RGB, M, method='Polynomial', degree=1):
+    """
+    Applies given colour fitting matrix of shape (3, T) to given *RGB*
+    colourspace array.
+    """
+
+    return np.dot(polynomial_expansion(RGB, method, degree), np.transpose(M))
+
+
+def _apply_colour_fitting_matrices(RGB, M, method='Polynomial', degree=1):
+    """
+    Applies given flattened per-pixel colour fitting matrices of shape
+    (..., 3 * T) to given *RGB* colourspace array.
+    """
+
+    return np.einsum('...ij,...j->...i',
+                     np.reshape(M, M.shape[:-1] + (3, -1)),
+                     polynomial_expansion(RGB, method, degree))
+
+
+def apply_colour_fitting_matrix(RGB,
+                                M,
+                                method='Polynomial',
+                                degree=1,
+                                tile_size=DEFAULT_TILE_SIZE,
+                                out=None,
+                                threads=1):
+    """
+    Applies given colour fitting matrix, or per-pixel colour fitting
+    matrices, to given *RGB* colourspace array.
+
+    The *RGB* colourspace array is expanded and fitted tile by tile: the
+    expanded array is never allocated at full size and the fitted array can
+    be written into a preallocated or memory-mapped array.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array of shape (..., 3).
+    M : array_like
+        Colour fitting matrix of shape (3, T) or per-pixel colour fitting
+        matrices of shape (..., 3, T) whose leading dimensions are broadcast
+        against the *RGB* colourspace array leading dimensions, e.g. as
+        returned by :func:`colour_fitting_matrix` definition.
+    method : unicode, optional
+        **{'Polynomial', 'Root-Polynomial'}**,
+        Expansion method the colour fitting matrix was computed with.
+    degree : integer, optional
+        **{1, 2, 3}**,
+        Expansion degree the colour fitting matrix was computed with.
+    tile_size : integer, optional
+        Tiles size in pixels.
+    out : ndarray, optional
+        Preallocated *C-contiguous* array of shape (..., 3) receiving the
+        fitted *RGB* colourspace array.
+    threads : integer, optional
+        Threads count processing the tiles concurrently.
+
+    Returns
+    -------
+    ndarray
+        Fitted *RGB* colourspace array, *out* argument if given.
+
+    Raises
+    ------
+    ValueError
+        If the colour fitting matrix terms count does not match the
+        expansion terms count.
+
+    Notes
+    -----
+    -   The per-pixel colour fitting matrices are only read tile by tile if
+        their leading shape matches the *RGB* colourspace array leading
+        shape or if they are broadcast along all the leading dimensions.
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.17224810, 0.09170660, 0.06416938],
+    ...                 [0.49189645, 0.27802050, 0.21923399]])
+    >>> M = np.array([[0.69822661, 0.03071629, 0.16210422],
+    ...               [0.06893499, 0.67579611, 0.16430385],
+    ...               [-0.06314955, 0.09212471, 0.97134152]])
+    >>> apply_colour_fitting_matrix(RGB, M)  # doctest: +ELLIPSIS
+    array([[ 0.1334872...,  0.0843921...,  0.0599014...],
+           [ 0.3875337...,  0.2578150...,  0.2075006...]])
+    """
+
+    RGB = np.asarray(RGB)
+    M = np.asarray(M, dtype=np.float_)
+
+    terms = polynomial_expansion(np.zeros(3), method, degree).shape[-1]
+    if M.ndim < 2 or M.shape[-2:] != (3, terms):
+        raise ValueError(
+            ('Colour fitting matrix shape "{0}" does not match "{1}" '
+             'expansion of degree "{2}" terms count "{3}"!').format(
+                M.shape, method, degree, terms))
+
+    if M.ndim == 2:
+        return tiled_apply(_apply_colour_fitting_matrix,
+                           RGB,
+                           tile_size=tile_size,
+                           out=out,
+                           threads=threads,
+                           M=M,
+                           method=method,
+                           degree=degree)
+    else:
+        M = np.reshape(M, M.shape[:-2] + (3 * terms,))
+        M = np.broadcast_arrays(M, RGB[..., 0:1])[0]
+
+        return tiled_apply(_apply_colour_fitting_matrices,
+                           (RGB, M),
+                           tile_size=tile_size,
+                           out=out,
+                           threads=threads,
+                           method=method,
+                           degree=degree)
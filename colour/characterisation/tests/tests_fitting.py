@@ -12,7 +12,11 @@ import unittest
 from itertools import permutations
 from numpy.linalg import LinAlgError
 
-from colour.characterisation.fitting import first_order_colour_fit
+from colour.characterisation.fitting import (
+    apply_colour_fitting_matrix,
+    colour_fitting_matrix,
+    first_order_colour_fit,
+    polynomial_expansion)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -24,7 +28,10 @@ __status__ = 'Production'
 
 __all__ = ['M1',
            'M2',
-           'TestFirstOrderColourFit']
+           'TestFirstOrderColourFit',
+           'TestPolynomialExpansion',
+           'TestColourFittingMatrix',
+           'TestApplyColourFittingMatrix']
 
 M1 = ((0.17224809530, 0.09170660377, 0.06416938454),
       (0.49189645050, 0.27802050110, 0.21923398970),
@@ -116,5 +123,238 @@ class TestFirstOrderColourFit(unittest.TestCase):
                 warning(traceback.format_exc())
 
 
+class TestPolynomialExpansion(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.polynomial_expansion`
+    definition unit tests methods.
+    """
+
+    def test_polynomial_expansion(self):
+        """
+        Tests :func:`colour.characterisation.fitting.polynomial_expansion`
+        definition.
+        """
+
+        RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB, 'Polynomial', 1),
+            RGB,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB, 'Polynomial', 3),
+            np.array([0.17224810, 0.09170660, 0.06416938,
+                      0.02966941, 0.00841010, 0.00411771,
+                      0.01579629, 0.00588476, 0.01105305,
+                      0.00511050, 0.00077126, 0.00026423,
+                      0.00144862, 0.00037762, 0.00070927,
+                      0.00272088, 0.00053967, 0.00190387,
+                      0.00101364]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB, 'Root-Polynomial', 3),
+            np.array([0.17224810, 0.09170660, 0.06416938,
+                      0.12568328, 0.07671216, 0.10513350,
+                      0.11314930, 0.07228010, 0.08918053,
+                      0.13960570, 0.08141598, 0.12394021,
+                      0.10045255]),
+            decimal=7)
+
+    def test_n_dimensional_polynomial_expansion(self):
+        """
+        Tests :func:`colour.characterisation.fitting.polynomial_expansion`
+        definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+        RGB_e = polynomial_expansion(RGB, 'Root-Polynomial', 2)
+
+        RGB = np.tile(RGB, (6, 1))
+        RGB_e = np.tile(RGB_e, (6, 1))
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB, 'Root-Polynomial', 2),
+            RGB_e,
+            decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        RGB_e = np.reshape(RGB_e, (2, 3, 6))
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB, 'Root-Polynomial', 2),
+            RGB_e,
+            decimal=7)
+
+    def test_raise_exception_polynomial_expansion(self):
+        """
+        Tests :func:`colour.characterisation.fitting.polynomial_expansion`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          polynomial_expansion,
+                          np.array([0.1, 0.2, 0.3]),
+                          'Polynomial',
+                          4)
+
+    def test_root_polynomial_expansion_exposure(self):
+        """
+        Tests :func:`colour.characterisation.fitting.polynomial_expansion`
+        definition *Root-Polynomial* method exposure invariance.
+        """
+
+        RGB = np.array([0.17224810, 0.09170660, 0.06416938])
+
+        np.testing.assert_almost_equal(
+            polynomial_expansion(RGB * 4, 'Root-Polynomial', 3),
+            polynomial_expansion(RGB, 'Root-Polynomial', 3) * 4,
+            decimal=7)
+
+
+class TestColourFittingMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.colour_fitting_matrix`
+    definition unit tests methods.
+    """
+
+    def test_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_fitting_matrix`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            colour_fitting_matrix(M1, M2),
+            first_order_colour_fit(M1, M2),
+            decimal=7)
+
+        for method in ('Polynomial', 'Root-Polynomial'):
+            for degree in (1, 2, 3):
+                m_1_e = polynomial_expansion(M1, method, degree)
+                np.testing.assert_almost_equal(
+                    colour_fitting_matrix(M1, M2, method, degree),
+                    np.transpose(np.linalg.lstsq(m_1_e, M2)[0]),
+                    decimal=7)
+
+    def test_n_dimensional_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_fitting_matrix`
+        definition n-dimensional arrays support.
+        """
+
+        m_1 = np.array(M1)
+        m_2 = np.array(M2)
+        m_1_s = np.array([m_1, m_1 * 0.5, m_1[::-1]])
+        m_2_s = np.array([m_2, m_2 ** 2, m_2[::-1]])
+
+        M = colour_fitting_matrix(m_1_s, m_2_s, 'Root-Polynomial', 2)
+        self.assertEqual(M.shape, (3, 3, 6))
+        for i in range(3):
+            np.testing.assert_almost_equal(
+                M[i],
+                colour_fitting_matrix(
+                    m_1_s[i], m_2_s[i], 'Root-Polynomial', 2),
+                decimal=7)
+
+        M = colour_fitting_matrix(m_1, np.reshape(m_2_s, (3, 1, 24, 3)))
+        self.assertEqual(M.shape, (3, 1, 3, 3))
+        np.testing.assert_almost_equal(
+            M[1, 0],
+            colour_fitting_matrix(m_1, m_2 ** 2),
+            decimal=7)
+
+    def test_rank_deficient_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_fitting_matrix`
+        definition rank-deficient fits support.
+        """
+
+        m_1 = np.array(M1)[:6]
+        m_2 = np.array(M2)[:6]
+
+        M = colour_fitting_matrix(m_1, m_2, 'Polynomial', 3)
+        np.testing.assert_almost_equal(
+            np.dot(polynomial_expansion(m_1, 'Polynomial', 3),
+                   np.transpose(M)),
+            m_2,
+            decimal=7)
+
+    def test_raise_exception_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.colour_fitting_matrix`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          colour_fitting_matrix,
+                          M1,
+                          M2[:12])
+
+
+class TestApplyColourFittingMatrix(unittest.TestCase):
+    """
+    Defines :func:`colour.characterisation.fitting.\
+apply_colour_fitting_matrix` definition unit tests methods.
+    """
+
+    def test_apply_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+apply_colour_fitting_matrix` definition.
+        """
+
+        M = colour_fitting_matrix(M1, M2, 'Root-Polynomial', 2)
+        RGB = np.reshape(np.tile(M1, (4, 1)), (8, 12, 3))
+        RGB_f = np.dot(polynomial_expansion(RGB, 'Root-Polynomial', 2),
+                       np.transpose(M))
+
+        np.testing.assert_almost_equal(
+            apply_colour_fitting_matrix(
+                RGB, M, 'Root-Polynomial', 2, tile_size=7),
+            RGB_f,
+            decimal=7)
+
+        out = np.empty(RGB.shape)
+        self.assertIs(
+            apply_colour_fitting_matrix(
+                RGB, M, 'Root-Polynomial', 2, tile_size=7, out=out,
+                threads=2),
+            out)
+        np.testing.assert_almost_equal(out, RGB_f, decimal=7)
+
+    def test_per_pixel_apply_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+apply_colour_fitting_matrix` definition per-pixel colour fitting matrices
+        support.
+        """
+
+        RGB = np.reshape(np.tile(M1, (4, 1)), (8, 12, 3))
+        M = np.array([colour_fitting_matrix(M1, M2),
+                      colour_fitting_matrix(M2, M1)])
+        M = np.reshape(np.repeat(M, 4, axis=0), (8, 1, 3, 3))
+
+        RGB_f = apply_colour_fitting_matrix(RGB, M, tile_size=7)
+        np.testing.assert_almost_equal(
+            RGB_f[:4],
+            apply_colour_fitting_matrix(RGB[:4], M[0, 0]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            RGB_f[4:],
+            apply_colour_fitting_matrix(RGB[4:], M[4, 0]),
+            decimal=7)
+
+    def test_raise_exception_apply_colour_fitting_matrix(self):
+        """
+        Tests :func:`colour.characterisation.fitting.\
+apply_colour_fitting_matrix` definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          apply_colour_fitting_matrix,
+                          np.array([0.1, 0.2, 0.3]),
+                          colour_fitting_matrix(M1, M2, 'Polynomial', 2))
+
+
 if __name__ == '__main__':
     unittest.main()
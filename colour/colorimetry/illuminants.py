@@ -7,6 +7,7 @@ Illuminants
 
 Defines *CIE* illuminants computation related objects:
 
+-   :func:`D_illuminant_weights`
 -   :func:`D_illuminant_relative_spd`
 -   :func:`CIE_standard_illuminant_A_function`
 
@@ -26,6 +27,7 @@ import numpy as np
 from colour.colorimetry import (
     D_ILLUMINANTS_S_SPDS,
     SpectralPowerDistribution)
+from colour.utilities import tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -34,10 +36,47 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['D_illuminant_relative_spd',
+__all__ = ['D_illuminant_weights',
+           'D_illuminant_relative_spd',
            'CIE_standard_illuminant_A_function']
 
 
+def D_illuminant_weights(xy):
+    """
+    Returns the *CIE Standard Illuminant D Series* :math:`S_0`, :math:`S_1`
+    and :math:`S_2` basis functions weights, i.e. :math:`1`, :math:`M_1` and
+    :math:`M_2`, of given *xy* chromaticity coordinates.
+
+    Parameters
+    ----------
+    xy : array_like
+        *xy* chromaticity coordinates.
+
+    Returns
+    -------
+    ndarray
+        *CIE Standard Illuminant D Series* basis functions weights.
+
+    See Also
+    --------
+    D_illuminant_relative_spd
+
+    Examples
+    --------
+    >>> xy = np.array([0.34567, 0.35850])
+    >>> D_illuminant_weights(xy)  # doctest: +ELLIPSIS
+    array([ 1.        , -1.0351003...,  0.3852789...])
+    """
+
+    x, y = tsplit(xy)
+
+    M = 0.0241 + 0.2562 * x - 0.7341 * y
+    M1 = (-1.3515 - 1.7703 * x + 5.9114 * y) / M
+    M2 = (0.0300 - 31.4424 * x + 30.0717 * y) / M
+
+    return tstack((np.ones(M.shape), M1, M2))
+
+
 def D_illuminant_relative_spd(xy):
     """
     Returns the relative spectral power distribution of given
@@ -73,9 +112,7 @@ def D_illuminant_relative_spd(xy):
 'CIE Standard Illuminant D Series', (300.0, 830.0, 10.0))
     """
 
-    M = 0.0241 + 0.2562 * xy[0] - 0.7341 * xy[1]
-    M1 = (-1.3515 - 1.7703 * xy[0] + 5.9114 * xy[1]) / M
-    M2 = (0.0300 - 31.4424 * xy[0] + 30.0717 * xy[1]) / M
+    _M, M1, M2 = D_illuminant_weights(xy)
 
     distribution = {}
     for i in D_ILLUMINANTS_S_SPDS.get('S0').shape:
@@ -1094,9 +1094,8 @@ class SpectralPowerDistribution(object):
                 '"{0}" type is not supported for indexing!'.format(
                     type(wavelength)))
 
-        values = np.resize(value, wavelengths.shape)
-        for i in range(len(wavelengths)):
-            self._data.__setitem__(wavelengths[i], values[i])
+        self._data.set_items(wavelengths,
+                             np.resize(value, wavelengths.shape))
 
     def __iter__(self):
         """
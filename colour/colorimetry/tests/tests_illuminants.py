@@ -11,6 +11,8 @@ import numpy as np
 import unittest
 
 from colour.colorimetry import (
+    D_ILLUMINANTS_S_SPDS,
+    D_illuminant_weights,
     D_illuminant_relative_spd,
     CIE_standard_illuminant_A_function)
 
@@ -23,6 +25,7 @@ __status__ = 'Production'
 
 __all__ = ['D60_SPD_DATA',
            'A_DATA',
+           'TestD_illuminantWeights',
            'TestD_illuminantRelativeSpd',
            'TestCIEStandardIlluminantAFunction']
 
@@ -179,6 +182,67 @@ A_DATA = np.array([
     259.86488167205436639051])
 
 
+class TestD_illuminantWeights(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.illuminants.D_illuminant_weights`
+    definition unit tests methods.
+    """
+
+    def test_D_illuminant_weights(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_weights`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            D_illuminant_weights(np.array([0.34567, 0.35850])),
+            np.array([1.00000000, -1.03510036, 0.38527899]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            D_illuminant_weights(np.array([0.31271, 0.32902])),
+            np.array([1.00000000, -0.29041003, -0.66880024]),
+            decimal=7)
+
+    def test_n_dimensional_D_illuminant_weights(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_weights`
+        definition n-dimensional arrays support.
+        """
+
+        xy = np.array([0.34567, 0.35850])
+        M = np.array([1.00000000, -1.03510036, 0.38527899])
+        np.testing.assert_almost_equal(
+            D_illuminant_weights(xy), M, decimal=7)
+
+        xy = np.tile(xy, (6, 1))
+        M = np.tile(M, (6, 1))
+        np.testing.assert_almost_equal(
+            D_illuminant_weights(xy), M, decimal=7)
+
+        xy = np.reshape(xy, (2, 3, 2))
+        M = np.reshape(M, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            D_illuminant_weights(xy), M, decimal=7)
+
+    def test_D_illuminant_relative_spd_weights(self):
+        """
+        Tests :func:`colour.colorimetry.illuminants.D_illuminant_weights`
+        definition consistency with
+        :func:`colour.colorimetry.illuminants.D_illuminant_relative_spd`
+        definition.
+        """
+
+        xy = np.array([0.32168, 0.33767])
+        spd = D_illuminant_relative_spd(xy)
+        np.testing.assert_almost_equal(
+            np.dot(D_illuminant_weights(xy),
+                   [D_ILLUMINANTS_S_SPDS.get(name).values
+                    for name in ('S0', 'S1', 'S2')]),
+            spd.values,
+            decimal=7)
+
+
 class TestD_illuminantRelativeSpd(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.illuminants.D_illuminant_relative_spd`
@@ -11,7 +11,8 @@ from .prediction import (
     corresponding_chromaticities_prediction_Fairchild1990,
     corresponding_chromaticities_prediction_VonKries,
     CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
-    corresponding_chromaticities_prediction)
+    corresponding_chromaticities_prediction,
+    corresponding_chromaticities_predictions)
 
 __all__ = []
 __all__ += dataset.__all__
@@ -20,4 +21,5 @@ __all__ += ['corresponding_chromaticities_prediction_CIE1994',
             'corresponding_chromaticities_prediction_Fairchild1990',
             'corresponding_chromaticities_prediction_VonKries',
             'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-            'corresponding_chromaticities_prediction']
+            'corresponding_chromaticities_prediction',
+            'corresponding_chromaticities_predictions']
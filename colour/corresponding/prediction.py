@@ -5,7 +5,14 @@
 Corresponding Chromaticities Prediction
 =======================================
 
-Defines objects to compute corresponding chromaticities prediction.
+Defines objects to compute corresponding chromaticities prediction:
+
+-   :func:`corresponding_chromaticities_prediction_CIE1994`
+-   :func:`corresponding_chromaticities_prediction_CMCCAT2000`
+-   :func:`corresponding_chromaticities_prediction_Fairchild1990`
+-   :func:`corresponding_chromaticities_prediction_VonKries`
+-   :func:`corresponding_chromaticities_prediction`
+-   :func:`corresponding_chromaticities_predictions`
 
 See Also
 --------
@@ -23,9 +30,14 @@ fulltext.cfm?uri=josaa-4-6-1115&id=2783
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 from collections import namedtuple
 
 from colour.adaptation import (
+    CHROMATIC_ADAPTATION_TRANSFORMS,
+    CIE1994_Adapter,
+    CMCCAT2000_Adapter,
+    Fairchild1990_Adapter,
     chromatic_adaptation_CIE1994,
     chromatic_adaptation_CMCCAT2000,
     chromatic_adaptation_Fairchild1990,
@@ -39,7 +51,11 @@ from colour.models import (
     XYZ_to_Luv,
     XYZ_to_xy,
     xy_to_XYZ)
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import (
+    CaseInsensitiveMapping,
+    is_string,
+    tsplit,
+    tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -49,12 +65,21 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['CorrespondingChromaticitiesPrediction',
+           'CorrespondingChromaticitiesPredictions',
            'corresponding_chromaticities_prediction_CIE1994',
            'corresponding_chromaticities_prediction_CMCCAT2000',
            'corresponding_chromaticities_prediction_Fairchild1990',
            'corresponding_chromaticities_prediction_VonKries',
            'CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS',
-           'corresponding_chromaticities_prediction']
+           'corresponding_chromaticities_prediction',
+           'corresponding_chromaticities_predictions']
+
+_BRENEMAN_EXPERIMENTS_ARRAYS_CACHE = {}
+"""
+Cache for the *Breneman (1987)* experiments stacked arrays.
+
+_BRENEMAN_EXPERIMENTS_ARRAYS_CACHE : dict
+"""
 
 
 class CorrespondingChromaticitiesPrediction(
@@ -76,6 +101,43 @@ class CorrespondingChromaticitiesPrediction(
     """
 
 
+class CorrespondingChromaticitiesPredictions(
+    namedtuple('CorrespondingChromaticitiesPredictions',
+               ('models', 'experiments', 'uvp_t', 'uvp_m', 'uvp_p',
+                'delta_uvp', 'mean', 'rms', 'maximum'))):
+    """
+    Defines the stacked predictions of various chromatic adaptation models
+    for various *Breneman (1987)* experiments.
+
+    The experiments do not have the same test colours count, the arrays are
+    padded with *nan* up to the largest count.
+
+    Parameters
+    ----------
+    models : tuple
+        Chromatic adaptation models names, a *Von Kries* model name is
+        suffixed with its chromatic adaptation transform name or index.
+    experiments : tuple
+        *Breneman (1987)* experiments numbers.
+    uvp_t : ndarray, (E, S, 2)
+        Chromaticity coordinates :math:`uv_t^p` of test colours.
+    uvp_m : ndarray, (E, S, 2)
+        Chromaticity coordinates :math:`uv_m^p` of matching colours.
+    uvp_p : ndarray, (M, E, S, 2)
+        Chromaticity coordinates :math:`uv_p^p` of predicted colours.
+    delta_uvp : ndarray, (M, E, S)
+        Euclidean distances between the matching and predicted colours
+        chromaticity coordinates.
+    mean : ndarray, (M,)
+        Mean distance of each model over the experiments test colours.
+    rms : ndarray, (M,)
+        Root mean square distance of each model over the experiments test
+        colours.
+    maximum : ndarray, (M,)
+        Maximum distance of each model over the experiments test colours.
+    """
+
+
 def corresponding_chromaticities_prediction_CIE1994(experiment=1, **kwargs):
     """
     Returns the corresponding chromaticities prediction for CIE 1994
@@ -391,3 +453,202 @@ def corresponding_chromaticities_prediction(experiment=1,
 
     return CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS.get(model)(
         experiment, **kwargs)
+
+
+def _XYZ_to_uvp(XYZ):
+    """
+    Returns the *CIE 1976 UCS* chromaticity coordinates :math:`uv^p` of given
+    *CIE XYZ* tristimulus values.
+    """
+
+    X, Y, Z = tsplit(XYZ)
+
+    d = X + 15 * Y + 3 * Z
+
+    return tstack((4 * X / d, 9 * Y / d))
+
+
+def _breneman_experiments_arrays(experiments):
+    """
+    Returns the stacked arrays of given *Breneman (1987)* experiments, the
+    test colours arrays are padded with *nan* up to the largest test colours
+    count.
+    """
+
+    experiments = tuple(experiments)
+
+    arrays = _BRENEMAN_EXPERIMENTS_ARRAYS_CACHE.get(experiments)
+    if arrays is not None:
+        return arrays
+
+    results, Y = [], []
+    for experiment in experiments:
+        primaries = BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES.get(
+            experiment)
+        if primaries is None:
+            raise ValueError(
+                ('"{0}" experiment is not supported, supported experiments '
+                 'are: "{1}"!').format(
+                    experiment,
+                    sorted(BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES)))
+
+        results.append(BRENEMAN_EXPERIMENTS.get(experiment))
+        Y.append(primaries.Y)
+
+    count = max(len(experiment_results) for experiment_results in results)
+    uvp = np.full((len(experiments), count, 2, 2), np.nan)
+    for i, experiment_results in enumerate(results):
+        for j, result in enumerate(experiment_results):
+            uvp[i, j] = (result.uvp_t, result.uvp_m)
+
+    # The first result of each experiment is the illuminant.
+    uvp_w, uvp = uvp[:, 0:1], uvp[:, 1:]
+    xy_w = Luv_uv_to_xy(uvp_w[..., 0, :])
+    xy_wr = Luv_uv_to_xy(uvp_w[..., 1, :])
+
+    arrays = {'uvp_t': uvp[..., 0, :],
+              'uvp_m': uvp[..., 1, :],
+              'XYZ_1': xy_to_XYZ(Luv_uv_to_xy(uvp[..., 0, :])),
+              'xy_w': xy_w,
+              'xy_wr': xy_wr,
+              'XYZ_w': xy_to_XYZ(xy_w),
+              'XYZ_wr': xy_to_XYZ(xy_wr),
+              'Y': np.asarray(Y, dtype=np.float_)[:, np.newaxis]}
+
+    for array in arrays.values():
+        array.setflags(write=False)
+
+    _BRENEMAN_EXPERIMENTS_ARRAYS_CACHE[experiments] = arrays
+
+    return arrays
+
+
+def corresponding_chromaticities_predictions(
+        experiments=None,
+        models=('CIE 1994', 'CMCCAT2000', 'Fairchild 1990', 'Von Kries'),
+        transforms=None):
+    """
+    Returns the corresponding chromaticities predictions of given chromatic
+    adaptation models for given *Breneman (1987)* experiments computed at once
+    along with their error statistics.
+
+    Parameters
+    ----------
+    experiments : array_like, optional
+        {1, 2, 3, 4, 6, 8, 9, 11, 12}
+        *Breneman (1987)* experiments numbers, default to all the supported
+        experiments.
+    models : array_like, optional
+        {'CIE 1994', 'CMCCAT2000', 'Fairchild 1990', 'Von Kries'}
+        Chromatic adaptation models.
+    transforms : array_like, optional
+        Chromatic adaptation transforms of the *Von Kries* model, either
+        names of :attr:`colour.CHROMATIC_ADAPTATION_TRANSFORMS` attribute
+        transforms or arbitrary matrices of shape (3, 3), e.g. an array of
+        shape (T, 3, 3) of candidate matrices, default to all the
+        :attr:`colour.CHROMATIC_ADAPTATION_TRANSFORMS` attribute transforms.
+
+    Returns
+    -------
+    CorrespondingChromaticitiesPredictions
+        Stacked corresponding chromaticities predictions.
+
+    Raises
+    ------
+    ValueError
+        If an experiment or a chromatic adaptation model is not supported.
+
+    Notes
+    -----
+    -   The *Breneman (1987)* experiments arrays are computed once and
+        cached, evaluating candidate matrices of shape (T, 3, 3) with the
+        *Von Kries* model only is suitable for use within an optimiser
+        fitting a chromatic adaptation transform.
+    -   The predictions match the definitions of
+        :attr:`CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS` attribute.
+
+    Examples
+    --------
+    >>> predictions = corresponding_chromaticities_predictions(
+    ...     models=('Von Kries',), transforms=('CAT02', 'Bradford'))
+    >>> predictions.models
+    ('Von Kries - CAT02', 'Von Kries - Bradford')
+    >>> predictions.uvp_p.shape
+    (2, 9, 19, 2)
+    >>> predictions.mean  # doctest: +ELLIPSIS
+    array([ 0.0191935...,  0.0209018...])
+    """
+
+    if experiments is None:
+        experiments = sorted(BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES)
+
+    arrays = _breneman_experiments_arrays(experiments)
+    XYZ_1 = arrays['XYZ_1']
+    XYZ_w, XYZ_wr = arrays['XYZ_w'], arrays['XYZ_wr']
+    Y = arrays['Y']
+
+    names, XYZ_2 = [], []
+    for model in models:
+        key = CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS.get(model)
+        if key is corresponding_chromaticities_prediction_CIE1994:
+            # :math:`Y_o` is set to an arbitrary value in domain [18, 100].
+            adapter = CIE1994_Adapter(
+                arrays['xy_w'], arrays['xy_wr'], 18, Y, Y)
+            names.append('CIE 1994')
+            XYZ_2.append(adapter.forward(XYZ_1 * 100)[np.newaxis])
+        elif key is corresponding_chromaticities_prediction_CMCCAT2000:
+            adapter = CMCCAT2000_Adapter(XYZ_w * 100, XYZ_wr * 100, Y, Y)
+            names.append('CMCCAT2000')
+            XYZ_2.append(adapter.forward(XYZ_1 * 100)[np.newaxis])
+        elif key is corresponding_chromaticities_prediction_Fairchild1990:
+            adapter = Fairchild1990_Adapter(XYZ_w * 100, XYZ_wr * 100, Y)
+            names.append('Fairchild 1990')
+            XYZ_2.append(adapter.forward(XYZ_1 * 100)[np.newaxis])
+        elif key is corresponding_chromaticities_prediction_VonKries:
+            if transforms is None:
+                transforms = sorted(CHROMATIC_ADAPTATION_TRANSFORMS)
+
+            if isinstance(transforms, np.ndarray):
+                M = np.reshape(transforms, (-1, 3, 3))
+                labels = range(M.shape[0])
+            else:
+                M = np.array([CHROMATIC_ADAPTATION_TRANSFORMS.get(transform)
+                              if is_string(transform) else
+                              transform
+                              for transform in transforms], dtype=np.float_)
+                labels = [transform
+                          if is_string(transform) else index
+                          for index, transform in enumerate(transforms)]
+
+            names.extend('Von Kries - {0}'.format(label) for label in labels)
+
+            # Scaling the rows of the transforms matrices is equivalent to
+            # multiplying them by the diagonal matrices of the cone responses
+            # ratios.
+            D = (np.einsum('tij,ej->tei', M, XYZ_wr[:, 0]) /
+                 np.einsum('tij,ej->tei', M, XYZ_w[:, 0]))
+            cat = np.einsum('tij,tej,tjk->teik', np.linalg.inv(M), D, M)
+            XYZ_2.append(np.einsum('teij,esj->tesi', cat, XYZ_1))
+        else:
+            raise ValueError(
+                ('"{0}" chromatic adaptation model is not supported, '
+                 'supported models are: "{1}"!').format(
+                    model,
+                    sorted(CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS)))
+
+    uvp_m = arrays['uvp_m']
+    uvp_p = _XYZ_to_uvp(np.concatenate(XYZ_2))
+    delta_uvp = np.linalg.norm(uvp_p - uvp_m, axis=-1)
+
+    valid = delta_uvp[:, ~np.isnan(uvp_m[..., 0])]
+
+    return CorrespondingChromaticitiesPredictions(
+        tuple(names),
+        tuple(experiments),
+        arrays['uvp_t'],
+        uvp_m,
+        uvp_p,
+        delta_uvp,
+        np.mean(valid, axis=-1),
+        np.sqrt(np.mean(valid ** 2, axis=-1)),
+        np.max(valid, axis=-1))
@@ -10,11 +10,13 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
+from colour.adaptation import CHROMATIC_ADAPTATION_TRANSFORMS
 from colour.corresponding.prediction import (
     corresponding_chromaticities_prediction_VonKries,
     corresponding_chromaticities_prediction_CIE1994,
     corresponding_chromaticities_prediction_CMCCAT2000,
-    corresponding_chromaticities_prediction_Fairchild1990)
+    corresponding_chromaticities_prediction_Fairchild1990,
+    corresponding_chromaticities_predictions)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -30,7 +32,8 @@ __all__ = ['VONKRIES_PREDICTION_DATA',
            'TestCorrespondingChromaticitiesPredictionVonKries',
            'TestCorrespondingChromaticitiesPredictionCIE1994',
            'TestCorrespondingChromaticitiesPredictionCMCCAT2000',
-           'TestCorrespondingChromaticitiesPredictionFairchild1990']
+           'TestCorrespondingChromaticitiesPredictionFairchild1990',
+           'TestCorrespondingChromaticitiesPredictions']
 
 VONKRIES_PREDICTION_DATA = (
     ((0.199, 0.487), (0.19999423529586305, 0.47059613254211008)),
@@ -172,3 +175,91 @@ corresponding_chromaticities_prediction_Fairchild1990` definition.
                  corresponding_chromaticities_prediction_Fairchild1990()]),
             FAIRCHILD1990_PREDICTION_DATA,
             decimal=7)
+
+
+class TestCorrespondingChromaticitiesPredictions(unittest.TestCase):
+    """
+    Defines :func:`colour.corresponding.prediction.\
+corresponding_chromaticities_predictions` definition unit tests methods.
+    """
+
+    def test_corresponding_chromaticities_predictions(self):
+        """
+        Tests :func:`colour.corresponding.prediction.\
+corresponding_chromaticities_predictions` definition.
+        """
+
+        predictions = corresponding_chromaticities_predictions(
+            experiments=(1, 9),
+            transforms=('CAT02', 'Bradford'))
+
+        self.assertTupleEqual(
+            predictions.models,
+            ('CIE 1994', 'CMCCAT2000', 'Fairchild 1990',
+             'Von Kries - CAT02', 'Von Kries - Bradford'))
+        self.assertTupleEqual(predictions.uvp_p.shape, (5, 2, 19, 2))
+
+        for i, data in enumerate((CIE1994_PREDICTION_DATA,
+                                  CMCCAT2000_PREDICTION_DATA,
+                                  FAIRCHILD1990_PREDICTION_DATA,
+                                  VONKRIES_PREDICTION_DATA)):
+            np.testing.assert_almost_equal(
+                np.transpose(np.array([predictions.uvp_m[0, :12],
+                                       predictions.uvp_p[i, 0, :12]]),
+                             (1, 0, 2)),
+                data,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            predictions.uvp_p[4, 1, :19],
+            np.array([p.uvp_p for p in
+                      corresponding_chromaticities_prediction_VonKries(
+                          9, 'Bradford')]),
+            decimal=7)
+
+        self.assertTrue(np.all(np.isnan(predictions.uvp_p[:, 0, 12:])))
+
+        delta_uvp = np.hstack([predictions.delta_uvp[:, 0, :12],
+                               predictions.delta_uvp[:, 1]])
+        np.testing.assert_almost_equal(
+            predictions.mean, np.mean(delta_uvp, axis=-1), decimal=7)
+        np.testing.assert_almost_equal(
+            predictions.rms,
+            np.sqrt(np.mean(delta_uvp ** 2, axis=-1)),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            predictions.maximum, np.max(delta_uvp, axis=-1), decimal=7)
+
+    def test_transforms_matrices(self):
+        """
+        Tests :func:`colour.corresponding.prediction.\
+corresponding_chromaticities_predictions` definition with chromatic
+        adaptation transforms matrices.
+        """
+
+        M = CHROMATIC_ADAPTATION_TRANSFORMS['CAT02']
+        predictions = corresponding_chromaticities_predictions(
+            models=('Von Kries',),
+            transforms=np.array([M, M * 2]))
+
+        self.assertTupleEqual(predictions.models,
+                              ('Von Kries - 0', 'Von Kries - 1'))
+        np.testing.assert_almost_equal(
+            predictions.uvp_p,
+            corresponding_chromaticities_predictions(
+                models=('Von Kries',),
+                transforms=('CAT02', 'CAT02')).uvp_p,
+            decimal=7)
+
+    def test_raise_exception_corresponding_chromaticities_predictions(self):
+        """
+        Tests :func:`colour.corresponding.prediction.\
+corresponding_chromaticities_predictions` definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          corresponding_chromaticities_predictions,
+                          experiments=(5,))
+        self.assertRaises(ValueError,
+                          corresponding_chromaticities_predictions,
+                          models=('Undefined',))
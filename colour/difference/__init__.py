@@ -3,6 +3,11 @@
 
 from __future__ import absolute_import
 
+from .cam02_ucs import (
+    delta_E_Luo2006,
+    delta_E_CAM02LCD,
+    delta_E_CAM02SCD,
+    delta_E_CAM02UCS)
 from .delta_e import (
     DELTA_E_METHODS,
     delta_E,
@@ -10,10 +15,18 @@ from .delta_e import (
     delta_E_CIE1994,
     delta_E_CIE2000,
     delta_E_CMC)
+from .pairwise import delta_E_pairwise, delta_E_nearest, Delta_E_Index
+from .statistics import Delta_E_Statistics, delta_E_statistics
 
-__all__ = ['DELTA_E_METHODS',
-           'delta_E',
-           'delta_E_CIE1976',
-           'delta_E_CIE1994',
-           'delta_E_CIE2000',
-           'delta_E_CMC']
+__all__ = ['delta_E_Luo2006',
+           'delta_E_CAM02LCD',
+           'delta_E_CAM02SCD',
+           'delta_E_CAM02UCS']
+__all__ += ['DELTA_E_METHODS',
+            'delta_E',
+            'delta_E_CIE1976',
+            'delta_E_CIE1994',
+            'delta_E_CIE2000',
+            'delta_E_CMC']
+__all__ += ['delta_E_pairwise', 'delta_E_nearest', 'Delta_E_Index']
+__all__ += ['Delta_E_Statistics', 'delta_E_statistics']
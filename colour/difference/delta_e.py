@@ -13,6 +13,9 @@ The following methods are available:
 -   :func:`delta_E_CIE1994`
 -   :func:`delta_E_CIE2000`
 -   :func:`delta_E_CMC`
+-   :func:`colour.difference.delta_E_CAM02LCD`
+-   :func:`colour.difference.delta_E_CAM02SCD`
+-   :func:`colour.difference.delta_E_CAM02UCS`
 
 See Also
 --------
@@ -31,7 +34,15 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.algebra import euclidean_distance
-from colour.utilities import CaseInsensitiveMapping, tsplit
+from colour.difference.cam02_ucs import (
+    delta_E_CAM02LCD,
+    delta_E_CAM02SCD,
+    delta_E_CAM02UCS)
+from colour.utilities import (
+    CaseInsensitiveMapping,
+    DEFAULT_TILE_SIZE,
+    tiles,
+    tsplit)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -168,7 +179,199 @@ def delta_E_CIE1994(Lab_1, Lab_2, textiles=False, **kwargs):
     return d_E
 
 
-def delta_E_CIE2000(Lab_1, Lab_2, textiles=False, **kwargs):
+_COS_30, _SIN_30 = np.cos(np.radians(30)), np.sin(np.radians(30))
+_COS_6, _SIN_6 = np.cos(np.radians(6)), np.sin(np.radians(6))
+_COS_63, _SIN_63 = np.cos(np.radians(63)), np.sin(np.radians(63))
+
+
+def _power_7(a, out, buffer):
+    """
+    Computes given array to the power of 7 into given output array using
+    given buffer.
+    """
+
+    np.multiply(a, a, out=buffer)
+    np.multiply(buffer, buffer, out=out)
+    out *= buffer
+    out *= a
+
+
+def _delta_E_CIE2000_tile(Lab_1, Lab_2, k_L, d_E, buffers, mask):
+    """
+    Computes the difference :math:`\Delta E_{ab}` between two given *CIE Lab*
+    colourspace arrays of shape (n, 3) using CIE 2000 recommendation into given
+    output array of shape (n, ).
+
+    The intermediate values are written into given buffers of shape (12, N)
+    and boolean mask of shape (N, ) with :math:`N \geq n`, and the
+    trigonometric functions of the mean hue multiples are derived from a
+    single sine and cosine evaluation.
+    """
+
+    n = d_E.shape[0]
+    x = [buffer[:n] for buffer in buffers]
+    mask = mask[:n]
+
+    L_1, a_1, b_1 = Lab_1[:, 0], Lab_1[:, 1], Lab_1[:, 2]
+    L_2, a_2, b_2 = Lab_2[:, 0], Lab_2[:, 1], Lab_2[:, 2]
+
+    # x[0]: c_bar
+    np.hypot(a_1, b_1, out=x[0])
+    np.hypot(a_2, b_2, out=x[1])
+    x[0] += x[1]
+    x[0] *= 0.5
+
+    # x[2]: 1 + g
+    _power_7(x[0], x[2], x[1])
+    np.add(x[2], 25 ** 7, out=x[1])
+    x[2] /= x[1]
+    np.sqrt(x[2], out=x[2])
+    np.subtract(1, x[2], out=x[2])
+    x[2] *= 0.5
+    x[2] += 1
+
+    # x[0], x[1]: a_1_prime, a_2_prime
+    np.multiply(a_1, x[2], out=x[0])
+    np.multiply(a_2, x[2], out=x[1])
+
+    # x[2], x[3]: c_1_prime, c_2_prime
+    np.hypot(x[0], b_1, out=x[2])
+    np.hypot(x[1], b_2, out=x[3])
+
+    # x[0], x[1]: h_1_prime, h_2_prime
+    for h_prime, a_prime, b in ((x[0], x[0], b_1), (x[1], x[1], b_2)):
+        np.arctan2(b, a_prime, out=h_prime)
+        np.rad2deg(h_prime, out=h_prime)
+        np.less(h_prime, 0, out=mask)
+        np.add(h_prime, 360, out=h_prime, where=mask)
+
+    # x[4]: h, mask: |h| > 180
+    np.subtract(x[1], x[0], out=x[4])
+    np.fabs(x[4], out=x[5])
+    np.greater(x[5], 180, out=mask)
+
+    # x[0]: h_bar_prime
+    x[0] += x[1]
+    np.add(x[0], 360, out=x[0], where=mask)
+    x[0] *= 0.5
+
+    # x[4]: delta_H_prime, as sin(0.5 * (h +/- 360)) = -sin(0.5 * h).
+    x[4] *= 0.5
+    np.deg2rad(x[4], out=x[4])
+    np.sin(x[4], out=x[4])
+    np.negative(x[4], out=x[4], where=mask)
+    np.multiply(x[2], x[3], out=x[5])
+    np.sqrt(x[5], out=x[5])
+    x[5] *= 2
+    x[4] *= x[5]
+
+    # x[1]: c_bar_prime, x[3]: delta_C_prime
+    np.add(x[2], x[3], out=x[1])
+    x[1] *= 0.5
+    x[3] -= x[2]
+
+    # x[2]: t, from cos(h_bar_prime) and sin(h_bar_prime) only.
+    np.deg2rad(x[0], out=x[2])
+    np.cos(x[2], out=x[5])
+    np.sin(x[2], out=x[6])
+    # x[7], x[8]: cos(2 * h_bar_prime), sin(2 * h_bar_prime)
+    np.multiply(x[5], x[5], out=x[7])
+    x[7] *= 2
+    x[7] -= 1
+    np.multiply(x[5], x[6], out=x[8])
+    x[8] *= 2
+    # x[9], x[10]: cos(3 * h_bar_prime), sin(3 * h_bar_prime)
+    np.multiply(x[7], x[5], out=x[9])
+    np.multiply(x[8], x[6], out=x[11])
+    x[9] -= x[11]
+    np.multiply(x[8], x[5], out=x[10])
+    np.multiply(x[7], x[6], out=x[11])
+    x[10] += x[11]
+    # x[5], x[6]: t terms in h_bar_prime - 30 and 2 * h_bar_prime
+    x[5] *= -0.17 * _COS_30
+    x[6] *= -0.17 * _SIN_30
+    x[5] += x[6]
+    np.multiply(x[7], 0.24, out=x[2])
+    x[2] += x[5]
+    x[2] += 1
+    # t term in 3 * h_bar_prime + 6
+    x[9] *= 0.32 * _COS_6
+    x[10] *= 0.32 * _SIN_6
+    x[9] -= x[10]
+    x[2] += x[9]
+    # x[7], x[8]: cos(4 * h_bar_prime), sin(4 * h_bar_prime)
+    np.multiply(x[8], x[7], out=x[9])
+    x[9] *= 2
+    x[7] *= x[7]
+    x[7] *= 2
+    x[7] -= 1
+    # t term in 4 * h_bar_prime - 63
+    x[7] *= 0.20 * _COS_63
+    x[9] *= 0.20 * _SIN_63
+    x[7] += x[9]
+    x[2] -= x[7]
+
+    # x[2]: s_H, x[5]: s_C
+    x[2] *= x[1]
+    x[2] *= 0.015
+    x[2] += 1
+    np.multiply(x[1], 0.045, out=x[5])
+    x[5] += 1
+
+    # x[0]: delta_theta
+    x[0] -= 275
+    x[0] /= 25
+    x[0] *= x[0]
+    np.negative(x[0], out=x[0])
+    np.exp(x[0], out=x[0])
+    x[0] *= 30
+
+    # x[1]: r_T
+    _power_7(x[1], x[6], x[7])
+    np.add(x[6], 25 ** 7, out=x[7])
+    x[6] /= x[7]
+    np.sqrt(x[6], out=x[1])
+    x[0] *= 2
+    np.deg2rad(x[0], out=x[0])
+    np.sin(x[0], out=x[0])
+    x[1] *= x[0]
+    x[1] *= -2
+
+    # x[6]: s_L
+    np.add(L_1, L_2, out=x[6])
+    x[6] *= 0.5
+    x[6] -= 50
+    x[6] *= x[6]
+    np.add(x[6], 20, out=x[7])
+    np.sqrt(x[7], out=x[7])
+    x[6] /= x[7]
+    x[6] *= 0.015
+    x[6] += 1
+
+    # x[6], x[3], x[4]: lightness, chroma and hue terms
+    x[6] *= k_L
+    np.subtract(L_2, L_1, out=x[7])
+    np.divide(x[7], x[6], out=x[6])
+    x[3] /= x[5]
+    x[4] /= x[2]
+
+    np.multiply(x[3], x[4], out=d_E)
+    d_E *= x[1]
+    x[6] *= x[6]
+    d_E += x[6]
+    x[3] *= x[3]
+    d_E += x[3]
+    x[4] *= x[4]
+    d_E += x[4]
+    np.sqrt(d_E, out=d_E)
+
+
+def delta_E_CIE2000(Lab_1,
+                    Lab_2,
+                    textiles=False,
+                    dtype=np.float_,
+                    tile_size=DEFAULT_TILE_SIZE,
+                    **kwargs):
     """
     Returns the difference :math:`\Delta E_{ab}` between two given *CIE Lab*
     colourspace arrays using CIE 2000 recommendation.
@@ -183,6 +386,12 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False, **kwargs):
         Textiles application specific parametric factors
         :math:`k_L=2,\ k_C=k_H=1` weights are used instead of
         :math:`k_L=k_C=k_H=1`.
+    dtype : object, optional
+        Computation and output data type, :class:`numpy.float32` halves the
+        memory bandwidth at the expense of precision.
+    tile_size : integer, optional
+        Count of colour differences computed at once, the intermediate
+        values are held in buffers of that size reused across the tiles.
     \**kwargs : dict, optional
         Unused parameter provided for signature compatibility with other
         :math:`\Delta E_{ab}` computation objects.
@@ -210,6 +419,10 @@ def delta_E_CIE2000(Lab_1, Lab_2, textiles=False, **kwargs):
         -   Sample colour-difference magnitude: Lower than 5.0
             :math:`\Delta E_{ab}`
         -   Sample structure: Homogeneous (without texture)
+    -   The colour differences are computed in tiles with a fixed set of
+        buffers, the memory footprint beyond the output array is thus bounded
+        by the tile size. The arrays must have the same shape to avoid the
+        copy of the broadcast arrays.
 
     References
     ----------
@@ -230,75 +443,37 @@ Melgosa_CIEDE2000_Workshop-July4.pdf
     100.8779470...
     >>> delta_E_CIE2000(Lab_1, Lab_2, textiles=True)  # doctest: +ELLIPSIS
     95.7920535...
+    >>> delta_E_CIE2000(  # doctest: +ELLIPSIS
+    ...     Lab_1, Lab_2, textiles=True, dtype=np.float32)
+    95.79205...
     """
 
-    k_L = 2 if textiles else 1
-    k_C = 1
-    k_H = 1
-
-    L_1, a_1, b_1 = tsplit(Lab_1)
-    L_2, a_2, b_2 = tsplit(Lab_2)
-
-    l_bar_prime = 0.5 * (L_1 + L_2)
+    Lab_1 = np.asarray(Lab_1)
+    Lab_2 = np.asarray(Lab_2)
 
-    c_1 = np.sqrt(a_1 ** 2 + b_1 ** 2)
-    c_2 = np.sqrt(a_2 ** 2 + b_2 ** 2)
-
-    c_bar = 0.5 * (c_1 + c_2)
-    c_bar7 = np.power(c_bar, 7)
-
-    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
-
-    a_1_prime = a_1 * (1 + g)
-    a_2_prime = a_2 * (1 + g)
-    c_1_prime = np.sqrt(a_1_prime ** 2 + b_1 ** 2)
-    c_2_prime = np.sqrt(a_2_prime ** 2 + b_2 ** 2)
-    c_bar_prime = 0.5 * (c_1_prime + c_2_prime)
-
-    h_1_prime = np.asarray(np.rad2deg(np.arctan2(b_1, a_1_prime)))
-    h_1_prime[np.asarray(h_1_prime < 0.0)] += 360
-
-    h_2_prime = np.asarray(np.rad2deg(np.arctan2(b_2, a_2_prime)))
-    h_2_prime[np.asarray(h_2_prime < 0.0)] += 360
-
-    h_bar_prime = np.where(np.fabs(h_1_prime - h_2_prime) <= 180,
-                           0.5 * (h_1_prime + h_2_prime),
-                           (0.5 * (h_1_prime + h_2_prime + 360)))
-
-    t = (1 - 0.17 * np.cos(np.deg2rad(h_bar_prime - 30)) +
-         0.24 * np.cos(np.deg2rad(2 * h_bar_prime)) +
-         0.32 * np.cos(np.deg2rad(3 * h_bar_prime + 6)) -
-         0.20 * np.cos(np.deg2rad(4 * h_bar_prime - 63)))
+    shape = np.broadcast(Lab_1[..., 0], Lab_2[..., 0]).shape
+    if Lab_1.shape != Lab_2.shape:
+        Lab_1, Lab_2 = np.broadcast_arrays(Lab_1, Lab_2)
 
-    h = h_2_prime - h_1_prime
-    delta_h_prime = np.where(h_2_prime <= h_1_prime, h - 360, h + 360)
-    delta_h_prime = np.where(np.fabs(h) <= 180, h, delta_h_prime)
+    Lab_1 = np.reshape(Lab_1, (-1, 3))
+    Lab_2 = np.reshape(Lab_2, (-1, 3))
 
-    delta_L_prime = L_2 - L_1
-    delta_C_prime = c_2_prime - c_1_prime
-    delta_H_prime = (2 * np.sqrt(c_1_prime * c_2_prime) *
-                     np.sin(np.deg2rad(0.5 * delta_h_prime)))
+    d_E = np.empty(shape, dtype=dtype)
+    d_E_f = np.reshape(d_E, -1)
 
-    s_L = 1 + ((0.015 * (l_bar_prime - 50) * (l_bar_prime - 50)) /
-               np.sqrt(20 + (l_bar_prime - 50) * (l_bar_prime - 50)))
-    s_C = 1 + 0.045 * c_bar_prime
-    s_H = 1 + 0.015 * c_bar_prime * t
+    size = d_E_f.shape[0]
+    tile_size = max(min(int(tile_size), size), 1)
+    buffers = np.empty((12, tile_size), dtype=dtype)
+    mask = np.empty(tile_size, dtype=np.bool_)
+    for tile in tiles(size, tile_size):
+        _delta_E_CIE2000_tile(np.asarray(Lab_1[tile], dtype=dtype),
+                              np.asarray(Lab_2[tile], dtype=dtype),
+                              2 if textiles else 1,
+                              d_E_f[tile],
+                              buffers,
+                              mask)
 
-    delta_theta = (30 * np.exp(-((h_bar_prime - 275) / 25) *
-                               ((h_bar_prime - 275) / 25)))
-
-    c_bar_prime7 = c_bar_prime ** 7
-
-    r_C = np.sqrt(c_bar_prime7 / (c_bar_prime7 + 25 ** 7))
-    r_T = -2 * r_C * np.sin(np.deg2rad(2 * delta_theta))
-
-    d_E = np.sqrt(
-        (delta_L_prime / (k_L * s_L)) ** 2 +
-        (delta_C_prime / (k_C * s_C)) ** 2 +
-        (delta_H_prime / (k_H * s_H)) ** 2 +
-        (delta_C_prime / (k_C * s_C)) * (delta_H_prime / (k_H * s_H)) * r_T)
-
-    return d_E
+    return d_E[()] if shape == () else d_E
 
 
 def delta_E_CMC(Lab_1, Lab_2, l=2, c=1):
@@ -382,12 +557,16 @@ DELTA_E_METHODS = CaseInsensitiveMapping(
     {'CIE 1976': delta_E_CIE1976,
      'CIE 1994': delta_E_CIE1994,
      'CIE 2000': delta_E_CIE2000,
-     'CMC': delta_E_CMC})
+     'CMC': delta_E_CMC,
+     'CAM02-LCD': delta_E_CAM02LCD,
+     'CAM02-SCD': delta_E_CAM02SCD,
+     'CAM02-UCS': delta_E_CAM02UCS})
 """
 Supported *Delta E* computations methods.
 
 DELTA_E_METHODS : CaseInsensitiveMapping
-    **{'CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC'}**
+    **{'CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+    'CAM02-UCS'}**
 
 Aliases:
 
@@ -412,11 +591,18 @@ def delta_E(Lab_1, Lab_2, method='CMC', **kwargs):
     Lab_2 : array_like
         *CIE Lab* colourspace array 2.
     method : unicode, optional
-        **{'CMC', 'CIE 1976', 'CIE 1994', 'CIE 2000'}**,
+        **{'CMC', 'CIE 1976', 'CIE 1994', 'CIE 2000', 'CAM02-LCD',
+        'CAM02-SCD', 'CAM02-UCS'}**,
         Computation method.
     \**kwargs : dict, optional
         Keywords arguments.
 
+    Notes
+    -----
+    -   *CAM02-LCD*, *CAM02-SCD* and *CAM02-UCS* methods expect
+        *Luo et al. (2006)* colourspaces :math:`J'a'b'` arrays instead of
+        *CIE Lab* colourspace arrays.
+
     Returns
     -------
     numeric or ndarray
@@ -0,0 +1,477 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Pairwise Colour Difference
+==========================
+
+Defines the objects computing the colour differences between each colour of
+a set of samples and each colour of a library, e.g. a paint fan deck:
+
+-   :func:`delta_E_pairwise`
+-   :func:`delta_E_nearest`
+-   :class:`Delta_E_Index`
+
+The cross-product of the samples and the library is streamed in blocks whose
+size is bounded by the tile size, only the :math:`k` nearest library colours
+of each block of samples are kept when searching for the nearest colours.
+The blocks of samples are processed concurrently by a thread pool.
+
+:class:`Delta_E_Index` class prunes the library with a *KD-Tree* built in
+*CIE Lab* colourspace: the nearest library colours in the *CIE Lab*
+colourspace euclidean sense are retrieved first and then ranked with the
+colour difference method.
+
+See Also
+--------
+colour.tiled_apply
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+from scipy.spatial import cKDTree
+
+from colour.difference.delta_e import DELTA_E_METHODS
+from colour.utilities import DEFAULT_TILE_SIZE, tiles, tiled_apply
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['delta_E_pairwise',
+           'delta_E_nearest',
+           'Delta_E_Index']
+
+
+class _Nearest(namedtuple('_Nearest', ('delta_E', 'indices'))):
+    """
+    Defines the nearest library colours of a block of samples, allowing
+    :func:`colour.tiled_apply` definition to write both arrays.
+    """
+
+
+def _library(Lab):
+    """
+    Returns given library flattened to an array of shape (M, 3).
+    """
+
+    return np.reshape(np.asarray(Lab, dtype=np.float_), (-1, 3))
+
+
+def _columns_size(library_size, tile_size):
+    """
+    Returns the count of library colours compared at once to a block of
+    samples and the count of samples of that block.
+    """
+
+    columns = max(min(library_size, int(tile_size)), 1)
+
+    return columns, max(int(tile_size) // columns, 1)
+
+
+def _check_k(k, library_size):
+    """
+    Checks that given count of nearest library colours is in domain [1, M].
+    """
+
+    if not 1 <= k <= library_size:
+        raise ValueError(
+            ('Nearest colours count "{0}" must be in domain '
+             '[1, {1}]!').format(k, library_size))
+
+
+def _sort_k_nearest(d_E, indices, k):
+    """
+    Returns the :math:`k` smallest colour differences along the last axis of
+    given colour differences array sorted in ascending order and their
+    indices.
+    """
+
+    rows = np.arange(d_E.shape[0])[:, np.newaxis]
+    if d_E.shape[-1] > k:
+        nearest = np.argpartition(d_E, k - 1, axis=-1)[:, :k]
+        d_E, indices = d_E[rows, nearest], indices[rows, nearest]
+
+    order = np.argsort(d_E, axis=-1)
+
+    return d_E[rows, order], indices[rows, order]
+
+
+def delta_E_pairwise(Lab_1,
+                     Lab_2,
+                     method='CIE 2000',
+                     tile_size=DEFAULT_TILE_SIZE,
+                     threads=1,
+                     out=None,
+                     **kwargs):
+    """
+    Returns the colour differences :math:`\Delta E_{ab}` between each given
+    sample *CIE Lab* colourspace array and each given library *CIE Lab*
+    colourspace array.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        Samples *CIE Lab* colourspace array of shape (..., 3).
+    Lab_2 : array_like
+        Library *CIE Lab* colourspace array of shape (M, 3), higher
+        dimensional arrays are flattened.
+    method : unicode, optional
+        {'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS'},
+        Computation method.
+    tile_size : integer, optional
+        Count of colour differences computed at once.
+    threads : integer, optional
+        Threads count processing the blocks of samples concurrently, default
+        to :func:`multiprocessing.cpu_count` definition if *None*.
+    out : ndarray, optional
+        Preallocated *C-contiguous* array of shape (..., M), e.g.
+        :class:`numpy.memmap` class instance, receiving the colour
+        differences.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the colour difference method.
+
+    Returns
+    -------
+    ndarray
+        Colour differences :math:`\Delta E_{ab}` array of shape (..., M).
+
+    Notes
+    -----
+    -   The colour differences array holds :math:`N \\times M` values, for
+        large samples and libraries :func:`delta_E_nearest` definition
+        should be used instead.
+
+    Examples
+    --------
+    >>> Lab_1 = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...                   [50.00000000, 8.32281957, -73.58297716]])
+    >>> Lab_2 = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...                   [100.00000000, 74.05216981, 276.45318193],
+    ...                   [100.00000000, 8.32281957, -73.58297716]])
+    >>> delta_E_pairwise(Lab_1, Lab_2)  # doctest: +ELLIPSIS
+    array([[ 94.0356490...,  14.8790641...,  68.2309487...],
+           [ 68.2111766...,  74.4033806...,  36.5192678...]])
+    """
+
+    library = _library(Lab_2)
+    function = DELTA_E_METHODS.get(method)
+    columns, rows = _columns_size(library.shape[0], tile_size)
+
+    def pairwise(Lab):
+        """
+        Returns the colour differences between given block of samples and the
+        library.
+        """
+
+        Lab = Lab[:, np.newaxis]
+        if columns == library.shape[0]:
+            return function(Lab, library[np.newaxis], **kwargs)
+
+        return np.hstack([function(Lab, library[np.newaxis, block], **kwargs)
+                          for block in tiles(library.shape[0], columns)])
+
+    return tiled_apply(pairwise,
+                       np.asarray(Lab_1, dtype=np.float_),
+                       tile_size=rows,
+                       out=out,
+                       threads=threads)
+
+
+def delta_E_nearest(Lab_1,
+                    Lab_2,
+                    k=1,
+                    method='CIE 2000',
+                    candidates=None,
+                    tile_size=DEFAULT_TILE_SIZE,
+                    threads=1,
+                    **kwargs):
+    """
+    Returns the :math:`k` nearest library colours of each given sample
+    *CIE Lab* colourspace array according to given colour difference method.
+
+    Parameters
+    ----------
+    Lab_1 : array_like
+        Samples *CIE Lab* colourspace array of shape (..., 3).
+    Lab_2 : array_like
+        Library *CIE Lab* colourspace array of shape (M, 3), higher
+        dimensional arrays are flattened.
+    k : integer, optional
+        Count of nearest library colours to return.
+    method : unicode, optional
+        {'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS'},
+        Computation method.
+    candidates : integer, optional
+        If given, the library is pruned with a :class:`Delta_E_Index` class
+        instance and only the given count of nearest library colours in the
+        *CIE Lab* colourspace euclidean sense are ranked with the colour
+        difference method, otherwise the library is searched exhaustively.
+    tile_size : integer, optional
+        Count of colour differences computed at once.
+    threads : integer, optional
+        Threads count processing the blocks of samples concurrently, default
+        to :func:`multiprocessing.cpu_count` definition if *None*.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the colour difference method.
+
+    Returns
+    -------
+    tuple
+        Colour differences :math:`\Delta E_{ab}` array and library indices
+        array of the nearest library colours, both of shape (..., k) and
+        sorted by ascending colour difference.
+
+    Raises
+    ------
+    ValueError
+        If the count of nearest library colours is not in domain [1, M].
+
+    Examples
+    --------
+    >>> Lab_1 = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...                   [50.00000000, 8.32281957, -73.58297716]])
+    >>> Lab_2 = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...                   [100.00000000, 74.05216981, 276.45318193],
+    ...                   [100.00000000, 8.32281957, -73.58297716]])
+    >>> d_E, indices = delta_E_nearest(Lab_1, Lab_2, k=2)
+    >>> d_E  # doctest: +ELLIPSIS
+    array([[ 14.8790641...,  68.2309487...],
+           [ 36.5192678...,  68.2111766...]])
+    >>> indices
+    array([[1, 2],
+           [2, 0]])
+    """
+
+    if candidates is not None:
+        return Delta_E_Index(Lab_2, method, **kwargs).query(
+            Lab_1, k, candidates, tile_size, threads)
+
+    library = _library(Lab_2)
+    _check_k(k, library.shape[0])
+
+    function = DELTA_E_METHODS.get(method)
+    columns, rows = _columns_size(library.shape[0], tile_size)
+
+    def nearest(Lab):
+        """
+        Returns the nearest library colours of given block of samples.
+        """
+
+        Lab = Lab[:, np.newaxis]
+        d_E = indices = None
+        for block in tiles(library.shape[0], columns):
+            d_E_b = function(Lab, library[np.newaxis, block], **kwargs)
+            indices_b = np.broadcast_arrays(
+                np.arange(block.start, block.stop), d_E_b)[0]
+            if d_E is not None:
+                d_E_b = np.hstack([d_E, d_E_b])
+                indices_b = np.hstack([indices, indices_b])
+
+            d_E, indices = _sort_k_nearest(d_E_b, indices_b, k)
+
+        return _Nearest(d_E, indices)
+
+    return tuple(tiled_apply(nearest,
+                             np.asarray(Lab_1, dtype=np.float_),
+                             tile_size=rows,
+                             threads=threads))
+
+
+class Delta_E_Index(object):
+    """
+    Defines a library of *CIE Lab* colourspace colours indexed with a
+    *KD-Tree* for nearest colours queries.
+
+    The library colours nearest to a sample in the *CIE Lab* colourspace
+    euclidean sense are retrieved with the *KD-Tree* and ranked with the
+    colour difference method.
+
+    Parameters
+    ----------
+    Lab : array_like
+        Library *CIE Lab* colourspace array of shape (M, 3), higher
+        dimensional arrays are flattened.
+    method : unicode, optional
+        {'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS'},
+        Computation method.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the colour difference method.
+
+    Attributes
+    ----------
+    library
+    method
+
+    Methods
+    -------
+    query
+
+    Notes
+    -----
+    -   Only the *CIE 1976* method is the euclidean distance, with the other
+        methods a library colour that is not a *KD-Tree* candidate might
+        have a smaller colour difference than the returned colours: the
+        query is then approximate. Increasing the candidates count trades
+        speed for accuracy, the query is exhaustive if the candidates count
+        is greater than or equal to the library size.
+    -   With the *CAM02-LCD*, *CAM02-SCD* and *CAM02-UCS* methods, the
+        library and samples are :math:`J'a'b'` arrays and the *KD-Tree* is
+        built in the respective colourspace.
+
+    Examples
+    --------
+    >>> Lab_1 = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...                   [50.00000000, 8.32281957, -73.58297716]])
+    >>> Lab_2 = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...                   [100.00000000, 74.05216981, 276.45318193],
+    ...                   [100.00000000, 8.32281957, -73.58297716]])
+    >>> index = Delta_E_Index(Lab_2)
+    >>> d_E, indices = index.query(Lab_1, candidates=2)
+    >>> d_E  # doctest: +ELLIPSIS
+    array([[ 14.8790641...],
+           [ 36.5192678...]])
+    >>> indices
+    array([[1],
+           [2]])
+    """
+
+    def __init__(self, Lab, method='CIE 2000', **kwargs):
+        self._library = _library(Lab)
+        self._method = method
+        self._function = DELTA_E_METHODS.get(method)
+        self._kwargs = kwargs
+        self._tree = cKDTree(self._library)
+
+    @property
+    def library(self):
+        """
+        Property for **self.library** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.library.
+        """
+
+        return self._library
+
+    @property
+    def method(self):
+        """
+        Property for **self.method** attribute.
+
+        Returns
+        -------
+        unicode
+            self.method.
+        """
+
+        return self._method
+
+    def query(self,
+              Lab,
+              k=1,
+              candidates=None,
+              tile_size=DEFAULT_TILE_SIZE,
+              threads=1):
+        """
+        Returns the :math:`k` nearest library colours of each given sample
+        *CIE Lab* colourspace array.
+
+        Parameters
+        ----------
+        Lab : array_like
+            Samples *CIE Lab* colourspace array of shape (..., 3).
+        k : integer, optional
+            Count of nearest library colours to return.
+        candidates : integer, optional
+            Count of nearest library colours in the *CIE Lab* colourspace
+            euclidean sense ranked with the colour difference method, default
+            to :math:`max(8k, 32)`.
+        tile_size : integer, optional
+            Count of colour differences computed at once.
+        threads : integer, optional
+            Threads count processing the blocks of samples concurrently,
+            default to :func:`multiprocessing.cpu_count` definition if
+            *None*.
+
+        Returns
+        -------
+        tuple
+            Colour differences :math:`\Delta E_{ab}` array and library
+            indices array of the nearest library colours, both of shape
+            (..., k) and sorted by ascending colour difference. The samples
+            that are not finite have *nan* colour differences and library
+            size indices.
+
+        Raises
+        ------
+        ValueError
+            If the count of nearest library colours is not in domain [1, M]
+            or if the candidates count is lower than it.
+        """
+
+        size = self._library.shape[0]
+        _check_k(k, size)
+
+        if candidates is None:
+            candidates = max(8 * k, 32)
+
+        if candidates < k:
+            raise ValueError(
+                ('Candidates count "{0}" must be greater than or equal to '
+                 'the nearest colours count "{1}"!').format(candidates, k))
+
+        Lab = np.asarray(Lab, dtype=np.float_)
+
+        if candidates >= size:
+            d_E, indices = delta_E_nearest(Lab,
+                                           self._library,
+                                           k,
+                                           self._method,
+                                           tile_size=tile_size,
+                                           threads=threads,
+                                           **self._kwargs)
+
+            non_finite = ~np.all(np.isfinite(Lab), axis=-1)
+            d_E[non_finite] = np.nan
+            indices[non_finite] = size
+
+            return d_E, indices
+
+        def nearest(Lab):
+            """
+            Returns the nearest library colours of given block of samples.
+            """
+
+            d_E = np.full((Lab.shape[0], k), np.nan)
+            indices = np.full((Lab.shape[0], k), size, dtype=np.int_)
+
+            # The *k-d tree* only accepts finite samples.
+            finite = np.all(np.isfinite(Lab), axis=-1)
+            if np.any(finite):
+                _d, indices_c = self._tree.query(Lab[finite], candidates)
+                indices_c = np.reshape(indices_c, (-1, candidates))
+                d_E_c = self._function(Lab[finite, np.newaxis],
+                                       self._library[indices_c],
+                                       **self._kwargs)
+
+                d_E[finite], indices[finite] = _sort_k_nearest(
+                    d_E_c, indices_c, k)
+
+            return _Nearest(d_E, indices)
+
+        return tuple(tiled_apply(nearest,
+                                 Lab,
+                                 tile_size=max(int(tile_size) // candidates,
+                                               1),
+                                 threads=threads))
@@ -0,0 +1,270 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Colour Difference Statistics
+============================
+
+Defines the objects computing the colour difference map between two images
+and its summary statistics in a single streaming pass:
+
+-   :class:`Delta_E_Statistics`
+-   :func:`delta_E_statistics`
+
+The images are read tile by tile, e.g. from memory-mapped arrays, and the
+colour differences of each tile are reduced into running statistics: the
+count, mean, root mean square, extrema with their location and a fixed bins
+histogram from which the percentiles are estimated. The colour difference map
+is only stored if an output array is given.
+
+See Also
+--------
+colour.utilities.tiled_imap
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.difference.delta_e import DELTA_E_METHODS
+from colour.utilities import DEFAULT_TILE_SIZE, tiled_imap
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Delta_E_Statistics',
+           'delta_E_statistics']
+
+
+class Delta_E_Statistics(
+    namedtuple('Delta_E_Statistics',
+               ('count', 'mean', 'rms', 'minimum', 'maximum',
+                'maximum_location', 'percentiles', 'histogram',
+                'bin_edges'))):
+    """
+    Defines the colour difference map summary statistics.
+
+    Parameters
+    ----------
+    count : integer
+        Count of colour differences that are not *nan*, the statistics are
+        computed over those colour differences.
+    mean : numeric
+        Mean colour difference.
+    rms : numeric
+        Root mean square colour difference.
+    minimum : numeric
+        Minimum colour difference.
+    maximum : numeric
+        Maximum colour difference.
+    maximum_location : tuple
+        Index of the maximum colour difference in the colour difference map.
+    percentiles : ndarray
+        Colour difference percentiles estimated from the histogram.
+    histogram : ndarray
+        Colour differences histogram, the colour differences outside the
+        histogram range are not counted.
+    bin_edges : ndarray
+        Histogram bin edges.
+    """
+
+
+def _histogram_percentiles(histogram,
+                           bin_edges,
+                           underflow,
+                           overflow,
+                           minimum,
+                           maximum,
+                           percentiles):
+    """
+    Estimates given percentiles from given histogram by linear interpolation
+    within the bins, the colour differences below and above the histogram
+    range are assumed to be uniformly distributed between the extrema and the
+    range bounds.
+    """
+
+    counts = np.hstack([underflow, histogram, overflow])
+    edges = np.hstack([min(minimum, bin_edges[0]),
+                       bin_edges,
+                       max(maximum, bin_edges[-1])])
+
+    cumulative = np.cumsum(counts)
+    targets = np.asarray(percentiles, dtype=np.float_) / 100 * cumulative[-1]
+
+    indexes = np.clip(np.searchsorted(cumulative, targets), 0,
+                      counts.shape[0] - 1)
+    previous = np.where(indexes > 0, cumulative[indexes - 1], 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fractions = np.where(counts[indexes] > 0,
+                             (targets - previous) / counts[indexes],
+                             0)
+
+    values = (edges[indexes] +
+              fractions * (edges[indexes + 1] - edges[indexes]))
+
+    return np.clip(values, minimum, maximum)
+
+
+def delta_E_statistics(image_1,
+                       image_2,
+                       method='CIE 2000',
+                       percentiles=(50, 95, 99),
+                       bins=10000,
+                       histogram_range=(0, 100),
+                       tile_size=DEFAULT_TILE_SIZE,
+                       threads=1,
+                       out=None,
+                       **kwargs):
+    """
+    Returns the summary statistics of the colour difference map between two
+    given *CIE Lab* colourspace images computed tile by tile.
+
+    Parameters
+    ----------
+    image_1 : array_like
+        Reference *CIE Lab* colourspace image of shape (..., 3), e.g.
+        :class:`numpy.memmap` class instance.
+    image_2 : array_like
+        Sample *CIE Lab* colourspace image of shape (..., 3), e.g.
+        :class:`numpy.memmap` class instance.
+    method : unicode, optional
+        {'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS'},
+        Computation method.
+    percentiles : array_like, optional
+        Percentiles to estimate in domain [0, 100].
+    bins : integer, optional
+        Histogram bins count.
+    histogram_range : array_like, optional
+        Histogram range, the percentiles resolution is the bins width within
+        that range.
+    tile_size : integer, optional
+        Count of colour differences computed at once.
+    threads : integer, optional
+        Threads count computing the tiles colour differences concurrently,
+        default to :func:`multiprocessing.cpu_count` definition if *None*.
+    out : ndarray, optional
+        Preallocated *C-contiguous* array of shape (...), e.g.
+        :class:`numpy.memmap` class instance, receiving the colour difference
+        map, the map is not stored if not given.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the colour difference method.
+
+    Returns
+    -------
+    Delta_E_Statistics
+        Colour difference map summary statistics.
+
+    Raises
+    ------
+    ValueError
+        If the images shapes do not match, or if the output array is not
+        *C-contiguous* or does not have the expected shape.
+
+    Notes
+    -----
+    -   The colour differences that are *nan* are ignored.
+    -   The percentiles are estimated as the inverse of the colour
+        differences cumulative distribution function and are exact to within
+        the bins width for the colour differences within the histogram
+        range.
+
+    Examples
+    --------
+    >>> image_1 = np.array([[[100.00000000, 21.57210357, 272.22819350],
+    ...                      [100.00000000, 21.57210357, 272.22819350]],
+    ...                     [[100.00000000, 21.57210357, 272.22819350],
+    ...                      [50.00000000, 8.32281957, -73.58297716]]])
+    >>> image_2 = np.array([[[100.00000000, 426.67945353, 72.39590835],
+    ...                      [100.00000000, 74.05216981, 276.45318193]],
+    ...                     [[100.00000000, 8.32281957, -73.58297716],
+    ...                      [50.00000000, 8.32281957, -73.58297716]]])
+    >>> statistics = delta_E_statistics(image_1, image_2)
+    >>> statistics.mean  # doctest: +ELLIPSIS
+    44.2864155...
+    >>> statistics.maximum  # doctest: +ELLIPSIS
+    94.0356490...
+    >>> statistics.maximum_location
+    (0, 0)
+    >>> statistics.percentiles[0]  # doctest: +ELLIPSIS
+    14.88...
+    """
+
+    image_1 = np.asarray(image_1)
+    image_2 = np.asarray(image_2)
+
+    if image_1.shape != image_2.shape:
+        raise ValueError(
+            'Images shapes "{0}" and "{1}" do not match!'.format(
+                image_1.shape, image_2.shape))
+
+    shape = image_1.shape[:-1]
+
+    if out is not None:
+        if out.shape != shape:
+            raise ValueError(
+                ('Output array shape "{0}" does not match expected shape '
+                 '"{1}"!').format(out.shape, shape))
+        if not out.flags.c_contiguous:
+            raise ValueError('Output array must be "C-contiguous"!')
+
+        out_f = np.reshape(out, -1)
+
+    count = 0
+    total = total_squares = 0.0
+    minimum = maximum = np.nan
+    maximum_index = None
+    underflow = overflow = 0
+    histogram, bin_edges = np.histogram([], bins=bins, range=histogram_range)
+
+    for tile, d_E in tiled_imap(DELTA_E_METHODS.get(method),
+                                (image_1, image_2),
+                                tile_size=tile_size,
+                                threads=threads,
+                                **kwargs):
+        d_E = np.ravel(d_E)
+        if out is not None:
+            out_f[tile] = d_E
+
+        valid = ~np.isnan(d_E)
+        if not np.any(valid):
+            continue
+
+        indexes = np.arange(tile.start, tile.stop)[valid]
+        d_E = d_E[valid]
+
+        count += d_E.shape[0]
+        total += np.sum(d_E, dtype=np.float_)
+        total_squares += np.sum(np.square(d_E, dtype=np.float_))
+
+        minimum = np.nanmin([minimum, np.min(d_E)])
+        argmax = np.argmax(d_E)
+        if not d_E[argmax] <= maximum:
+            maximum = d_E[argmax]
+            maximum_index = indexes[argmax]
+
+        histogram += np.histogram(d_E, bins=bins, range=histogram_range)[0]
+        underflow += np.count_nonzero(d_E < bin_edges[0])
+        overflow += np.count_nonzero(d_E > bin_edges[-1])
+
+    if count == 0:
+        return Delta_E_Statistics(
+            0, np.nan, np.nan, np.nan, np.nan, None,
+            np.full(np.shape(percentiles), np.nan), histogram, bin_edges)
+
+    return Delta_E_Statistics(
+        count,
+        total / count,
+        np.sqrt(total_squares / count),
+        minimum,
+        maximum,
+        tuple(int(i) for i in np.unravel_index(maximum_index, shape)),
+        _histogram_percentiles(histogram, bin_edges, underflow, overflow,
+                               minimum, maximum, percentiles),
+        histogram,
+        bin_edges)
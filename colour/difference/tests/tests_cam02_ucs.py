@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.difference.cam02_ucs` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.difference import (
+    delta_E,
+    delta_E_CAM02LCD,
+    delta_E_CAM02SCD,
+    delta_E_CAM02UCS)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestDelta_E_Luo2006']
+
+
+class TestDelta_E_Luo2006(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.cam02_ucs.delta_E_Luo2006` definition
+    unit tests methods.
+    """
+
+    def test_delta_E_Luo2006(self):
+        """
+        Tests :func:`colour.difference.cam02_ucs.delta_E_Luo2006` definition.
+        """
+
+        Jpapbp_1 = np.array([54.90433134, -0.08442362, -0.06848314])
+        Jpapbp_2 = np.array([32.53658959, 30.59448663, 5.67035293])
+
+        self.assertAlmostEqual(
+            delta_E_CAM02LCD(Jpapbp_1, Jpapbp_2),
+            42.6377187568,
+            places=7)
+
+        self.assertAlmostEqual(
+            delta_E_CAM02SCD(Jpapbp_1, Jpapbp_2),
+            36.0488183780,
+            places=7)
+
+        self.assertAlmostEqual(
+            delta_E_CAM02UCS(Jpapbp_1, Jpapbp_2),
+            38.3985109641,
+            places=7)
+
+        self.assertAlmostEqual(
+            delta_E(Jpapbp_1, Jpapbp_2, method='CAM02-UCS'),
+            38.3985109641,
+            places=7)
+
+    def test_n_dimensional_delta_E_Luo2006(self):
+        """
+        Tests :func:`colour.difference.cam02_ucs.delta_E_Luo2006` definition
+        n-dimensional arrays support.
+        """
+
+        Jpapbp_1 = np.array([54.90433134, -0.08442362, -0.06848314])
+        Jpapbp_2 = np.array([32.53658959, 30.59448663, 5.67035293])
+        delta_E = 38.3985109641
+        np.testing.assert_almost_equal(
+            delta_E_CAM02UCS(Jpapbp_1, Jpapbp_2),
+            delta_E,
+            decimal=7)
+
+        Jpapbp_1 = np.tile(Jpapbp_1, (6, 1))
+        Jpapbp_2 = np.tile(Jpapbp_2, (6, 1))
+        delta_E = np.tile(delta_E, 6)
+        np.testing.assert_almost_equal(
+            delta_E_CAM02UCS(Jpapbp_1, Jpapbp_2),
+            delta_E,
+            decimal=7)
+
+        Jpapbp_1 = np.reshape(Jpapbp_1, (2, 3, 3))
+        Jpapbp_2 = np.reshape(Jpapbp_2, (2, 3, 3))
+        delta_E = np.reshape(delta_E, (2, 3))
+        np.testing.assert_almost_equal(
+            delta_E_CAM02UCS(Jpapbp_1, Jpapbp_2),
+            delta_E,
+            decimal=7)
+
+    def test_pairwise_delta_E_Luo2006(self):
+        """
+        Tests :func:`colour.difference.cam02_ucs.delta_E_Luo2006` definition
+        pairwise differences computation by broadcasting.
+        """
+
+        Jpapbp_1 = np.array([[54.90433134, -0.08442362, -0.06848314],
+                             [32.53658959, 30.59448663, 5.67035293]])
+        Jpapbp_2 = np.array([[87.31907263, 5.30367404, -9.18623290],
+                             [54.90433134, -0.08442362, -0.06848314],
+                             [40.00000000, -12.00000000, 20.00000000]])
+
+        pairwise = delta_E_CAM02UCS(Jpapbp_1[:, np.newaxis],
+                                    Jpapbp_2[np.newaxis])
+        self.assertEqual(pairwise.shape, (2, 3))
+        for i, a in enumerate(Jpapbp_1):
+            for j, b in enumerate(Jpapbp_2):
+                self.assertAlmostEqual(pairwise[i, j],
+                                       delta_E_CAM02UCS(a, b),
+                                       places=10)
+
+    @ignore_numpy_errors
+    def test_nan_delta_E_Luo2006(self):
+        """
+        Tests :func:`colour.difference.cam02_ucs.delta_E_Luo2006` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            Jpapbp_1 = np.array(case)
+            Jpapbp_2 = np.array(case)
+            delta_E_CAM02UCS(Jpapbp_1, Jpapbp_2)
+
+
+if __name__ == '__main__':
+    unittest.main()
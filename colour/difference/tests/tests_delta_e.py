@@ -405,6 +405,47 @@ class TestDelta_E_CIE2000(unittest.TestCase):
             d_E,
             decimal=4)
 
+    def test_tiles_delta_E_CIE2000(self):
+        """
+        Tests :func:`colour.difference.delta_e.delta_E_CIE2000` definition
+        tiled computation and broadcasting support.
+        """
+
+        random_state = np.random.RandomState(4)
+        Lab_1 = (random_state.random_sample((7, 11, 3)) *
+                 np.array([100, 256, 256]) - np.array([0, 128, 128]))
+        Lab_2 = (random_state.random_sample((7, 11, 3)) *
+                 np.array([100, 256, 256]) - np.array([0, 128, 128]))
+
+        d_E = delta_E_CIE2000(Lab_1, Lab_2)
+        for tile_size in (1, 5, 77, 1000):
+            np.testing.assert_equal(
+                delta_E_CIE2000(Lab_1, Lab_2, tile_size=tile_size),
+                d_E)
+
+        np.testing.assert_almost_equal(
+            delta_E_CIE2000(Lab_1[:, 0:1], Lab_2[0]),
+            np.array([[delta_E_CIE2000(Lab_1[i, 0], Lab_2[0, j])
+                       for j in range(11)] for i in range(7)]),
+            decimal=10)
+
+    def test_float32_delta_E_CIE2000(self):
+        """
+        Tests :func:`colour.difference.delta_e.delta_E_CIE2000` definition
+        single precision computation.
+        """
+
+        random_state = np.random.RandomState(4)
+        Lab_1 = (random_state.random_sample((100, 3)) *
+                 np.array([100, 256, 256]) - np.array([0, 128, 128]))
+        Lab_2 = (random_state.random_sample((100, 3)) *
+                 np.array([100, 256, 256]) - np.array([0, 128, 128]))
+
+        d_E = delta_E_CIE2000(Lab_1, Lab_2, dtype=np.float32)
+        self.assertEqual(d_E.dtype, np.float32)
+        np.testing.assert_allclose(
+            d_E, delta_E_CIE2000(Lab_1, Lab_2), rtol=1e-4, atol=1e-4)
+
 
 class TestDelta_E_CMC(unittest.TestCase):
     """
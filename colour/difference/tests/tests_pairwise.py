@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.difference.pairwise` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.difference import (
+    DELTA_E_METHODS,
+    Delta_E_Index,
+    delta_E_nearest,
+    delta_E_pairwise)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SAMPLES',
+           'LIBRARY',
+           'TestDelta_E_Pairwise',
+           'TestDelta_E_Nearest',
+           'TestDelta_E_Index']
+
+SAMPLES = (np.random.RandomState(4).random_sample((4, 5, 3)) *
+           np.array([100, 160, 160]) - np.array([0, 80, 80]))
+
+LIBRARY = (np.random.RandomState(8).random_sample((50, 3)) *
+           np.array([100, 160, 160]) - np.array([0, 80, 80]))
+
+
+def _delta_E_loop(Lab_1, Lab_2, method='CIE 2000'):
+    """
+    Returns the pairwise colour differences computed with a loop.
+    """
+
+    Lab_1 = np.reshape(Lab_1, (-1, 3))
+
+    return np.array([[DELTA_E_METHODS[method](a, b) for b in Lab_2]
+                     for a in Lab_1])
+
+
+class TestDelta_E_Pairwise(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.pairwise.delta_E_pairwise` definition
+    unit tests methods.
+    """
+
+    def test_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition.
+        """
+
+        for method in ('CIE 2000', 'CIE 1976', 'CMC'):
+            np.testing.assert_almost_equal(
+                delta_E_pairwise(SAMPLES, LIBRARY, method),
+                np.reshape(_delta_E_loop(SAMPLES, LIBRARY, method),
+                           (4, 5, 50)),
+                decimal=10)
+
+    def test_blocks_delta_E_pairwise(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_pairwise` definition
+        blocks and threads support.
+        """
+
+        d_E = delta_E_pairwise(SAMPLES, LIBRARY)
+        for tile_size in (1, 7, 50, 120):
+            np.testing.assert_equal(
+                delta_E_pairwise(SAMPLES, LIBRARY, tile_size=tile_size),
+                d_E)
+
+        np.testing.assert_equal(
+            delta_E_pairwise(SAMPLES, LIBRARY, tile_size=60, threads=4),
+            d_E)
+
+        out = np.zeros((4, 5, 50))
+        self.assertIs(delta_E_pairwise(SAMPLES, LIBRARY, out=out), out)
+        np.testing.assert_equal(out, d_E)
+
+
+class TestDelta_E_Nearest(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.pairwise.delta_E_nearest` definition
+    unit tests methods.
+    """
+
+    def test_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition.
+        """
+
+        d_E = _delta_E_loop(SAMPLES, LIBRARY)
+        indices = np.argsort(d_E, axis=-1)[:, :3]
+
+        for tile_size in (1, 7, 50, 120):
+            d_E_n, indices_n = delta_E_nearest(
+                SAMPLES, LIBRARY, k=3, tile_size=tile_size, threads=2)
+            self.assertEqual(d_E_n.shape, (4, 5, 3))
+            np.testing.assert_equal(np.reshape(indices_n, (-1, 3)), indices)
+            np.testing.assert_almost_equal(
+                np.reshape(d_E_n, (-1, 3)),
+                np.sort(d_E, axis=-1)[:, :3],
+                decimal=10)
+
+        d_E_n, indices_n = delta_E_nearest(SAMPLES[0, 0], LIBRARY)
+        self.assertEqual(indices_n.shape, (1,))
+        self.assertEqual(indices_n[0], indices[0, 0])
+
+    def test_raise_exception_delta_E_nearest(self):
+        """
+        Tests :func:`colour.difference.pairwise.delta_E_nearest` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, delta_E_nearest, SAMPLES, LIBRARY, 0)
+        self.assertRaises(ValueError, delta_E_nearest, SAMPLES, LIBRARY, 51)
+
+
+class TestDelta_E_Index(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.pairwise.Delta_E_Index` class unit
+    tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('library', 'method')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(Delta_E_Index))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('query',)
+
+        for method in required_methods:
+            self.assertIn(method, dir(Delta_E_Index))
+
+    def test_query(self):
+        """
+        Tests :func:`colour.difference.pairwise.Delta_E_Index.query` method.
+        """
+
+        d_E, indices = delta_E_nearest(SAMPLES, LIBRARY, k=2)
+
+        index = Delta_E_Index(LIBRARY)
+        np.testing.assert_equal(
+            index.query(SAMPLES, k=2, candidates=50)[1], indices)
+
+        d_E_i, indices_i = index.query(SAMPLES, k=2, candidates=20)
+        self.assertEqual(indices_i.shape, (4, 5, 2))
+        self.assertTrue(np.all(d_E_i >= d_E - 1e-10))
+        self.assertGreater(np.mean(indices_i == indices), 0.9)
+
+        d_E, indices = delta_E_nearest(SAMPLES, LIBRARY, k=2, candidates=20)
+        np.testing.assert_equal(indices, indices_i)
+
+        index = Delta_E_Index(LIBRARY, 'CIE 1976')
+        np.testing.assert_equal(
+            index.query(SAMPLES, k=2, candidates=2)[1],
+            delta_E_nearest(SAMPLES, LIBRARY, k=2, method='CIE 1976')[1])
+
+    @ignore_numpy_errors
+    def test_nan_query(self):
+        """
+        Tests :func:`colour.difference.pairwise.Delta_E_Index.query` method
+        nan support.
+        """
+
+        samples = np.vstack([[[np.nan, 0, 0], [50, np.inf, 0]],
+                             np.reshape(SAMPLES, (-1, 3))])
+        index = Delta_E_Index(LIBRARY)
+        for candidates in (4, len(LIBRARY)):
+            d_E, indices = index.query(samples, k=2, candidates=candidates)
+
+            np.testing.assert_equal(d_E[:2], np.full((2, 2), np.nan))
+            np.testing.assert_equal(indices[:2],
+                                    np.full((2, 2), len(LIBRARY)))
+
+            d_E_f, indices_f = index.query(
+                samples[2:], k=2, candidates=candidates)
+            np.testing.assert_almost_equal(d_E[2:], d_E_f, decimal=7)
+            np.testing.assert_equal(indices[2:], indices_f)
+
+    def test_raise_exception_query(self):
+        """
+        Tests :func:`colour.difference.pairwise.Delta_E_Index.query` method
+        raised exception.
+        """
+
+        index = Delta_E_Index(LIBRARY)
+        self.assertRaises(ValueError, index.query, SAMPLES, 0)
+        self.assertRaises(ValueError, index.query, SAMPLES, 4, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.difference.statistics` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.difference import delta_E, delta_E_statistics
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['IMAGE_1',
+           'IMAGE_2',
+           'TestDelta_E_Statistics']
+
+IMAGE_1 = (np.random.RandomState(4).random_sample((64, 48, 3)) *
+           np.array([100, 256, 256]) - np.array([0, 128, 128]))
+
+IMAGE_2 = IMAGE_1 + np.random.RandomState(8).normal(0, 4, (64, 48, 3))
+
+
+def _inverse_cdf(a, percentiles):
+    """
+    Returns given percentiles of given array as the inverse of its empirical
+    cumulative distribution function.
+    """
+
+    a = np.sort(np.ravel(a))
+    indexes = np.ceil(np.asarray(percentiles) / 100 * a.size).astype(int)
+
+    return a[np.clip(indexes - 1, 0, a.size - 1)]
+
+
+class TestDelta_E_Statistics(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.statistics.delta_E_statistics`
+    definition unit tests methods.
+    """
+
+    def test_delta_E_statistics(self):
+        """
+        Tests :func:`colour.difference.statistics.delta_E_statistics`
+        definition.
+        """
+
+        for method in ('CIE 2000', 'CIE 1976'):
+            d_E = delta_E(IMAGE_1, IMAGE_2, method=method)
+            for tile_size, threads in ((100000, 1), (500, 1), (333, 3)):
+                statistics = delta_E_statistics(IMAGE_1,
+                                                IMAGE_2,
+                                                method,
+                                                tile_size=tile_size,
+                                                threads=threads)
+
+                self.assertEqual(statistics.count, d_E.size)
+                self.assertAlmostEqual(statistics.mean, np.mean(d_E),
+                                       places=10)
+                self.assertAlmostEqual(statistics.rms,
+                                       np.sqrt(np.mean(d_E ** 2)),
+                                       places=10)
+                self.assertEqual(statistics.minimum, np.min(d_E))
+                self.assertEqual(statistics.maximum, np.max(d_E))
+                self.assertEqual(
+                    statistics.maximum_location,
+                    np.unravel_index(np.argmax(d_E), d_E.shape))
+                self.assertEqual(np.sum(statistics.histogram), d_E.size)
+                np.testing.assert_allclose(
+                    statistics.percentiles,
+                    _inverse_cdf(d_E, (50, 95, 99)),
+                    atol=0.01)
+
+    def test_out_delta_E_statistics(self):
+        """
+        Tests :func:`colour.difference.statistics.delta_E_statistics`
+        definition colour difference map output.
+        """
+
+        out = np.zeros((64, 48))
+        delta_E_statistics(IMAGE_1, IMAGE_2, tile_size=500, threads=2,
+                           out=out)
+        np.testing.assert_almost_equal(
+            out, delta_E(IMAGE_1, IMAGE_2, method='CIE 2000'), decimal=10)
+
+    def test_range_delta_E_statistics(self):
+        """
+        Tests :func:`colour.difference.statistics.delta_E_statistics`
+        definition percentiles outside the histogram range.
+        """
+
+        d_E = delta_E(IMAGE_1, IMAGE_2, method='CIE 1976')
+        statistics = delta_E_statistics(IMAGE_1, IMAGE_2, 'CIE 1976',
+                                        percentiles=(0, 5, 100),
+                                        bins=1000,
+                                        histogram_range=(2, 10))
+
+        self.assertLess(np.sum(statistics.histogram), d_E.size)
+        self.assertEqual(statistics.percentiles[0], np.min(d_E))
+        self.assertEqual(statistics.percentiles[-1], np.max(d_E))
+        self.assertAlmostEqual(statistics.percentiles[1],
+                               _inverse_cdf(d_E, 5),
+                               delta=0.01)
+
+    def test_raise_exception_delta_E_statistics(self):
+        """
+        Tests :func:`colour.difference.statistics.delta_E_statistics`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, delta_E_statistics, IMAGE_1,
+                          IMAGE_2[:-1])
+        self.assertRaises(ValueError, delta_E_statistics, IMAGE_1, IMAGE_2,
+                          out=np.zeros((48, 64)))
+
+    @ignore_numpy_errors
+    def test_nan_delta_E_statistics(self):
+        """
+        Tests :func:`colour.difference.statistics.delta_E_statistics`
+        definition nan support.
+        """
+
+        image = np.copy(IMAGE_2)
+        image[0, 0] = np.nan
+        statistics = delta_E_statistics(IMAGE_1, image)
+        self.assertEqual(statistics.count, 64 * 48 - 1)
+
+        statistics = delta_E_statistics(IMAGE_1, np.full_like(image, np.nan))
+        self.assertEqual(statistics.count, 0)
+        self.assertIsNone(statistics.maximum_location)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,629 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+CGATS Data Input
+================
+
+Defines input objects for *CGATS* and *IT8* measurement data files, e.g.
+*X-Rite* instruments data files:
+
+-   :class:`CGATS_Data`
+-   :func:`read_cgats_file`
+-   :func:`iter_cgats_file`
+
+The files are read line by line: the keywords and data format are parsed
+from the header and the data block rows are parsed in bulk into a single
+:class:`numpy.ndarray` class instance, the iterator definition yielding the
+data block in chunks of rows for files not fitting in memory.
+
+See Also
+--------
+:mod:`colour.io.xrite`
+
+References
+----------
+.. [1]  ANSI. (2013). CGATS.17-2009 (R2013) - Graphic technology - Exchange
+        format for colour and process control data using XML or ASCII text.
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import re
+from collections import OrderedDict
+from itertools import islice
+
+import numpy as np
+
+from colour.colorimetry import SpectralPowerDistribution
+from colour.utilities import is_string, string_to_values
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['CGATS_FILE_ENCODING',
+           'DEFAULT_CGATS_CHUNK_SIZE',
+           'CGATS_TEXT_FIELDS',
+           'CGATS_SPECTRAL_FIELD_PATTERN',
+           'CGATS_XYZ_FIELDS',
+           'CGATS_LAB_FIELDS',
+           'CGATS_Data',
+           'iter_cgats_file',
+           'read_cgats_file']
+
+CGATS_FILE_ENCODING = 'utf-8'
+"""
+*CGATS* files encoding.
+
+CGATS_FILE_ENCODING : unicode
+"""
+
+DEFAULT_CGATS_CHUNK_SIZE = 65536
+"""
+Default count of *CGATS* file data block rows read at once.
+
+DEFAULT_CGATS_CHUNK_SIZE : integer
+"""
+
+CGATS_TEXT_FIELDS = ('SAMPLE_ID', 'SAMPLE_NAME', 'SAMPLE_LOC', 'STRING')
+"""
+*CGATS* data fields always stored as text, the other fields are stored as
+text only if their first row value is not numeric.
+
+CGATS_TEXT_FIELDS : tuple
+"""
+
+CGATS_SPECTRAL_FIELD_PATTERN = (
+    '^(?:SPECTRAL_NM_?|SPECTRAL_|NM_?)(\\d+(?:\\.\\d+)?)$')
+"""
+*CGATS* spectral data fields names pattern, e.g. *SPECTRAL_NM380*,
+*SPECTRAL_380* or *nm380*, matched case insensitively, the group capturing
+the wavelength.
+
+CGATS_SPECTRAL_FIELD_PATTERN : unicode
+"""
+
+CGATS_XYZ_FIELDS = ('XYZ_X', 'XYZ_Y', 'XYZ_Z')
+"""
+*CGATS* *CIE XYZ* tristimulus values data fields names.
+
+CGATS_XYZ_FIELDS : tuple
+"""
+
+CGATS_LAB_FIELDS = ('LAB_L', 'LAB_A', 'LAB_B')
+"""
+*CGATS* *CIE Lab* colourspace data fields names.
+
+CGATS_LAB_FIELDS : tuple
+"""
+
+
+class CGATS_Data(object):
+    """
+    Defines the array backed data of a *CGATS* file, or of a chunk of its
+    data block rows.
+
+    Parameters
+    ----------
+    keywords : OrderedDict
+        Header keywords values, the quotes and comments being removed.
+    fields : list
+        Data fields names.
+    values : ndarray
+        Data values of shape (N, F) with :math:`N` the samples count and
+        :math:`F` the fields count, the text fields values are *nan*.
+    text : OrderedDict
+        Text fields values arrays of shape (N, ) keyed by field name.
+
+    Attributes
+    ----------
+    keywords
+    fields
+    values
+    text
+    wavelengths
+    spectral_values
+    XYZ
+    Lab
+
+    Methods
+    -------
+    field_values
+    spds
+
+    Examples
+    --------
+    >>> import os
+    >>> cgats_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'xrite_digital_colour_checker.txt')
+    >>> data = read_cgats_file(cgats_file)
+    >>> data.keywords['INSTRUMENTATION']
+    'Spectrolino'
+    >>> data.values.shape
+    (10, 41)
+    >>> data.wavelengths[:4]
+    array([ 380.,  390.,  400.,  410.])
+    >>> data.spectral_values[:2, :4]
+    array([[ 0.0069,  0.0069,  0.0068,  0.0068],
+           [ 0.007 ,  0.0069,  0.0069,  0.0069]])
+    >>> data.field_values(['RGB_R', 'RGB_G', 'RGB_B'])[0]
+    array([ 109.97,  110.29,  110.21])
+    """
+
+    def __init__(self, keywords, fields, values, text):
+        self._keywords = keywords
+        self._fields = fields
+        self._values = values
+        self._text = text
+
+        pattern = re.compile(CGATS_SPECTRAL_FIELD_PATTERN, re.IGNORECASE)
+        matches = [(i, pattern.match(field))
+                   for i, field in enumerate(fields)]
+        self._spectral_indices = [i for i, match in matches if match]
+        self._wavelengths = np.array([float(match.group(1))
+                                      for _i, match in matches if match])
+
+    @property
+    def keywords(self):
+        """
+        Property for **self.keywords** attribute.
+
+        Returns
+        -------
+        OrderedDict
+            self.keywords.
+        """
+
+        return self._keywords
+
+    @property
+    def fields(self):
+        """
+        Property for **self.fields** attribute.
+
+        Returns
+        -------
+        list
+            self.fields.
+        """
+
+        return self._fields
+
+    @property
+    def values(self):
+        """
+        Property for **self.values** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.values.
+        """
+
+        return self._values
+
+    @property
+    def text(self):
+        """
+        Property for **self.text** attribute.
+
+        Returns
+        -------
+        OrderedDict
+            self.text.
+        """
+
+        return self._text
+
+    @property
+    def wavelengths(self):
+        """
+        Property for **self.wavelengths** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.wavelengths, wavelengths :math:`\lambda_n` of the spectral
+            data fields.
+        """
+
+        return self._wavelengths
+
+    @property
+    def spectral_values(self):
+        """
+        Property for **self.spectral_values** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.spectral_values, spectral data values of shape (N, W), a
+            view of :attr:`CGATS_Data.values` attribute if the spectral data
+            fields are contiguous.
+        """
+
+        indices = self._spectral_indices
+        if indices and indices == list(range(indices[0], indices[-1] + 1)):
+            return self._values[:, indices[0]:indices[-1] + 1]
+        else:
+            return self._values[:, indices]
+
+    @property
+    def XYZ(self):
+        """
+        Property for **self.XYZ** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.XYZ, *CIE XYZ* tristimulus values of shape (N, 3) or *None*
+            if the data does not define them.
+        """
+
+        if all(field in self._fields for field in CGATS_XYZ_FIELDS):
+            return self.field_values(CGATS_XYZ_FIELDS)
+
+    @property
+    def Lab(self):
+        """
+        Property for **self.Lab** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.Lab, *CIE Lab* colourspace values of shape (N, 3) or *None*
+            if the data does not define them.
+        """
+
+        if all(field in self._fields for field in CGATS_LAB_FIELDS):
+            return self.field_values(CGATS_LAB_FIELDS)
+
+    def field_values(self, fields):
+        """
+        Returns given data field values or stacked data fields values.
+
+        Parameters
+        ----------
+        fields : unicode or array_like
+            Data field name or data fields names.
+
+        Returns
+        -------
+        ndarray
+            Data field values of shape (N, ), a text field values being an
+            array of *unicode*, or stacked data fields values of shape
+            (N, K).
+
+        Raises
+        ------
+        ValueError
+            If a data field is not defined.
+        """
+
+        names = [fields] if is_string(fields) else list(fields)
+        for name in names:
+            if name not in self._fields:
+                raise ValueError(
+                    ('"{0}" field is not defined, it must be one of '
+                     '{1}!').format(name, self._fields))
+
+        if is_string(fields):
+            if fields in self._text:
+                return self._text[fields]
+
+            return self._values[:, self._fields.index(fields)]
+
+        return self._values[:, [self._fields.index(name) for name in names]]
+
+    def spds(self, name_field=None):
+        """
+        Returns the spectral data as an *OrderedDict* of
+        :class:`colour.colorimetry.spectrum.SpectralPowerDistribution`
+        classes.
+
+        Parameters
+        ----------
+        name_field : unicode, optional
+            Data field naming the spectral power distributions, default to
+            the first defined field of *SAMPLE_NAME*, *SAMPLE_ID* and the
+            first data field.
+
+        Returns
+        -------
+        OrderedDict
+            :class:`colour.colorimetry.spectrum.SpectralPowerDistribution`
+            classes.
+        """
+
+        if name_field is None:
+            name_field = next((field for field in ('SAMPLE_NAME', 'SAMPLE_ID')
+                               if field in self._fields), self._fields[0])
+
+        names = self.field_values(name_field)
+        if name_field not in self._text:
+            names = ['{0:g}'.format(name) for name in names]
+
+        wavelengths = self._wavelengths.tolist()
+
+        return OrderedDict(
+            (name, SpectralPowerDistribution(
+                name, dict(zip(wavelengths, values))))
+            for name, values in zip(names, self.spectral_values.tolist()))
+
+
+def _cgats_tokens(line):
+    """
+    Splits given *CGATS* file line into tokens, the quoted tokens being
+    unquoted.
+    """
+
+    if '"' not in line:
+        return line.split()
+
+    return [token[1:-1] if token.startswith('"') else token
+            for token in re.findall('"[^"]*"|[^\\s"]+', line)]
+
+
+def _cgats_keyword(line):
+    """
+    Parses given *CGATS* file header line into a keyword and its value.
+    """
+
+    tokens = line.split(None, 1)
+    keyword = tokens[0]
+    value = tokens[1].strip() if len(tokens) == 2 else ''
+
+    if value.startswith('"'):
+        value = value[1:value.find('"', 1)]
+    elif '#' in value:
+        value = value[:value.find('#')].strip()
+
+    return keyword, value
+
+
+def _cgats_header(cgats_file):
+    """
+    Reads the header of given *CGATS* file up to its data block.
+    """
+
+    keywords = OrderedDict()
+    fields = []
+    is_data_format = False
+    for line in cgats_file:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+
+        if line == 'BEGIN_DATA_FORMAT':
+            is_data_format = True
+        elif line == 'END_DATA_FORMAT':
+            is_data_format = False
+        elif line == 'BEGIN_DATA':
+            break
+        elif is_data_format:
+            fields += _cgats_tokens(line)
+        else:
+            keyword, value = _cgats_keyword(line)
+            if keyword == 'KEYWORD':
+                continue
+
+            keywords[keyword] = value
+
+    return keywords, fields
+
+
+def _cgats_rows_to_array(lines, count, text_indices):
+    """
+    Parses given *CGATS* file data block lines into an array of shape
+    (R, count) and the text fields values arrays.
+
+    When the text fields are the leading fields, they are split from the
+    lines and the remaining numeric fields are parsed at once by
+    :func:`numpy.fromstring` definition, the lines are otherwise tokenised.
+    """
+
+    leading = len(text_indices)
+    if text_indices == list(range(leading)):
+        text, numeric = [], []
+        for line in lines:
+            if '"' in line:
+                tokens = _cgats_tokens(line)
+                tokens = tokens[:leading] + [' '.join(tokens[leading:])]
+            else:
+                tokens = line.split(None, leading)
+
+            text.append(tokens[:leading])
+            numeric.append(tokens[leading] if len(tokens) > leading else '')
+
+        values = string_to_values(' '.join(numeric), ' ')
+
+        if (values is not None and
+                values.size == len(lines) * (count - leading) and
+                all(len(row) == leading for row in text)):
+            text = np.array(text, dtype=np.unicode_)
+            values = np.hstack(
+                (np.full((len(lines), leading), np.nan),
+                 np.reshape(values, (len(lines), count - leading))))
+
+            return values, dict((i, text[:, i]) for i in text_indices)
+
+    tokens = [_cgats_tokens(line) for line in lines]
+    for line, row in zip(lines, tokens):
+        if len(row) != count:
+            raise ValueError(
+                ('"{0}" data row fields count does not match "{1}" data '
+                 'fields count!').format(line, count))
+
+    tokens = np.array(tokens, dtype=np.unicode_)
+    values = np.full((len(lines), count), np.nan)
+    numeric_indices = [i for i in range(count) if i not in text_indices]
+    try:
+        values[:, numeric_indices] = (
+            tokens[:, numeric_indices].astype(np.float_))
+    except ValueError:
+        for i in numeric_indices:
+            for j, token in enumerate(tokens[:, i]):
+                try:
+                    values[j, i] = float(token)
+                except ValueError:
+                    pass
+
+    return values, dict((i, tokens[:, i]) for i in text_indices)
+
+
+def _cgats_text_indices(fields, line):
+    """
+    Returns the indices of the text data fields from given data fields names
+    and first data block line.
+    """
+
+    def is_numeric(token):
+        """
+        Returns if given token is numeric.
+        """
+
+        try:
+            float(token)
+            return True
+        except ValueError:
+            return False
+
+    tokens = _cgats_tokens(line)
+    return [i for i, field in enumerate(fields)
+            if field.upper() in CGATS_TEXT_FIELDS or
+            (i < len(tokens) and not is_numeric(tokens[i]))]
+
+
+def iter_cgats_file(path, chunk_size=DEFAULT_CGATS_CHUNK_SIZE):
+    """
+    Reads the data from given *CGATS* file in chunks of data block rows and
+    yields them as :class:`CGATS_Data` class instances.
+
+    Only a chunk of rows is in memory at any time: a *CGATS* file larger
+    than the available memory can be processed chunk by chunk.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CGATS* file path.
+    chunk_size : integer, optional
+        Count of data block rows read at once, the remaining rows are read
+        at once if *None*.
+
+    Returns
+    -------
+    generator
+        :class:`CGATS_Data` class instances of the *CGATS* file data block
+        chunks of rows, sharing the header keywords.
+
+    Raises
+    ------
+    ValueError
+        If a data block row fields count does not match the data fields
+        count.
+
+    Notes
+    -----
+    -   Only the first data block of a *CGATS* file is read.
+
+    Examples
+    --------
+    >>> import os
+    >>> cgats_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'xrite_digital_colour_checker.txt')
+    >>> for data in iter_cgats_file(cgats_file, 4):
+    ...     print(data.values.shape)
+    (4, 41)
+    (4, 41)
+    (2, 41)
+    """
+
+    with codecs.open(path, encoding=CGATS_FILE_ENCODING) as cgats_file:
+        keywords, fields = _cgats_header(cgats_file)
+        count = len(fields)
+
+        text_indices = None
+        while True:
+            lines = list(islice(cgats_file, chunk_size))
+
+            is_last = not lines
+            for i, line in enumerate(lines):
+                if line.strip() == 'END_DATA':
+                    lines, is_last = lines[:i], True
+                    break
+
+            lines = [line.strip() for line in lines]
+            lines = [line for line in lines
+                     if line and not line.startswith('#')]
+
+            if lines:
+                if text_indices is None:
+                    text_indices = _cgats_text_indices(fields, lines[0])
+
+                values, text = _cgats_rows_to_array(
+                    lines, count, text_indices)
+
+                yield CGATS_Data(
+                    keywords,
+                    fields,
+                    values,
+                    OrderedDict((fields[i], text[i]) for i in text_indices))
+
+            if is_last:
+                break
+
+
+def read_cgats_file(path):
+    """
+    Reads the data from given *CGATS* file and returns it as a
+    :class:`CGATS_Data` class instance.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute *CGATS* file path.
+
+    Returns
+    -------
+    CGATS_Data
+        *CGATS* file data.
+
+    See Also
+    --------
+    :func:`iter_cgats_file`
+
+    Examples
+    --------
+    >>> import os
+    >>> cgats_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'xrite_digital_colour_checker.txt')
+    >>> print(read_cgats_file(cgats_file).fields[:5])
+    ['SampleID', 'SAMPLE_NAME', 'RGB_R', 'RGB_G', 'RGB_B']
+    """
+
+    chunks = list(iter_cgats_file(path, None))
+
+    if not chunks:
+        with codecs.open(path, encoding=CGATS_FILE_ENCODING) as cgats_file:
+            keywords, fields = _cgats_header(cgats_file)
+
+        return CGATS_Data(keywords,
+                          fields,
+                          np.zeros((0, len(fields))),
+                          OrderedDict())
+
+    return chunks[0]
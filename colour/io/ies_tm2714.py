@@ -6,7 +6,8 @@ IES TM-27-14 Data Input / Output
 ================================
 
 Defines the :class:`IES_TM2714_Spd` class handling IES TM-27-14 spectral data
-XML files.
+XML files and the :func:`read_spds_from_ies_tm2714_directory` definition
+reading a directory of IES TM-27-14 spectral data XML files concurrently.
 
 References
 ----------
@@ -17,11 +18,13 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
+import numpy as np
 import os
 import re
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
+from multiprocessing.pool import ThreadPool
 from xml.etree import ElementTree
-from xml.dom import minidom
 
 from colour.colorimetry import SpectralPowerDistribution
 from colour.utilities import Structure, is_numeric
@@ -37,7 +40,8 @@ __all__ = ['IES_TM2714_VERSION',
            'IES_TM2714_NAMESPACE',
            'IES_TM2714_ElementSpecification',
            'IES_TM2714_Header',
-           'IES_TM2714_Spd']
+           'IES_TM2714_Spd',
+           'read_spds_from_ies_tm2714_directory']
 
 IES_TM2714_VERSION = '1.0'
 IES_TM2714_NAMESPACE = 'http://www.ies.org/iestm2714'
@@ -591,6 +595,27 @@ class IES_TM2714_Header(object):
         self._comments = value
 
 
+def _indent_element(element, level=0):
+    """
+    Indents given element and its children in place with tabulations, the
+    elements having no children being written on a single line.
+    """
+
+    indentation = '\n' + level * '\t'
+    if len(element):
+        if not element.text or not element.text.strip():
+            element.text = indentation + '\t'
+
+        for child in element:
+            _indent_element(child, level + 1)
+            child.tail = indentation + '\t'
+
+        child.tail = indentation
+
+    if not level:
+        element.tail = '\n'
+
+
 class IES_TM2714_Spd(SpectralPowerDistribution):
     """
     Defines a IES TM-27-14 spectral power distribution.
@@ -1002,34 +1027,47 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
         array(0.034...)
         """
 
-        formatter = './{{{0}}}{1}/{{{0}}}{2}'
-
-        tree = ElementTree.parse(self._path)
-        root = tree.getroot()
-
-        namespace = re.match('\{(.*)\}', root.tag).group(1)
-
-        self.name = os.path.splitext(os.path.basename(self._path))[0]
-
-        iterator = root.iter
-
-        for header_element in (self.header, self):
-            mapping = header_element.mapping
-            for specification in mapping.elements:
-                element = root.find(formatter.format(
-                    namespace, mapping.element, specification.element))
-                if element is not None:
+        data = self.mapping.data
+        wavelengths, values = [], []
+
+        elements, specifications = [], {}
+        for event, element in ElementTree.iterparse(
+                self._path, events=('start', 'end')):
+            if event == 'start':
+                if not elements:
+                    namespace = re.match('\{(.*)\}', element.tag).group(1)
+                    data_tag = '{{{0}}}{1}'.format(namespace, data.element)
+                    specifications = dict(
+                        (('{{{0}}}{1}'.format(namespace, mapping.element),
+                          '{{{0}}}{1}'.format(namespace,
+                                              specification.element)),
+                         (header_element, specification))
+                        for header_element, mapping in (
+                            (self.header, self.header.mapping),
+                            (self, self.mapping))
+                        for specification in mapping.elements)
+
+                elements.append(element)
+                continue
+
+            elements.pop()
+            if element.tag == data_tag:
+                # Reading spectral data, the parsed elements are removed so
+                # that the memory usage does not grow with the file size.
+                wavelengths.append(float(element.attrib[data.attribute]))
+                values.append(float(element.text))
+                elements[-1].remove(element)
+            elif len(elements) == 2:
+                header_element, specification = specifications.get(
+                    (elements[-1].tag, element.tag), (None, None))
+                if specification is not None:
                     setattr(header_element,
                             specification.attribute,
                             specification.read_conversion(element.text))
 
-        # Reading spectral data.
-        for spectral_data in iterator('{{{0}}}{1}'.format(
-                namespace, self.mapping.data.element)):
-            wavelength = float(spectral_data.attrib[
-                self.mapping.data.attribute])
-            value = float(spectral_data.text)
-            self[wavelength] = value
+        self.name = os.path.splitext(os.path.basename(self._path))[0]
+
+        self[np.array(wavelengths)] = np.array(values)
 
         return True
 
@@ -1084,9 +1122,75 @@ class IES_TM2714_Spd(SpectralPowerDistribution):
                 mapping.data.attribute: mapping.data.write_conversion(
                     wavelength)}
 
-        xml = minidom.parseString(ElementTree.tostring(root)).toprettyxml()
+        _indent_element(root)
+        xml = ElementTree.tostring(root).decode('ascii')
 
         with open(self._path, 'w') as file:
+            file.write('<?xml version="1.0" ?>\n')
             file.write(xml)
 
         return True
+
+
+def read_spds_from_ies_tm2714_directory(directory,
+                                        extension='.spdx',
+                                        threads=None):
+    """
+    Reads the IES TM-27-14 spectral data XML files of given directory
+    concurrently and returns them as an *OrderedDict* of
+    :class:`IES_TM2714_Spd` classes.
+
+    Parameters
+    ----------
+    directory : unicode
+        Directory containing the IES TM-27-14 spectral data XML files.
+    extension : unicode, optional
+        IES TM-27-14 spectral data XML files extension, matched case
+        insensitively.
+    threads : integer, optional
+        Threads count reading the files concurrently, default to
+        :func:`multiprocessing.cpu_count` definition if *None*.
+
+    Returns
+    -------
+    OrderedDict
+        :class:`IES_TM2714_Spd` classes keyed by name, i.e. file name
+        without extension, sorted by file name.
+
+    Examples
+    --------
+    >>> from os.path import dirname, join
+    >>> directory = join(dirname(__file__), 'tests', 'resources')
+    >>> spds = read_spds_from_ies_tm2714_directory(directory)
+    >>> list(spds.keys())
+    ['Fluorescent']
+    >>> spds['Fluorescent'].header.description
+    'Rare earth fluorescent lamp'
+    """
+
+    paths = sorted(os.path.join(directory, name)
+                   for name in os.listdir(directory)
+                   if os.path.splitext(name)[1].lower() == extension.lower())
+
+    def read(path):
+        """
+        Reads given IES TM-27-14 spectral data XML file.
+        """
+
+        spd = IES_TM2714_Spd(path)
+        spd.read()
+
+        return spd
+
+    threads = threads if threads else multiprocessing.cpu_count()
+    if threads == 1 or len(paths) <= 1:
+        spds = [read(path) for path in paths]
+    else:
+        pool = ThreadPool(processes=min(threads, len(paths)))
+        try:
+            spds = pool.map(read, paths)
+        finally:
+            pool.close()
+            pool.join()
+
+    return OrderedDict((spd.name, spd) for spd in spds)
@@ -10,14 +10,27 @@ Defines various input / output objects for CSV tabular data files:
 -   :func:`read_spectral_data_from_csv_file`
 -   :func:`read_spds_from_csv_file`
 -   :func:`write_spds_to_csv_file`
+-   :class:`SpectralArray`
+-   :func:`read_spectral_array_from_csv_file`
+-   :func:`iter_spectral_array_from_csv_file`
+-   :func:`write_spectral_array_to_csv_file`
+
+The spectral arrays definitions parse the CSV files rows in bulk straight
+into :class:`numpy.ndarray` class instances and format them back in bulk,
+the iterator definition reading the files in chunks of rows for files not
+fitting in memory.
 """
 
 from __future__ import division, unicode_literals
 
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
+from itertools import islice
 import csv
 
+import numpy as np
+
 from colour.colorimetry import SpectralPowerDistribution
+from colour.utilities import string_to_values
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -28,7 +41,36 @@ __status__ = 'Production'
 
 __all__ = ['read_spectral_data_from_csv_file',
            'read_spds_from_csv_file',
-           'write_spds_to_csv_file']
+           'write_spds_to_csv_file',
+           'DEFAULT_CSV_CHUNK_SIZE',
+           'SpectralArray',
+           'read_spectral_array_from_csv_file',
+           'iter_spectral_array_from_csv_file',
+           'write_spectral_array_to_csv_file']
+
+DEFAULT_CSV_CHUNK_SIZE = 1024
+"""
+Default count of CSV file rows read or written at once.
+
+DEFAULT_CSV_CHUNK_SIZE : integer
+"""
+
+
+class SpectralArray(
+        namedtuple('SpectralArray', ('fields', 'wavelengths', 'values'))):
+    """
+    Defines a spectral array, i.e. the spectral data of a CSV file.
+
+    Parameters
+    ----------
+    fields : list
+        Spectral data fields names, the wavelengths field name excluded.
+    wavelengths : ndarray
+        Wavelengths :math:`\lambda_n` of shape (W, ).
+    values : ndarray
+        Spectral data values of shape (W, N) with :math:`N` the fields
+        count.
+    """
 
 
 def read_spectral_data_from_csv_file(path,
@@ -118,28 +160,13 @@ def read_spectral_data_from_csv_file(path,
      '24']
     """
 
-    with open(path, 'rU') as csv_file:
-        reader = csv.DictReader(csv_file,
-                                delimiter=str(delimiter),
-                                fieldnames=fields)
-        if len(reader.fieldnames) == 1:
-            raise RuntimeError(('A CSV spectral data file should define '
-                                'the following fields: '
-                                '("wavelength", "field 1", ..., "field n")!'))
-
-        wavelength = reader.fieldnames[0]
-        fields = reader.fieldnames[1:]
-
-        data = OrderedDict(zip(fields, ({} for _ in range(len(fields)))))
-        for line in reader:
-            for field in fields:
-                try:
-                    value = float(line[field])
-                except ValueError:
-                    value = default
+    fields, wavelengths, values = read_spectral_array_from_csv_file(
+        path, delimiter, fields, default)
 
-                data[field][float(line[wavelength])] = value
-        return data
+    wavelengths = wavelengths.tolist()
+    data = OrderedDict(zip(fields, (dict(zip(wavelengths, column))
+                                    for column in values.T.tolist())))
+    return data
 
 
 def read_spds_from_csv_file(path,
@@ -233,20 +260,269 @@ def write_spds_to_csv_file(spds,
             raise RuntimeError(('Cannot write spectral power distributions '
                                 'with different shapes to CSV file!'))
 
+    fields = list(fields) if fields is not None else sorted(spds.keys())
     wavelengths = tuple(spds.values())[0].wavelengths
+    values = np.transpose([spds[field].values for field in fields])
+
+    return write_spectral_array_to_csv_file(
+        SpectralArray(fields, wavelengths, values), path, delimiter)
+
+
+def _csv_fields(csv_file, delimiter, fields):
+    """
+    Returns the spectral data fields names of given CSV file, reading them
+    from its first line if not given.
+    """
+
+    if fields is None:
+        fields = next(csv.reader([csv_file.readline()],
+                                 delimiter=str(delimiter)), [])
+
+    fields = list(fields)
+    if len(fields) < 2:
+        raise RuntimeError(('A CSV spectral data file should define '
+                            'the following fields: '
+                            '("wavelength", "field 1", ..., "field n")!'))
+
+    return fields
+
+
+def _csv_rows_to_array(lines, delimiter, count, default):
+    """
+    Parses given CSV file lines into an array of shape (R, count).
+
+    The lines are parsed at once by :func:`numpy.fromstring` definition, the
+    lines with missing or invalid values are parsed row by row.
+    """
+
+    lines = [line.strip() for line in lines]
+    lines = [line for line in lines if line]
+
+    if all(line.count(delimiter) == count - 1 for line in lines):
+        values = string_to_values(delimiter.join(lines), delimiter)
+
+        if values is not None and values.size == len(lines) * count:
+            return np.reshape(values, (len(lines), count))
+
+    values = np.full((len(lines), count), default, dtype=np.float_)
+    for i, row in enumerate(csv.reader(lines, delimiter=str(delimiter))):
+        values[i, 0] = float(row[0])
+        for j, value in enumerate(row[1:count], 1):
+            try:
+                values[i, j] = float(value)
+            except ValueError:
+                pass
+
+    return values
+
+
+def iter_spectral_array_from_csv_file(path,
+                                      chunk_size=DEFAULT_CSV_CHUNK_SIZE,
+                                      delimiter=',',
+                                      fields=None,
+                                      default=0):
+    """
+    Reads the spectral data from given CSV file in chunks of rows and yields
+    them as :class:`SpectralArray` class instances.
+
+    Only a chunk of rows is in memory at any time: a CSV file larger than
+    the available memory can be processed, or written into a
+    :class:`numpy.memmap` class instance, chunk by chunk.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute CSV file path.
+    chunk_size : integer, optional
+        Count of rows read at once, the remaining rows are read at once if
+        *None*.
+    delimiter : unicode, optional
+        CSV file content delimiter.
+    fields : array_like, optional
+        CSV file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    generator
+        :class:`SpectralArray` class instances of the CSV file chunks of
+        rows.
+
+    Raises
+    ------
+    RuntimeError
+        If the CSV spectral data file doesn't define the appropriate fields.
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'colorchecker_n_ohta.csv')
+    >>> for chunk in iter_spectral_array_from_csv_file(csv_file, 40):
+    ...     print(chunk.wavelengths[0], chunk.values.shape)
+    380.0 (40, 24)
+    580.0 (40, 24)
+    780.0 (1, 24)
+    """
+
+    with open(path, 'rU') as csv_file:
+        fields = _csv_fields(csv_file, delimiter, fields)
+
+        while True:
+            lines = list(islice(csv_file, chunk_size))
+            if not lines:
+                break
+
+            values = _csv_rows_to_array(
+                lines, delimiter, len(fields), default)
+            if values.size:
+                yield SpectralArray(fields[1:], values[:, 0], values[:, 1:])
+
+
+def read_spectral_array_from_csv_file(path,
+                                      delimiter=',',
+                                      fields=None,
+                                      default=0):
+    """
+    Reads the spectral data from given CSV file and returns it as a
+    :class:`SpectralArray` class instance.
+
+    Parameters
+    ----------
+    path : unicode
+        Absolute CSV file path.
+    delimiter : unicode, optional
+        CSV file content delimiter.
+    fields : array_like, optional
+        CSV file spectral data fields names. If no value is provided the
+        first line of the file will be used as spectral data fields names.
+    default : numeric, optional
+        Default value for fields row with missing value.
+
+    Returns
+    -------
+    SpectralArray
+        CSV file content.
+
+    Raises
+    ------
+    RuntimeError
+        If the CSV spectral data file doesn't define the appropriate fields.
+
+    See Also
+    --------
+    :func:`iter_spectral_array_from_csv_file`
+
+    Examples
+    --------
+    >>> import os
+    >>> csv_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'colorchecker_n_ohta.csv')
+    >>> spectral_array = read_spectral_array_from_csv_file(csv_file)
+    >>> print(spectral_array.fields[:4])
+    ['1', '2', '3', '4']
+    >>> spectral_array.wavelengths.shape, spectral_array.values.shape
+    ((81,), (81, 24))
+    >>> spectral_array.values[:2, :4]
+    array([[ 0.048,  0.103,  0.113,  0.048],
+           [ 0.051,  0.12 ,  0.138,  0.049]])
+    """
+
+    chunks = list(iter_spectral_array_from_csv_file(
+        path, None, delimiter, fields, default))
+
+    if not chunks:
+        with open(path, 'rU') as csv_file:
+            fields = _csv_fields(csv_file, delimiter, fields)
+
+        return SpectralArray(fields[1:],
+                             np.zeros(0),
+                             np.zeros((0, len(fields) - 1)))
+
+    return chunks[0]
+
+
+def write_spectral_array_to_csv_file(spectral_array,
+                                     path,
+                                     delimiter=',',
+                                     chunk_size=DEFAULT_CSV_CHUNK_SIZE):
+    """
+    Writes given spectral array, or spectral arrays chunks, to given CSV
+    file.
+
+    The rows are converted to text in bulk, chunk by chunk, e.g. a spectral
+    array backed by a :class:`numpy.memmap` class instance is never loaded
+    entirely in memory.
+
+    Parameters
+    ----------
+    spectral_array : SpectralArray or iterable
+        Spectral array to write or iterable of spectral arrays chunks with
+        identical fields, e.g. as yielded by
+        :func:`iter_spectral_array_from_csv_file` definition.
+    path : unicode
+        Absolute CSV file path.
+    delimiter : unicode, optional
+        CSV file content delimiter.
+    chunk_size : integer, optional
+        Count of rows converted to text at once.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The values are written with the shortest representation round-trip
+        converting to the same floating point numbers.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> csv_file = os.path.join(
+    ...     os.path.dirname(__file__),
+    ...     'tests',
+    ...     'resources',
+    ...     'colorchecker_n_ohta.csv')
+    >>> write_spectral_array_to_csv_file(
+    ...     iter_spectral_array_from_csv_file(csv_file),
+    ...     os.path.join(tempfile.gettempdir(), 'colorchecker_n_ohta.csv'))
+    True
+    """
+
+    chunks = ([spectral_array]
+              if isinstance(spectral_array, SpectralArray) else
+              spectral_array)
+
     with open(path, 'w') as csv_file:
-        fields = list(fields) if fields is not None else sorted(spds.keys())
-        writer = csv.DictWriter(csv_file,
-                                delimiter=str(delimiter),
-                                fieldnames=['wavelength'] + fields,
-                                lineterminator='\n')
-        # Python 2.7.x / 3.4.x only.
-        # writer.writeheader()
-        writer.writerow(dict((name, name) for name in writer.fieldnames))
-        for wavelength in wavelengths:
-            row = {'wavelength': wavelength}
-            row.update(
-                dict((field, spds[field][wavelength]) for field in fields))
-            writer.writerow(row)
+        header = False
+        for fields, wavelengths, values in chunks:
+            if not header:
+                writer = csv.writer(csv_file,
+                                    delimiter=str(delimiter),
+                                    lineterminator='\n')
+                writer.writerow(['wavelength'] + list(fields))
+                header = True
+
+            # Single row template applied to whole blocks of rows at once.
+            template = delimiter.replace('{', '{{').replace('}', '}}').join(
+                ['{!r}'] * (len(fields) + 1)) + '\n'
+            for i in range(0, len(wavelengths), chunk_size):
+                rows = np.hstack(
+                    (np.reshape(wavelengths[i:i + chunk_size], (-1, 1)),
+                     np.reshape(values[i:i + chunk_size],
+                                (-1, len(fields)))))
+                csv_file.write(
+                    (template * rows.shape[0]).format(*rows.ravel().tolist()))
 
     return True
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.io.cgats` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (
+    CGATS_Data,
+    iter_cgats_file,
+    read_cgats_file,
+    read_spds_from_xrite_file)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['RESOURCES_DIRECTORY',
+           'TestCGATS_Data',
+           'TestReadCgatsFile',
+           'TestIterCgatsFile']
+
+RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestCGATS_Data(unittest.TestCase):
+    """
+    Defines :class:`colour.io.cgats.CGATS_Data` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('keywords',
+                               'fields',
+                               'values',
+                               'text',
+                               'wavelengths',
+                               'spectral_values',
+                               'XYZ',
+                               'Lab')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CGATS_Data))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('field_values',
+                            'spds')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CGATS_Data))
+
+    def test_field_values(self):
+        """
+        Tests :meth:`colour.io.cgats.CGATS_Data.field_values` method.
+        """
+
+        data = read_cgats_file(
+            os.path.join(RESOURCES_DIRECTORY, 'cgats_colour_checker.txt'))
+
+        self.assertListEqual(
+            data.field_values('SAMPLE_NAME').tolist(),
+            ['dark skin', 'light skin', 'blue sky', 'foliage'])
+        np.testing.assert_array_equal(data.field_values('XYZ_Y'),
+                                      np.array([9.93, 35.32, 19.21, 13.21]))
+        np.testing.assert_array_equal(
+            data.field_values(['LAB_L', 'XYZ_Y']),
+            np.array([[37.70, 9.93],
+                      [65.80, 35.32],
+                      [50.90, 19.21],
+                      [43.10, 13.21]]))
+
+        self.assertRaises(ValueError, data.field_values, 'RGB_R')
+
+    def test_spds(self):
+        """
+        Tests :meth:`colour.io.cgats.CGATS_Data.spds` method.
+        """
+
+        xrite_file = os.path.join(RESOURCES_DIRECTORY,
+                                  'xrite_digital_colour_checker.txt')
+        spds = read_cgats_file(xrite_file).spds()
+        xrite_spds = read_spds_from_xrite_file(xrite_file)
+        self.assertListEqual(list(spds.keys()), list(xrite_spds.keys()))
+        for name, spd in spds.items():
+            self.assertEqual(spd, xrite_spds[name])
+
+        spds = read_cgats_file(xrite_file).spds('SampleID')
+        self.assertListEqual(list(spds.keys()),
+                             [str(i) for i in range(1, 11)])
+
+
+class TestReadCgatsFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.cgats.read_cgats_file` definition unit tests
+    methods.
+    """
+
+    def test_read_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.read_cgats_file` definition.
+        """
+
+        data = read_cgats_file(
+            os.path.join(RESOURCES_DIRECTORY, 'cgats_colour_checker.txt'))
+
+        self.assertEqual(data.keywords['ORIGINATOR'], 'Colour Developers')
+        self.assertEqual(data.keywords['CREATED'], '2015-06-01')
+        self.assertEqual(data.keywords['MEASUREMENT_CONDITION'], 'M0')
+        self.assertEqual(len(data.fields), 11)
+        self.assertListEqual(list(data.text.keys()),
+                             ['SAMPLE_ID', 'SAMPLE_NAME'])
+        self.assertListEqual(data.text['SAMPLE_ID'].tolist(),
+                             ['A1', 'A2', 'A3', 'A4'])
+
+        np.testing.assert_array_equal(data.XYZ,
+                                      np.array([[11.06, 9.93, 6.91],
+                                                [38.26, 35.32, 27.15],
+                                                [17.87, 19.21, 33.88],
+                                                [10.42, 13.21, 7.09]]))
+        np.testing.assert_array_equal(data.Lab,
+                                      np.array([[37.70, 12.40, 14.70],
+                                                [65.80, 18.00, 17.70],
+                                                [50.90, -1.80, -21.60],
+                                                [43.10, -15.90, 21.70]]))
+        np.testing.assert_array_equal(data.wavelengths,
+                                      np.array([400, 500, 600]))
+        np.testing.assert_array_equal(data.spectral_values,
+                                      np.array([[0.055, 0.061, 0.129],
+                                                [0.118, 0.220, 0.420],
+                                                [0.164, 0.244, 0.100],
+                                                [0.051, 0.082, 0.081]]))
+
+        data = read_cgats_file(os.path.join(
+            RESOURCES_DIRECTORY, 'xrite_digital_colour_checker.txt'))
+        self.assertEqual(data.values.shape, (10, 41))
+        self.assertIsNone(data.XYZ)
+        self.assertIsNone(data.Lab)
+        np.testing.assert_array_equal(data.wavelengths,
+                                      np.linspace(380, 730, 36))
+        np.testing.assert_array_equal(data.field_values('SampleID'),
+                                      np.arange(1, 11))
+
+
+class TestIterCgatsFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.cgats.iter_cgats_file` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_iter_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.iter_cgats_file` definition.
+        """
+
+        for name in ('cgats_colour_checker.txt',
+                     'xrite_digital_colour_checker.txt'):
+            path = os.path.join(RESOURCES_DIRECTORY, name)
+            data = read_cgats_file(path)
+            chunks = list(iter_cgats_file(path, 3))
+
+            np.testing.assert_array_equal(
+                np.concatenate([chunk.values for chunk in chunks]),
+                data.values)
+            for field, values in data.text.items():
+                np.testing.assert_array_equal(
+                    np.concatenate([chunk.text[field] for chunk in chunks]),
+                    values)
+
+    def test_invalid_values_iter_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.iter_cgats_file` definition with invalid
+        values.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write('CGATS.17\n'
+                             'BEGIN_DATA_FORMAT\n'
+                             'SAMPLE_ID SAMPLE_NAME XYZ_X XYZ_Y XYZ_Z\n'
+                             'END_DATA_FORMAT\n'
+                             'BEGIN_DATA\n'
+                             'A1 x 0.1 0.2 0.3\n'
+                             'A2 y 0.4 n/a 0.6\n'
+                             'A3 z 0.7 0.8 0.9\n'
+                             'END_DATA\n')
+
+        data = read_cgats_file(path)
+        np.testing.assert_array_equal(data.XYZ,
+                                      np.array([[0.1, 0.2, 0.3],
+                                                [0.4, np.nan, 0.6],
+                                                [0.7, 0.8, 0.9]]))
+        self.assertListEqual(data.text['SAMPLE_NAME'].tolist(),
+                             ['x', 'y', 'z'])
+
+        chunks = list(iter_cgats_file(path, 2))
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.values for chunk in chunks]), data.values)
+
+    def test_raise_exception_iter_cgats_file(self):
+        """
+        Tests :func:`colour.io.cgats.iter_cgats_file` definition raised
+        exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cgats.txt')
+        with open(path, 'w') as cgats_file:
+            cgats_file.write('CGATS.17\n'
+                             'BEGIN_DATA_FORMAT\n'
+                             'SAMPLE_ID XYZ_X XYZ_Y XYZ_Z\n'
+                             'END_DATA_FORMAT\n'
+                             'BEGIN_DATA\n'
+                             'A1 0.1 0.2 0.3\n'
+                             'A2 0.1 0.2\n'
+                             'END_DATA\n')
+
+        self.assertRaises(ValueError, read_cgats_file, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,10 @@ import shutil
 import unittest
 import tempfile
 
-from colour.io.ies_tm2714 import IES_TM2714_Header, IES_TM2714_Spd
+from colour.io.ies_tm2714 import (
+    IES_TM2714_Header,
+    IES_TM2714_Spd,
+    read_spds_from_ies_tm2714_directory)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2008 - 2014 - Colour Developers'
@@ -21,7 +24,13 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RESOURCES_DIRECTORY']
+__all__ = ['RESOURCES_DIRECTORY',
+           'FLUORESCENT_FILE_HEADER',
+           'FLUORESCENT_FILE_SPECTRAL_DESCRIPTION',
+           'FLUORESCENT_FILE_SPECTRAL_DATA',
+           'TestIES_TM2714_Header',
+           'TestIES_TM2714_Spd',
+           'TestReadSpdsFromIesTm2714Directory']
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
 
@@ -250,5 +259,57 @@ class TestIES_TM2714_Spd(unittest.TestCase):
         self.assertEquals(spd_r, spd_t)
 
 
+class TestReadSpdsFromIesTm2714Directory(unittest.TestCase):
+    """
+    Defines :func:`colour.io.iestm2714.read_spds_from_ies_tm2714_directory`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spds_from_ies_tm2714_directory(self):
+        """
+        Tests :func:`colour.io.iestm2714.read_spds_from_ies_tm2714_directory`
+        definition.
+        """
+
+        names = ['Fluorescent {0}'.format(i) for i in range(9, -1, -1)]
+        for name in names:
+            shutil.copy(
+                os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'),
+                os.path.join(self._temporary_directory,
+                             '{0}.spdx'.format(name)))
+        shutil.copy(
+            os.path.join(RESOURCES_DIRECTORY, 'colorchecker_n_ohta.csv'),
+            self._temporary_directory)
+
+        spd_r = IES_TM2714_Spd(
+            os.path.join(RESOURCES_DIRECTORY, 'Fluorescent.spdx'))
+        spd_r.read()
+
+        for threads in (1, 4):
+            spds = read_spds_from_ies_tm2714_directory(
+                self._temporary_directory, threads=threads)
+            self.assertListEqual(list(spds.keys()), sorted(names))
+            for name, spd in spds.items():
+                self.assertEqual(spd.name, name)
+                self.assertDictEqual(dict(spd.data),
+                                     FLUORESCENT_FILE_SPECTRAL_DATA)
+                self.assertEqual(spd.header.description,
+                                 spd_r.header.description)
+
+
 if __name__ == '__main__':
     unittest.main()
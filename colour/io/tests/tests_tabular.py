@@ -7,6 +7,7 @@ Defines unit tests for :mod:`colour.io.tabular` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import os
 import shutil
 import unittest
@@ -14,8 +15,12 @@ import tempfile
 
 from colour.colorimetry import SpectralPowerDistribution
 from colour.io import (
+    SpectralArray,
+    iter_spectral_array_from_csv_file,
+    read_spectral_array_from_csv_file,
     read_spectral_data_from_csv_file,
     read_spds_from_csv_file,
+    write_spectral_array_to_csv_file,
     write_spds_to_csv_file)
 
 __author__ = 'Colour Developers'
@@ -29,7 +34,10 @@ __all__ = ['RESOURCES_DIRECTORY',
            'COLOURCHECKER_N_OHTA_1',
            'TestReadSpectralDataFromCsvFile',
            'TestReadSpdsFromCsvFile',
-           'TestWriteSpdsToCsvFile']
+           'TestWriteSpdsToCsvFile',
+           'TestReadSpectralArrayFromCsvFile',
+           'TestIterSpectralArrayFromCsvFile',
+           'TestWriteSpectralArrayToCsvFile']
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
 
@@ -217,5 +225,179 @@ class TestWriteSpdsToCsvFile(unittest.TestCase):
         self.assertEqual(len(spds_test), 1)
 
 
+class TestReadSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition.
+        """
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        spectral_array = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta)
+        self.assertListEqual(spectral_array.fields,
+                             [unicode(x) for x in range(1, 25)])  # noqa
+        self.assertEqual(spectral_array.values.shape, (81, 24))
+        np.testing.assert_array_equal(
+            spectral_array.wavelengths,
+            sorted(COLOURCHECKER_N_OHTA_1.keys()))
+        np.testing.assert_array_equal(
+            spectral_array.values[..., 0],
+            [COLOURCHECKER_N_OHTA_1[wavelength]
+             for wavelength in spectral_array.wavelengths])
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY,
+                                    'linss2_10e_5.csv')
+        for default in (0, -1):
+            spectral_array = read_spectral_array_from_csv_file(
+                linss2_10e_5,
+                fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+                default=default)
+            self.assertListEqual(spectral_array.fields,
+                                 ['l_bar', 'm_bar', 's_bar'])
+            data = read_spectral_data_from_csv_file(
+                linss2_10e_5,
+                fields=['wavelength', 'l_bar', 'm_bar', 's_bar'],
+                default=default)
+            for i, field in enumerate(spectral_array.fields):
+                np.testing.assert_array_equal(
+                    spectral_array.values[..., i],
+                    [data[field][wavelength]
+                     for wavelength in spectral_array.wavelengths])
+
+    def test_blank_values_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition blank values handling.
+        """
+
+        path = os.path.join(self._temporary_directory, 'blank_values.csv')
+        with open(path, 'w') as csv_file:
+            csv_file.write('wavelength,a,b\n500,1,2\n510, ,3\n520,4,5\n')
+
+        spectral_array = read_spectral_array_from_csv_file(path, default=-2)
+        np.testing.assert_array_equal(
+            spectral_array.values,
+            np.array([[1, 2], [-2, 3], [4, 5]]))
+
+    def test_raise_exception_read_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.read_spectral_array_from_csv_file`
+        definition raised exception.
+        """
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY,
+                                    'linss2_10e_5.csv')
+        self.assertRaises(RuntimeError,
+                          read_spectral_array_from_csv_file,
+                          linss2_10e_5,
+                          fields=['wavelength'])
+
+
+class TestIterSpectralArrayFromCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.iter_spectral_array_from_csv_file`
+    definition unit tests methods.
+    """
+
+    def test_iter_spectral_array_from_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.iter_spectral_array_from_csv_file`
+        definition.
+        """
+
+        linss2_10e_5 = os.path.join(RESOURCES_DIRECTORY,
+                                    'linss2_10e_5.csv')
+        fields = ['wavelength', 'l_bar', 'm_bar', 's_bar']
+        spectral_array = read_spectral_array_from_csv_file(
+            linss2_10e_5, fields=fields)
+
+        chunks = list(iter_spectral_array_from_csv_file(
+            linss2_10e_5, 7, fields=fields))
+        self.assertListEqual([len(chunk.wavelengths) for chunk in chunks],
+                             [7] * 12 + [5])
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.wavelengths for chunk in chunks]),
+            spectral_array.wavelengths)
+        np.testing.assert_array_equal(
+            np.concatenate([chunk.values for chunk in chunks]),
+            spectral_array.values)
+
+
+class TestWriteSpectralArrayToCsvFile(unittest.TestCase):
+    """
+    Defines :func:`colour.io.tabular.write_spectral_array_to_csv_file`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_spectral_array_to_csv_file(self):
+        """
+        Tests :func:`colour.io.tabular.write_spectral_array_to_csv_file`
+        definition.
+        """
+
+        spectral_array = SpectralArray(
+            ['a', 'b', 'c'],
+            np.linspace(380, 780, 81),
+            np.random.RandomState(4).random_sample((81, 3)))
+        path = os.path.join(self._temporary_directory, 'spectral_array.csv')
+        write_spectral_array_to_csv_file(spectral_array, path, chunk_size=7)
+        spectral_array_test = read_spectral_array_from_csv_file(path)
+        self.assertListEqual(spectral_array_test.fields, ['a', 'b', 'c'])
+        np.testing.assert_array_equal(spectral_array_test.wavelengths,
+                                      spectral_array.wavelengths)
+        np.testing.assert_array_equal(spectral_array_test.values,
+                                      spectral_array.values)
+
+        colour_checker_n_ohta = os.path.join(RESOURCES_DIRECTORY,
+                                             'colorchecker_n_ohta.csv')
+        write_spectral_array_to_csv_file(
+            iter_spectral_array_from_csv_file(colour_checker_n_ohta, 10),
+            path,
+            delimiter=';')
+        spectral_array = read_spectral_array_from_csv_file(
+            colour_checker_n_ohta)
+        spectral_array_test = read_spectral_array_from_csv_file(
+            path, delimiter=';')
+        self.assertListEqual(spectral_array_test.fields,
+                             spectral_array.fields)
+        np.testing.assert_array_equal(spectral_array_test.values,
+                                      spectral_array.values)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Luo, Cui and Li (2006) Uniform Colour Spaces
+============================================
+
+Defines the *Luo et al. (2006)* *CAM02-LCD*, *CAM02-SCD* and *CAM02-UCS*
+colourspaces transformations built on top of the CIECAM02 colour appearance
+model correlates:
+
+-   :class:`Coefficients_UCS_Luo2006`
+-   :attr:`COEFFICIENTS_UCS_LUO2006`
+-   :func:`JMh_CIECAM02_to_UCS_Luo2006`
+-   :func:`UCS_Luo2006_to_JMh_CIECAM02`
+-   :func:`JMh_CIECAM02_to_CAM02LCD`
+-   :func:`CAM02LCD_to_JMh_CIECAM02`
+-   :func:`JMh_CIECAM02_to_CAM02SCD`
+-   :func:`CAM02SCD_to_JMh_CIECAM02`
+-   :func:`JMh_CIECAM02_to_CAM02UCS`
+-   :func:`CAM02UCS_to_JMh_CIECAM02`
+
+References
+----------
+.. [1]  Luo, R. M., Cui, G., & Li, C. (2006). Uniform colour spaces based on
+        CIECAM02 colour appearance model. Color Research & Application,
+        31(4), 320–330. doi:10.1002/col.20227
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.utilities import CaseInsensitiveMapping, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['Coefficients_UCS_Luo2006',
+           'COEFFICIENTS_UCS_LUO2006',
+           'JMh_CIECAM02_to_UCS_Luo2006',
+           'UCS_Luo2006_to_JMh_CIECAM02',
+           'JMh_CIECAM02_to_CAM02LCD',
+           'CAM02LCD_to_JMh_CIECAM02',
+           'JMh_CIECAM02_to_CAM02SCD',
+           'CAM02SCD_to_JMh_CIECAM02',
+           'JMh_CIECAM02_to_CAM02UCS',
+           'CAM02UCS_to_JMh_CIECAM02']
+
+
+class Coefficients_UCS_Luo2006(
+        namedtuple('Coefficients_UCS_Luo2006', ('K_L', 'c_1', 'c_2'))):
+    """
+    Defines the *Luo et al. (2006)* uniform colourspaces coefficients.
+
+    Parameters
+    ----------
+    K_L : numeric
+        Lightness coefficient :math:`K_L`.
+    c_1 : numeric
+        Lightness compression coefficient :math:`c_1`.
+    c_2 : numeric
+        Colourfulness compression coefficient :math:`c_2`.
+    """
+
+
+COEFFICIENTS_UCS_LUO2006 = CaseInsensitiveMapping(
+    {'CAM02-LCD': Coefficients_UCS_Luo2006(0.77, 0.007, 0.0053),
+     'CAM02-SCD': Coefficients_UCS_Luo2006(1.24, 0.007, 0.0363),
+     'CAM02-UCS': Coefficients_UCS_Luo2006(1.00, 0.007, 0.0228)})
+"""
+*Luo et al. (2006)* uniform colourspaces coefficients for respectively the
+large, small and combined colour differences data sets.
+
+COEFFICIENTS_UCS_LUO2006 : CaseInsensitiveMapping
+    **{'CAM02-LCD', 'CAM02-SCD', 'CAM02-UCS'}**
+"""
+
+
+def JMh_CIECAM02_to_UCS_Luo2006(JMh, coefficients):
+    """
+    Converts from CIECAM02 :math:`JMh` correlates array to one of the
+    *Luo et al. (2006)* *CAM02-LCD*, *CAM02-SCD*, or *CAM02-UCS* colourspaces
+    :math:`J'a'b'` array.
+
+    Parameters
+    ----------
+    JMh : array_like
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+    coefficients : array_like
+        Coefficients of one of the *Luo et al. (2006)* *CAM02-LCD*,
+        *CAM02-SCD*, or *CAM02-UCS* colourspaces.
+
+    Returns
+    -------
+    ndarray
+        *Luo et al. (2006)* *CAM02-LCD*, *CAM02-SCD*, or *CAM02-UCS*
+        colourspaces :math:`J'a'b'` array.
+
+    Examples
+    --------
+    >>> from colour.appearance import XYZ_to_CIECAM02
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> specification = XYZ_to_CIECAM02(
+    ...     XYZ, XYZ_w, 318.31, 20.0, correlates=('J', 'M', 'h'))
+    >>> JMh = tstack((specification.J, specification.M, specification.h))
+    >>> JMh_CIECAM02_to_UCS_Luo2006(  # doctest: +ELLIPSIS
+    ...     JMh, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+    array([ 54.9043313...,  -0.0844236...,  -0.0684831...])
+    """
+
+    J, M, h = tsplit(JMh)
+    _K_L, c_1, c_2 = tsplit(coefficients)
+
+    J_p = ((1 + 100 * c_1) * J) / (1 + c_1 * J)
+    M_p = (1 / c_2) * np.log(1 + c_2 * M)
+
+    h_r = np.radians(h)
+    a_p, b_p = M_p * np.cos(h_r), M_p * np.sin(h_r)
+
+    return tstack((J_p, a_p, b_p))
+
+
+def UCS_Luo2006_to_JMh_CIECAM02(Jpapbp, coefficients):
+    """
+    Converts from one of the *Luo et al. (2006)* *CAM02-LCD*, *CAM02-SCD*, or
+    *CAM02-UCS* colourspaces :math:`J'a'b'` array to CIECAM02 :math:`JMh`
+    correlates array.
+
+    Parameters
+    ----------
+    Jpapbp : array_like
+        *Luo et al. (2006)* *CAM02-LCD*, *CAM02-SCD*, or *CAM02-UCS*
+        colourspaces :math:`J'a'b'` array.
+    coefficients : array_like
+        Coefficients of one of the *Luo et al. (2006)* *CAM02-LCD*,
+        *CAM02-SCD*, or *CAM02-UCS* colourspaces.
+
+    Returns
+    -------
+    ndarray
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Examples
+    --------
+    >>> Jpapbp = np.array([54.904331339172842,
+    ...                    -0.084423619960753,
+    ...                    -0.068483141520841])
+    >>> UCS_Luo2006_to_JMh_CIECAM02(  # doctest: +ELLIPSIS
+    ...     Jpapbp, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+    array([  4.1731091...e+01,   1.0884218...e-01,   2.1904843...e+02])
+    """
+
+    J_p, a_p, b_p = tsplit(Jpapbp)
+    _K_L, c_1, c_2 = tsplit(coefficients)
+
+    J = J_p / (1 + c_1 * (100 - J_p))
+    M = (np.exp(c_2 * np.hypot(a_p, b_p)) - 1) / c_2
+    h = np.degrees(np.arctan2(b_p, a_p)) % 360
+
+    return tstack((J, M, h))
+
+
+def JMh_CIECAM02_to_CAM02LCD(JMh):
+    """
+    Converts from CIECAM02 :math:`JMh` correlates array to *Luo et al. (2006)*
+    *CAM02-LCD* colourspace :math:`J'a'b'` array.
+
+    Parameters
+    ----------
+    JMh : array_like
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Returns
+    -------
+    ndarray
+        *Luo et al. (2006)* *CAM02-LCD* colourspace :math:`J'a'b'` array.
+
+    Examples
+    --------
+    >>> JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+    >>> JMh_CIECAM02_to_CAM02LCD(JMh)  # doctest: +ELLIPSIS
+    array([ 54.9043313...,  -0.0845039...,  -0.0685483...])
+    """
+
+    return JMh_CIECAM02_to_UCS_Luo2006(
+        JMh, COEFFICIENTS_UCS_LUO2006['CAM02-LCD'])
+
+
+def CAM02LCD_to_JMh_CIECAM02(Jpapbp):
+    """
+    Converts from *Luo et al. (2006)* *CAM02-LCD* colourspace :math:`J'a'b'`
+    array to CIECAM02 :math:`JMh` correlates array.
+
+    Parameters
+    ----------
+    Jpapbp : array_like
+        *Luo et al. (2006)* *CAM02-LCD* colourspace :math:`J'a'b'` array.
+
+    Returns
+    -------
+    ndarray
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Examples
+    --------
+    >>> Jpapbp = np.array([54.904331339172842,
+    ...                    -0.084503958304021,
+    ...                    -0.068548310748767])
+    >>> CAM02LCD_to_JMh_CIECAM02(Jpapbp)  # doctest: +ELLIPSIS
+    array([  4.1731091...e+01,   1.0884218...e-01,   2.1904843...e+02])
+    """
+
+    return UCS_Luo2006_to_JMh_CIECAM02(
+        Jpapbp, COEFFICIENTS_UCS_LUO2006['CAM02-LCD'])
+
+
+def JMh_CIECAM02_to_CAM02SCD(JMh):
+    """
+    Converts from CIECAM02 :math:`JMh` correlates array to *Luo et al. (2006)*
+    *CAM02-SCD* colourspace :math:`J'a'b'` array.
+
+    Parameters
+    ----------
+    JMh : array_like
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Returns
+    -------
+    ndarray
+        *Luo et al. (2006)* *CAM02-SCD* colourspace :math:`J'a'b'` array.
+
+    Examples
+    --------
+    >>> JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+    >>> JMh_CIECAM02_to_CAM02SCD(JMh)  # doctest: +ELLIPSIS
+    array([ 54.9043313...,  -0.0843617...,  -0.0684329...])
+    """
+
+    return JMh_CIECAM02_to_UCS_Luo2006(
+        JMh, COEFFICIENTS_UCS_LUO2006['CAM02-SCD'])
+
+
+def CAM02SCD_to_JMh_CIECAM02(Jpapbp):
+    """
+    Converts from *Luo et al. (2006)* *CAM02-SCD* colourspace :math:`J'a'b'`
+    array to CIECAM02 :math:`JMh` correlates array.
+
+    Parameters
+    ----------
+    Jpapbp : array_like
+        *Luo et al. (2006)* *CAM02-SCD* colourspace :math:`J'a'b'` array.
+
+    Returns
+    -------
+    ndarray
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Examples
+    --------
+    >>> Jpapbp = np.array([54.904331339172842,
+    ...                    -0.084361783627798,
+    ...                    -0.068432980838998])
+    >>> CAM02SCD_to_JMh_CIECAM02(Jpapbp)  # doctest: +ELLIPSIS
+    array([  4.1731091...e+01,   1.0884218...e-01,   2.1904843...e+02])
+    """
+
+    return UCS_Luo2006_to_JMh_CIECAM02(
+        Jpapbp, COEFFICIENTS_UCS_LUO2006['CAM02-SCD'])
+
+
+def JMh_CIECAM02_to_CAM02UCS(JMh):
+    """
+    Converts from CIECAM02 :math:`JMh` correlates array to *Luo et al. (2006)*
+    *CAM02-UCS* colourspace :math:`J'a'b'` array.
+
+    Parameters
+    ----------
+    JMh : array_like
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Returns
+    -------
+    ndarray
+        *Luo et al. (2006)* *CAM02-UCS* colourspace :math:`J'a'b'` array.
+
+    Examples
+    --------
+    >>> JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+    >>> JMh_CIECAM02_to_CAM02UCS(JMh)  # doctest: +ELLIPSIS
+    array([ 54.9043313...,  -0.0844236...,  -0.0684831...])
+    """
+
+    return JMh_CIECAM02_to_UCS_Luo2006(
+        JMh, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+
+
+def CAM02UCS_to_JMh_CIECAM02(Jpapbp):
+    """
+    Converts from *Luo et al. (2006)* *CAM02-UCS* colourspace :math:`J'a'b'`
+    array to CIECAM02 :math:`JMh` correlates array.
+
+    Parameters
+    ----------
+    Jpapbp : array_like
+        *Luo et al. (2006)* *CAM02-UCS* colourspace :math:`J'a'b'` array.
+
+    Returns
+    -------
+    ndarray
+        CIECAM02 correlates array *Lightness* :math:`J`, *colourfulness*
+        :math:`M` and *hue* angle :math:`h` in degrees.
+
+    Examples
+    --------
+    >>> Jpapbp = np.array([54.904331339172842,
+    ...                    -0.084423619960753,
+    ...                    -0.068483141520841])
+    >>> CAM02UCS_to_JMh_CIECAM02(Jpapbp)  # doctest: +ELLIPSIS
+    array([  4.1731091...e+01,   1.0884218...e-01,   2.1904843...e+02])
+    """
+
+    return UCS_Luo2006_to_JMh_CIECAM02(
+        Jpapbp, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
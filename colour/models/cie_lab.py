@@ -31,7 +31,8 @@ import numpy as np
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.models.kernels import XYZ_to_Lab_kernel, Lab_to_XYZ_kernel
+from colour.utilities import is_numba_backend_enabled, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -87,6 +88,9 @@ def XYZ_to_Lab(XYZ,
     XYZ = np.asarray(XYZ)
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
+    if is_numba_backend_enabled() and XYZ_r.size == 3:
+        return XYZ_to_Lab_kernel(XYZ, XYZ_r)
+
     XYZ_f = XYZ / XYZ_r
 
     XYZ_f = np.where(XYZ_f > CIE_E,
@@ -142,9 +146,13 @@ def Lab_to_XYZ(Lab,
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    L, a, b = tsplit(Lab)
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
+    if is_numba_backend_enabled() and XYZ_r.size == 3:
+        return Lab_to_XYZ_kernel(Lab, XYZ_r)
+
+    L, a, b = tsplit(Lab)
+
     f_y = (L + 16) / 116
     f_x = a / 500 + f_y
     f_z = f_y - b / 200
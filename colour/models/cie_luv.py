@@ -33,7 +33,8 @@ import numpy as np
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.models.kernels import XYZ_to_Luv_kernel, Luv_to_XYZ_kernel
+from colour.utilities import is_numba_backend_enabled, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -88,8 +89,13 @@ def XYZ_to_Luv(XYZ,
     array([ 37.9856291..., -28.7922944...,  -1.3558195...])
     """
 
+    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+
+    if is_numba_backend_enabled() and XYZ_r.size == 3:
+        return XYZ_to_Luv_kernel(XYZ, XYZ_r)
+
     X, Y, Z = tsplit(XYZ)
-    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_r, Y_r, Z_r = tsplit(XYZ_r)
 
     y_r = Y / Y_r
 
@@ -143,8 +149,13 @@ def Luv_to_XYZ(Luv,
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
+    XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
+
+    if is_numba_backend_enabled() and XYZ_r.size == 3:
+        return Luv_to_XYZ_kernel(Luv, XYZ_r)
+
     L, u, v = tsplit(Luv)
-    X_r, Y_r, Z_r = tsplit(xyY_to_XYZ(xy_to_xyY(illuminant)))
+    X_r, Y_r, Z_r = tsplit(XYZ_r)
 
     Y = np.where(L > CIE_E * CIE_K, ((L + 16) / 116) ** 3, L / CIE_K)
 
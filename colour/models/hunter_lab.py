@@ -28,7 +28,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.colorimetry import HUNTERLAB_ILLUMINANTS
-from colour.utilities import tsplit, tstack
+from colour.models.kernels import (
+    XYZ_to_Hunter_Lab_kernel,
+    Hunter_Lab_to_XYZ_kernel)
+from colour.utilities import is_numba_backend_enabled, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -126,11 +129,15 @@ def XYZ_to_Hunter_Lab(
     array([ 31.7490157..., -15.1146262...,  -2.7866075...])
     """
 
+    K_ab = XYZ_to_K_ab_HunterLab1966(XYZ_n) if K_ab is None else K_ab
+
+    if (is_numba_backend_enabled() and
+            np.size(XYZ_n) == 3 and np.size(K_ab) == 2):
+        return XYZ_to_Hunter_Lab_kernel(XYZ, XYZ_n, K_ab)
+
     X, Y, Z = tsplit(XYZ)
     X_n, Y_n, Z_n = tsplit(XYZ_n)
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else
-                tsplit(K_ab))
+    K_a, K_b = tsplit(K_ab)
 
     Y_Y_n = Y / Y_n
     sqrt_Y_Y_n = np.sqrt(Y_Y_n)
@@ -184,11 +191,15 @@ def Hunter_Lab_to_XYZ(
     array([  7.049534,  10.08    ,   9.558313])
     """
 
+    K_ab = XYZ_to_K_ab_HunterLab1966(XYZ_n) if K_ab is None else K_ab
+
+    if (is_numba_backend_enabled() and
+            np.size(XYZ_n) == 3 and np.size(K_ab) == 2):
+        return Hunter_Lab_to_XYZ_kernel(Lab, XYZ_n, K_ab)
+
     L, a, b = tsplit(Lab)
     X_n, Y_n, Z_n = tsplit(XYZ_n)
-    K_a, K_b = (tsplit(XYZ_to_K_ab_HunterLab1966(XYZ_n))
-                if K_ab is None else
-                tsplit(K_ab))
+    K_a, K_b = tsplit(K_ab)
 
     L_100 = L / 100
     L_100_2 = L_100 ** 2
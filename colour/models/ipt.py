@@ -24,7 +24,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import dot_vector, tsplit
+from colour.models.kernels import XYZ_to_IPT_kernel, IPT_to_XYZ_kernel
+from colour.utilities import dot_vector, is_numba_backend_enabled, tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -104,6 +105,10 @@ def XYZ_to_IPT(XYZ):
     array([ 1.0030082...,  0.0190691..., -0.0136929...])
     """
 
+    if is_numba_backend_enabled():
+        return XYZ_to_IPT_kernel(
+            XYZ, IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_IPT_MATRIX)
+
     LMS = dot_vector(IPT_XYZ_TO_LMS_MATRIX, XYZ)
     LMS_prime = np.sign(LMS) * np.abs(LMS) ** 0.43
     IPT = dot_vector(IPT_LMS_TO_IPT_MATRIX, LMS_prime)
@@ -132,6 +137,10 @@ def IPT_to_XYZ(IPT):
     array([ 0.9690723...,  1.        ,  1.1217921...])
     """
 
+    if is_numba_backend_enabled():
+        return IPT_to_XYZ_kernel(
+            IPT, IPT_IPT_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX)
+
     LMS = dot_vector(IPT_IPT_TO_LMS_MATRIX, IPT)
     LMS_prime = np.sign(LMS) * np.abs(LMS) ** (1 / 0.43)
     XYZ = dot_vector(IPT_LMS_TO_XYZ_MATRIX, LMS_prime)
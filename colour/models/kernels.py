@@ -0,0 +1,743 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Colour Models Kernels
+=====================
+
+Defines the compiled kernels used by the colour models transformations when
+the *Numba* computation backend is enabled:
+
+-   :func:`XYZ_to_Lab_kernel`
+-   :func:`Lab_to_XYZ_kernel`
+-   :func:`XYZ_to_Luv_kernel`
+-   :func:`Luv_to_XYZ_kernel`
+-   :func:`XYZ_to_IPT_kernel`
+-   :func:`IPT_to_XYZ_kernel`
+-   :func:`XYZ_to_Hunter_Lab_kernel`
+-   :func:`Hunter_Lab_to_XYZ_kernel`
+-   :func:`RGB_to_HSV_kernel`
+-   :func:`HSV_to_RGB_kernel`
+-   :func:`RGB_to_HSL_kernel`
+-   :func:`HSL_to_RGB_kernel`
+
+Each kernel fuses the whole transformation into a single loop over the
+pixels: a pixel is read once, its intermediate values live in registers and
+the result is written once, whereas the *NumPy* implementation allocates and
+traverses a full size array for every intermediate expression.
+
+The kernels take the colour models parameters, e.g. the reference white
+tristimulus values, already resolved by the calling definitions.
+
+See Also
+--------
+colour.utilities.set_computation_backend
+"""
+
+from __future__ import division, unicode_literals
+
+import math
+import numpy as np
+
+from colour.constants import CIE_E, CIE_K
+from colour.utilities import jit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZ_to_Lab_kernel',
+           'Lab_to_XYZ_kernel',
+           'XYZ_to_Luv_kernel',
+           'Luv_to_XYZ_kernel',
+           'XYZ_to_IPT_kernel',
+           'IPT_to_XYZ_kernel',
+           'XYZ_to_Hunter_Lab_kernel',
+           'Hunter_Lab_to_XYZ_kernel',
+           'RGB_to_HSV_kernel',
+           'HSV_to_RGB_kernel',
+           'RGB_to_HSL_kernel',
+           'HSL_to_RGB_kernel']
+
+
+def _apply_kernel(loop, a, *args):
+    """
+    Applies given kernel loop to given array of triplets.
+
+    Parameters
+    ----------
+    loop : object
+        Kernel loop processing a contiguous (N, 3) input array into a
+        contiguous (N, 3) output array.
+    a : array_like
+        Array of triplets.
+    \*args : list, optional
+        Kernel loop additional arguments.
+
+    Returns
+    -------
+    ndarray
+        Kernel loop output reshaped to input array shape.
+    """
+
+    a = np.asarray(a, dtype=np.float_)
+    shape = a.shape
+
+    a = np.ascontiguousarray(np.reshape(a, (-1, 3)))
+    b = np.empty(a.shape, dtype=np.float_)
+    loop(a, b, *args)
+
+    return np.reshape(b, shape)
+
+
+def _as_float_array(a):
+    """
+    Returns given array as a contiguous *float* array.
+    """
+
+    return np.ascontiguousarray(a, dtype=np.float_)
+
+
+@jit
+def _XYZ_to_Lab_loop(XYZ, Lab, XYZ_r):
+    for i in range(XYZ.shape[0]):
+        X_f = XYZ[i, 0] / XYZ_r[0]
+        Y_f = XYZ[i, 1] / XYZ_r[1]
+        Z_f = XYZ[i, 2] / XYZ_r[2]
+
+        X_f = X_f ** (1 / 3) if X_f > CIE_E else (CIE_K * X_f + 16) / 116
+        Y_f = Y_f ** (1 / 3) if Y_f > CIE_E else (CIE_K * Y_f + 16) / 116
+        Z_f = Z_f ** (1 / 3) if Z_f > CIE_E else (CIE_K * Z_f + 16) / 116
+
+        Lab[i, 0] = 116 * Y_f - 16
+        Lab[i, 1] = 500 * (X_f - Y_f)
+        Lab[i, 2] = 200 * (Y_f - Z_f)
+
+
+def XYZ_to_Lab_kernel(XYZ, XYZ_r):
+    """
+    Converts from *CIE XYZ* tristimulus values to *CIE Lab* colourspace using
+    a compiled kernel.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+    XYZ_r : array_like
+        Reference *illuminant* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Lab* colourspace array.
+
+    See Also
+    --------
+    colour.XYZ_to_Lab
+
+    Examples
+    --------
+    >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+    >>> XYZ_r = np.array([0.96421199, 1.00000000, 0.82518828])
+    >>> XYZ_to_Lab_kernel(XYZ, XYZ_r)  # doctest: +ELLIPSIS
+    array([ 37.9856291..., -23.6230285...,  -4.4141705...])
+    """
+
+    return _apply_kernel(_XYZ_to_Lab_loop, XYZ, _as_float_array(XYZ_r))
+
+
+@jit
+def _Lab_to_XYZ_loop(Lab, XYZ, XYZ_r):
+    for i in range(Lab.shape[0]):
+        L = Lab[i, 0]
+
+        f_y = (L + 16) / 116
+        f_x = Lab[i, 1] / 500 + f_y
+        f_z = f_y - Lab[i, 2] / 200
+
+        f_x_3 = f_x ** 3
+        f_z_3 = f_z ** 3
+
+        x_r = f_x_3 if f_x_3 > CIE_E else (116 * f_x - 16) / CIE_K
+        y_r = f_y ** 3 if L > CIE_K * CIE_E else L / CIE_K
+        z_r = f_z_3 if f_z_3 > CIE_E else (116 * f_z - 16) / CIE_K
+
+        XYZ[i, 0] = x_r * XYZ_r[0]
+        XYZ[i, 1] = y_r * XYZ_r[1]
+        XYZ[i, 2] = z_r * XYZ_r[2]
+
+
+def Lab_to_XYZ_kernel(Lab, XYZ_r):
+    """
+    Converts from *CIE Lab* colourspace to *CIE XYZ* tristimulus values using
+    a compiled kernel.
+
+    Parameters
+    ----------
+    Lab : array_like
+        *CIE Lab* colourspace array.
+    XYZ_r : array_like
+        Reference *illuminant* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    colour.Lab_to_XYZ
+
+    Examples
+    --------
+    >>> Lab = np.array([37.98562910, -23.62302887, -4.41417036])
+    >>> XYZ_r = np.array([0.96421199, 1.00000000, 0.82518828])
+    >>> Lab_to_XYZ_kernel(Lab, XYZ_r)  # doctest: +ELLIPSIS
+    array([ 0.0704953...,  0.1008    ,  0.0955831...])
+    """
+
+    return _apply_kernel(_Lab_to_XYZ_loop, Lab, _as_float_array(XYZ_r))
+
+
+@jit
+def _XYZ_to_Luv_loop(XYZ, Luv, XYZ_r):
+    X_r, Y_r, Z_r = XYZ_r[0], XYZ_r[1], XYZ_r[2]
+    u_r = 4 * X_r / (X_r + 15 * Y_r + 3 * Z_r)
+    v_r = 9 * Y_r / (X_r + 15 * Y_r + 3 * Z_r)
+
+    for i in range(XYZ.shape[0]):
+        X, Y, Z = XYZ[i, 0], XYZ[i, 1], XYZ[i, 2]
+
+        y_r = Y / Y_r
+        L = 116 * y_r ** (1 / 3) - 16 if y_r > CIE_E else CIE_K * y_r
+
+        d = X + 15 * Y + 3 * Z
+
+        Luv[i, 0] = L
+        Luv[i, 1] = 13 * L * (4 * X / d - u_r)
+        Luv[i, 2] = 13 * L * (9 * Y / d - v_r)
+
+
+def XYZ_to_Luv_kernel(XYZ, XYZ_r):
+    """
+    Converts from *CIE XYZ* tristimulus values to *CIE Luv* colourspace using
+    a compiled kernel.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+    XYZ_r : array_like
+        Reference *illuminant* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        *CIE Luv* colourspace array.
+
+    See Also
+    --------
+    colour.XYZ_to_Luv
+
+    Examples
+    --------
+    >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+    >>> XYZ_r = np.array([0.96421199, 1.00000000, 0.82518828])
+    >>> XYZ_to_Luv_kernel(XYZ, XYZ_r)  # doctest: +ELLIPSIS
+    array([ 37.9856291..., -28.7922940...,  -1.3558197...])
+    """
+
+    return _apply_kernel(_XYZ_to_Luv_loop, XYZ, _as_float_array(XYZ_r))
+
+
+@jit
+def _Luv_to_XYZ_loop(Luv, XYZ, XYZ_r):
+    X_r, Y_r, Z_r = XYZ_r[0], XYZ_r[1], XYZ_r[2]
+    u_r = 4 * X_r / (X_r + 15 * Y_r + 3 * Z_r)
+    v_r = 9 * Y_r / (X_r + 15 * Y_r + 3 * Z_r)
+
+    for i in range(Luv.shape[0]):
+        L, u, v = Luv[i, 0], Luv[i, 1], Luv[i, 2]
+
+        Y = ((L + 16) / 116) ** 3 if L > CIE_E * CIE_K else L / CIE_K
+
+        a = 1 / 3 * ((52 * L / (u + 13 * L * u_r)) - 1)
+        b = -5 * Y
+        c = -1 / 3
+        d = Y * (39 * L / (v + 13 * L * v_r) - 5)
+
+        X = (d - b) / (a - c)
+
+        XYZ[i, 0] = X
+        XYZ[i, 1] = Y
+        XYZ[i, 2] = X * a + b
+
+
+def Luv_to_XYZ_kernel(Luv, XYZ_r):
+    """
+    Converts from *CIE Luv* colourspace to *CIE XYZ* tristimulus values using
+    a compiled kernel.
+
+    Parameters
+    ----------
+    Luv : array_like
+        *CIE Luv* colourspace array.
+    XYZ_r : array_like
+        Reference *illuminant* tristimulus values.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    colour.Luv_to_XYZ
+
+    Examples
+    --------
+    >>> Luv = np.array([37.98562910, -28.79229446, -1.35581950])
+    >>> XYZ_r = np.array([0.96421199, 1.00000000, 0.82518828])
+    >>> Luv_to_XYZ_kernel(Luv, XYZ_r)  # doctest: +ELLIPSIS
+    array([ 0.0704953...,  0.1008    ,  0.0955831...])
+    """
+
+    return _apply_kernel(_Luv_to_XYZ_loop, Luv, _as_float_array(XYZ_r))
+
+
+@jit
+def _IPT_loop(a, b, M_1, M_2, exponent):
+    for i in range(a.shape[0]):
+        x, y, z = a[i, 0], a[i, 1], a[i, 2]
+
+        L = M_1[0, 0] * x + M_1[0, 1] * y + M_1[0, 2] * z
+        M = M_1[1, 0] * x + M_1[1, 1] * y + M_1[1, 2] * z
+        S = M_1[2, 0] * x + M_1[2, 1] * y + M_1[2, 2] * z
+
+        L = math.copysign(abs(L) ** exponent, L)
+        M = math.copysign(abs(M) ** exponent, M)
+        S = math.copysign(abs(S) ** exponent, S)
+
+        b[i, 0] = M_2[0, 0] * L + M_2[0, 1] * M + M_2[0, 2] * S
+        b[i, 1] = M_2[1, 0] * L + M_2[1, 1] * M + M_2[1, 2] * S
+        b[i, 2] = M_2[2, 0] * L + M_2[2, 1] * M + M_2[2, 2] * S
+
+
+def XYZ_to_IPT_kernel(XYZ, XYZ_to_LMS_matrix, LMS_to_IPT_matrix):
+    """
+    Converts from *CIE XYZ* tristimulus values to *IPT* colourspace using a
+    compiled kernel.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+    XYZ_to_LMS_matrix : array_like
+        *CIE XYZ* tristimulus values to normalised cone responses matrix.
+    LMS_to_IPT_matrix : array_like
+        Normalised non-linear cone responses to *IPT* colourspace matrix.
+
+    Returns
+    -------
+    ndarray
+        *IPT* colourspace array.
+
+    See Also
+    --------
+    colour.XYZ_to_IPT
+
+    Examples
+    --------
+    >>> from colour.models.ipt import (
+    ...     IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_IPT_MATRIX)
+    >>> XYZ = np.array([0.96907232, 1.00000000, 1.12179215])
+    >>> XYZ_to_IPT_kernel(  # doctest: +ELLIPSIS
+    ...     XYZ, IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_IPT_MATRIX)
+    array([ 1.0030082...,  0.0190691..., -0.0136929...])
+    """
+
+    return _apply_kernel(_IPT_loop,
+                         XYZ,
+                         _as_float_array(XYZ_to_LMS_matrix),
+                         _as_float_array(LMS_to_IPT_matrix),
+                         0.43)
+
+
+def IPT_to_XYZ_kernel(IPT, IPT_to_LMS_matrix, LMS_to_XYZ_matrix):
+    """
+    Converts from *IPT* colourspace to *CIE XYZ* tristimulus values using a
+    compiled kernel.
+
+    Parameters
+    ----------
+    IPT : array_like
+        *IPT* colourspace array.
+    IPT_to_LMS_matrix : array_like
+        *IPT* colourspace to normalised non-linear cone responses matrix.
+    LMS_to_XYZ_matrix : array_like
+        Normalised cone responses to *CIE XYZ* tristimulus values matrix.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    colour.IPT_to_XYZ
+
+    Examples
+    --------
+    >>> from colour.models.ipt import (
+    ...     IPT_IPT_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX)
+    >>> IPT = np.array([1.00300825, 0.01906918, -0.01369292])
+    >>> IPT_to_XYZ_kernel(  # doctest: +ELLIPSIS
+    ...     IPT, IPT_IPT_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX)
+    array([ 0.9690723...,  1.        ,  1.1217921...])
+    """
+
+    return _apply_kernel(_IPT_loop,
+                         IPT,
+                         _as_float_array(IPT_to_LMS_matrix),
+                         _as_float_array(LMS_to_XYZ_matrix),
+                         1 / 0.43)
+
+
+@jit
+def _XYZ_to_Hunter_Lab_loop(XYZ, Lab, XYZ_n, K_ab):
+    for i in range(XYZ.shape[0]):
+        Y_Y_n = XYZ[i, 1] / XYZ_n[1]
+        sqrt_Y_Y_n = math.sqrt(Y_Y_n)
+
+        Lab[i, 0] = 100 * sqrt_Y_Y_n
+        Lab[i, 1] = K_ab[0] * ((XYZ[i, 0] / XYZ_n[0] - Y_Y_n) / sqrt_Y_Y_n)
+        Lab[i, 2] = K_ab[1] * ((Y_Y_n - XYZ[i, 2] / XYZ_n[2]) / sqrt_Y_Y_n)
+
+
+def XYZ_to_Hunter_Lab_kernel(XYZ, XYZ_n, K_ab):
+    """
+    Converts from *CIE XYZ* tristimulus values to *Hunter L,a,b* colour scale
+    using a compiled kernel.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values.
+    XYZ_n : array_like
+        Reference *illuminant* tristimulus values.
+    K_ab : array_like
+        Reference *illuminant* chromaticity coefficients.
+
+    Returns
+    -------
+    ndarray
+        *Hunter L,a,b* colour scale array.
+
+    See Also
+    --------
+    colour.XYZ_to_Hunter_Lab
+
+    Examples
+    --------
+    >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313]) * 100
+    >>> XYZ_n = np.array([96.38, 100.00, 82.45])
+    >>> K_ab = np.array([173.51, 58.48])
+    >>> XYZ_to_Hunter_Lab_kernel(XYZ, XYZ_n, K_ab)  # doctest: +ELLIPSIS
+    array([ 31.7490157..., -15.1146262...,  -2.7866075...])
+    """
+
+    return _apply_kernel(_XYZ_to_Hunter_Lab_loop,
+                         XYZ,
+                         _as_float_array(XYZ_n),
+                         _as_float_array(K_ab))
+
+
+@jit
+def _Hunter_Lab_to_XYZ_loop(Lab, XYZ, XYZ_n, K_ab):
+    for i in range(Lab.shape[0]):
+        L_100 = Lab[i, 0] / 100
+        L_100_2 = L_100 ** 2
+
+        XYZ[i, 0] = ((Lab[i, 1] / K_ab[0]) * L_100 + L_100_2) * XYZ_n[0]
+        XYZ[i, 1] = L_100_2 * XYZ_n[1]
+        XYZ[i, 2] = -((Lab[i, 2] / K_ab[1]) * L_100 - L_100_2) * XYZ_n[2]
+
+
+def Hunter_Lab_to_XYZ_kernel(Lab, XYZ_n, K_ab):
+    """
+    Converts from *Hunter L,a,b* colour scale to *CIE XYZ* tristimulus values
+    using a compiled kernel.
+
+    Parameters
+    ----------
+    Lab : array_like
+        *Hunter L,a,b* colour scale array.
+    XYZ_n : array_like
+        Reference *illuminant* tristimulus values.
+    K_ab : array_like
+        Reference *illuminant* chromaticity coefficients.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    colour.Hunter_Lab_to_XYZ
+
+    Examples
+    --------
+    >>> Lab = np.array([31.74901573, -15.11462629, -2.78660758])
+    >>> XYZ_n = np.array([96.38, 100.00, 82.45])
+    >>> K_ab = np.array([173.51, 58.48])
+    >>> Hunter_Lab_to_XYZ_kernel(Lab, XYZ_n, K_ab)  # doctest: +ELLIPSIS
+    array([  7.049534,  10.08    ,   9.558313])
+    """
+
+    return _apply_kernel(_Hunter_Lab_to_XYZ_loop,
+                         Lab,
+                         _as_float_array(XYZ_n),
+                         _as_float_array(K_ab))
+
+
+@jit
+def _RGB_to_hue(R, G, B, maximum, delta):
+    delta_R = (((maximum - R) / 6) + (delta / 2)) / delta
+    delta_G = (((maximum - G) / 6) + (delta / 2)) / delta
+    delta_B = (((maximum - B) / 6) + (delta / 2)) / delta
+
+    if B == maximum:
+        H = (2 / 3) + delta_G - delta_R
+    elif G == maximum:
+        H = (1 / 3) + delta_R - delta_B
+    else:
+        H = delta_B - delta_G
+
+    if H < 0:
+        H += 1
+    if H > 1:
+        H -= 1
+
+    return H
+
+
+@jit
+def _RGB_to_HSV_loop(RGB, HSV):
+    for i in range(RGB.shape[0]):
+        R, G, B = RGB[i, 0], RGB[i, 1], RGB[i, 2]
+
+        maximum = max(R, G, B)
+        delta = maximum - min(R, G, B)
+
+        if delta == 0:
+            HSV[i, 0] = 0
+            HSV[i, 1] = 0
+        else:
+            HSV[i, 0] = _RGB_to_hue(R, G, B, maximum, delta)
+            HSV[i, 1] = delta / maximum
+        HSV[i, 2] = maximum
+
+
+def RGB_to_HSV_kernel(RGB):
+    """
+    Converts from *RGB* colourspace to *HSV* colourspace using a compiled
+    kernel.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        *HSV* array.
+
+    See Also
+    --------
+    colour.RGB_to_HSV
+
+    Examples
+    --------
+    >>> RGB = np.array([0.49019608, 0.98039216, 0.25098039])
+    >>> RGB_to_HSV_kernel(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2786738...,  0.744     ,  0.98039216])
+    """
+
+    return _apply_kernel(_RGB_to_HSV_loop, RGB)
+
+
+@jit
+def _HSV_to_RGB_loop(HSV, RGB):
+    for i in range(HSV.shape[0]):
+        H, S, V = HSV[i, 0], HSV[i, 1], HSV[i, 2]
+
+        h = H * 6
+        if h == 6:
+            h = 0
+
+        f = math.floor(h)
+        j = V * (1 - S)
+        k = V * (1 - S * (h - f))
+        l = V * (1 - S * (1 - (h - f)))
+
+        sector = int(min(max(f, 0), 5))
+        if sector == 0:
+            R, G, B = V, l, j
+        elif sector == 1:
+            R, G, B = k, V, j
+        elif sector == 2:
+            R, G, B = j, V, l
+        elif sector == 3:
+            R, G, B = j, k, V
+        elif sector == 4:
+            R, G, B = l, j, V
+        else:
+            R, G, B = V, j, k
+
+        RGB[i, 0] = R
+        RGB[i, 1] = G
+        RGB[i, 2] = B
+
+
+def HSV_to_RGB_kernel(HSV):
+    """
+    Converts from *HSV* colourspace to *RGB* colourspace using a compiled
+    kernel.
+
+    Parameters
+    ----------
+    HSV : array_like
+        *HSV* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace array.
+
+    See Also
+    --------
+    colour.HSV_to_RGB
+
+    Examples
+    --------
+    >>> HSV = np.array([0.27867384, 0.74400000, 0.98039216])
+    >>> HSV_to_RGB_kernel(HSV)  # doctest: +ELLIPSIS
+    array([ 0.4901960...,  0.9803921...,  0.2509803...])
+    """
+
+    return _apply_kernel(_HSV_to_RGB_loop, HSV)
+
+
+@jit
+def _RGB_to_HSL_loop(RGB, HSL):
+    for i in range(RGB.shape[0]):
+        R, G, B = RGB[i, 0], RGB[i, 1], RGB[i, 2]
+
+        maximum = max(R, G, B)
+        minimum = min(R, G, B)
+        delta = maximum - minimum
+
+        L = (maximum + minimum) / 2
+
+        if delta == 0:
+            HSL[i, 0] = 0
+            HSL[i, 1] = 0
+        else:
+            HSL[i, 0] = _RGB_to_hue(R, G, B, maximum, delta)
+            HSL[i, 1] = (delta / (maximum + minimum)
+                         if L < 0.5 else
+                         delta / (2 - maximum - minimum))
+        HSL[i, 2] = L
+
+
+def RGB_to_HSL_kernel(RGB):
+    """
+    Converts from *RGB* colourspace to *HSL* colourspace using a compiled
+    kernel.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        *HSL* array.
+
+    See Also
+    --------
+    colour.RGB_to_HSL
+
+    Examples
+    --------
+    >>> RGB = np.array([0.49019608, 0.98039216, 0.25098039])
+    >>> RGB_to_HSL_kernel(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2786738...,  0.9489796...,  0.6156862...])
+    """
+
+    return _apply_kernel(_RGB_to_HSL_loop, RGB)
+
+
+@jit
+def _hue_to_RGB(vi, vj, vH):
+    if vH < 0:
+        vH += 1
+    if vH > 1:
+        vH -= 1
+
+    if 6 * vH < 1:
+        return vi + (vj - vi) * 6 * vH
+    elif 2 * vH < 1:
+        return vj
+    elif 3 * vH < 2:
+        return vi + (vj - vi) * ((2 / 3) - vH) * 6
+    else:
+        return vi
+
+
+@jit
+def _HSL_to_RGB_loop(HSL, RGB):
+    for i in range(HSL.shape[0]):
+        H, S, L = HSL[i, 0], HSL[i, 1], HSL[i, 2]
+
+        j = L * (1 + S) if L < 0.5 else (L + S) - (S * L)
+        k = 2 * L - j
+
+        RGB[i, 0] = _hue_to_RGB(k, j, H + (1 / 3))
+        RGB[i, 1] = _hue_to_RGB(k, j, H)
+        RGB[i, 2] = _hue_to_RGB(k, j, H - (1 / 3))
+
+
+def HSL_to_RGB_kernel(HSL):
+    """
+    Converts from *HSL* colourspace to *RGB* colourspace using a compiled
+    kernel.
+
+    Parameters
+    ----------
+    HSL : array_like
+        *HSL* colourspace array.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace array.
+
+    See Also
+    --------
+    colour.HSL_to_RGB
+
+    Examples
+    --------
+    >>> HSL = np.array([0.27867384, 0.94897959, 0.61568627])
+    >>> HSL_to_RGB_kernel(HSL)  # doctest: +ELLIPSIS
+    array([ 0.4901960...,  0.9803921...,  0.2509803...])
+    """
+
+    return _apply_kernel(_HSL_to_RGB_loop, HSL)
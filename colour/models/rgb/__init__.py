@@ -17,7 +17,9 @@ from . import dataset
 from .conversion_functions import *  # noqa
 from . import conversion_functions
 from .common import XYZ_to_sRGB, sRGB_to_XYZ
-from .aces_it import spectral_to_aces_relative_exposure_values
+from .aces_it import (
+    spectral_to_aces_relative_exposure_values,
+    RelativeExposureValuesPipeline)
 
 __all__ = ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
@@ -30,4 +32,5 @@ __all__ += ['normalised_primary_matrix',
 __all__ += dataset.__all__
 __all__ += conversion_functions.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
-__all__ += ['spectral_to_aces_relative_exposure_values']
+__all__ += ['spectral_to_aces_relative_exposure_values',
+            'RelativeExposureValuesPipeline']
@@ -8,6 +8,7 @@ Academy Color Encoding System - Input Transform
 Defines the *Academy Color Encoding System* (ACES) *Input Transform* utilities:
 
 -   :func:`spectral_to_aces_relative_exposure_values`
+-   :class:`RelativeExposureValuesPipeline`
 
 See Also
 --------
@@ -38,8 +39,11 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
+from collections import Mapping
 
-from colour.colorimetry import ILLUMINANTS_RELATIVE_SPDS
+from colour.colorimetry import (
+    ILLUMINANTS_RELATIVE_SPDS,
+    SpectralPowerDistribution)
 from colour.models.rgb import ACES_RICD
 
 __author__ = 'Colour Developers'
@@ -51,7 +55,8 @@ __status__ = 'Production'
 
 __all__ = ['FLARE_PERCENTAGE',
            'S_FLARE_FACTOR',
-           'spectral_to_aces_relative_exposure_values']
+           'spectral_to_aces_relative_exposure_values',
+           'RelativeExposureValuesPipeline']
 
 FLARE_PERCENTAGE = 0.00500
 S_FLARE_FACTOR = 0.18000 / (0.18000 + FLARE_PERCENTAGE)
@@ -83,7 +88,8 @@ def spectral_to_aces_relative_exposure_values(
 
     See Also
     --------
-    :func:`colour.colorimetry.tristimulus.spectral_to_XYZ`
+    :func:`colour.colorimetry.tristimulus.spectral_to_XYZ`,
+    :class:`RelativeExposureValuesPipeline`
 
     References
     ----------
@@ -132,3 +138,222 @@ def spectral_to_aces_relative_exposure_values(
     E_rgb *= S_FLARE_FACTOR
 
     return E_rgb
+
+
+class RelativeExposureValuesPipeline(object):
+    """
+    Defines a camera spectral sensitivities simulation pipeline converting
+    spectral power distributions to relative exposure values.
+
+    The spectral sensitivities and illuminant are aligned and the
+    :math:`K_r`, :math:`K_g` and :math:`K_b` scale factors computed once: a
+    whole colour checker, or any multi-spectral array, is then converted
+    with a single matrix product.
+
+    Parameters
+    ----------
+    sensitivities : TriSpectralPowerDistribution, optional
+        Camera spectral sensitivities, e.g. :attr:`colour.models.ACES_RICD`
+        attribute, the computations are performed with their spectral shape.
+    illuminant : SpectralPowerDistribution, optional
+        *Illuminant* spectral power distribution.
+    flare_percentage : numeric, optional
+        Flare percentage added to the relative exposure values before
+        scaling them so that the 18% grey reflector relative exposure
+        values are unchanged, *0* disables the flare modeling.
+
+    Attributes
+    ----------
+    sensitivities
+    illuminant
+    shape
+    weights
+
+    Methods
+    -------
+    spectral_values
+    relative_exposure_values
+
+    Notes
+    -----
+    -   The relative exposure values match
+        :func:`spectral_to_aces_relative_exposure_values` definition output
+        with the default arguments.
+    -   The spectral power distributions not sampled at the pipeline
+        spectral shape are aligned at each conversion, the values returned
+        by :meth:`RelativeExposureValuesPipeline.spectral_values` method can
+        be kept for repeated conversions.
+
+    Examples
+    --------
+    >>> from colour import COLOURCHECKERS_SPDS
+    >>> spds = COLOURCHECKERS_SPDS['ColorChecker N Ohta']
+    >>> pipeline = RelativeExposureValuesPipeline()
+    >>> pipeline.relative_exposure_values(  # doctest: +ELLIPSIS
+    ...     spds['dark skin'])
+    array([ 0.1187697...,  0.0870866...,  0.0589442...])
+    >>> pipeline.relative_exposure_values(  # doctest: +ELLIPSIS
+    ...     [spds['dark skin'], spds['light skin']])
+    array([[ 0.1187697...,  0.0870866...,  0.0589442...],
+           [ 0.4000236...,  0.3191478...,  0.2373479...]])
+    """
+
+    def __init__(self,
+                 sensitivities=ACES_RICD,
+                 illuminant=ILLUMINANTS_RELATIVE_SPDS.get('D60'),
+                 flare_percentage=FLARE_PERCENTAGE):
+        shape = sensitivities.shape
+        if illuminant.shape != shape:
+            illuminant = illuminant.clone().align(shape)
+
+        self._sensitivities = sensitivities
+        self._illuminant = illuminant
+        self._shape = shape
+        self._flare_percentage = flare_percentage
+
+        I_s = illuminant.values[..., np.newaxis] * sensitivities.values
+        weights = I_s / np.sum(I_s, axis=0)
+        weights.setflags(write=False)
+
+        self._weights = weights
+        self._count = weights.shape[0]
+
+    @property
+    def sensitivities(self):
+        """
+        Property for **self.sensitivities** attribute.
+
+        Returns
+        -------
+        TriSpectralPowerDistribution
+            self.sensitivities.
+        """
+
+        return self._sensitivities
+
+    @property
+    def illuminant(self):
+        """
+        Property for **self.illuminant** attribute.
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            self.illuminant.
+        """
+
+        return self._illuminant
+
+    @property
+    def shape(self):
+        """
+        Property for **self.shape** attribute.
+
+        Returns
+        -------
+        SpectralShape
+            self.shape.
+        """
+
+        return self._shape
+
+    @property
+    def weights(self):
+        """
+        Property for **self.weights** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.weights, read only array of shape (W, 3) of the illuminant
+            and spectral sensitivities products normalised with the
+            :math:`K_r`, :math:`K_g` and :math:`K_b` scale factors.
+        """
+
+        return self._weights
+
+    def spectral_values(self, spds):
+        """
+        Returns given spectral power distributions values aligned to the
+        pipeline spectral shape.
+
+        Parameters
+        ----------
+        spds : SpectralPowerDistribution or array_like
+            Spectral power distribution, sequence of spectral power
+            distributions or multi-spectral array of shape (..., W) sampled
+            at the pipeline spectral shape wavelengths.
+
+        Returns
+        -------
+        ndarray
+            Spectral power distributions values of shape (..., W).
+
+        Raises
+        ------
+        ValueError
+            If the multi-spectral array values count does not match the
+            pipeline spectral shape wavelengths count.
+        """
+
+        if isinstance(spds, SpectralPowerDistribution):
+            spds = [spds]
+            squeeze = True
+        else:
+            squeeze = False
+
+        if isinstance(spds, np.ndarray):
+            values = spds
+        else:
+            values = np.array(
+                [(spd if spd.shape == self._shape else
+                  spd.clone().align(self._shape)).values
+                 if isinstance(spd, SpectralPowerDistribution) else spd
+                 for spd in spds], dtype=np.float_)
+
+        if values.shape[-1:] != (self._count,):
+            raise ValueError(
+                ('Spectral values shape "{0}" does not match "{1}" spectral '
+                 'shape wavelengths count!').format(values.shape,
+                                                    self._shape))
+
+        return values[0] if squeeze else values
+
+    def relative_exposure_values(self, spds):
+        """
+        Converts given spectral power distributions to relative exposure
+        values.
+
+        Parameters
+        ----------
+        spds : SpectralPowerDistribution or array_like or dict
+            Spectral power distribution, sequence of spectral power
+            distributions, multi-spectral array of shape (..., W) sampled at
+            the pipeline spectral shape wavelengths or mapping of spectral
+            power distributions, e.g. a
+            :attr:`colour.characterisation.COLOURCHECKERS_SPDS` attribute
+            colour checker.
+
+        Returns
+        -------
+        ndarray or dict
+            Relative exposure values of shape (..., 3), a mapping of the
+            relative exposure values with the same keys is returned for a
+            mapping of spectral power distributions.
+        """
+
+        if isinstance(spds, Mapping):
+            keys = list(spds.keys())
+            E_rgb = self.relative_exposure_values(
+                [spds[key] for key in keys])
+
+            return dict(zip(keys, E_rgb))
+
+        E_rgb = np.dot(self.spectral_values(spds), self._weights)
+
+        # Accounting for flare.
+        if self._flare_percentage:
+            E_rgb += self._flare_percentage
+            E_rgb *= 0.18 / (0.18 + self._flare_percentage)
+
+        return E_rgb
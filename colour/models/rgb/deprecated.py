@@ -21,7 +21,8 @@ relevance for computation speed. They should not be used in the colour science
 domain although they are useful for image analysis and provide end user
 software colour selection tools.
 
-They are provided for convenience and completeness.
+They are provided for convenience and completeness. They are vectorised and
+accept arrays of any shape whose last dimension holds the colour components.
 
 Warning
 -------
@@ -41,7 +42,12 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import tsplit, tstack
+from colour.models.kernels import (
+    RGB_to_HSV_kernel,
+    HSV_to_RGB_kernel,
+    RGB_to_HSL_kernel,
+    HSL_to_RGB_kernel)
+from colour.utilities import is_numba_backend_enabled, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -60,6 +66,57 @@ __all__ = ['RGB_to_HSV',
            'CMYK_to_CMY']
 
 
+def _RGB_to_hue(R, G, B, maximum, delta):
+    """
+    Returns the *hue* shared by the *HSV* and *HSL* colourspaces of given *RGB*
+    colourspace components.
+
+    Parameters
+    ----------
+    R : array_like
+        *RGB* colourspace array red component.
+    G : array_like
+        *RGB* colourspace array green component.
+    B : array_like
+        *RGB* colourspace array blue component.
+    maximum : array_like
+        *RGB* colourspace array maximum component.
+    delta : array_like
+        *RGB* colourspace array components range, i.e. maximum component minus
+        minimum component.
+
+    Returns
+    -------
+    ndarray
+        *Hue* in domain [0, 1].
+
+    Notes
+    -----
+    -   Input *RGB* colourspace components are in domain [0, 1].
+    -   The *hue* of achromatic colours, i.e. where *delta* is equal to zero,
+        is set to zero.
+
+    Examples
+    --------
+    >>> R, G, B = 0.49019608, 0.98039216, 0.25098039
+    >>> _RGB_to_hue(R, G, B, G, G - B)  # doctest: +ELLIPSIS
+    array(0.2786738...)
+    """
+
+    delta_R = (((maximum - R) / 6) + (delta / 2)) / delta
+    delta_G = (((maximum - G) / 6) + (delta / 2)) / delta
+    delta_B = (((maximum - B) / 6) + (delta / 2)) / delta
+
+    H = np.select((B == maximum, G == maximum),
+                  ((2 / 3) + delta_G - delta_R, (1 / 3) + delta_R - delta_B),
+                  delta_B - delta_G)
+    H = np.where(H < 0, H + 1, H)
+    H = np.where(H > 1, H - 1, H)
+    H = np.where(delta == 0, 0, H)
+
+    return H
+
+
 def RGB_to_HSV(RGB):
     """
     Converts from *RGB* colourspace to *HSV* colourspace.
@@ -91,26 +148,17 @@ def RGB_to_HSV(RGB):
     array([ 0.2786738...,  0.744     ,  0.98039216])
     """
 
-    maximum = np.amax(RGB, -1)
-    delta = np.ptp(RGB, -1)
-
-    V = maximum
+    if is_numba_backend_enabled():
+        return RGB_to_HSV_kernel(RGB)
 
     R, G, B = tsplit(RGB)
 
-    S = np.asarray(delta / maximum)
-    S[np.asarray(delta == 0)] = 0
-
-    delta_R = (((maximum - R) / 6) + (delta / 2)) / delta
-    delta_G = (((maximum - G) / 6) + (delta / 2)) / delta
-    delta_B = (((maximum - B) / 6) + (delta / 2)) / delta
+    maximum = np.maximum(np.maximum(R, G), B)
+    delta = maximum - np.minimum(np.minimum(R, G), B)
 
-    H = delta_B - delta_G
-    H = np.where(G == maximum, (1 / 3) + delta_R - delta_B, H)
-    H = np.where(B == maximum, (2 / 3) + delta_G - delta_R, H)
-    H[np.asarray(H < 0)] += 1
-    H[np.asarray(H > 1)] -= 1
-    H[np.asarray(delta == 0)] = 0
+    H = _RGB_to_hue(R, G, B, maximum, delta)
+    S = np.where(delta == 0, 0, delta / maximum)
+    V = maximum
 
     HSV = tstack((H, S, V))
 
@@ -148,26 +196,25 @@ def HSV_to_RGB(HSV):
     array([ 0.4901960...,  0.9803921...,  0.2509803...])
     """
 
+    if is_numba_backend_enabled():
+        return HSV_to_RGB_kernel(HSV)
+
     H, S, V = tsplit(HSV)
 
-    h = np.asarray(H * 6)
-    h[np.asarray(h == 6)] = 0
+    h = H * 6
+    h = np.where(h == 6, 0, h)
 
     i = np.floor(h)
     j = V * (1 - S)
     k = V * (1 - S * (h - i))
     l = V * (1 - S * (1 - (h - i)))
 
-    i = tstack((i, i, i)).astype(np.uint8)
+    # Hue sectors indexes, values beyond the last sector are clipped to it.
+    i = np.minimum(np.asarray(i).astype(np.uint8), 5)
 
-    RGB = np.choose(i,
-                    (tstack((V, l, j)),
-                     tstack((k, V, j)),
-                     tstack((j, V, l)),
-                     tstack((j, k, V)),
-                     tstack((l, j, V)),
-                     tstack((V, j, k))),
-                    mode='clip')
+    RGB = tstack((np.choose(i, (V, k, j, j, l, V)),
+                  np.choose(i, (l, V, V, k, j, j)),
+                  np.choose(i, (j, j, l, V, V, k))))
 
     return RGB
 
@@ -203,29 +250,21 @@ def RGB_to_HSL(RGB):
     array([ 0.2786738...,  0.9489796...,  0.6156862...])
     """
 
-    minimum = np.amin(RGB, -1)
-    maximum = np.amax(RGB, -1)
-    delta = np.ptp(RGB, -1)
+    if is_numba_backend_enabled():
+        return RGB_to_HSL_kernel(RGB)
 
     R, G, B = tsplit(RGB)
 
-    L = (maximum + minimum) / 2
+    minimum = np.minimum(np.minimum(R, G), B)
+    maximum = np.maximum(np.maximum(R, G), B)
+    delta = maximum - minimum
 
+    H = _RGB_to_hue(R, G, B, maximum, delta)
+    L = (maximum + minimum) / 2
     S = np.where(L < 0.5,
                  delta / (maximum + minimum),
                  delta / (2 - maximum - minimum))
-    S[np.asarray(delta == 0)] = 0
-
-    delta_R = (((maximum - R) / 6) + (delta / 2)) / delta
-    delta_G = (((maximum - G) / 6) + (delta / 2)) / delta
-    delta_B = (((maximum - B) / 6) + (delta / 2)) / delta
-
-    H = delta_B - delta_G
-    H = np.where(G == maximum, (1 / 3) + delta_R - delta_B, H)
-    H = np.where(B == maximum, (2 / 3) + delta_G - delta_R, H)
-    H[np.asarray(H < 0)] += 1
-    H[np.asarray(H > 1)] -= 1
-    H[np.asarray(delta == 0)] = 0
+    S = np.where(delta == 0, 0, S)
 
     HSL = tstack((H, S, L))
 
@@ -263,6 +302,9 @@ def HSL_to_RGB(HSL):
     array([ 0.4901960...,  0.9803921...,  0.2509803...])
     """
 
+    if is_numba_backend_enabled():
+        return HSL_to_RGB_kernel(HSL)
+
     H, S, L = tsplit(HSL)
 
     def H_to_RGB(vi, vj, vH):
@@ -270,38 +312,24 @@ def HSL_to_RGB(HSL):
         Converts *hue* value to *RGB* colourspace.
         """
 
-        vH = np.asarray(vH)
-
-        vH[np.asarray(vH < 0)] += 1
-        vH[np.asarray(vH > 1)] -= 1
+        vH = np.where(vH < 0, vH + 1, vH)
+        vH = np.where(vH > 1, vH - 1, vH)
 
-        v = np.full(vi.shape, np.nan)
-
-        v = np.where(np.logical_and(6 * vH < 1, np.isnan(v)),
-                     vi + (vj - vi) * 6 * vH,
-                     v)
-        v = np.where(np.logical_and(2 * vH < 1, np.isnan(v)),
-                     vj,
-                     v)
-        v = np.where(np.logical_and(3 * vH < 2, np.isnan(v)),
-                     vi + (vj - vi) * ((2 / 3) - vH) * 6,
-                     v)
-        v = np.where(np.isnan(v), vi, v)
-
-        return v
+        return np.select((6 * vH < 1, 2 * vH < 1, 3 * vH < 2),
+                         (vi + (vj - vi) * 6 * vH,
+                          vj,
+                          vi + (vj - vi) * ((2 / 3) - vH) * 6),
+                         vi)
 
+    # Achromatic colours, i.e. where *S* is equal to zero, are implicitly
+    # handled as *i* and *j* are then both equal to *L*.
     j = np.where(L < 0.5, L * (1 + S), (L + S) - (S * L))
     i = 2 * L - j
 
-    R = H_to_RGB(i, j, H + (1 / 3))
-    G = H_to_RGB(i, j, H)
-    B = H_to_RGB(i, j, H - (1 / 3))
-
-    R = np.where(S == 1, L, R)
-    G = np.where(S == 1, L, G)
-    B = np.where(S == 1, L, B)
-
-    RGB = tstack((R, G, B))
+    # The *RGB* components are processed at once by offsetting the *hue*.
+    RGB = H_to_RGB(i[..., np.newaxis],
+                   j[..., np.newaxis],
+                   H[..., np.newaxis] + np.array([1 / 3, 0, -1 / 3]))
 
     return RGB
 
@@ -411,20 +439,16 @@ def CMY_to_CMYK(CMY):
 
     C, M, Y = tsplit(CMY)
 
-    K = np.ones(C.shape)
-    K = np.where(C < K, C, K)
-    K = np.where(M < K, M, K)
-    K = np.where(Y < K, Y, K)
-
-    C = np.asarray((C - K) / (1 - K))
-    M = np.asarray((M - K) / (1 - K))
-    Y = np.asarray((Y - K) / (1 - K))
+    # *Numpy* "fmin" definition ignores *nan* values, *K* is thus equal to 1
+    # if all the components are *nan*.
+    K = np.fmin(np.fmin(np.fmin(C, M), Y), 1)
 
-    C[np.asarray(K == 1)] = 0
-    M[np.asarray(K == 1)] = 0
-    Y[np.asarray(K == 1)] = 0
+    CMY = np.asarray(CMY)
+    CMY = np.where(K[..., np.newaxis] == 1,
+                   0,
+                   (CMY - K[..., np.newaxis]) / (1 - K[..., np.newaxis]))
 
-    CMYK = tstack((C, M, Y, K))
+    CMYK = np.concatenate((CMY, K[..., np.newaxis]), axis=-1)
 
     return CMYK
 
@@ -25,6 +25,10 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.models import xy_to_XYZ, xy_to_xyY, xyY_to_XYZ
+from colour.models.rgb.derivation import (
+    normalised_primary_matrix,
+    chromatically_adapted_primaries,
+    RGB_luminance_equation)
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
 from colour.utilities import dot_matrix, dot_vector
 
@@ -80,6 +84,27 @@ class RGB_Colourspace(object):
     EOCF
     OETF
     EOTF
+
+    Methods
+    -------
+    cached
+    clear_cache
+    normalised_primary_matrix
+    RGB_luminance_equation
+    chromatically_adapted_primaries
+    chromatically_adapted_RGB_to_XYZ_matrix
+    chromatically_adapted_XYZ_to_RGB_matrix
+
+    Notes
+    -----
+    -   The values derived from the colourspace *primaries*, *whitepoint* and
+        transformation matrices are memoised per colourspace and the cache is
+        cleared whenever one of the related attributes is set. Modifying these
+        attributes in place, e.g. `colourspace.whitepoint[0] = 0.3`, does not
+        clear the cache, :meth:`RGB_Colourspace.clear_cache` method must be
+        called explicitly in that case.
+    -   The memoised arrays are returned as copies, the cached arrays are
+        read-only.
     """
 
     def __init__(self,
@@ -91,6 +116,7 @@ class RGB_Colourspace(object):
                  XYZ_to_RGB_matrix=None,
                  OECF=None,
                  EOCF=None):
+        self._cache = {}
         self._name = None
         self.name = name
         self._primaries = None
@@ -166,6 +192,8 @@ class RGB_Colourspace(object):
             value = np.asarray(value)
         self._primaries = value
 
+        self.clear_cache()
+
     @property
     def whitepoint(self):
         """
@@ -196,6 +224,8 @@ class RGB_Colourspace(object):
                  'or "matrix" instance!').format('whitepoint', value))
         self._whitepoint = value
 
+        self.clear_cache()
+
     @property
     def illuminant(self):
         """
@@ -254,6 +284,8 @@ class RGB_Colourspace(object):
             value = np.asarray(value)
         self._RGB_to_XYZ_matrix = value
 
+        self.clear_cache()
+
     @property
     def XYZ_to_RGB_matrix(self):
         """
@@ -282,6 +314,8 @@ class RGB_Colourspace(object):
             value = np.asarray(value)
         self._XYZ_to_RGB_matrix = value
 
+        self.clear_cache()
+
     @property
     def OECF(self):
         """
@@ -394,6 +428,284 @@ class RGB_Colourspace(object):
 
         self.EOCF = value
 
+    def cached(self, key, function):
+        """
+        Returns the colourspace derived value memoised under given key,
+        computing it with given function on cache miss.
+
+        Parameters
+        ----------
+        key : object
+            Hashable cache key.
+        function : object
+            Function computing the derived value, called with the colourspace
+            as single argument.
+
+        Returns
+        -------
+        object
+            Derived value.
+
+        Notes
+        -----
+        -   The derived value must only depend on the colourspace
+            *primaries*, *whitepoint* and transformation matrices.
+        -   A copy of the memoised value is returned if it is an
+            :class:`ndarray` class instance so that modifying it does not
+            alter the cache.
+
+        Examples
+        --------
+        >>> p = np.array(
+        ...     [0.73470, 0.26530, 0.00000, 1.00000, 0.00010, -0.07700])
+        >>> whitepoint = np.array([0.32168, 0.33767])
+        >>> colourspace = RGB_Colourspace('RGB Colourspace', p, whitepoint)
+        >>> colourspace.cached(  # doctest: +ELLIPSIS
+        ...     'whitepoint_XYZ', lambda x: xy_to_XYZ(x.whitepoint))
+        array([ 0.9526460...,  1.        ,  1.0088251...])
+        """
+
+        try:
+            value = self._cache[key]
+        except KeyError:
+            value = function(self)
+            if isinstance(value, np.ndarray):
+                value = np.copy(value)
+                value.setflags(write=False)
+            self._cache[key] = value
+
+        return np.copy(value) if isinstance(value, np.ndarray) else value
+
+    def clear_cache(self):
+        """
+        Clears the colourspace derived values cache.
+        """
+
+        self._cache.clear()
+
+    def normalised_primary_matrix(self):
+        """
+        Returns the memoised colourspace *normalised primary matrix*.
+
+        Returns
+        -------
+        ndarray, (3, 3)
+            *Normalised primary matrix*.
+
+        See Also
+        --------
+        colour.normalised_primary_matrix
+
+        Examples
+        --------
+        >>> p = np.array(
+        ...     [0.73470, 0.26530, 0.00000, 1.00000, 0.00010, -0.07700])
+        >>> whitepoint = np.array([0.32168, 0.33767])
+        >>> colourspace = RGB_Colourspace('RGB Colourspace', p, whitepoint)
+        >>> colourspace.normalised_primary_matrix()  # doctest: +ELLIPSIS
+        array([[  9.5255239...e-01,   0.0000000...e+00,   9.3678631...e-05],
+               [  3.4396645...e-01,   7.2816609...e-01,  -7.2132546...e-02],
+               [  0.0000000...e+00,   0.0000000...e+00,   1.0088251...e+00]])
+        """
+
+        return self.cached(
+            'normalised_primary_matrix',
+            lambda x: normalised_primary_matrix(x.primaries, x.whitepoint))
+
+    def RGB_luminance_equation(self):
+        """
+        Returns the memoised colourspace *luminance equation*.
+
+        Returns
+        -------
+        unicode
+            *Luminance* equation.
+
+        See Also
+        --------
+        colour.RGB_luminance_equation
+
+        Examples
+        --------
+        >>> p = np.array(
+        ...     [0.73470, 0.26530, 0.00000, 1.00000, 0.00010, -0.07700])
+        >>> whitepoint = np.array([0.32168, 0.33767])
+        >>> colourspace = RGB_Colourspace('RGB Colourspace', p, whitepoint)
+        >>> # Doctests skip for Python 2.x compatibility.
+        >>> colourspace.RGB_luminance_equation()  # doctest: +SKIP
+        'Y = 0.3439664...(R) + 0.7281660...(G) + -0.0721325...(B)'
+        """
+
+        return self.cached(
+            'RGB_luminance_equation',
+            lambda x: RGB_luminance_equation(x.primaries, x.whitepoint))
+
+    def chromatically_adapted_primaries(
+            self,
+            whitepoint,
+            chromatic_adaptation_transform='CAT02'):
+        """
+        Returns the memoised colourspace *primaries* :math:`xy` chromaticity
+        coordinates chromatically adapted to given whitepoint.
+
+        Parameters
+        ----------
+        whitepoint : array_like
+            Reference illuminant / whitepoint :math:`xy` chromaticity
+            coordinates.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform.
+
+        Returns
+        -------
+        ndarray
+            Chromatically adapted primaries :math:`xy` chromaticity
+            coordinates.
+
+        See Also
+        --------
+        colour.chromatically_adapted_primaries
+
+        Examples
+        --------
+        >>> p = np.array([0.64, 0.33, 0.30, 0.60, 0.15, 0.06])
+        >>> whitepoint = np.array([0.31271, 0.32902])
+        >>> colourspace = RGB_Colourspace('RGB Colourspace', p, whitepoint)
+        >>> colourspace.chromatically_adapted_primaries(  # doctest: +ELLIPSIS
+        ...     np.array([0.34567, 0.35850]), 'Bradford')
+        array([[ 0.6484318...,  0.3308548...],
+               [ 0.3211603...,  0.5978620...],
+               [ 0.1558860...,  0.0660431...]])
+        """
+
+        return self.cached(
+            ('chromatically_adapted_primaries',
+             _whitepoint_key(whitepoint),
+             chromatic_adaptation_transform),
+            lambda x: chromatically_adapted_primaries(
+                x.primaries,
+                x.whitepoint,
+                whitepoint,
+                chromatic_adaptation_transform))
+
+    def chromatically_adapted_RGB_to_XYZ_matrix(
+            self,
+            whitepoint,
+            chromatic_adaptation_transform='CAT02'):
+        """
+        Returns the memoised matrix converting from the colourspace to *CIE
+        XYZ* tristimulus values chromatically adapted to given whitepoint.
+
+        Parameters
+        ----------
+        whitepoint : array_like
+            *CIE XYZ* tristimulus values *illuminant* :math:`xy` chromaticity
+            coordinates.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform.
+
+        Returns
+        -------
+        ndarray, (3, 3)
+            Chromatically adapted transformation matrix.
+
+        Examples
+        --------
+        >>> from colour import sRGB_COLOURSPACE
+        >>> whitepoint = np.array([0.34567, 0.35850])
+        >>> sRGB_COLOURSPACE.chromatically_adapted_RGB_to_XYZ_matrix(
+        ...     whitepoint, 'Bradford')  # doctest: +ELLIPSIS
+        array([[ 0.4360219...,  0.3851088...,  0.1430812...],
+               [ 0.2224751...,  0.7169066...,  0.0606182...],
+               [ 0.0139281...,  0.0971015...,  0.7141585...]])
+        """
+
+        def RGB_to_XYZ_matrix(colourspace):
+            """
+            Computes the chromatically adapted transformation matrix.
+            """
+
+            M = chromatic_adaptation_matrix_VonKries(
+                xy_to_XYZ(colourspace.whitepoint),
+                xy_to_XYZ(whitepoint),
+                chromatic_adaptation_transform)
+
+            return dot_matrix(M, colourspace.RGB_to_XYZ_matrix)
+
+        return self.cached(
+            ('chromatically_adapted_RGB_to_XYZ_matrix',
+             _whitepoint_key(whitepoint),
+             chromatic_adaptation_transform),
+            RGB_to_XYZ_matrix)
+
+    def chromatically_adapted_XYZ_to_RGB_matrix(
+            self,
+            whitepoint,
+            chromatic_adaptation_transform='CAT02'):
+        """
+        Returns the memoised matrix converting from *CIE XYZ* tristimulus
+        values with given whitepoint to the colourspace, chromatically adapting
+        them to the colourspace whitepoint.
+
+        Parameters
+        ----------
+        whitepoint : array_like
+            *CIE XYZ* tristimulus values *illuminant* :math:`xy` chromaticity
+            coordinates.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform.
+
+        Returns
+        -------
+        ndarray, (3, 3)
+            Chromatically adapted transformation matrix.
+
+        Examples
+        --------
+        >>> from colour import sRGB_COLOURSPACE
+        >>> whitepoint = np.array([0.34567, 0.35850])
+        >>> sRGB_COLOURSPACE.chromatically_adapted_XYZ_to_RGB_matrix(
+        ...     whitepoint, 'Bradford')  # doctest: +ELLIPSIS
+        array([[ 3.1343113..., -1.6172324..., -0.4906856...],
+               [-0.9787436...,  1.9161140...,  0.0334497...],
+               [ 0.0719482..., -0.2289864...,  1.4052709...]])
+        """
+
+        def XYZ_to_RGB_matrix(colourspace):
+            """
+            Computes the chromatically adapted transformation matrix.
+            """
+
+            M = chromatic_adaptation_matrix_VonKries(
+                xy_to_XYZ(whitepoint),
+                xy_to_XYZ(colourspace.whitepoint),
+                chromatic_adaptation_transform)
+
+            return dot_matrix(colourspace.XYZ_to_RGB_matrix, M)
+
+        return self.cached(
+            ('chromatically_adapted_XYZ_to_RGB_matrix',
+             _whitepoint_key(whitepoint),
+             chromatic_adaptation_transform),
+            XYZ_to_RGB_matrix)
+
+
+def _whitepoint_key(whitepoint):
+    """
+    Returns a hashable cache key from given whitepoint.
+    """
+
+    return tuple(np.ravel(whitepoint).tolist())
+
 
 def XYZ_to_RGB(XYZ,
                illuminant_XYZ,
@@ -591,12 +903,8 @@ def RGB_to_RGB(RGB,
     array([ 0.0643338...,  0.1157362...,  0.1157614...])
     """
 
-    cat = chromatic_adaptation_matrix_VonKries(
-        xy_to_XYZ(input_colourspace.whitepoint),
-        xy_to_XYZ(output_colourspace.whitepoint),
-        chromatic_adaptation_transform)
-
-    M = dot_matrix(cat, input_colourspace.RGB_to_XYZ_matrix)
+    M = input_colourspace.chromatically_adapted_RGB_to_XYZ_matrix(
+        output_colourspace.whitepoint, chromatic_adaptation_transform)
     M = dot_matrix(output_colourspace.XYZ_to_RGB_matrix, M)
 
     RGB = dot_vector(M, RGB)
@@ -11,8 +11,14 @@ import numpy as np
 import unittest
 
 from colour.characterisation import COLOURCHECKERS_SPDS
-from colour.colorimetry import constant_spd, ones_spd
-from colour.models import ACES_RICD, spectral_to_aces_relative_exposure_values
+from colour.colorimetry import (
+    ILLUMINANTS_RELATIVE_SPDS,
+    constant_spd,
+    ones_spd)
+from colour.models import (
+    ACES_RICD,
+    RelativeExposureValuesPipeline,
+    spectral_to_aces_relative_exposure_values)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -21,7 +27,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestSpectralToAcesRelativeExposureValues']
+__all__ = ['TestSpectralToAcesRelativeExposureValues',
+           'TestRelativeExposureValuesPipeline']
 
 
 class TestSpectralToAcesRelativeExposureValues(unittest.TestCase):
@@ -54,5 +61,105 @@ spectral_to_aces_relative_exposure_values` definition.
             np.array([0.11876978, 0.08708666, 0.0589442]))
 
 
+class TestRelativeExposureValuesPipeline(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.aces_it.RelativeExposureValuesPipeline`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('sensitivities',
+                               'illuminant',
+                               'shape',
+                               'weights')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RelativeExposureValuesPipeline))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('spectral_values',
+                            'relative_exposure_values')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RelativeExposureValuesPipeline))
+
+    def test_relative_exposure_values(self):
+        """
+        Tests :meth:`colour.models.rgb.aces_it.RelativeExposureValuesPipeline.\
+relative_exposure_values` method.
+        """
+
+        spds = COLOURCHECKERS_SPDS.get('ColorChecker N Ohta')
+        for illuminant in (ILLUMINANTS_RELATIVE_SPDS.get('D60'),
+                           ILLUMINANTS_RELATIVE_SPDS.get('A')):
+            pipeline = RelativeExposureValuesPipeline(illuminant=illuminant)
+
+            E_rgb = pipeline.relative_exposure_values(spds)
+            self.assertEqual(sorted(E_rgb.keys()), sorted(spds.keys()))
+            for name, spd in spds.items():
+                np.testing.assert_almost_equal(
+                    E_rgb[name],
+                    spectral_to_aces_relative_exposure_values(
+                        spd, illuminant),
+                    decimal=7)
+
+        pipeline = RelativeExposureValuesPipeline()
+        np.testing.assert_almost_equal(
+            pipeline.relative_exposure_values(
+                constant_spd(0.18, ACES_RICD.shape)),
+            np.array([0.18, 0.18, 0.18]),
+            decimal=7)
+
+        pipeline = RelativeExposureValuesPipeline(flare_percentage=0)
+        np.testing.assert_almost_equal(
+            pipeline.relative_exposure_values(ones_spd(ACES_RICD.shape)),
+            np.array([1.0, 1.0, 1.0]),
+            decimal=7)
+
+    def test_n_dimensional_relative_exposure_values(self):
+        """
+        Tests :meth:`colour.models.rgb.aces_it.RelativeExposureValuesPipeline.\
+relative_exposure_values` method n-dimensional arrays support.
+        """
+
+        pipeline = RelativeExposureValuesPipeline()
+        spd = COLOURCHECKERS_SPDS.get('ColorChecker N Ohta').get('dark skin')
+        values = pipeline.spectral_values(spd)
+        E_rgb = pipeline.relative_exposure_values(spd)
+
+        values = np.tile(values, (6, 1))
+        E_rgb = np.tile(E_rgb, (6, 1))
+        np.testing.assert_almost_equal(
+            pipeline.relative_exposure_values(values),
+            E_rgb,
+            decimal=7)
+
+        values = np.reshape(values, (2, 3, -1))
+        E_rgb = np.reshape(E_rgb, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            pipeline.relative_exposure_values(values),
+            E_rgb,
+            decimal=7)
+
+    def test_raise_exception_relative_exposure_values(self):
+        """
+        Tests :meth:`colour.models.rgb.aces_it.RelativeExposureValuesPipeline.\
+relative_exposure_values` method raised exception.
+        """
+
+        pipeline = RelativeExposureValuesPipeline()
+        self.assertRaises(ValueError,
+                          pipeline.relative_exposure_values,
+                          np.ones((4, 10)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -266,6 +266,30 @@ class TestHSL_to_RGB(unittest.TestCase):
             np.array([1., 1., 1.]),
             decimal=7)
 
+    def test_saturated_HSL_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.deprecated.HSL_to_RGB` definition
+        fully saturated colours support.
+        """
+
+        np.testing.assert_almost_equal(
+            HSL_to_RGB(np.array([0, 1, 0.5])),
+            np.array([1., 0., 0.]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            HSL_to_RGB(np.array([0.5, 1, 0.25])),
+            np.array([0., 0.5, 0.5]),
+            decimal=7)
+
+        RGB = np.array([0.25, 0.60, 0.05])
+        HSL = RGB_to_HSL(RGB)
+        HSL[..., 1] = 1
+        np.testing.assert_almost_equal(
+            RGB_to_HSL(HSL_to_RGB(HSL)),
+            HSL,
+            decimal=7)
+
     def test_n_dimensional_HSL_to_RGB(self):
         """
         Tests :func:`colour.models.rgb.deprecated.HSL_to_RGB` definition
@@ -18,7 +18,9 @@ from colour.models import (
     XYZ_to_RGB,
     RGB_to_XYZ,
     RGB_to_RGB,
-    normalised_primary_matrix)
+    chromatically_adapted_primaries,
+    normalised_primary_matrix,
+    sRGB_COLOURSPACE)
 from colour.models.rgb.dataset.srgb import _srgb_OECF, _srgb_EOCF
 from colour.utilities import ignore_numpy_errors
 
@@ -328,6 +330,109 @@ class TestRGB_Colourspace(unittest.TestCase):
         for attribute in required_attributes:
             self.assertIn(attribute, dir(RGB_Colourspace))
 
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('cached',
+                            'clear_cache',
+                            'normalised_primary_matrix',
+                            'RGB_luminance_equation',
+                            'chromatically_adapted_primaries',
+                            'chromatically_adapted_RGB_to_XYZ_matrix',
+                            'chromatically_adapted_XYZ_to_RGB_matrix')
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_Colourspace))
+
+    def test_cached(self):
+        """
+        Tests :meth:`colour.models.rgb.rgb_colourspace.RGB_Colourspace.cached`
+        method.
+        """
+
+        colourspace = RGB_Colourspace('RGB Colourspace',
+                                      sRGB_COLOURSPACE.primaries,
+                                      sRGB_COLOURSPACE.whitepoint)
+
+        npm = colourspace.normalised_primary_matrix()
+        self.assertIsNot(colourspace.normalised_primary_matrix(), npm)
+        npm *= 2
+        np.testing.assert_almost_equal(
+            colourspace.normalised_primary_matrix(), npm / 2, decimal=7)
+        npm = colourspace.normalised_primary_matrix()
+        np.testing.assert_almost_equal(
+            npm,
+            normalised_primary_matrix(sRGB_COLOURSPACE.primaries,
+                                      sRGB_COLOURSPACE.whitepoint),
+            decimal=7)
+
+        whitepoint = np.array([0.34567, 0.35850])
+        primaries = colourspace.chromatically_adapted_primaries(whitepoint)
+        np.testing.assert_equal(
+            colourspace.chromatically_adapted_primaries(whitepoint),
+            primaries)
+        self.assertFalse(np.array_equal(
+            colourspace.chromatically_adapted_primaries(whitepoint,
+                                                        'Bradford'),
+            primaries))
+
+        colourspace.whitepoint = whitepoint
+        self.assertFalse(np.array_equal(
+            colourspace.normalised_primary_matrix(), npm))
+        np.testing.assert_almost_equal(
+            colourspace.normalised_primary_matrix(),
+            normalised_primary_matrix(sRGB_COLOURSPACE.primaries, whitepoint),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            colourspace.chromatically_adapted_primaries(
+                sRGB_COLOURSPACE.whitepoint),
+            chromatically_adapted_primaries(sRGB_COLOURSPACE.primaries,
+                                            whitepoint,
+                                            sRGB_COLOURSPACE.whitepoint),
+            decimal=7)
+
+        colourspace.primaries = np.array(
+            [0.73470, 0.26530, 0.00000, 1.00000, 0.00010, -0.07700])
+        np.testing.assert_almost_equal(
+            colourspace.normalised_primary_matrix(),
+            normalised_primary_matrix(colourspace.primaries, whitepoint),
+            decimal=7)
+
+        colourspace.cached('key', lambda x: np.ones(3))
+        colourspace.clear_cache()
+        np.testing.assert_equal(
+            colourspace.cached('key', lambda x: np.zeros(3)), np.zeros(3))
+
+    def test_chromatically_adapted_matrices(self):
+        """
+        Tests :meth:`colour.models.rgb.rgb_colourspace.RGB_Colourspace.\
+chromatically_adapted_RGB_to_XYZ_matrix` and :meth:`colour.models.rgb.\
+rgb_colourspace.RGB_Colourspace.chromatically_adapted_XYZ_to_RGB_matrix`
+        methods.
+        """
+
+        whitepoint = np.array([0.34567, 0.35850])
+        RGB = np.array([0.01103604, 0.12734466, 0.11631037])
+        XYZ = RGB_to_XYZ(RGB,
+                         sRGB_COLOURSPACE.whitepoint,
+                         whitepoint,
+                         sRGB_COLOURSPACE.RGB_to_XYZ_matrix,
+                         'Bradford')
+
+        np.testing.assert_almost_equal(
+            np.dot(sRGB_COLOURSPACE.chromatically_adapted_RGB_to_XYZ_matrix(
+                whitepoint, 'Bradford'), RGB),
+            XYZ,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            np.dot(sRGB_COLOURSPACE.chromatically_adapted_XYZ_to_RGB_matrix(
+                whitepoint, 'Bradford'), XYZ),
+            RGB,
+            decimal=7)
+
 
 class TestXYZ_to_RGB(unittest.TestCase):
     """
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.models.cam02_ucs` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.models.cam02_ucs import (
+    COEFFICIENTS_UCS_LUO2006,
+    JMh_CIECAM02_to_UCS_Luo2006,
+    UCS_Luo2006_to_JMh_CIECAM02,
+    JMh_CIECAM02_to_CAM02LCD,
+    CAM02LCD_to_JMh_CIECAM02,
+    JMh_CIECAM02_to_CAM02SCD,
+    CAM02SCD_to_JMh_CIECAM02,
+    JMh_CIECAM02_to_CAM02UCS,
+    CAM02UCS_to_JMh_CIECAM02)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestJMh_CIECAM02_to_UCS_Luo2006',
+           'TestUCS_Luo2006_to_JMh_CIECAM02',
+           'TestJMh_CIECAM02_to_CAM02LCD',
+           'TestJMh_CIECAM02_to_CAM02SCD',
+           'TestJMh_CIECAM02_to_CAM02UCS']
+
+
+class TestJMh_CIECAM02_to_UCS_Luo2006(unittest.TestCase):
+    """
+    Defines :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_UCS_Luo2006`
+    definition unit tests methods.
+    """
+
+    def test_JMh_CIECAM02_to_UCS_Luo2006(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_UCS_Luo2006`
+        definition.
+        """
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+            np.array([54.90433134, -0.08450396, -0.06854831]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+            np.array([54.90433134, -0.08436178, -0.06843298]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+            np.array([54.90433134, -0.08442362, -0.06848314]),
+            decimal=7)
+
+    def test_n_dimensional_JMh_CIECAM02_to_UCS_Luo2006(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_UCS_Luo2006`
+        definition n-dimensions support.
+        """
+
+        coefficients = COEFFICIENTS_UCS_LUO2006['CAM02-UCS']
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        Jpapbp = np.array([54.90433134, -0.08442362, -0.06848314])
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(JMh, coefficients),
+            Jpapbp,
+            decimal=7)
+
+        JMh = np.tile(JMh, (6, 1))
+        Jpapbp = np.tile(Jpapbp, (6, 1))
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(JMh, coefficients),
+            Jpapbp,
+            decimal=7)
+
+        JMh = np.reshape(JMh, (2, 3, 3))
+        Jpapbp = np.reshape(Jpapbp, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            JMh_CIECAM02_to_UCS_Luo2006(JMh, coefficients),
+            Jpapbp,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_JMh_CIECAM02_to_UCS_Luo2006(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_UCS_Luo2006`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            JMh = np.array(case)
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+
+
+class TestUCS_Luo2006_to_JMh_CIECAM02(unittest.TestCase):
+    """
+    Defines :func:`colour.models.cam02_ucs.UCS_Luo2006_to_JMh_CIECAM02`
+    definition unit tests methods.
+    """
+
+    def test_UCS_Luo2006_to_JMh_CIECAM02(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.UCS_Luo2006_to_JMh_CIECAM02`
+        definition.
+        """
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(
+                np.array([54.90433134, -0.08450396, -0.06854831]),
+                COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+            JMh,
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(
+                np.array([54.90433134, -0.08436178, -0.06843298]),
+                COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+            JMh,
+            decimal=5)
+
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(
+                np.array([54.90433134, -0.08442362, -0.06848314]),
+                COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+            JMh,
+            decimal=5)
+
+    def test_n_dimensional_UCS_Luo2006_to_JMh_CIECAM02(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.UCS_Luo2006_to_JMh_CIECAM02`
+        definition n-dimensions support.
+        """
+
+        coefficients = COEFFICIENTS_UCS_LUO2006['CAM02-UCS']
+
+        Jpapbp = np.array([54.90433134, -0.08442362, -0.06848314])
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(Jpapbp, coefficients),
+            JMh,
+            decimal=5)
+
+        Jpapbp = np.tile(Jpapbp, (6, 1))
+        JMh = np.tile(JMh, (6, 1))
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(Jpapbp, coefficients),
+            JMh,
+            decimal=5)
+
+        Jpapbp = np.reshape(Jpapbp, (2, 3, 3))
+        JMh = np.reshape(JMh, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            UCS_Luo2006_to_JMh_CIECAM02(Jpapbp, coefficients),
+            JMh,
+            decimal=5)
+
+    def test_round_trip_UCS_Luo2006_to_JMh_CIECAM02(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.UCS_Luo2006_to_JMh_CIECAM02`
+        definition round trip with
+        :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_UCS_Luo2006`
+        definition.
+        """
+
+        JMh = np.array([[41.73109113, 0.10884218, 219.04843266],
+                        [22.10000000, 45.30000000, 10.50000000],
+                        [80.20000000, 12.00000000, 300.00000000]])
+        for coefficients in COEFFICIENTS_UCS_LUO2006.values():
+            np.testing.assert_almost_equal(
+                UCS_Luo2006_to_JMh_CIECAM02(
+                    JMh_CIECAM02_to_UCS_Luo2006(JMh, coefficients),
+                    coefficients),
+                JMh,
+                decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_UCS_Luo2006_to_JMh_CIECAM02(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.UCS_Luo2006_to_JMh_CIECAM02`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            Jpapbp = np.array(case)
+            UCS_Luo2006_to_JMh_CIECAM02(
+                Jpapbp, COEFFICIENTS_UCS_LUO2006['CAM02-UCS'])
+
+
+class TestJMh_CIECAM02_to_CAM02LCD(unittest.TestCase):
+    """
+    Defines :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02LCD`
+    definition unit tests methods.
+    """
+
+    def test_JMh_CIECAM02_to_CAM02LCD(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02LCD`
+        definition and :func:`colour.models.cam02_ucs.CAM02LCD_to_JMh_CIECAM02`
+        definition.
+        """
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        Jpapbp = JMh_CIECAM02_to_CAM02LCD(JMh)
+        np.testing.assert_almost_equal(
+            Jpapbp,
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CAM02LCD_to_JMh_CIECAM02(Jpapbp),
+            JMh,
+            decimal=7)
+
+
+class TestJMh_CIECAM02_to_CAM02SCD(unittest.TestCase):
+    """
+    Defines :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02SCD`
+    definition unit tests methods.
+    """
+
+    def test_JMh_CIECAM02_to_CAM02SCD(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02SCD`
+        definition and :func:`colour.models.cam02_ucs.CAM02SCD_to_JMh_CIECAM02`
+        definition.
+        """
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        Jpapbp = JMh_CIECAM02_to_CAM02SCD(JMh)
+        np.testing.assert_almost_equal(
+            Jpapbp,
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CAM02SCD_to_JMh_CIECAM02(Jpapbp),
+            JMh,
+            decimal=7)
+
+
+class TestJMh_CIECAM02_to_CAM02UCS(unittest.TestCase):
+    """
+    Defines :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02UCS`
+    definition unit tests methods.
+    """
+
+    def test_JMh_CIECAM02_to_CAM02UCS(self):
+        """
+        Tests :func:`colour.models.cam02_ucs.JMh_CIECAM02_to_CAM02UCS`
+        definition and :func:`colour.models.cam02_ucs.CAM02UCS_to_JMh_CIECAM02`
+        definition.
+        """
+
+        JMh = np.array([41.73109113, 0.10884218, 219.04843266])
+        Jpapbp = JMh_CIECAM02_to_CAM02UCS(JMh)
+        np.testing.assert_almost_equal(
+            Jpapbp,
+            JMh_CIECAM02_to_UCS_Luo2006(
+                JMh, COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            CAM02UCS_to_JMh_CIECAM02(Jpapbp),
+            JMh,
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.models.kernels` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models import (
+    XYZ_to_Lab,
+    Lab_to_XYZ,
+    XYZ_to_Luv,
+    Luv_to_XYZ,
+    XYZ_to_IPT,
+    IPT_to_XYZ,
+    XYZ_to_Hunter_Lab,
+    Hunter_Lab_to_XYZ,
+    xy_to_xyY,
+    xyY_to_XYZ)
+from colour.models.ipt import (
+    IPT_XYZ_TO_LMS_MATRIX,
+    IPT_LMS_TO_IPT_MATRIX,
+    IPT_IPT_TO_LMS_MATRIX,
+    IPT_LMS_TO_XYZ_MATRIX)
+from colour.models.rgb.deprecated import (
+    RGB_to_HSV,
+    HSV_to_RGB,
+    RGB_to_HSL,
+    HSL_to_RGB)
+from colour.models.kernels import (
+    XYZ_to_Lab_kernel,
+    Lab_to_XYZ_kernel,
+    XYZ_to_Luv_kernel,
+    Luv_to_XYZ_kernel,
+    XYZ_to_IPT_kernel,
+    IPT_to_XYZ_kernel,
+    XYZ_to_Hunter_Lab_kernel,
+    Hunter_Lab_to_XYZ_kernel,
+    RGB_to_HSV_kernel,
+    HSV_to_RGB_kernel,
+    RGB_to_HSL_kernel,
+    HSL_to_RGB_kernel)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestXYZ_to_Lab_kernel',
+           'TestLab_to_XYZ_kernel',
+           'TestXYZ_to_Luv_kernel',
+           'TestLuv_to_XYZ_kernel',
+           'TestXYZ_to_IPT_kernel',
+           'TestIPT_to_XYZ_kernel',
+           'TestXYZ_to_Hunter_Lab_kernel',
+           'TestHunter_Lab_to_XYZ_kernel',
+           'TestRGB_to_HSV_kernel',
+           'TestHSV_to_RGB_kernel',
+           'TestRGB_to_HSL_kernel',
+           'TestHSL_to_RGB_kernel']
+
+ILLUMINANT = np.array([0.34567, 0.35850])
+
+XYZ_R = xyY_to_XYZ(xy_to_xyY(ILLUMINANT))
+
+XYZ_N = np.array([96.38, 100.00, 82.45])
+
+K_AB = np.array([173.51, 58.48])
+
+SAMPLES = np.reshape(np.random.RandomState(4).random_sample(48), (4, 4, 3))
+
+
+class TestXYZ_to_Lab_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.XYZ_to_Lab_kernel` definition unit
+    tests methods.
+    """
+
+    def test_XYZ_to_Lab_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.XYZ_to_Lab_kernel` definition.
+        """
+
+        XYZ = SAMPLES
+        np.testing.assert_almost_equal(
+            XYZ_to_Lab_kernel(XYZ, XYZ_R),
+            XYZ_to_Lab(XYZ, ILLUMINANT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_Lab_kernel(XYZ[0, 0], XYZ_R),
+            XYZ_to_Lab(XYZ[0, 0], ILLUMINANT),
+            decimal=7)
+
+
+class TestLab_to_XYZ_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.Lab_to_XYZ_kernel` definition unit
+    tests methods.
+    """
+
+    def test_Lab_to_XYZ_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.Lab_to_XYZ_kernel` definition.
+        """
+
+        Lab = XYZ_to_Lab(SAMPLES, ILLUMINANT)
+        np.testing.assert_almost_equal(
+            Lab_to_XYZ_kernel(Lab, XYZ_R),
+            Lab_to_XYZ(Lab, ILLUMINANT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            Lab_to_XYZ_kernel(Lab[0, 0], XYZ_R),
+            Lab_to_XYZ(Lab[0, 0], ILLUMINANT),
+            decimal=7)
+
+
+class TestXYZ_to_Luv_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.XYZ_to_Luv_kernel` definition unit
+    tests methods.
+    """
+
+    def test_XYZ_to_Luv_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.XYZ_to_Luv_kernel` definition.
+        """
+
+        XYZ = SAMPLES
+        np.testing.assert_almost_equal(
+            XYZ_to_Luv_kernel(XYZ, XYZ_R),
+            XYZ_to_Luv(XYZ, ILLUMINANT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_Luv_kernel(XYZ[0, 0], XYZ_R),
+            XYZ_to_Luv(XYZ[0, 0], ILLUMINANT),
+            decimal=7)
+
+
+class TestLuv_to_XYZ_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.Luv_to_XYZ_kernel` definition unit
+    tests methods.
+    """
+
+    def test_Luv_to_XYZ_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.Luv_to_XYZ_kernel` definition.
+        """
+
+        Luv = XYZ_to_Luv(SAMPLES, ILLUMINANT)
+        np.testing.assert_almost_equal(
+            Luv_to_XYZ_kernel(Luv, XYZ_R),
+            Luv_to_XYZ(Luv, ILLUMINANT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            Luv_to_XYZ_kernel(Luv[0, 0], XYZ_R),
+            Luv_to_XYZ(Luv[0, 0], ILLUMINANT),
+            decimal=7)
+
+
+class TestXYZ_to_IPT_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.XYZ_to_IPT_kernel` definition unit
+    tests methods.
+    """
+
+    def test_XYZ_to_IPT_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.XYZ_to_IPT_kernel` definition.
+        """
+
+        XYZ = SAMPLES
+        np.testing.assert_almost_equal(
+            XYZ_to_IPT_kernel(
+                XYZ, IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_IPT_MATRIX),
+            XYZ_to_IPT(XYZ),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_IPT_kernel(
+                XYZ[0, 0], IPT_XYZ_TO_LMS_MATRIX, IPT_LMS_TO_IPT_MATRIX),
+            XYZ_to_IPT(XYZ[0, 0]),
+            decimal=7)
+
+
+class TestIPT_to_XYZ_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.IPT_to_XYZ_kernel` definition unit
+    tests methods.
+    """
+
+    def test_IPT_to_XYZ_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.IPT_to_XYZ_kernel` definition.
+        """
+
+        IPT = XYZ_to_IPT(SAMPLES)
+        np.testing.assert_almost_equal(
+            IPT_to_XYZ_kernel(
+                IPT, IPT_IPT_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX),
+            IPT_to_XYZ(IPT),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            IPT_to_XYZ_kernel(
+                IPT[0, 0], IPT_IPT_TO_LMS_MATRIX, IPT_LMS_TO_XYZ_MATRIX),
+            IPT_to_XYZ(IPT[0, 0]),
+            decimal=7)
+
+
+class TestXYZ_to_Hunter_Lab_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.\
+XYZ_to_Hunter_Lab_kernel` definition unit tests methods.
+    """
+
+    def test_XYZ_to_Hunter_Lab_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.\
+XYZ_to_Hunter_Lab_kernel` definition.
+        """
+
+        XYZ = SAMPLES * 100
+        np.testing.assert_almost_equal(
+            XYZ_to_Hunter_Lab_kernel(XYZ, XYZ_N, K_AB),
+            XYZ_to_Hunter_Lab(XYZ, XYZ_N, K_AB),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_Hunter_Lab_kernel(XYZ[0, 0], XYZ_N, K_AB),
+            XYZ_to_Hunter_Lab(XYZ[0, 0], XYZ_N, K_AB),
+            decimal=7)
+
+
+class TestHunter_Lab_to_XYZ_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.\
+Hunter_Lab_to_XYZ_kernel` definition unit tests methods.
+    """
+
+    def test_Hunter_Lab_to_XYZ_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.\
+Hunter_Lab_to_XYZ_kernel` definition.
+        """
+
+        Lab = XYZ_to_Hunter_Lab(SAMPLES * 100, XYZ_N, K_AB)
+        np.testing.assert_almost_equal(
+            Hunter_Lab_to_XYZ_kernel(Lab, XYZ_N, K_AB),
+            Hunter_Lab_to_XYZ(Lab, XYZ_N, K_AB),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            Hunter_Lab_to_XYZ_kernel(Lab[0, 0], XYZ_N, K_AB),
+            Hunter_Lab_to_XYZ(Lab[0, 0], XYZ_N, K_AB),
+            decimal=7)
+
+
+class TestRGB_to_HSV_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.RGB_to_HSV_kernel` definition unit
+    tests methods.
+    """
+
+    def test_RGB_to_HSV_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.RGB_to_HSV_kernel` definition.
+        """
+
+        RGB = SAMPLES
+        np.testing.assert_almost_equal(
+            RGB_to_HSV_kernel(RGB),
+            RGB_to_HSV(RGB),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_HSV_kernel(RGB[0, 0]),
+            RGB_to_HSV(RGB[0, 0]),
+            decimal=7)
+
+
+class TestHSV_to_RGB_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.HSV_to_RGB_kernel` definition unit
+    tests methods.
+    """
+
+    def test_HSV_to_RGB_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.HSV_to_RGB_kernel` definition.
+        """
+
+        HSV = SAMPLES
+        np.testing.assert_almost_equal(
+            HSV_to_RGB_kernel(HSV),
+            HSV_to_RGB(HSV),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            HSV_to_RGB_kernel(HSV[0, 0]),
+            HSV_to_RGB(HSV[0, 0]),
+            decimal=7)
+
+
+class TestRGB_to_HSL_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.RGB_to_HSL_kernel` definition unit
+    tests methods.
+    """
+
+    def test_RGB_to_HSL_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.RGB_to_HSL_kernel` definition.
+        """
+
+        RGB = SAMPLES
+        np.testing.assert_almost_equal(
+            RGB_to_HSL_kernel(RGB),
+            RGB_to_HSL(RGB),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_HSL_kernel(RGB[0, 0]),
+            RGB_to_HSL(RGB[0, 0]),
+            decimal=7)
+
+
+class TestHSL_to_RGB_kernel(unittest.TestCase):
+    """
+    Defines :func:`colour.models.kernels.HSL_to_RGB_kernel` definition unit
+    tests methods.
+    """
+
+    def test_HSL_to_RGB_kernel(self):
+        """
+        Tests :func:`colour.models.kernels.HSL_to_RGB_kernel` definition.
+        """
+
+        HSL = SAMPLES
+        np.testing.assert_almost_equal(
+            HSL_to_RGB_kernel(HSL),
+            HSL_to_RGB(HSL),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            HSL_to_RGB_kernel(HSL[0, 0]),
+            HSL_to_RGB(HSL[0, 0]),
+            decimal=7)
+
+        HSL = np.copy(SAMPLES)
+        HSL[..., 1] = 1
+        np.testing.assert_almost_equal(
+            HSL_to_RGB_kernel(HSL),
+            HSL_to_RGB(HSL),
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
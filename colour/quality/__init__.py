@@ -5,10 +5,26 @@ from __future__ import absolute_import
 
 from .dataset import *  # noqa
 from . import dataset
-from .cri import CRI_Specification, colour_rendering_index
-from .cqs import CQS_Specification, colour_quality_scale
+from .cri import (
+    CRI_Specification,
+    colour_rendering_index,
+    CRI_BatchSpecification,
+    colour_rendering_index_batch)
+from .cqs import (
+    CQS_Specification,
+    colour_quality_scale,
+    CQS_BatchSpecification,
+    colour_quality_scale_batch)
+from .mixture import SpectralMixture
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['CRI_Specification', 'colour_rendering_index']
-__all__ += ['CQS_Specification', 'colour_quality_scale']
+__all__ += ['CRI_Specification',
+            'colour_rendering_index',
+            'CRI_BatchSpecification',
+            'colour_rendering_index_batch']
+__all__ += ['CQS_Specification',
+            'colour_quality_scale',
+            'CQS_BatchSpecification',
+            'colour_quality_scale_batch']
+__all__ += ['SpectralMixture']
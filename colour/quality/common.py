@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Common Colour Quality Utilities
+===============================
+
+Defines the colour quality metrics batch computations common objects shared
+by :func:`colour.quality.colour_rendering_index_batch` and
+:func:`colour.quality.colour_quality_scale_batch` definitions and
+:class:`colour.quality.SpectralMixture` class:
+
+-   :func:`samples_batch_data`
+-   :func:`samples_XYZ`
+-   :func:`reference_illuminants`
+
+See Also
+--------
+:mod:`colour.quality.cri`, :mod:`colour.quality.cqs`,
+:mod:`colour.quality.mixture`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (
+    D_ILLUMINANTS_S_SPDS,
+    D_illuminant_weights,
+    STANDARD_OBSERVERS_CMFS,
+    SpectralShape,
+    planck_law)
+from colour.temperature import CCT_to_xy_CIE_D
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['samples_batch_data',
+           'samples_XYZ',
+           'reference_illuminants']
+
+
+def samples_batch_data(shape, spds, indexes_to_names, cache=None):
+    """
+    Returns the colour quality metrics batch computations data depending only
+    on given spectral shape: the colour matching functions, the given colour
+    samples reflectances and the *CIE Standard Illuminant D Series* basis
+    functions.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape the computations are performed with.
+    spds : dict
+        Colour samples reflectances spectral power distributions.
+    indexes_to_names : dict
+        Colour samples indexes to names mapping defining their order.
+    cache : dict, optional
+        Cache the data is retrieved from and stored into, keyed by spectral
+        shape.
+
+    Returns
+    -------
+    dict
+        Read-only arrays of the batch computations data:
+
+        -   *wavelengths_r*: Wavelengths in meters of the *ASTM E308–15*
+            practise working range at 1 nm interval the reference
+            illuminants tristimulus values are computed with.
+        -   *wavelengths_s*: Wavelengths in meters of given spectral shape.
+        -   *cmfs_r*: *CIE 1931 2 Degree Standard Observer* colour matching
+            functions sampled at *wavelengths_r*.
+        -   *cmfs_s*: *CIE 1931 2 Degree Standard Observer* colour matching
+            functions sampled at given spectral shape.
+        -   *S_XYZ_r*: *CIE XYZ* tristimulus values of the
+            *CIE Standard Illuminant D Series* :math:`S_0`, :math:`S_1` and
+            :math:`S_2` basis functions.
+        -   *S_s*: *CIE Standard Illuminant D Series* :math:`S_0`,
+            :math:`S_1` and :math:`S_2` basis functions sampled at given
+            spectral shape.
+        -   *R*: Colour samples reflectances sampled at given spectral shape.
+
+    Notes
+    -----
+    -   The reference illuminants tristimulus values are computed on the
+        practise *ASTM E308–15* working wavelengths range at 1 nm interval as
+        :func:`colour.quality.colour_rendering_index` and
+        :func:`colour.quality.colour_quality_scale` definitions do.
+
+    Examples
+    --------
+    >>> from colour.quality.dataset.tcs import (
+    ...     TCS_INDEXES_TO_NAMES, TCS_SPDS)
+    >>> data = samples_batch_data(
+    ...     SpectralShape(360, 780, 5), TCS_SPDS, TCS_INDEXES_TO_NAMES)
+    >>> data['R'].shape
+    (14, 85)
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+    if cache is not None:
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+    cmfs = STANDARD_OBSERVERS_CMFS.get('CIE 1931 2 Degree Standard Observer')
+
+    shape_r = SpectralShape(360, 780, 1)
+    cmfs_r = cmfs.clone().trim_wavelengths(shape_r)
+    cmfs_s = cmfs_r.clone().align(shape)
+
+    S_r, S_s = [], []
+    for name in ('S0', 'S1', 'S2'):
+        spd = D_ILLUMINANTS_S_SPDS.get(name).clone().align(cmfs.shape)
+        S_r.append(spd.clone().align(shape_r).values)
+        S_s.append(spd.clone().align(shape).values)
+
+    data = {'wavelengths_r': shape_r.range() * 1e-9,
+            'wavelengths_s': shape.range() * 1e-9,
+            'cmfs_r': cmfs_r.values,
+            'cmfs_s': cmfs_s.values,
+            'S_XYZ_r': np.dot(np.array(S_r), cmfs_r.values),
+            'S_s': np.array(S_s),
+            'R': np.array([spds.get(name).clone().align(shape).values
+                           for _index, name in
+                           sorted(indexes_to_names.items())])}
+
+    for array in data.values():
+        array.setflags(write=False)
+
+    if cache is not None:
+        cache[key] = data
+
+    return data
+
+
+def samples_XYZ(S, data):
+    """
+    Returns the colour samples *CIE XYZ* tristimulus values under given
+    illuminants spectral power distributions values.
+
+    Parameters
+    ----------
+    S : array_like, (N, W)
+        Illuminants spectral power distributions values sampled at the
+        spectral shape of given batch computations data.
+    data : dict
+        Batch computations data as returned by :func:`samples_batch_data`
+        definition.
+
+    Returns
+    -------
+    ndarray, (N, M, 3)
+        Colour samples *CIE XYZ* tristimulus values, not normalised.
+
+    Examples
+    --------
+    >>> from colour.quality.dataset.tcs import (
+    ...     TCS_INDEXES_TO_NAMES, TCS_SPDS)
+    >>> shape = SpectralShape(360, 780, 5)
+    >>> data = samples_batch_data(shape, TCS_SPDS, TCS_INDEXES_TO_NAMES)
+    >>> S = np.ones((2, len(shape.range())))
+    >>> samples_XYZ(S, data).shape
+    (2, 14, 3)
+    """
+
+    S = np.asarray(S)
+    cmfs, R = data['cmfs_s'], data['R']
+
+    XYZ = np.empty((S.shape[0], R.shape[0], 3))
+    for i in range(3):
+        XYZ[..., i] = np.dot(S * cmfs[..., i], R.T)
+
+    return XYZ
+
+
+def reference_illuminants(CCT, blackbody, data):
+    """
+    Returns the reference illuminants spectral power distributions values and
+    *CIE XYZ* tristimulus values of given correlated colour temperatures
+    :math:`T_{cp}`.
+
+    Parameters
+    ----------
+    CCT : array_like, (N,)
+        Correlated colour temperatures :math:`T_{cp}`.
+    blackbody : array_like, (N,)
+        Whether the reference illuminants are planckian radiators or
+        *CIE Standard Illuminant D Series*.
+    data : dict
+        Batch computations data as returned by :func:`samples_batch_data`
+        definition.
+
+    Returns
+    -------
+    tuple
+        Reference illuminants spectral power distributions values sampled at
+        the spectral shape of given batch computations data and their
+        *CIE XYZ* tristimulus values, not normalised.
+
+    Examples
+    --------
+    >>> from colour.quality.dataset.tcs import (
+    ...     TCS_INDEXES_TO_NAMES, TCS_SPDS)
+    >>> data = samples_batch_data(
+    ...     SpectralShape(360, 780, 5), TCS_SPDS, TCS_INDEXES_TO_NAMES)
+    >>> CCT = np.array([2856, 6504])
+    >>> S_r, XYZ_r = reference_illuminants(CCT, CCT < 5000, data)
+    >>> XYZ_r / XYZ_r[..., 1, np.newaxis]  # doctest: +ELLIPSIS
+    array([[ 1.0984372...,  1.        ,  0.3559702...],
+           [ 0.9504540...,  1.        ,  1.0896045...]])
+    """
+
+    CCT = np.asarray(CCT, dtype=np.float_)
+    blackbody = np.asarray(blackbody, dtype=np.bool_)
+
+    S_r = np.empty((len(CCT), len(data['wavelengths_s'])))
+    XYZ_r = np.empty((len(CCT), 3))
+
+    if np.any(blackbody):
+        T = CCT[blackbody, np.newaxis]
+        S_r[blackbody] = planck_law(data['wavelengths_s'], T)
+        XYZ_r[blackbody] = np.dot(planck_law(data['wavelengths_r'], T),
+                                  data['cmfs_r'])
+
+    daylight = ~blackbody
+    if np.any(daylight):
+        M = D_illuminant_weights(CCT_to_xy_CIE_D(CCT[daylight]))
+        S_r[daylight] = np.dot(M, data['S_s'])
+        XYZ_r[daylight] = np.dot(M, data['S_XYZ_r'])
+
+    return S_r, XYZ_r
@@ -9,6 +9,8 @@ Defines *colour quality scale* computation objects:
 
 -   :class:`CQS_Specification`
 -   :func:`colour_quality_scale`
+-   :class:`CQS_BatchSpecification`
+-   :func:`colour_quality_scale_batch`
 
 See Also
 --------
@@ -28,14 +30,20 @@ References
 from __future__ import division, unicode_literals
 
 import numpy as np
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 
 from colour.colorimetry import (
     D_illuminant_relative_spd,
     ILLUMINANTS,
     STANDARD_OBSERVERS_CMFS,
+    SpectralPowerDistribution,
+    SpectralShape,
     blackbody_spd,
     spectral_to_XYZ)
+from colour.quality.common import (
+    reference_illuminants,
+    samples_XYZ,
+    samples_batch_data)
 from colour.quality.dataset.vs import VS_INDEXES_TO_NAMES, VS_SPDS
 from colour.models import (
     Lab_to_LCHab,
@@ -45,8 +53,10 @@ from colour.models import (
     XYZ_to_xy,
     xy_to_XYZ)
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Ohno2013
-from colour.adaptation import chromatic_adaptation_VonKries
-from colour.utilities import tsplit
+from colour.adaptation import (
+    chromatic_adaptation_VonKries,
+    chromatic_adaptation_matrix_VonKries)
+from colour.utilities import tiles, tsplit, tstack, unique_rows
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -65,10 +75,39 @@ __all__ = ['D65_GAMUT_AREA',
            'CCT_factor',
            'scale_conversion',
            'delta_E_RMS',
-           'colour_quality_scales']
+           'colour_quality_scales',
+           'CQS_BatchSpecification',
+           'vs_batch_data',
+           'colour_quality_scales_batch',
+           'cqs_batch_specification',
+           'colour_quality_scale_batch']
 
 D65_GAMUT_AREA = 8210
 
+_CQS_BATCH_DATA_CACHE = {}
+"""
+Cache for the spectral shape dependent data of
+:func:`colour_quality_scale_batch` definition.
+
+_CQS_BATCH_DATA_CACHE : dict
+"""
+
+_CQS_REFERENCES_CACHE = OrderedDict()
+"""
+Least recently used cache for the reference illuminants dependent data of
+:func:`colour_quality_scale_batch` definition, keyed by spectral shape,
+quantised correlated colour temperature and reference illuminant type.
+
+_CQS_REFERENCES_CACHE : OrderedDict
+"""
+
+_CQS_REFERENCES_CACHE_SIZE = 8192
+"""
+Maximum entries count of :attr:`_CQS_REFERENCES_CACHE` attribute.
+
+_CQS_REFERENCES_CACHE_SIZE : integer
+"""
+
 
 class VS_ColorimetryData(namedtuple('VS_ColorimetryData',
                                     ('name', 'XYZ', 'Lab', 'C'))):
@@ -230,11 +269,12 @@ def gamut_area(Lab):
     Parameters
     ----------
     Lab : array_like
-        *CIE Lab* colourspace matrices.
+        *CIE Lab* colourspace matrices, the gamut areas of stacked arrays of
+        shape (..., S, 3) are computed at once.
 
     Returns
     -------
-    numeric
+    numeric or ndarray
         Gamut area :math:`G`.
 
     Examples
@@ -260,18 +300,15 @@ def gamut_area(Lab):
     """
 
     Lab = np.asarray(Lab)
-    Lab_s = np.roll(np.copy(Lab), -3)
-
-    _L, a, b = tsplit(Lab)
-    _L_s, a_s, b_s = tsplit(Lab_s)
+    Lab_s = np.roll(Lab, -1, axis=-2)
 
     A = np.linalg.norm(Lab[..., 1:3], axis=-1)
     B = np.linalg.norm(Lab_s[..., 1:3], axis=-1)
-    C = np.linalg.norm(np.dstack((a_s - a, b_s - b)), axis=-1)
+    C = np.linalg.norm(Lab_s[..., 1:3] - Lab[..., 1:3], axis=-1)
     t = (A + B + C) / 2
     S = np.sqrt(t * (t - A) * (t - B) * (t - C))
 
-    return np.sum(S)
+    return np.sum(S, axis=-1)
 
 
 def vs_colorimetry_data(spd_test,
@@ -454,3 +491,384 @@ def colour_quality_scales(test_data, reference_data, CCT_f):
         Q_as[i + 1] = VS_ColourQualityScaleData(
             test_data[i].name, Q_a, D_C_ab, D_E_ab, D_Ep_ab)
     return Q_as
+
+
+class CQS_BatchSpecification(
+    namedtuple(
+        'CQS_BatchSpecification',
+        ('Q_a',
+         'Q_f',
+         'Q_p',
+         'Q_g',
+         'Q_d',
+         'Q_as',
+         'CCT',
+         'D_uv'))):
+    """
+    Defines the *CQS* colour quality specification of various test spectral
+    power distributions.
+
+    Parameters
+    ----------
+    Q_a : ndarray, (N,)
+        Colour quality scales :math:`Q_a`.
+    Q_f : ndarray, (N,)
+        Colour fidelity scales :math:`Q_f`.
+    Q_p : ndarray, (N,)
+        Colour preference scales :math:`Q_p`.
+    Q_g : ndarray, (N,)
+        Gamut area scales :math:`Q_g`.
+    Q_d : ndarray, (N,)
+        Relative gamut area scales :math:`Q_d`.
+    Q_as : ndarray, (N, 15)
+        Individual colour quality scales :math:`Q_a` of the
+        *VS test colour samples*.
+    CCT : ndarray, (N,)
+        Correlated colour temperatures :math:`T_{cp}` of the test spectral
+        power distributions.
+    D_uv : ndarray, (N,)
+        :math:`\Delta_{uv}` of the test spectral power distributions.
+    """
+
+
+def vs_batch_data(shape):
+    """
+    Returns the *VS test colour samples* batch computations data of
+    :func:`colour_quality_scale_batch` definition depending only on given
+    spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape the computations are performed with.
+
+    Returns
+    -------
+    dict
+        Batch computations data, see
+        :func:`colour.quality.common.samples_batch_data` definition.
+
+    Examples
+    --------
+    >>> vs_batch_data(SpectralShape(360, 780, 5))['R'].shape
+    (15, 85)
+    """
+
+    return samples_batch_data(
+        shape, VS_SPDS, VS_INDEXES_TO_NAMES, _CQS_BATCH_DATA_CACHE)
+
+
+def _cqs_references(CCT, blackbody, shape, data):
+    """
+    Returns the reference illuminants dependent data of
+    :func:`colour_quality_scale_batch` definition for given correlated colour
+    temperatures: the reference illuminants *CIE XYZ* tristimulus values, the
+    *VS test colour samples* *CIE Lab* colourspace values and chroma under
+    the reference illuminants, the correlated colour temperature factors and
+    the reference gamut areas.
+
+    The reference illuminants are planckian radiators where given
+    ``blackbody`` array is *True* and *CIE Standard Illuminant D Series*
+    otherwise. The data is retrieved from :attr:`_CQS_REFERENCES_CACHE`
+    attribute, only the missing correlated colour temperatures being
+    computed.
+    """
+
+    key = (shape.start, shape.end, shape.interval)
+
+    CCT_u, inverse = unique_rows(tstack((CCT, blackbody)))
+    references = [None] * len(CCT_u)
+    missing = []
+    for i, (T, is_blackbody) in enumerate(CCT_u):
+        reference = _CQS_REFERENCES_CACHE.pop(
+            (key, T, is_blackbody), None)
+        if reference is None:
+            missing.append(i)
+        else:
+            references[i] = reference
+            _CQS_REFERENCES_CACHE[(key, T, is_blackbody)] = reference
+
+    if missing:
+        T, blackbody = tsplit(CCT_u[missing])
+        blackbody = blackbody.astype(np.bool_)
+
+        S_r, XYZ_r = reference_illuminants(T, blackbody, data)
+
+        XYZ_r /= XYZ_r[..., 1, np.newaxis]
+        xy_r = XYZ_to_xy(XYZ_r)[:, np.newaxis]
+
+        XYZ_vs = samples_XYZ(S_r, data)
+        XYZ_vs /= np.dot(S_r, data['cmfs_s'][..., 1])[
+            ..., np.newaxis, np.newaxis]
+        Lab_r = XYZ_to_Lab(XYZ_vs, illuminant=xy_r)
+        C_r = Lab_to_LCHab(Lab_r)[..., 1]
+
+        xy_w = ILLUMINANTS.get(
+            'CIE 1931 2 Degree Standard Observer').get('D65')
+        M = chromatic_adaptation_matrix_VonKries(
+            XYZ_r,
+            np.tile(xy_to_XYZ(xy_w), (len(T), 1)),
+            transform='CMCCAT2000')
+        Lab_w = XYZ_to_Lab(np.einsum('nij,nsj->nsi', M, XYZ_vs),
+                           illuminant=xy_w)
+        CCT_f = np.minimum(gamut_area(Lab_w) / D65_GAMUT_AREA, 1)
+        G_r = gamut_area(Lab_r)
+
+        for j, i in enumerate(missing):
+            reference = (XYZ_r[j], Lab_r[j], C_r[j], CCT_f[j], G_r[j])
+            for array in reference[:3]:
+                array.setflags(write=False)
+
+            references[i] = reference
+            _CQS_REFERENCES_CACHE[(key,) + tuple(CCT_u[i])] = reference
+
+        while len(_CQS_REFERENCES_CACHE) > _CQS_REFERENCES_CACHE_SIZE:
+            _CQS_REFERENCES_CACHE.popitem(last=False)
+
+    return [np.array(x)[inverse] for x in zip(*references)]
+
+
+def colour_quality_scales_batch(XYZ_t, XYZ_vs_t, CCT_step, shape, data):
+    """
+    Returns the data the *colour quality scales* are computed from, i.e.
+    the correlated colour temperatures :math:`T_{cp}` and
+    :math:`\Delta_{uv}`, the *VS test colour samples* chroma and colour
+    differences, the test and reference gamut areas and the correlated colour
+    temperature factors of test illuminants from their *CIE XYZ* tristimulus
+    values and the *VS test colour samples* *CIE XYZ* tristimulus values
+    under them.
+
+    Parameters
+    ----------
+    XYZ_t : array_like, (N, 3)
+        Test illuminants *CIE XYZ* tristimulus values, not normalised.
+    XYZ_vs_t : array_like, (N, 15, 3)
+        *VS test colour samples* *CIE XYZ* tristimulus values under the test
+        illuminants, not normalised.
+    CCT_step : numeric
+        Correlated colour temperature quantisation step in kelvin degrees
+        used to select the reference illuminants, *None* disables the
+        quantisation.
+    shape : SpectralShape
+        Spectral shape the computations are performed with.
+    data : dict
+        Batch computations data as returned by :func:`vs_batch_data`
+        definition.
+
+    Returns
+    -------
+    tuple
+        Correlated colour temperatures :math:`T_{cp}` and
+        :math:`\Delta_{uv}` of shape (N, 2), *VS test colour samples* chroma
+        differences and colour differences of shape (N, 15), test gamut
+        areas, correlated colour temperature factors and reference gamut
+        areas of shape (N,), i.e. the arguments of
+        :func:`cqs_batch_specification` definition.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> shape = SpectralShape(360, 780, 5)
+    >>> data = vs_batch_data(shape)
+    >>> S_t = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(shape).values
+    >>> S_t = S_t[np.newaxis]
+    >>> scales = colour_quality_scales_batch(
+    ...     np.dot(S_t, data['cmfs_s']), samples_XYZ(S_t, data), None, shape,
+    ...     data)
+    >>> cqs_batch_specification(*scales).Q_a  # doctest: +ELLIPSIS
+    array([ 64.6781117...])
+    """
+
+    CCT_D_uv = uv_to_CCT_Ohno2013(UCS_to_uv(XYZ_to_UCS(XYZ_t)))
+
+    # The reference illuminant type is selected before quantisation so that
+    # the correlated colour temperatures close to 5000K do not switch
+    # reference illuminant type.
+    CCT = CCT_D_uv[..., 0]
+    blackbody = CCT < 5000
+    if CCT_step is not None:
+        CCT = np.around(CCT / CCT_step) * CCT_step
+
+    XYZ_r, Lab_r, C_r, CCT_f, G_r = _cqs_references(
+        CCT, blackbody, shape, data)
+
+    M = chromatic_adaptation_matrix_VonKries(
+        XYZ_t / XYZ_t[..., 1, np.newaxis], XYZ_r, transform='CMCCAT2000')
+    XYZ_vs_t = XYZ_vs_t / XYZ_t[..., 1, np.newaxis, np.newaxis]
+    Lab_t = XYZ_to_Lab(np.einsum('nij,nsj->nsi', M, XYZ_vs_t),
+                       illuminant=XYZ_to_xy(XYZ_r)[:, np.newaxis])
+    C_t = Lab_to_LCHab(Lab_t)[..., 1]
+
+    D_C_ab = C_t - C_r
+    D_E_ab = np.linalg.norm(Lab_t - Lab_r, axis=-1)
+
+    return CCT_D_uv, D_C_ab, D_E_ab, gamut_area(Lab_t), CCT_f, G_r
+
+
+def cqs_batch_specification(CCT_D_uv, D_C_ab, D_E_ab, G_t, CCT_f, G_r):
+    """
+    Returns the *CQS* colour quality specification from the data returned by
+    :func:`colour_quality_scales_batch` definition.
+
+    Parameters
+    ----------
+    CCT_D_uv : array_like, (N, 2)
+        Correlated colour temperatures :math:`T_{cp}` and
+        :math:`\Delta_{uv}` of the test illuminants.
+    D_C_ab : array_like, (N, 15)
+        *VS test colour samples* chroma differences.
+    D_E_ab : array_like, (N, 15)
+        *VS test colour samples* colour differences.
+    G_t : array_like, (N,)
+        Test gamut areas.
+    CCT_f : array_like, (N,)
+        Correlated colour temperature factors.
+    G_r : array_like, (N,)
+        Reference gamut areas.
+
+    Returns
+    -------
+    CQS_BatchSpecification
+        *CQS* colour quality specification.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> shape = SpectralShape(360, 780, 5)
+    >>> data = vs_batch_data(shape)
+    >>> S_t = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(shape).values
+    >>> S_t = S_t[np.newaxis]
+    >>> scales = colour_quality_scales_batch(
+    ...     np.dot(S_t, data['cmfs_s']), samples_XYZ(S_t, data), None, shape,
+    ...     data)
+    >>> cqs_batch_specification(*scales).Q_f  # doctest: +ELLIPSIS
+    array([ 65.8320842...])
+    """
+
+    D_Ep_ab = np.where(D_C_ab > 0,
+                       np.sqrt(np.maximum(D_E_ab ** 2 - D_C_ab ** 2, 0)),
+                       D_E_ab)
+
+    D_E_RMS = np.sqrt(np.mean(D_E_ab ** 2, axis=-1))
+    D_Ep_RMS = np.sqrt(np.mean(D_Ep_ab ** 2, axis=-1))
+
+    Q_p = 100 - 3.6 * (D_Ep_RMS - np.mean(np.maximum(D_C_ab, 0), axis=-1))
+
+    return CQS_BatchSpecification(
+        scale_conversion(D_Ep_RMS, CCT_f),
+        scale_conversion(D_E_RMS, CCT_f, 2.928),
+        Q_p,
+        G_t / D65_GAMUT_AREA * 100,
+        G_t / G_r * CCT_f * 100,
+        scale_conversion(D_Ep_ab, CCT_f[..., np.newaxis]),
+        CCT_D_uv[..., 0],
+        CCT_D_uv[..., 1])
+
+
+def colour_quality_scale_batch(spds,
+                               shape=SpectralShape(360, 780, 5),
+                               CCT_step=1,
+                               tile_size=1024,
+                               additional_data=False):
+    """
+    Returns the *colour quality scales* of given spectral power distributions
+    computed at once.
+
+    The *VS test colour samples* reflectances and the colour matching
+    functions are sampled once at given spectral shape. The reference
+    illuminants colorimetry only depends on the correlated colour
+    temperature, it is thus cached by quantised correlated colour temperature
+    in a bounded least recently used cache and shared among the test spectral
+    power distributions.
+
+    Parameters
+    ----------
+    spds : array_like
+        Test spectral power distributions, either
+        :class:`SpectralPowerDistribution` class instances aligned to given
+        spectral shape or an array of shape (N, W) of spectral power
+        distributions values sampled at given spectral shape wavelengths.
+    shape : SpectralShape, optional
+        Spectral shape the computations are performed with.
+    CCT_step : numeric, optional
+        Correlated colour temperature quantisation step in kelvin degrees
+        used to select the reference illuminants, *None* disables the
+        quantisation.
+    tile_size : integer, optional
+        Count of spectral power distributions processed at once.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CQS_BatchSpecification
+        Colour quality scales.
+
+    Raises
+    ------
+    ValueError
+        If the spectral power distributions values count does not match the
+        spectral shape wavelengths count.
+
+    Notes
+    -----
+    -   Without quantisation, the colour quality scales match those of
+        :func:`colour_quality_scale` definition for spectral power
+        distributions sampled at 5 nm interval with the default spectral
+        shape. The default 1K quantisation step changes them by less than
+        :math:`10^{-2}`.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> spds = [ILLUMINANTS_RELATIVE_SPDS.get(name)
+    ...         for name in ('F1', 'F2', 'F11')]
+    >>> colour_quality_scale_batch(spds)  # doctest: +ELLIPSIS
+    array([ 75.3340995...,  64.6789922...,  79.7278645...])
+    >>> colour_quality_scale_batch(spds, CCT_step=None)  # doctest: +ELLIPSIS
+    array([ 75.3343612...,  64.6781117...,  79.7278772...])
+    """
+
+    if isinstance(spds, np.ndarray):
+        values = spds
+    else:
+        values = np.array([spd.clone().align(shape).values
+                           if isinstance(spd, SpectralPowerDistribution) else
+                           spd
+                           for spd in spds], dtype=np.float_)
+
+    values = np.reshape(values, (-1, values.shape[-1]))
+
+    if values.shape[-1] != len(shape.range()):
+        raise ValueError(
+            ('Spectral power distributions values count "{0}" does not match '
+             '"{1}" spectral shape wavelengths count!').format(
+                values.shape[-1], shape))
+
+    data = vs_batch_data(shape)
+
+    scales = [np.empty((values.shape[0],) + shape_)
+              for shape_ in ((2,),
+                             (len(VS_INDEXES_TO_NAMES),),
+                             (len(VS_INDEXES_TO_NAMES),),
+                             (),
+                             (),
+                             ())]
+    for tile in tiles(values.shape[0], tile_size):
+        S_t = values[tile]
+
+        for array, tile_array in zip(
+                scales,
+                colour_quality_scales_batch(np.dot(S_t, data['cmfs_s']),
+                                            samples_XYZ(S_t, data),
+                                            CCT_step,
+                                            shape,
+                                            data)):
+            array[tile] = tile_array
+
+    specification = cqs_batch_specification(*scales)
+
+    if additional_data:
+        return specification
+    else:
+        return specification.Q_a
@@ -9,6 +9,8 @@ Defines *colour rendering index* computation objects:
 
 -   :class:`CRI_Specification`
 -   :func:`colour_rendering_index`
+-   :class:`CRI_BatchSpecification`
+-   :func:`colour_rendering_index_batch`
 
 See Also
 --------
@@ -31,11 +33,18 @@ from colour.algebra import euclidean_distance
 from colour.colorimetry import (
     D_illuminant_relative_spd,
     STANDARD_OBSERVERS_CMFS,
+    SpectralPowerDistribution,
+    SpectralShape,
     blackbody_spd,
     spectral_to_XYZ)
+from colour.quality.common import (
+    reference_illuminants,
+    samples_XYZ,
+    samples_batch_data)
 from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
 from colour.models import UCS_to_uv, XYZ_to_UCS, XYZ_to_xyY
 from colour.temperature import CCT_to_xy_CIE_D, uv_to_CCT_Robertson1968
+from colour.utilities import tiles, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -49,7 +58,19 @@ __all__ = ['TCS_ColorimetryData',
            'CRI_Specification',
            'colour_rendering_index',
            'tcs_colorimetry_data',
-           'colour_rendering_indexes']
+           'colour_rendering_indexes',
+           'CRI_BatchSpecification',
+           'tcs_batch_data',
+           'colour_rendering_indexes_batch',
+           'colour_rendering_index_batch']
+
+_CRI_BATCH_DATA_CACHE = {}
+"""
+Cache for the spectral shape dependent data of
+:func:`colour_rendering_index_batch` definition.
+
+_CRI_BATCH_DATA_CACHE : dict
+"""
 
 
 class TCS_ColorimetryData(namedtuple('TCS_ColorimetryData',
@@ -263,3 +284,243 @@ def colour_rendering_indexes(test_data, reference_data):
             100 - 4.6 * euclidean_distance(reference_data[i].UVW,
                                            test_data[i].UVW))
     return Q_as
+
+
+class CRI_BatchSpecification(
+    namedtuple(
+        'CRI_BatchSpecification',
+        ('Q_a', 'Q_as', 'CCT', 'D_uv'))):
+    """
+    Defines the *colour rendering index* colour quality specification of
+    various test spectral power distributions.
+
+    Parameters
+    ----------
+    Q_a : ndarray, (N,)
+        *Colour rendering indexes* :math:`Q_a`, i.e. :math:`R_a`.
+    Q_as : ndarray, (N, 14)
+        Individual *colour rendering indexes* :math:`R_1` to :math:`R_{14}`
+        of the *test colour samples*.
+    CCT : ndarray, (N,)
+        Correlated colour temperatures :math:`T_{cp}` of the test spectral
+        power distributions.
+    D_uv : ndarray, (N,)
+        :math:`\Delta_{uv}` of the test spectral power distributions.
+    """
+
+
+def tcs_batch_data(shape):
+    """
+    Returns the *test colour samples* batch computations data of
+    :func:`colour_rendering_index_batch` definition depending only on given
+    spectral shape.
+
+    Parameters
+    ----------
+    shape : SpectralShape
+        Spectral shape the computations are performed with.
+
+    Returns
+    -------
+    dict
+        Batch computations data, see
+        :func:`colour.quality.common.samples_batch_data` definition.
+
+    Examples
+    --------
+    >>> tcs_batch_data(SpectralShape(360, 780, 5))['R'].shape
+    (14, 85)
+    """
+
+    return samples_batch_data(
+        shape, TCS_SPDS, TCS_INDEXES_TO_NAMES, _CRI_BATCH_DATA_CACHE)
+
+
+def _tcs_UVW(XYZ, Y, uv, uv_r, chromatic_adaptation=False):
+    """
+    Returns the *test colour samples* *CIE 1964 U\*V\*W\** colourspace
+    values from given *test colour samples* *CIE XYZ* tristimulus values
+    under illuminants with given luminance :math:`Y`.
+    """
+
+    XYZ = XYZ * (100 / Y)[..., np.newaxis, np.newaxis]
+
+    u, v = tsplit(UCS_to_uv(XYZ_to_UCS(XYZ)))
+    u_r, v_r = [x[..., np.newaxis] for x in tsplit(uv_r)]
+
+    if chromatic_adaptation:
+
+        def c(x, y):
+            """
+            Computes the :math:`c` term.
+            """
+
+            return (4 - x - 10 * y) / y
+
+        def d(x, y):
+            """
+            Computes the :math:`d` term.
+            """
+
+            return (1.708 * y + 0.404 - 1.481 * x) / y
+
+        u_t, v_t = [x[..., np.newaxis] for x in tsplit(uv)]
+
+        c_s = c(u_r, v_r) / c(u_t, v_t) * c(u, v)
+        d_s = d(u_r, v_r) / d(u_t, v_t) * d(u, v)
+        denominator = 16.518 + 1.481 * c_s - d_s
+        u = (10.872 + 0.404 * c_s - 4 * d_s) / denominator
+        v = 5.52 / denominator
+
+    W = 25 * XYZ[..., 1] ** (1 / 3) - 17
+
+    return tstack((13 * W * (u - u_r), 13 * W * (v - v_r), W))
+
+
+def colour_rendering_indexes_batch(XYZ_t, XYZ_tcs_t, data):
+    """
+    Returns the *test colour samples* colour rendering indexes, the
+    correlated colour temperatures :math:`T_{cp}` and :math:`\Delta_{uv}` of
+    test illuminants from their *CIE XYZ* tristimulus values and the
+    *test colour samples* *CIE XYZ* tristimulus values under them.
+
+    Parameters
+    ----------
+    XYZ_t : array_like, (N, 3)
+        Test illuminants *CIE XYZ* tristimulus values, not normalised.
+    XYZ_tcs_t : array_like, (N, 14, 3)
+        *Test colour samples* *CIE XYZ* tristimulus values under the test
+        illuminants, not normalised.
+    data : dict
+        Batch computations data as returned by :func:`tcs_batch_data`
+        definition.
+
+    Returns
+    -------
+    tuple
+        *Test colour samples* colour rendering indexes of shape (N, 14) and
+        correlated colour temperatures :math:`T_{cp}` and
+        :math:`\Delta_{uv}` of shape (N, 2).
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> shape = SpectralShape(360, 780, 5)
+    >>> data = tcs_batch_data(shape)
+    >>> S_t = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(shape).values
+    >>> S_t = S_t[np.newaxis]
+    >>> Q_as, CCT_D_uv = colour_rendering_indexes_batch(
+    ...     np.dot(S_t, data['cmfs_s']), samples_XYZ(S_t, data), data)
+    >>> np.mean(Q_as[..., :8], axis=-1)  # doctest: +ELLIPSIS
+    array([ 64.1495478...])
+    """
+
+    uv_t = UCS_to_uv(XYZ_to_UCS(XYZ_t))
+    CCT_D_uv = uv_to_CCT_Robertson1968(uv_t)
+    CCT = CCT_D_uv[..., 0]
+
+    S_r, XYZ_r = reference_illuminants(CCT, CCT < 5000, data)
+    uv_r = UCS_to_uv(XYZ_to_UCS(XYZ_r))
+
+    UVW_t = _tcs_UVW(XYZ_tcs_t,
+                     XYZ_t[..., 1],
+                     uv_t,
+                     uv_r,
+                     chromatic_adaptation=True)
+    UVW_r = _tcs_UVW(samples_XYZ(S_r, data),
+                     np.dot(S_r, data['cmfs_s'][..., 1]),
+                     uv_r,
+                     uv_r)
+
+    Q_as = 100 - 4.6 * np.linalg.norm(UVW_r - UVW_t, axis=-1)
+
+    return Q_as, CCT_D_uv
+
+
+def colour_rendering_index_batch(spds,
+                                 shape=SpectralShape(360, 780, 5),
+                                 tile_size=1024,
+                                 additional_data=False):
+    """
+    Returns the *colour rendering indexes* :math:`Q_a` of given spectral power
+    distributions computed at once.
+
+    The *test colour samples* reflectances and the colour matching functions
+    are sampled once at given spectral shape, the tristimulus values of the
+    *test colour samples* under the test and reference illuminants are then
+    computed with a few matrix products.
+
+    Parameters
+    ----------
+    spds : array_like
+        Test spectral power distributions, either
+        :class:`SpectralPowerDistribution` class instances aligned to given
+        spectral shape or an array of shape (N, W) of spectral power
+        distributions values sampled at given spectral shape wavelengths.
+    shape : SpectralShape, optional
+        Spectral shape the computations are performed with.
+    tile_size : integer, optional
+        Count of spectral power distributions processed at once.
+    additional_data : bool, optional
+        Output additional data.
+
+    Returns
+    -------
+    ndarray or CRI_BatchSpecification
+        Colour rendering indexes.
+
+    Raises
+    ------
+    ValueError
+        If the spectral power distributions values count does not match the
+        spectral shape wavelengths count.
+
+    Notes
+    -----
+    -   The colour rendering indexes match those of
+        :func:`colour_rendering_index` definition for spectral power
+        distributions sampled at 5 nm interval with the default spectral
+        shape.
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> spds = [ILLUMINANTS_RELATIVE_SPDS.get(name)
+    ...         for name in ('F2', 'F7', 'F11')]
+    >>> colour_rendering_index_batch(spds)  # doctest: +ELLIPSIS
+    array([ 64.1495478...,  90.1833252...,  82.8306599...])
+    """
+
+    if isinstance(spds, np.ndarray):
+        values = spds
+    else:
+        values = np.array([spd.clone().align(shape).values
+                           if isinstance(spd, SpectralPowerDistribution) else
+                           spd
+                           for spd in spds], dtype=np.float_)
+
+    values = np.reshape(values, (-1, values.shape[-1]))
+
+    if values.shape[-1] != len(shape.range()):
+        raise ValueError(
+            ('Spectral power distributions values count "{0}" does not match '
+             '"{1}" spectral shape wavelengths count!').format(
+                values.shape[-1], shape))
+
+    data = tcs_batch_data(shape)
+
+    Q_as = np.empty((values.shape[0], len(TCS_INDEXES_TO_NAMES)))
+    CCT_D_uv = np.empty((values.shape[0], 2))
+    for tile in tiles(values.shape[0], tile_size):
+        S_t = values[tile]
+
+        Q_as[tile], CCT_D_uv[tile] = colour_rendering_indexes_batch(
+            np.dot(S_t, data['cmfs_s']), samples_XYZ(S_t, data), data)
+
+    Q_a = np.mean(Q_as[..., :8], axis=-1)
+
+    if additional_data:
+        return CRI_BatchSpecification(
+            Q_a, Q_as, CCT_D_uv[..., 0], CCT_D_uv[..., 1])
+    else:
+        return Q_a
@@ -0,0 +1,419 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Spectral Mixtures
+=================
+
+Defines spectral mixtures quality metrics and photometric quantities
+evaluation objects:
+
+-   :class:`SpectralMixture`
+
+The spectral power distribution of a mixture of primaries, e.g. *LED*
+primaries, is linear in the primaries weights: all the per-primary
+tristimulus values contributions are thus computed once and evaluating the
+quality metrics and photometric quantities of a weights vector only costs a
+few small matrix products. The correlated colour temperature dependent
+reference illuminants computations are shared with
+:func:`colour.quality.colour_rendering_index_batch` and
+:func:`colour.quality.colour_quality_scale_batch` definitions.
+
+See Also
+--------
+:mod:`colour.quality.common`, :mod:`colour.quality.cri`,
+:mod:`colour.quality.cqs`, :mod:`colour.colorimetry.photometry`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (
+    PHOTOPIC_LEFS,
+    SpectralPowerDistribution,
+    SpectralShape)
+from colour.constants import K_M
+from colour.quality.common import samples_XYZ
+from colour.quality.cqs import (
+    colour_quality_scales_batch,
+    cqs_batch_specification,
+    vs_batch_data)
+from colour.quality.cri import (
+    CRI_BatchSpecification,
+    colour_rendering_indexes_batch,
+    tcs_batch_data)
+from colour.utilities import tiles
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SpectralMixture']
+
+
+class SpectralMixture(object):
+    """
+    Defines a mixture of primaries spectral power distributions whose quality
+    metrics and photometric quantities are evaluated for given primaries
+    weights.
+
+    The methods accept a weights vector of shape (P, ) or stacked weights
+    vectors of shape (..., P), e.g. the perturbed weights vectors of a finite
+    differences gradient estimation, which are evaluated at once.
+
+    Parameters
+    ----------
+    primaries : array_like
+        Primaries spectral power distributions, either
+        :class:`SpectralPowerDistribution` class instances or an array of
+        shape (P, W) of spectral power distributions values sampled at given
+        spectral shape wavelengths.
+    shape : SpectralShape, optional
+        Spectral shape the computations are performed with.
+    lef : SpectralPowerDistribution, optional
+        :math:`V(\lambda)` luminous efficiency function.
+    K_m : numeric, optional
+        :math:`lm\cdot W^{-1}` maximum photopic luminous efficiency.
+
+    Attributes
+    ----------
+    primaries
+    shape
+
+    Methods
+    -------
+    spd
+    XYZ
+    luminous_flux
+    luminous_efficiency
+    luminous_efficacy
+    colour_rendering_index
+    colour_quality_scale
+
+    Raises
+    ------
+    ValueError
+        If the primaries values count does not match the spectral shape
+        wavelengths count.
+
+    Notes
+    -----
+    -   The quantities are those of the mixture spectral power distribution
+        aligned to given spectral shape, they match the
+        :func:`colour.colorimetry.luminous_flux`,
+        :func:`colour.colorimetry.luminous_efficacy`,
+        :func:`colour.quality.colour_rendering_index` and
+        :func:`colour.quality.colour_quality_scale` definitions for
+        primaries sampled at 5 nm interval with the default spectral shape.
+
+    Examples
+    --------
+    >>> from colour import LIGHT_SOURCES_RELATIVE_SPDS
+    >>> mixture = SpectralMixture(
+    ...     [LIGHT_SOURCES_RELATIVE_SPDS.get(name)
+    ...      for name in ('Luxeon WW 2880', 'Phosphor LED YAG')])
+    >>> weights = np.array([[1, 0], [0.5, 0.5], [0, 1]])
+    >>> mixture.colour_rendering_index(weights)  # doctest: +ELLIPSIS
+    array([ 91.7863740...,  81.4861690...,  81.4734043...])
+    >>> mixture.colour_quality_scale(weights)  # doctest: +ELLIPSIS
+    array([ 84.8838882...,  77.5954669...,  77.5814312...])
+    >>> mixture.luminous_efficacy(weights)  # doctest: +ELLIPSIS
+    array([ 293.8298440...,  293.7904042...,  293.7903824...])
+    """
+
+    def __init__(self,
+                 primaries,
+                 shape=SpectralShape(360, 780, 5),
+                 lef=PHOTOPIC_LEFS.get('CIE 1924 Photopic Standard Observer'),
+                 K_m=K_M):
+        if isinstance(primaries, np.ndarray):
+            values = np.array(primaries, dtype=np.float_)
+        else:
+            values = np.array([spd.clone().align(shape).values
+                               if isinstance(spd, SpectralPowerDistribution)
+                               else spd
+                               for spd in primaries], dtype=np.float_)
+
+        values = np.reshape(values, (-1, values.shape[-1]))
+
+        if values.shape[-1] != len(shape.range()):
+            raise ValueError(
+                ('Primaries values count "{0}" does not match "{1}" spectral '
+                 'shape wavelengths count!').format(values.shape[-1], shape))
+
+        values.setflags(write=False)
+
+        self._primaries = values
+        self._shape = shape
+
+        self._cri_data = tcs_batch_data(shape)
+        self._cqs_data = vs_batch_data(shape)
+
+        wavelengths = shape.range()
+        lef = lef.clone().align(shape,
+                                extrapolation_left=0,
+                                extrapolation_right=0)
+
+        self._XYZ = np.dot(values, self._cri_data['cmfs_s'])
+        self._XYZ_tcs = samples_XYZ(values, self._cri_data)
+        self._XYZ_vs = samples_XYZ(values, self._cqs_data)
+        self._power = np.trapz(values, wavelengths)
+        self._flux = K_m * np.trapz(values * lef.values, wavelengths)
+        self._K_m = K_m
+
+    @property
+    def primaries(self):
+        """
+        Property for **self.primaries** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.primaries.
+        """
+
+        return self._primaries
+
+    @property
+    def shape(self):
+        """
+        Property for **self.shape** attribute.
+
+        Returns
+        -------
+        SpectralShape
+            self.shape.
+        """
+
+        return self._shape
+
+    def _weights(self, weights):
+        """
+        Returns given weights as an array of shape (N, P) and the shape the
+        results are reshaped to.
+        """
+
+        weights = np.asarray(weights, dtype=np.float_)
+
+        if weights.shape[-1:] != (self._primaries.shape[0],):
+            raise ValueError(
+                ('Weights shape "{0}" is not compatible with the primaries '
+                 'count "{1}"!').format(weights.shape,
+                                        self._primaries.shape[0]))
+
+        return np.reshape(weights, (-1, weights.shape[-1])), weights.shape[:-1]
+
+    def _mix(self, weights, contributions):
+        """
+        Returns the mixture of given per-primary contributions.
+        """
+
+        return np.reshape(
+            np.dot(weights, np.reshape(contributions,
+                                       (contributions.shape[0], -1))),
+            (weights.shape[0],) + contributions.shape[1:])
+
+    def spd(self, weights):
+        """
+        Returns the mixture spectral power distribution values.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+
+        Returns
+        -------
+        ndarray
+            Mixture spectral power distribution values of shape (..., W).
+        """
+
+        weights, shape = self._weights(weights)
+
+        return np.reshape(np.dot(weights, self._primaries),
+                          shape + self._primaries.shape[-1:])
+
+    def XYZ(self, weights):
+        """
+        Returns the mixture *CIE XYZ* tristimulus values, not normalised.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+
+        Returns
+        -------
+        ndarray
+            Mixture *CIE XYZ* tristimulus values of shape (..., 3).
+        """
+
+        weights, shape = self._weights(weights)
+
+        return np.reshape(np.dot(weights, self._XYZ), shape + (3,))
+
+    def luminous_flux(self, weights):
+        """
+        Returns the mixture *luminous flux*.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+
+        Returns
+        -------
+        numeric or ndarray
+            Luminous flux.
+        """
+
+        weights, shape = self._weights(weights)
+
+        return np.reshape(np.dot(weights, self._flux), shape)
+
+    def luminous_efficiency(self, weights):
+        """
+        Returns the mixture *luminous efficiency*.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+
+        Returns
+        -------
+        numeric or ndarray
+            Luminous efficiency.
+        """
+
+        weights, shape = self._weights(weights)
+
+        return np.reshape(np.dot(weights, self._flux) /
+                          np.dot(weights, self._power) / self._K_m,
+                          shape)
+
+    def luminous_efficacy(self, weights):
+        """
+        Returns the mixture *luminous efficacy* in :math:`lm\cdot W^{-1}`.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+
+        Returns
+        -------
+        numeric or ndarray
+            Luminous efficacy in :math:`lm\cdot W^{-1}`.
+        """
+
+        weights, shape = self._weights(weights)
+
+        return np.reshape(np.dot(weights, self._flux) /
+                          np.dot(weights, self._power),
+                          shape)
+
+    def colour_rendering_index(self,
+                               weights,
+                               tile_size=1024,
+                               additional_data=False):
+        """
+        Returns the mixture *colour rendering index*.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+        tile_size : integer, optional
+            Count of weights vectors processed at once.
+        additional_data : bool, optional
+            Output additional data.
+
+        Returns
+        -------
+        numeric or ndarray or CRI_BatchSpecification
+            Colour rendering index, the :class:`CRI_BatchSpecification`
+            class instance attributes are arrays of shape (N, ...) with N the
+            weights vectors count.
+        """
+
+        weights, shape = self._weights(weights)
+
+        Q_as = np.empty((weights.shape[0], self._XYZ_tcs.shape[1]))
+        CCT_D_uv = np.empty((weights.shape[0], 2))
+        for tile in tiles(weights.shape[0], tile_size):
+            Q_as[tile], CCT_D_uv[tile] = colour_rendering_indexes_batch(
+                np.dot(weights[tile], self._XYZ),
+                self._mix(weights[tile], self._XYZ_tcs),
+                self._cri_data)
+
+        Q_a = np.mean(Q_as[..., :8], axis=-1)
+
+        if additional_data:
+            return CRI_BatchSpecification(
+                Q_a, Q_as, CCT_D_uv[..., 0], CCT_D_uv[..., 1])
+        else:
+            return np.reshape(Q_a, shape)
+
+    def colour_quality_scale(self,
+                             weights,
+                             CCT_step=None,
+                             tile_size=1024,
+                             additional_data=False):
+        """
+        Returns the mixture *colour quality scale*.
+
+        Parameters
+        ----------
+        weights : array_like
+            Primaries weights of shape (..., P).
+        CCT_step : numeric, optional
+            Correlated colour temperature quantisation step in kelvin degrees
+            used to select the reference illuminants, *None* disables the
+            quantisation.
+        tile_size : integer, optional
+            Count of weights vectors processed at once.
+        additional_data : bool, optional
+            Output additional data.
+
+        Returns
+        -------
+        numeric or ndarray or CQS_BatchSpecification
+            Colour quality scale, the :class:`CQS_BatchSpecification` class
+            instance attributes are arrays of shape (N, ...) with N the
+            weights vectors count.
+
+        Notes
+        -----
+        -   The quantisation is disabled by default: the colour quality scale
+            is then a continuous function of the weights, quantising the
+            correlated colour temperature makes it piecewise and defeats
+            finite differences gradient estimations.
+        """
+
+        weights, shape = self._weights(weights)
+
+        count = self._XYZ_vs.shape[1]
+        scales = [np.empty((weights.shape[0],) + shape_)
+                  for shape_ in ((2,), (count,), (count,), (), (), ())]
+        for tile in tiles(weights.shape[0], tile_size):
+            for array, tile_array in zip(
+                    scales,
+                    colour_quality_scales_batch(
+                        np.dot(weights[tile], self._XYZ),
+                        self._mix(weights[tile], self._XYZ_vs),
+                        CCT_step,
+                        self._shape,
+                        self._cqs_data)):
+                array[tile] = tile_array
+
+        specification = cqs_batch_specification(*scales)
+
+        if additional_data:
+            return specification
+        else:
+            return np.reshape(specification.Q_a, shape)
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.quality.common` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import (
+    D_illuminant_relative_spd,
+    SpectralShape,
+    planck_law)
+from colour.quality.common import (
+    reference_illuminants,
+    samples_XYZ,
+    samples_batch_data)
+from colour.quality.dataset.tcs import TCS_INDEXES_TO_NAMES, TCS_SPDS
+from colour.temperature import CCT_to_xy_CIE_D
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SHAPE',
+           'TestSamplesBatchData',
+           'TestSamplesXYZ',
+           'TestReferenceIlluminants']
+
+SHAPE = SpectralShape(360, 780, 5)
+
+
+class TestSamplesBatchData(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.samples_batch_data` definition unit
+    tests methods.
+    """
+
+    def test_samples_batch_data(self):
+        """
+        Tests :func:`colour.quality.common.samples_batch_data` definition.
+        """
+
+        data = samples_batch_data(SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES)
+
+        self.assertTupleEqual(data['cmfs_s'].shape, (85, 3))
+        self.assertTupleEqual(data['cmfs_r'].shape, (421, 3))
+        self.assertTupleEqual(data['S_s'].shape, (3, 85))
+        self.assertTupleEqual(data['S_XYZ_r'].shape, (3, 3))
+        self.assertTupleEqual(data['R'].shape, (14, 85))
+
+        np.testing.assert_almost_equal(
+            data['R'][0],
+            TCS_SPDS.get(TCS_INDEXES_TO_NAMES[1]).clone().align(SHAPE).values,
+            decimal=7)
+
+        for array in data.values():
+            self.assertFalse(array.flags.writeable)
+
+    def test_cache_samples_batch_data(self):
+        """
+        Tests :func:`colour.quality.common.samples_batch_data` definition
+        cache.
+        """
+
+        cache = {}
+        data = samples_batch_data(
+            SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES, cache)
+        self.assertEqual(len(cache), 1)
+        self.assertIs(
+            samples_batch_data(SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES, cache),
+            data)
+
+        self.assertIsNot(
+            samples_batch_data(SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES),
+            data)
+
+
+class TestSamplesXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.samples_XYZ` definition unit tests
+    methods.
+    """
+
+    def test_samples_XYZ(self):
+        """
+        Tests :func:`colour.quality.common.samples_XYZ` definition.
+        """
+
+        data = samples_batch_data(SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES)
+        S = np.random.RandomState(4).uniform(0, 1, (3, len(SHAPE.range())))
+
+        np.testing.assert_almost_equal(
+            samples_XYZ(S, data),
+            np.einsum('nw,sw,wi->nsi', S, data['R'], data['cmfs_s']),
+            decimal=7)
+
+
+class TestReferenceIlluminants(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.common.reference_illuminants` definition
+    unit tests methods.
+    """
+
+    def test_reference_illuminants(self):
+        """
+        Tests :func:`colour.quality.common.reference_illuminants` definition.
+        """
+
+        data = samples_batch_data(SHAPE, TCS_SPDS, TCS_INDEXES_TO_NAMES)
+        CCT = np.array([2856, 6504, 4000, 5003])
+        blackbody = CCT < 5000
+        S_r, XYZ_r = reference_illuminants(CCT, blackbody, data)
+
+        np.testing.assert_almost_equal(
+            S_r[blackbody],
+            planck_law(data['wavelengths_s'], CCT[blackbody, np.newaxis]),
+            decimal=7)
+
+        for i in np.where(~blackbody)[0]:
+            np.testing.assert_almost_equal(
+                S_r[i],
+                D_illuminant_relative_spd(
+                    CCT_to_xy_CIE_D(CCT[i])).clone().align(SHAPE).values,
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_r[blackbody],
+            np.dot(planck_law(data['wavelengths_r'],
+                              CCT[blackbody, np.newaxis]),
+                   data['cmfs_r']),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_r[0] / XYZ_r[0, 1],
+            np.array([1.09843721, 1.00000000, 0.35597029]),
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,12 +7,15 @@ Defines unit tests for :mod:`colour.quality.cqs` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_quality_scale
+from colour.quality import colour_quality_scale, colour_quality_scale_batch
+from colour.quality.cqs import _CQS_REFERENCES_CACHE
 from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
-    LIGHT_SOURCES_RELATIVE_SPDS)
+    LIGHT_SOURCES_RELATIVE_SPDS,
+    SpectralShape)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -21,7 +24,7 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourQualityScale']
+__all__ = ['TestColourQualityScale', 'TestColourQualityScaleBatch']
 
 
 class TestColourQualityScale(unittest.TestCase):
@@ -72,5 +75,111 @@ class TestColourQualityScale(unittest.TestCase):
             places=7)
 
 
+class TestColourQualityScaleBatch(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cqs.colour_quality_scale_batch` definition
+    unit tests methods.
+    """
+
+    def test_colour_quality_scale_batch(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_batch`
+        definition.
+        """
+
+        spds = [ILLUMINANTS_RELATIVE_SPDS.get('F1'),
+                ILLUMINANTS_RELATIVE_SPDS.get('F2'),
+                LIGHT_SOURCES_RELATIVE_SPDS.get('Neodimium Incandescent'),
+                LIGHT_SOURCES_RELATIVE_SPDS.get('F32T8/TL841 (Triphosphor)')]
+
+        np.testing.assert_almost_equal(
+            colour_quality_scale_batch(spds, CCT_step=None),
+            np.array([75.334361226715345,
+                      64.678111793396397,
+                      87.658976437863089,
+                      83.175799064274571]),
+            decimal=7)
+
+        np.testing.assert_allclose(
+            colour_quality_scale_batch(spds),
+            np.array([75.334361226715345,
+                      64.678111793396397,
+                      87.658976437863089,
+                      83.175799064274571]),
+            atol=0.01)
+
+        specification = colour_quality_scale_batch(
+            [ILLUMINANTS_RELATIVE_SPDS.get('F2')],
+            CCT_step=None,
+            additional_data=True)
+        np.testing.assert_almost_equal(
+            np.hstack((specification.Q_f,
+                       specification.Q_p,
+                       specification.Q_g,
+                       specification.Q_d,
+                       specification.CCT,
+                       specification.D_uv)),
+            np.array([65.832084207403329,
+                      64.247727153809656,
+                      81.431471346998850,
+                      79.976447604984630,
+                      4224.513403396287,
+                      0.001787064337826]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            specification.Q_as,
+            np.array([[66.90372367, 97.60639473, 72.40003412, 58.94384574,
+                       61.80085665, 61.67325536, 63.11297701, 77.42010533,
+                       94.56126090, 77.51421002, 65.83249791, 62.72973390,
+                       61.10782800, 42.05371501, 51.15283268]]),
+            decimal=7)
+
+    def test_n_dimensional_colour_quality_scale_batch(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_batch`
+        definition n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(360, 780, 5)
+        values = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(
+            shape).values
+
+        np.testing.assert_almost_equal(
+            colour_quality_scale_batch(np.tile(values, (6, 1)),
+                                       CCT_step=None,
+                                       tile_size=4),
+            np.tile(64.678111793396397, 6),
+            decimal=7)
+
+    def test_references_cache_colour_quality_scale_batch(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_batch`
+        definition reference illuminants cache.
+        """
+
+        shape = SpectralShape(360, 780, 5)
+        values = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(
+            shape).values
+
+        _CQS_REFERENCES_CACHE.clear()
+        Q_a = colour_quality_scale_batch(values * np.array([[1], [2], [4]]))
+        self.assertEqual(len(_CQS_REFERENCES_CACHE), 1)
+
+        np.testing.assert_almost_equal(
+            colour_quality_scale_batch(values[np.newaxis]), Q_a[0:1],
+            decimal=7)
+        self.assertEqual(len(_CQS_REFERENCES_CACHE), 1)
+
+    def test_raise_exception_colour_quality_scale_batch(self):
+        """
+        Tests :func:`colour.quality.cqs.colour_quality_scale_batch`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          colour_quality_scale_batch,
+                          np.ones((2, 10)))
+
+
 if __name__ == '__main__':
     unittest.main()
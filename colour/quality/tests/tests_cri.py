@@ -7,12 +7,16 @@ Defines unit tests for :mod:`colour.quality.cri` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import unittest
 
-from colour.quality import colour_rendering_index
+from colour.quality import (
+    colour_rendering_index,
+    colour_rendering_index_batch)
 from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
-    SpectralPowerDistribution)
+    SpectralPowerDistribution,
+    SpectralShape)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -21,7 +25,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestColourRenderingIndex']
+__all__ = ['TestColourRenderingIndex',
+           'TestColourRenderingIndexBatch']
 
 SAMPLE_SPD_DATA = {
     380: 0.005883458,
@@ -136,5 +141,64 @@ class TestColourRenderingIndex(unittest.TestCase):
             places=7)
 
 
+class TestColourRenderingIndexBatch(unittest.TestCase):
+    """
+    Defines :func:`colour.quality.cri.colour_rendering_index_batch`
+    definition unit tests methods.
+    """
+
+    def test_colour_rendering_index_batch(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_batch`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_batch(
+                [ILLUMINANTS_RELATIVE_SPDS.get('F2'),
+                 ILLUMINANTS_RELATIVE_SPDS.get('A'),
+                 SpectralPowerDistribution('Sample', SAMPLE_SPD_DATA)]),
+            np.array([64.149547892010048,
+                      99.996736287811871,
+                      70.802983572028324]),
+            decimal=7)
+
+        specification = colour_rendering_index_batch(
+            [ILLUMINANTS_RELATIVE_SPDS.get('F2')], additional_data=True)
+        np.testing.assert_almost_equal(
+            specification.Q_as,
+            np.array([[55.92587959, 76.68738943, 90.29768813, 56.97553185,
+                       58.94258645, 67.15338585, 74.08004885, 33.13387299,
+                       -83.91149693, 45.30054188, 45.85859658, 53.68208412,
+                       60.29158587, 94.06048964]]),
+            decimal=7)
+
+    def test_n_dimensional_colour_rendering_index_batch(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_batch`
+        definition n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(360, 780, 5)
+        values = ILLUMINANTS_RELATIVE_SPDS.get('F2').clone().align(
+            shape).values
+
+        np.testing.assert_almost_equal(
+            colour_rendering_index_batch(np.tile(values, (6, 1)),
+                                         tile_size=4),
+            np.tile(64.149547892010048, 6),
+            decimal=7)
+
+    def test_raise_exception_colour_rendering_index_batch(self):
+        """
+        Tests :func:`colour.quality.cri.colour_rendering_index_batch`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          colour_rendering_index_batch,
+                          np.ones((2, 10)))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.quality.mixture` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import (
+    LIGHT_SOURCES_RELATIVE_SPDS,
+    SpectralPowerDistribution,
+    SpectralShape,
+    luminous_efficacy,
+    luminous_flux)
+from colour.quality import SpectralMixture, colour_rendering_index
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestSpectralMixture']
+
+
+class TestSpectralMixture(unittest.TestCase):
+    """
+    Defines :class:`colour.quality.mixture.SpectralMixture` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._mixture = SpectralMixture(
+            [LIGHT_SOURCES_RELATIVE_SPDS.get(name)
+             for name in ('Luxeon WW 2880', 'Phosphor LED YAG')])
+        self._weights = np.array([[1, 0], [0.5, 0.5], [0, 1]])
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('primaries', 'shape')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralMixture))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('spd',
+                            'XYZ',
+                            'luminous_flux',
+                            'luminous_efficiency',
+                            'luminous_efficacy',
+                            'colour_rendering_index',
+                            'colour_quality_scale')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralMixture))
+
+    def test_colour_rendering_index(self):
+        """
+        Tests :meth:`colour.quality.mixture.SpectralMixture.\
+colour_rendering_index` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._mixture.colour_rendering_index(self._weights),
+            np.array([91.786374083124470,
+                      81.486169012740190,
+                      81.473404348179390]),
+            decimal=7)
+
+        spd = SpectralPowerDistribution(
+            'Mixture',
+            dict(zip(SpectralShape(360, 780, 5).range(),
+                     self._mixture.spd(self._weights[1]))))
+        self.assertAlmostEqual(
+            self._mixture.colour_rendering_index(self._weights[1]),
+            colour_rendering_index(spd),
+            places=7)
+
+    def test_colour_quality_scale(self):
+        """
+        Tests :meth:`colour.quality.mixture.SpectralMixture.\
+colour_quality_scale` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._mixture.colour_quality_scale(self._weights),
+            np.array([84.883888269059970,
+                      77.595466956689440,
+                      77.581431239859510]),
+            decimal=7)
+
+        specification = self._mixture.colour_quality_scale(
+            self._weights, additional_data=True)
+        self.assertTupleEqual(specification.Q_as.shape, (3, 15))
+
+    def test_photometry(self):
+        """
+        Tests :meth:`colour.quality.mixture.SpectralMixture.luminous_flux`
+        and :meth:`colour.quality.mixture.SpectralMixture.luminous_efficacy`
+        methods.
+        """
+
+        spd = SpectralPowerDistribution(
+            'Mixture',
+            dict(zip(SpectralShape(360, 780, 5).range(),
+                     self._mixture.spd(self._weights[1]))))
+
+        self.assertAlmostEqual(
+            self._mixture.luminous_flux(self._weights[1]),
+            luminous_flux(spd),
+            places=7)
+        self.assertAlmostEqual(
+            self._mixture.luminous_efficacy(self._weights[1]),
+            luminous_efficacy(spd),
+            places=7)
+        np.testing.assert_almost_equal(
+            self._mixture.luminous_efficacy(self._weights),
+            np.array([293.829844012680440,
+                      293.790404200832540,
+                      293.790382454093840]),
+            decimal=7)
+
+    def test_n_dimensional_weights(self):
+        """
+        Tests :class:`colour.quality.mixture.SpectralMixture` class
+        n-dimensional weights support.
+        """
+
+        weights = np.reshape(np.tile(self._weights, (2, 1)), (2, 3, 2))
+
+        Q_a = self._mixture.colour_rendering_index(self._weights)
+        np.testing.assert_almost_equal(
+            self._mixture.colour_rendering_index(weights, tile_size=4),
+            np.reshape(np.tile(Q_a, 2), (2, 3)),
+            decimal=7)
+
+        self.assertTupleEqual(self._mixture.XYZ(weights).shape, (2, 3, 3))
+        self.assertTupleEqual(self._mixture.spd(weights).shape, (2, 3, 85))
+
+    def test_raise_exception(self):
+        """
+        Tests :class:`colour.quality.mixture.SpectralMixture` class raised
+        exceptions.
+        """
+
+        self.assertRaises(ValueError, SpectralMixture, np.ones((2, 10)))
+        self.assertRaises(ValueError,
+                          self._mixture.colour_rendering_index,
+                          np.ones(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
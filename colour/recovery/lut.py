@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Look-Up Table - Spectral Recovery
+=================================
+
+Defines objects for spectral recovery using a precomputed look-up table:
+
+-   :class:`SpectralRecoveryLUT_Report`
+-   :class:`SpectralRecoveryLUT`
+
+The spectral power distributions recovered at the nodes of a regular grid
+over the *RGB* colourspace cube are stored in a 3D table, either as spectral
+power distributions values or as coefficients of a low-dimensional basis.
+Recovering the spectral power distributions of large arrays then only
+requires a trilinear interpolation of the table.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS,
+    SpectralPowerDistribution,
+    SpectralShape,
+    ones_spd,
+    spectral_to_XYZ)
+from colour.recovery import SMITS_1999_SPDS
+from colour.recovery.smits1999 import (
+    SMITS1999_BASIS_NAMES,
+    SMITS1999_XYZ_TO_RGB_MATRIX,
+    RGB_to_spectral_Smits1999_weights)
+from colour.utilities import tiled_apply, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SpectralRecoveryLUT_Report',
+           'SpectralRecoveryLUT']
+
+
+class SpectralRecoveryLUT_Report(
+    namedtuple('SpectralRecoveryLUT_Report',
+               ('delta_XYZ',
+                'mean',
+                'rms',
+                'maximum',
+                'interpolation_error'))):
+    """
+    Defines the round-trip error report of a spectral recovery look-up
+    table.
+
+    Parameters
+    ----------
+    delta_XYZ : ndarray
+        Euclidean distances between the *CIE XYZ* tristimulus values of the
+        samples and those of the spectral power distributions recovered with
+        the look-up table.
+    mean : numeric
+        Mean of the *CIE XYZ* tristimulus values euclidean distances.
+    rms : numeric
+        Root-mean-square of the *CIE XYZ* tristimulus values euclidean
+        distances.
+    maximum : numeric
+        Maximum of the *CIE XYZ* tristimulus values euclidean distances.
+    interpolation_error : numeric
+        Maximum absolute difference between the spectral power distributions
+        values recovered with the look-up table and those recovered directly
+        with the recovery method.
+    """
+
+
+def _RGB_to_spectral_Smits1999(shape):
+    """
+    Returns a definition recovering the spectral power distributions values
+    sampled at given spectral shape wavelengths of given *RGB* colourspace
+    arrays using Smits (1999) method.
+    """
+
+    basis = np.array([SMITS_1999_SPDS.get(name).clone().align(shape).values
+                      for name in SMITS1999_BASIS_NAMES])
+
+    def RGB_to_spectral(RGB):
+        """
+        Recovers the spectral power distributions values of given *RGB*
+        colourspace array.
+        """
+
+        return np.dot(RGB_to_spectral_Smits1999_weights(RGB), basis)
+
+    return RGB_to_spectral
+
+
+class SpectralRecoveryLUT(object):
+    """
+    Defines a spectral recovery look-up table over the *RGB* colourspace cube.
+
+    Parameters
+    ----------
+    size : integer, optional
+        Table resolution, i.e. count of nodes along each *RGB* colourspace
+        axis.
+    recovery : object, optional
+        Definition recovering the spectral power distributions values of
+        *RGB* colourspace arrays of shape (..., 3) as arrays of shape (..., W)
+        sampled at given spectral shape wavelengths, default to Smits (1999)
+        method.
+    shape : SpectralShape, optional
+        Spectral shape of the recovered spectral power distributions.
+    basis : integer or array_like, optional
+        Basis the table stores the coefficients of: *None* stores the
+        spectral power distributions values, an integer :math:`k` stores the
+        coefficients of the :math:`k` principal components of the spectral
+        power distributions recovered at the table nodes, an array of shape
+        (B, W) stores the coefficients of its least squares projection onto
+        the given basis spectral power distributions.
+    XYZ_to_RGB_matrix : array_like, optional
+        *CIE XYZ* tristimulus values to *RGB* colourspace matrix used by
+        :meth:`SpectralRecoveryLUT.recover_XYZ` and
+        :meth:`SpectralRecoveryLUT.round_trip_error` methods.
+
+    Attributes
+    ----------
+    size
+    shape
+    table
+    basis
+
+    Methods
+    -------
+    recover
+    recover_XYZ
+    round_trip_error
+
+    Raises
+    ------
+    ValueError
+        If the table resolution is lower than 2 or if the recovered spectral
+        power distributions values count does not match the spectral shape
+        wavelengths count.
+
+    Notes
+    -----
+    -   The *RGB* colourspace arrays are clipped to domain [0, 1].
+    -   With a basis, the interpolated coefficients are projected back onto
+        the basis, which is equivalent to interpolating the spectral power
+        distributions values as the projection is linear.
+
+    Examples
+    --------
+    >>> lut = SpectralRecoveryLUT(17)
+    >>> RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+    >>> lut.recover(RGB)[:4]  # doctest: +ELLIPSIS
+    array([ 0.2778771...,  0.2781353...,  0.2778661...,  0.2771646...])
+    """
+
+    def __init__(self,
+                 size=33,
+                 recovery=None,
+                 shape=SpectralShape(380, 720, 5),
+                 basis=None,
+                 XYZ_to_RGB_matrix=SMITS1999_XYZ_TO_RGB_MATRIX):
+        if size < 2:
+            raise ValueError(
+                'Table resolution "{0}" must be greater than 1!'.format(size))
+
+        self._size = size
+        self._shape = shape
+        self._recovery = (_RGB_to_spectral_Smits1999(shape)
+                          if recovery is None else recovery)
+        self._XYZ_to_RGB_matrix = np.asarray(XYZ_to_RGB_matrix)
+
+        nodes = np.linspace(0, 1, size)
+        RGB = tstack(np.meshgrid(nodes, nodes, nodes, indexing='ij'))
+        values = self._recovery(np.reshape(RGB, (-1, 3)))
+
+        if values.shape[-1] != len(shape.range()):
+            raise ValueError(
+                ('Recovered spectral power distributions values count "{0}" '
+                 'does not match "{1}" spectral shape wavelengths '
+                 'count!').format(values.shape[-1], shape))
+
+        if basis is None:
+            self._basis = None
+            self._table = values
+        else:
+            if np.ndim(basis) == 0:
+                self._basis = np.linalg.svd(values,
+                                            full_matrices=False)[2][:basis]
+            else:
+                self._basis = np.array(basis, dtype=np.float_)
+            self._table = np.dot(values, np.linalg.pinv(self._basis))
+            self._basis.setflags(write=False)
+
+        self._table.setflags(write=False)
+
+    @property
+    def size(self):
+        """
+        Property for **self.size** attribute.
+
+        Returns
+        -------
+        integer
+            self.size.
+        """
+
+        return self._size
+
+    @property
+    def shape(self):
+        """
+        Property for **self.shape** attribute.
+
+        Returns
+        -------
+        SpectralShape
+            self.shape.
+        """
+
+        return self._shape
+
+    @property
+    def table(self):
+        """
+        Property for **self.table** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.table, array of shape (size ** 3, C) with C the spectral
+            power distributions values or basis coefficients count, the
+            nodes being ordered with the blue component varying the fastest.
+        """
+
+        return self._table
+
+    @property
+    def basis(self):
+        """
+        Property for **self.basis** attribute.
+
+        Returns
+        -------
+        ndarray
+            self.basis.
+        """
+
+        return self._basis
+
+    def _interpolate(self, RGB):
+        """
+        Recovers the spectral power distributions values of given *RGB*
+        colourspace array tile by trilinear interpolation of the table.
+        """
+
+        size = self._size
+
+        x = np.clip(RGB, 0, 1) * (size - 1)
+        i = np.clip(np.floor(x).astype(np.int_), 0, size - 2)
+        f = (x - i)[..., np.newaxis, :]
+
+        i_r, i_g, i_b = tsplit(i)
+        index = (i_r * size + i_g) * size + i_b
+
+        # The 8 cells corners weights and table rows are gathered at once.
+        corners = np.array([(d_r, d_g, d_b)
+                            for d_r in (0, 1)
+                            for d_g in (0, 1)
+                            for d_b in (0, 1)])
+        offsets = np.dot(corners, [size * size, size, 1])
+        weights = np.prod(np.where(corners, f, 1 - f), axis=-1)
+
+        values = np.einsum('...k,...kc->...c',
+                           weights,
+                           self._table[index[..., np.newaxis] + offsets])
+
+        if self._basis is not None:
+            values = np.dot(values, self._basis)
+
+        return values
+
+    def recover(self,
+                RGB,
+                tile_size=4096,
+                out=None,
+                threads=1):
+        """
+        Recovers the spectral power distributions values of given *RGB*
+        colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array.
+        tile_size : integer, optional
+            Tiles size in pixels, the table rows gathered for a tile should
+            fit in cache.
+        out : ndarray, optional
+            Preallocated *C-contiguous* array of shape (..., W), e.g.
+            :class:`numpy.memmap` class instance, receiving the spectral power
+            distributions values.
+        threads : integer, optional
+            Threads count processing the tiles concurrently, default to
+            :func:`multiprocessing.cpu_count` definition if *None*.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Recovered spectral power distributions values sampled at
+            **self.shape** attribute wavelengths, *out* argument if given.
+        """
+
+        return tiled_apply(self._interpolate,
+                           np.asarray(RGB, dtype=np.float_),
+                           tile_size=tile_size,
+                           out=out,
+                           threads=threads)
+
+    def recover_XYZ(self,
+                    XYZ,
+                    tile_size=4096,
+                    out=None,
+                    threads=1):
+        """
+        Recovers the spectral power distributions values of given *CIE XYZ*
+        tristimulus values converted to *RGB* colourspace with
+        **self.XYZ_to_RGB_matrix** attribute.
+
+        Parameters
+        ----------
+        XYZ : array_like, (..., 3)
+            *CIE XYZ* tristimulus values.
+        tile_size : integer, optional
+            Tiles size in pixels, the table rows gathered for a tile should
+            fit in cache.
+        out : ndarray, optional
+            Preallocated *C-contiguous* array of shape (..., W) receiving the
+            spectral power distributions values.
+        threads : integer, optional
+            Threads count processing the tiles concurrently, default to
+            :func:`multiprocessing.cpu_count` definition if *None*.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Recovered spectral power distributions values sampled at
+            **self.shape** attribute wavelengths, *out* argument if given.
+        """
+
+        M = self._XYZ_to_RGB_matrix
+
+        return tiled_apply(lambda x: self._interpolate(np.dot(x, M.T)),
+                           np.asarray(XYZ, dtype=np.float_),
+                           tile_size=tile_size,
+                           out=out,
+                           threads=threads)
+
+    def _XYZ_weights(self, cmfs, illuminant):
+        """
+        Returns the matrix converting the spectral power distributions values
+        recovered with the look-up table to *CIE XYZ* tristimulus values in
+        domain [0, 1] with :func:`colour.spectral_to_XYZ` definition.
+        """
+
+        # The tristimulus values are linear in the spectral power
+        # distribution values and the recovered spectral power distributions
+        # are linear combinations of the table rows, only the tristimulus
+        # values of a basis of the table rows space are thus required.
+        if self._basis is None:
+            _U, S, basis = np.linalg.svd(self._table, full_matrices=False)
+            basis = basis[S > S[0] * len(S) * np.finfo(np.float_).eps]
+        else:
+            basis = self._basis
+
+        wavelengths = self._shape.range()
+        XYZ = np.array([
+            spectral_to_XYZ(
+                SpectralPowerDistribution('Basis',
+                                          dict(zip(wavelengths, values))),
+                cmfs,
+                illuminant) / 100
+            for values in basis])
+
+        return np.dot(np.linalg.pinv(basis), XYZ)
+
+    def round_trip_error(self,
+                         RGB=None,
+                         cmfs=STANDARD_OBSERVERS_CMFS.get(
+                             'CIE 1931 2 Degree Standard Observer'),
+                         illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+                             'CIE 1931 2 Degree Standard Observer').shape)):
+        """
+        Returns the round-trip error of the look-up table: the *CIE XYZ*
+        tristimulus values of given *RGB* colourspace samples are compared to
+        those computed with :func:`colour.spectral_to_XYZ` definition from
+        the spectral power distributions recovered with the look-up table.
+
+        Parameters
+        ----------
+        RGB : array_like, optional
+            *RGB* colourspace samples of shape (..., 3) in domain [0, 1],
+            default to the table cells centres where the interpolation error
+            is the largest.
+        cmfs : XYZ_ColourMatchingFunctions, optional
+            Standard observer colour matching functions.
+        illuminant : SpectralPowerDistribution, optional
+            Illuminant spectral power distribution.
+
+        Returns
+        -------
+        SpectralRecoveryLUT_Report
+            Round-trip error report.
+
+        Examples
+        --------
+        >>> lut = SpectralRecoveryLUT(9)
+        >>> report = lut.round_trip_error()
+        >>> report.maximum  # doctest: +ELLIPSIS
+        0.0678584...
+        >>> report.interpolation_error  # doctest: +ELLIPSIS
+        0.0044701...
+        """
+
+        if RGB is None:
+            centres = (np.arange(self._size - 1) + 0.5) / (self._size - 1)
+            RGB = tstack(
+                np.meshgrid(centres, centres, centres, indexing='ij'))
+
+        RGB = np.reshape(np.asarray(RGB, dtype=np.float_), (-1, 3))
+
+        values = self.recover(RGB)
+
+        XYZ = np.dot(RGB, np.linalg.inv(self._XYZ_to_RGB_matrix).T)
+        XYZ_r = np.dot(values, self._XYZ_weights(cmfs, illuminant))
+
+        delta_XYZ = np.linalg.norm(XYZ - XYZ_r, axis=-1)
+
+        return SpectralRecoveryLUT_Report(
+            delta_XYZ,
+            np.mean(delta_XYZ),
+            np.sqrt(np.mean(delta_XYZ ** 2)),
+            np.max(delta_XYZ),
+            np.max(np.abs(values - self._recovery(RGB))))
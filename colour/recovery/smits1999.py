@@ -5,7 +5,11 @@
 Smits (1999) - Reflectance Recovery
 ===================================
 
-Defines objects for reflectance recovery using Smits (1999) method.
+Defines objects for reflectance recovery using Smits (1999) method:
+
+-   :func:`RGB_to_spectral_Smits1999`
+-   :func:`RGB_to_spectral_Smits1999_weights`
+-   :func:`RGB_to_spectral_image_Smits1999`
 
 See Also
 --------
@@ -30,6 +34,7 @@ from colour.models import (
     normalised_primary_matrix,
     sRGB_COLOURSPACE)
 from colour.recovery import SMITS_1999_SPDS
+from colour.utilities import DEFAULT_TILE_SIZE, tiled_apply, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -41,8 +46,12 @@ __status__ = 'Production'
 __all__ = ['SMITS1999_PRIMARIES',
            'SMITS1999_WHITEPOINT',
            'SMITS1999_XYZ_TO_RGB_MATRIX',
+           'SMITS1999_BASIS_NAMES',
+           'SMITS1999_BASIS',
            'XYZ_to_RGB_Smits1999',
-           'RGB_to_spectral_Smits1999']
+           'RGB_to_spectral_Smits1999',
+           'RGB_to_spectral_Smits1999_weights',
+           'RGB_to_spectral_image_Smits1999']
 
 SMITS1999_PRIMARIES = sRGB_COLOURSPACE.primaries
 """
@@ -68,6 +77,31 @@ Current Smits (1999) method implementation *RGB* colourspace to
 SMITS1999_XYZ_TO_RGB_MATRIX : array_like, (3, 3)
 """
 
+SMITS1999_BASIS_NAMES = ('white',
+                         'cyan',
+                         'magenta',
+                         'yellow',
+                         'red',
+                         'green',
+                         'blue')
+"""
+Smits (1999) method basis spectral power distributions names in
+:attr:`SMITS1999_BASIS` attribute rows order.
+
+SMITS1999_BASIS_NAMES : tuple
+"""
+
+SMITS1999_BASIS = np.array([SMITS_1999_SPDS.get(name).values
+                            for name in SMITS1999_BASIS_NAMES])
+"""
+Smits (1999) method basis spectral power distributions values sampled at
+:attr:`SMITS_1999_SPDS` attribute wavelengths.
+
+SMITS1999_BASIS : ndarray, (7, 10)
+"""
+
+SMITS1999_BASIS.setflags(write=False)
+
 
 def XYZ_to_RGB_Smits1999(XYZ, chromatic_adaptation_transform='Bradford'):
     """
@@ -168,3 +202,120 @@ def RGB_to_spectral_Smits1999(RGB):
             spd += red_spd * (R - G)
 
     return spd
+
+
+def RGB_to_spectral_Smits1999_weights(RGB):
+    """
+    Returns the Smits (1999) method basis spectral power distributions
+    weights of given *RGB* colourspace array, the branches of
+    :func:`RGB_to_spectral_Smits1999` definition are selected element-wise.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+
+    Returns
+    -------
+    ndarray, (..., 7)
+        Basis spectral power distributions weights in
+        :attr:`SMITS1999_BASIS_NAMES` attribute order, the recovered spectral
+        power distributions values are their product with
+        :attr:`SMITS1999_BASIS` attribute.
+
+    Examples
+    --------
+    >>> RGB = np.array([0.50, 0.25, 0.75])
+    >>> RGB_to_spectral_Smits1999_weights(RGB)
+    array([ 0.25,  0.  ,  0.25,  0.  ,  0.  ,  0.  ,  0.25])
+    """
+
+    R, G, B = tsplit(RGB)
+
+    # The basis spectral power distributions weights depend on the minimal
+    # component, the ties between components yield zero weights and the
+    # branches selection is thus irrelevant to them.
+    is_R = np.logical_and(R <= G, R <= B)
+    is_G = np.logical_and(~is_R, np.logical_and(G <= R, G <= B))
+    is_B = ~np.logical_or(is_R, is_G)
+
+    zeros = np.zeros(np.shape(R))
+
+    return tstack((
+        np.minimum(np.minimum(R, G), B),
+        np.where(is_R, np.minimum(G, B) - R, zeros),
+        np.where(is_G, np.minimum(R, B) - G, zeros),
+        np.where(is_B, np.minimum(R, G) - B, zeros),
+        np.where(is_G, np.maximum(R - B, 0), zeros) +
+        np.where(is_B, np.maximum(R - G, 0), zeros),
+        np.where(is_R, np.maximum(G - B, 0), zeros) +
+        np.where(is_B, np.maximum(G - R, 0), zeros),
+        np.where(is_R, np.maximum(B - G, 0), zeros) +
+        np.where(is_G, np.maximum(B - R, 0), zeros)))
+
+
+def _RGB_to_spectral_Smits1999_tile(RGB):
+    """
+    Recovers the spectral power distributions values of given *RGB*
+    colourspace array tile using Smits (1999) method.
+    """
+
+    return np.dot(RGB_to_spectral_Smits1999_weights(RGB), SMITS1999_BASIS)
+
+
+def RGB_to_spectral_image_Smits1999(RGB,
+                                    tile_size=DEFAULT_TILE_SIZE,
+                                    out=None,
+                                    threads=1):
+    """
+    Recovers the spectral power distributions values of given *RGB*
+    colourspace array, e.g. an image, using Smits (1999) method.
+
+    The basis spectral power distributions weights are computed element-wise
+    and the spectral power distributions values are recovered with a single
+    matrix product against :attr:`SMITS1999_BASIS` attribute, tile by tile.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array.
+    tile_size : integer, optional
+        Tiles size in pixels.
+    out : ndarray, optional
+        Preallocated *C-contiguous* array of shape (..., 10), e.g.
+        :class:`numpy.memmap` class instance, receiving the spectral power
+        distributions values.
+    threads : integer, optional
+        Threads count processing the tiles concurrently, default to
+        :func:`multiprocessing.cpu_count` definition if *None*.
+
+    Returns
+    -------
+    ndarray, (..., 10)
+        Recovered spectral power distributions values sampled at
+        :attr:`SMITS_1999_SPDS` attribute wavelengths, *out* argument if
+        given.
+
+    Notes
+    -----
+    -   The spectral power distributions values match those of the
+        :func:`RGB_to_spectral_Smits1999` definition output.
+
+    Examples
+    --------
+    >>> RGB = np.array([[0.45293517, 0.31732158, 0.26414773],
+    ...                 [0.35505307, 0.47995567, 0.61088035]])
+    >>> RGB_to_spectral_image_Smits1999(RGB)  # doctest: +ELLIPSIS
+    array([[ 0.2778771...,  0.2711318...,  0.2699066...,  0.2993287...,
+             0.3171102...,  0.3172687...,  0.4301986...,  0.4527544...,
+             0.4532808...,  0.4541050...],
+           [ 0.6072581...,  0.6037109...,  0.5967400...,  0.5233008...,
+             0.4797590...,  0.4799720...,  0.3746271...,  0.3598841...,
+             0.3613767...,  0.3615469...]])
+    """
+
+    return tiled_apply(_RGB_to_spectral_Smits1999_tile,
+                       np.asarray(RGB, dtype=np.float_),
+                       tile_size=tile_size,
+                       out=out,
+                       threads=threads)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.recovery.lut` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import SpectralPowerDistribution, spectral_to_XYZ
+from colour.recovery import (
+    RGB_to_spectral_Smits1999,
+    SMITS_1999_SPDS,
+    SpectralRecoveryLUT)
+from colour.recovery.smits1999 import SMITS1999_XYZ_TO_RGB_MATRIX
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestSpectralRecoveryLUT']
+
+
+class TestSpectralRecoveryLUT(unittest.TestCase):
+    """
+    Defines :class:`colour.recovery.lut.SpectralRecoveryLUT` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('size', 'shape', 'table', 'basis')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SpectralRecoveryLUT))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('recover', 'recover_XYZ', 'round_trip_error')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SpectralRecoveryLUT))
+
+    def test_recover(self):
+        """
+        Tests :meth:`colour.recovery.lut.SpectralRecoveryLUT.recover` method.
+        """
+
+        lut = SpectralRecoveryLUT(5)
+        self.assertTupleEqual(lut.table.shape, (125, 69))
+
+        # The table nodes are recovered exactly, the tolerance accounts for
+        # the irregular *Smits (1999)* basis wavelengths interval rounding.
+        RGB = np.array([[0.25, 0.50, 0.75],
+                        [1.00, 0.00, 0.50],
+                        [0.50, 0.50, 0.50]])
+        for RGB_i in RGB:
+            np.testing.assert_almost_equal(
+                lut.recover(RGB_i),
+                RGB_to_spectral_Smits1999(RGB_i).clone().align(
+                    lut.shape).values,
+                decimal=6)
+
+        np.testing.assert_almost_equal(
+            lut.recover(np.tile(RGB, (2, 2, 1)), tile_size=5),
+            np.tile(lut.recover(RGB), (2, 2, 1)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            lut.recover(np.array([0.45293517, 0.31732158, 0.26414773]))[:4],
+            np.array([0.27828954, 0.27865027, 0.27842870, 0.27772768]),
+            decimal=7)
+
+    def test_recover_XYZ(self):
+        """
+        Tests :meth:`colour.recovery.lut.SpectralRecoveryLUT.recover_XYZ`
+        method.
+        """
+
+        lut = SpectralRecoveryLUT(5)
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        XYZ = np.dot(np.linalg.inv(SMITS1999_XYZ_TO_RGB_MATRIX), RGB)
+
+        np.testing.assert_almost_equal(
+            lut.recover_XYZ(XYZ), lut.recover(RGB), decimal=7)
+
+    def test_basis(self):
+        """
+        Tests :class:`colour.recovery.lut.SpectralRecoveryLUT` class basis
+        support.
+        """
+
+        lut = SpectralRecoveryLUT(5)
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+
+        basis = np.array([spd.clone().align(lut.shape).values
+                          for spd in SMITS_1999_SPDS.values()])
+        lut_b = SpectralRecoveryLUT(5, basis=basis)
+        self.assertTupleEqual(lut_b.table.shape, (125, 7))
+        np.testing.assert_almost_equal(
+            lut_b.recover(RGB), lut.recover(RGB), decimal=7)
+
+        lut_k = SpectralRecoveryLUT(5, basis=7)
+        self.assertTupleEqual(lut_k.basis.shape, (7, 69))
+        np.testing.assert_almost_equal(
+            lut_k.recover(RGB), lut.recover(RGB), decimal=7)
+
+    def test_round_trip_error(self):
+        """
+        Tests :meth:`colour.recovery.lut.SpectralRecoveryLUT.round_trip_error`
+        method.
+        """
+
+        lut = SpectralRecoveryLUT(9)
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        spd = SpectralPowerDistribution(
+            'Recovered', dict(zip(lut.shape.range(), lut.recover(RGB))))
+        report = lut.round_trip_error(RGB)
+        self.assertAlmostEqual(
+            report.maximum,
+            np.linalg.norm(
+                spectral_to_XYZ(spd) / 100 -
+                np.dot(np.linalg.inv(SMITS1999_XYZ_TO_RGB_MATRIX), RGB)),
+            places=7)
+
+        report = lut.round_trip_error()
+        self.assertTupleEqual(report.delta_XYZ.shape, (512, ))
+        self.assertAlmostEqual(report.maximum, 0.067858441301155, places=7)
+        self.assertAlmostEqual(
+            report.interpolation_error, 0.004470177565980, places=7)
+        self.assertLess(
+            SpectralRecoveryLUT(17).round_trip_error().interpolation_error,
+            report.interpolation_error)
+
+    def test_raise_exception(self):
+        """
+        Tests :class:`colour.recovery.lut.SpectralRecoveryLUT` class raised
+        exceptions.
+        """
+
+        self.assertRaises(ValueError, SpectralRecoveryLUT, 1)
+        self.assertRaises(ValueError,
+                          SpectralRecoveryLUT,
+                          5,
+                          lambda RGB: np.ones(RGB.shape[:-1] + (10, )))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,12 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.recovery import RGB_to_spectral_Smits1999
+from colour.recovery import (
+    RGB_to_spectral_Smits1999,
+    RGB_to_spectral_image_Smits1999)
+from colour.recovery.smits1999 import (
+    SMITS1999_BASIS,
+    RGB_to_spectral_Smits1999_weights)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -19,7 +24,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_spectral_Smits1999']
+__all__ = ['TestRGB_to_spectral_Smits1999',
+           'TestRGB_to_spectral_Smits1999_weights',
+           'TestRGB_to_spectral_image_Smits1999']
 
 
 class TestRGB_to_spectral_Smits1999(unittest.TestCase):
@@ -80,5 +87,94 @@ class TestRGB_to_spectral_Smits1999(unittest.TestCase):
             decimal=7)
 
 
+class TestRGB_to_spectral_Smits1999_weights(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.\
+RGB_to_spectral_Smits1999_weights` definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_Smits1999_weights(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_Smits1999_weights` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_Smits1999_weights(
+                np.array([0.50000000, 0.25000000, 0.75000000])),
+            np.array([0.25, 0.00, 0.25, 0.00, 0.00, 0.00, 0.25]),
+            decimal=7)
+
+        RGB = np.array([[0.45293517, 0.31732158, 0.26414773],
+                        [0.35505307, 0.47995567, 0.61088035],
+                        [0.00000000, 0.75000000, 0.25000000]])
+        np.testing.assert_almost_equal(
+            np.dot(RGB_to_spectral_Smits1999_weights(RGB), SMITS1999_BASIS),
+            np.array([RGB_to_spectral_Smits1999(RGB_i).values
+                      for RGB_i in RGB]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_Smits1999_weights(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_Smits1999_weights` definition n-dimensional arrays
+        support.
+        """
+
+        RGB = np.array([0.50000000, 0.25000000, 0.75000000])
+        weights = RGB_to_spectral_Smits1999_weights(RGB)
+
+        RGB = np.tile(RGB, (2, 3, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_Smits1999_weights(RGB),
+            np.tile(weights, (2, 3, 1)),
+            decimal=7)
+
+
+class TestRGB_to_spectral_image_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.RGB_to_spectral_image_Smits1999`
+    definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_image_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_image_Smits1999` definition.
+        """
+
+        RGB = np.array([[0.45293517, 0.31732158, 0.26414773],
+                        [0.77875824, 0.57726450, 0.50453169],
+                        [0.35505307, 0.47995567, 0.61088035],
+                        [0.25000000, 0.50000000, 0.25000000],
+                        [0.50000000, 0.50000000, 0.50000000],
+                        [0.00000000, 0.75000000, 0.25000000],
+                        [0.75000000, 0.25000000, 0.50000000]])
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_image_Smits1999(RGB, tile_size=3),
+            np.array([RGB_to_spectral_Smits1999(RGB_i).values
+                      for RGB_i in RGB]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_image_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_image_Smits1999` definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        values = RGB_to_spectral_Smits1999(RGB).values
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_image_Smits1999(RGB), values, decimal=7)
+
+        RGB = np.tile(RGB, (2, 3, 1))
+        out = np.empty((2, 3, 10))
+        RGB_to_spectral_image_Smits1999(RGB, tile_size=4, out=out)
+        np.testing.assert_almost_equal(
+            out, np.tile(values, (2, 3, 1)), decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -52,10 +52,17 @@ from collections import namedtuple
 
 from colour.colorimetry import (
     STANDARD_OBSERVERS_CMFS,
+    SpectralShape,
     blackbody_spd,
+    planck_law,
     spectral_to_XYZ)
 from colour.models import UCS_to_uv, XYZ_to_UCS
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack, warning
+from colour.utilities import (
+    CaseInsensitiveMapping,
+    tsplit,
+    tstack,
+    unique_rows,
+    warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -314,34 +321,72 @@ def uv_to_CCT_Ohno2013(uv,
     array([  6.5075128...e+03,   3.2233587...e-03])
     """
 
-    # Ensuring we do at least one iteration to initialise variables.
-    if iterations <= 0:
-        iterations = 1
+    uv = np.asarray(uv, dtype=np.float_)
+    shape = uv.shape[:-1]
+    u, v = [np.reshape(x, (-1, 1)) for x in tsplit(uv)]
+
+    if cmfs.shape.interval == 1:
+        # Planckian radiators tristimulus values computed at once as the
+        # practise *ASTM E308–15* integration performed by
+        # :func:`colour.spectral_to_XYZ` definition does.
+        cmfs = cmfs.clone().trim_wavelengths(SpectralShape(360, 780, 1))
+        wavelengths, cmfs = cmfs.wavelengths * 1e-9, cmfs.values
+
+        def planckian_uv(T):
+            """
+            Returns the *uv* chromaticity coordinates of the planckian
+            radiators at given temperatures.
+            """
+
+            return UCS_to_uv(XYZ_to_UCS(
+                np.dot(planck_law(wavelengths, T[..., np.newaxis]), cmfs)))
+    else:
 
-    # Planckian table creation through cascade expansion.
-    for _i in range(iterations):
-        table = planckian_table(uv, cmfs, start, end, count)
-        index = planckian_table_minimal_distance_index(table)
-        if index == 0:
+        def planckian_uv(T):
+            """
+            Returns the *uv* chromaticity coordinates of the planckian
+            radiators at given temperatures.
+            """
+
+            return np.reshape(
+                [UCS_to_uv(XYZ_to_UCS(spectral_to_XYZ(
+                    blackbody_spd(Ti, cmfs.shape), cmfs)))
+                 for Ti in np.ravel(T)], T.shape + (2,))
+
+    rows = np.arange(u.shape[0])[..., np.newaxis]
+    start = np.full(u.shape, start, dtype=np.float_)
+    end = np.full(u.shape, end, dtype=np.float_)
+
+    # Planckian tables creation through cascade expansion, the tables are
+    # only computed once per distinct temperatures range.
+    for _i in range(max(iterations, 1)):
+        ranges, indices = unique_rows(np.hstack((start, end)))
+        T_u = (ranges[..., 0:1] + np.arange(count) *
+               ((ranges[..., 1:2] - ranges[..., 0:1]) / (count - 1)))
+        T_u[..., -1] = ranges[..., 1]
+
+        T_i = T_u[indices]
+        u_i, v_i = tsplit(planckian_uv(T_u)[indices])
+        d_i = np.sqrt((u - u_i) ** 2 + (v - v_i) ** 2)
+
+        index = np.argmin(d_i, axis=-1)[..., np.newaxis]
+        if np.any(index == 0):
             warning(
                 ('Minimal distance index is on lowest planckian table bound, '
                  'unpredictable results may occur!'))
-            index += 1
-        elif index == len(table) - 1:
+        if np.any(index == count - 1):
             warning(
                 ('Minimal distance index is on highest planckian table bound, '
                  'unpredictable results may occur!'))
-            index -= 1
-
-        start = table[index - 1].Ti
-        end = table[index + 1].Ti
+        index = np.clip(index, 1, count - 2)
 
-    _ux, vx = uv
+        start = T_i[rows, index - 1]
+        end = T_i[rows, index + 1]
 
-    Tuvdip, Tuvdi, Tuvdin = (table[index - 1], table[index], table[index + 1])
-    Tip, uip, vip, dip = Tuvdip.Ti, Tuvdip.ui, Tuvdip.vi, Tuvdip.di
-    Ti, di = Tuvdi.Ti, Tuvdi.di
-    Tin, uin, vin, din = Tuvdin.Ti, Tuvdin.ui, Tuvdin.vi, Tuvdin.di
+    index, rows, v = index[..., 0], rows[..., 0], v[..., 0]
+    Tip, uip, vip, dip = [x[rows, index - 1] for x in (T_i, u_i, v_i, d_i)]
+    Ti, di = [x[rows, index] for x in (T_i, d_i)]
+    Tin, uin, vin, din = [x[rows, index + 1] for x in (T_i, u_i, v_i, d_i)]
 
     # Triangular solution.
     l = np.sqrt((uin - uip) ** 2 + (vin - vip) ** 2)
@@ -349,23 +394,23 @@ def uv_to_CCT_Ohno2013(uv,
     T = Tip + (Tin - Tip) * (x / l)
 
     vtx = vip + (vin - vip) * (x / l)
-    sign = 1 if vx - vtx >= 0 else -1
+    sign = np.where(v - vtx >= 0, 1, -1)
     D_uv = (dip ** 2 - x ** 2) ** (1 / 2) * sign
 
     # Parabolic solution.
-    if D_uv < 0.002:
-        X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
-        a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
-        b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
-               (di - dip)) * X ** -1)
-        c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin +
-               din * (Ti - Tip) * Tip * Ti) * X ** -1)
-
-        T = -b / (2 * a)
+    parabolic = D_uv < 0.002
+    X = (Tin - Ti) * (Tip - Tin) * (Ti - Tip)
+    a = (Tip * (din - di) + Ti * (dip - din) + Tin * (di - dip)) * X ** -1
+    b = (-(Tip ** 2 * (din - di) + Ti ** 2 * (dip - din) + Tin ** 2 *
+           (di - dip)) * X ** -1)
+    c = (-(dip * (Tin - Ti) * Ti * Tin + di * (Tip - Tin) * Tip * Tin +
+           din * (Ti - Tip) * Tip * Ti) * X ** -1)
 
-        D_uv = sign * (a * T ** 2 + b * T + c)
+    T_p = -b / (2 * a)
+    T = np.where(parabolic, T_p, T)
+    D_uv = np.where(parabolic, sign * (a * T_p ** 2 + b * T_p + c), D_uv)
 
-    return np.array([T, D_uv])
+    return np.reshape(tstack((T, D_uv)), shape + (2,))
 
 
 def CCT_to_uv_Ohno2013(CCT,
@@ -468,60 +513,45 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0.0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1.0
-        dv = wr_ruvt.t
-
-        length = np.sqrt(1 + dv * dv)
-
-        du /= length
-        dv /= length
-
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
-
-        dt = -uu * dv + vv * du
+    u, v = tsplit(uv)
+    u = u[..., np.newaxis]
+    v = v[..., np.newaxis]
 
-        if dt <= 0 or i == 30:
-            if dt > 0.0:
-                dt = 0.0
+    r_l, u_l, v_l, t_l = tsplit(np.array(ROBERTSON_ISOTEMPERATURE_LINES))
 
-            dt = -dt
+    length = np.sqrt(1 + t_l * t_l)
+    du_l = 1 / length
+    dv_l = t_l / length
 
-            if i == 1:
-                f = 0.0
-            else:
-                f = dt / (last_dt + dt)
+    # Signed distances to the isotemperature lines, the search stops at the
+    # first line the chromaticity coordinates are not above of.
+    dt_l = -(u - u_l[1:]) * dv_l[1:] + (v - v_l[1:]) * du_l[1:]
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    below = dt_l <= 0
+    i = np.where(np.any(below, axis=-1), np.argmax(below, axis=-1) + 1, 30)
+    i = i[..., np.newaxis]
+    p = i - 1
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    dt = -np.minimum(-(u - u_l[i]) * dv_l[i] + (v - v_l[i]) * du_l[i], 0)
+    last_dt = np.where(
+        i == 1, 0, -(u - u_l[p]) * dv_l[p] + (v - v_l[p]) * du_l[p])
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    with np.errstate(invalid='ignore'):
+        f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            length = np.sqrt(du * du + dv * dv)
+    T = 1.0e6 / (r_l[p] * f + r_l[i] * (1 - f))
 
-            du /= length
-            dv /= length
+    uu = u - (u_l[p] * f + u_l[i] * (1 - f))
+    vv = v - (v_l[p] * f + v_l[i] * (1 - f))
 
-            D_uv = uu * du + vv * dv
+    du = du_l[i] * (1 - f) + du_l[p] * f
+    dv = dv_l[i] * (1 - f) + dv_l[p] * f
 
-            break
+    length = np.sqrt(du * du + dv * dv)
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
+    D_uv = (uu * du + vv * dv) / length
 
-    return np.array([T, -D_uv])
+    return tstack((T[..., 0], -D_uv[..., 0]))
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
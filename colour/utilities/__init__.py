@@ -12,6 +12,7 @@ from .common import (
     ignore_python_warnings,
     batch,
     is_openimageio_installed,
+    is_numba_installed,
     is_iterable,
     is_string,
     is_numeric,
@@ -27,13 +28,22 @@ from .array import (
     tsplit,
     row_as_diagonal,
     dot_vector,
-    dot_matrix)
+    dot_matrix,
+    unique_rows,
+    string_to_values)
 from .data_structures import (
     ArbitraryPrecisionMapping,
     Lookup,
     Structure,
     CaseInsensitiveMapping)
 from .verbose import message_box, warning
+from .backend import (
+    COMPUTATION_BACKENDS,
+    get_computation_backend,
+    set_computation_backend,
+    is_numba_backend_enabled,
+    jit)
+from .tiling import DEFAULT_TILE_SIZE, tiles, tiled_imap, tiled_apply
 
 __all__ = ['handle_numpy_errors',
            'ignore_numpy_errors',
@@ -43,6 +53,7 @@ __all__ = ['handle_numpy_errors',
            'ignore_python_warnings',
            'batch',
            'is_openimageio_installed',
+           'is_numba_installed',
            'is_iterable',
            'is_string',
            'is_numeric',
@@ -57,9 +68,17 @@ __all__ += ['as_numeric',
             'tsplit',
             'row_as_diagonal',
             'dot_vector',
-            'dot_matrix']
+            'dot_matrix',
+            'unique_rows',
+            'string_to_values']
 __all__ += ['ArbitraryPrecisionMapping',
             'Lookup',
             'Structure',
             'CaseInsensitiveMapping']
 __all__ += ['message_box', 'warning']
+__all__ += ['COMPUTATION_BACKENDS',
+            'get_computation_backend',
+            'set_computation_backend',
+            'is_numba_backend_enabled',
+            'jit']
+__all__ += ['DEFAULT_TILE_SIZE', 'tiles', 'tiled_imap', 'tiled_apply']
@@ -11,6 +11,8 @@ Defines array utilities objects.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import re
+import warnings
 
 from colour.constants import EPSILON
 
@@ -31,7 +33,9 @@ __all__ = ['as_numeric',
            'tsplit',
            'row_as_diagonal',
            'dot_vector',
-           'dot_matrix']
+           'dot_matrix',
+           'unique_rows',
+           'string_to_values']
 
 
 def as_numeric(x):
@@ -507,3 +511,95 @@ def dot_matrix(a, b):
     """
 
     return np.einsum('...ij,...jk->...ik', a, b)
+
+
+def unique_rows(a):
+    """
+    Returns the sorted unique rows of given 2d array and the indices of the
+    unique rows reconstructing it.
+
+    Parameters
+    ----------
+    a : array_like
+        2d array to find the unique rows of.
+
+    Returns
+    -------
+    tuple
+        Unique rows, indices of the unique rows reconstructing given array.
+
+    Notes
+    -----
+    -   This definition is equivalent to :func:`np.unique` definition called
+        with the *axis=0* and *return_inverse=True* arguments, which is only
+        available in *Numpy* 1.13 onwards.
+
+    Examples
+    --------
+    >>> a = np.array([[1, 2], [0, 1], [1, 2]])
+    >>> rows, indices = unique_rows(a)
+    >>> rows
+    array([[0, 1],
+           [1, 2]])
+    >>> indices
+    array([1, 0, 1])
+    """
+
+    a = np.asarray(a)
+
+    order = np.lexsort(a.T[::-1])
+    a = a[order]
+
+    unique = np.ones(a.shape[0], dtype=np.bool_)
+    unique[1:] = np.any(a[1:] != a[:-1], axis=-1)
+
+    indices = np.empty(a.shape[0], dtype=np.int_)
+    indices[order] = np.cumsum(unique) - 1
+
+    return a[unique], indices
+
+
+def string_to_values(string, separator):
+    """
+    Parses given string separated numeric values at once with
+    :func:`np.fromstring` definition.
+
+    Parameters
+    ----------
+    string : unicode
+        String of separated numeric values.
+    separator : unicode
+        Values separator, whitespaces around it are ignored.
+
+    Returns
+    -------
+    ndarray or None
+        Parsed values or *None* if a value is missing or invalid.
+
+    Notes
+    -----
+    -   Depending on *Numpy* version, an invalid value either stops the
+        parsing, raises a :class:`DeprecationWarning` warning or a
+        :class:`ValueError` exception: the callers should compare the parsed
+        values count with the expected one.
+    -   Some *Numpy* versions parse a blank value between two non-whitespace
+        separators as *-1*, such values are thus detected beforehand.
+
+    Examples
+    --------
+    >>> string_to_values('1.5, 2, 3e-1', ',')
+    array([ 1.5,  2. ,  0.3])
+    >>> print(string_to_values('1.5, , 3e-1', ','))
+    None
+    """
+
+    if separator.strip() and re.search(
+            r'(?:^|{0})\s*(?:{0}|$)'.format(re.escape(separator)), string):
+        return None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(string, sep=separator)
+        except (DeprecationWarning, ValueError):
+            return None
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Computation Backends
+====================
+
+Defines the computation backends related objects:
+
+-   :attr:`COMPUTATION_BACKENDS`
+-   :func:`get_computation_backend`
+-   :func:`set_computation_backend`
+-   :func:`is_numba_backend_enabled`
+-   :func:`jit`
+
+The *NumPy* backend evaluates the colour models transformations as chains of
+whole-array expressions. The optional *Numba* backend evaluates them with
+compiled kernels fusing each transformation into a single pass over memory, it
+is only used if *Numba* is installed.
+"""
+
+from __future__ import division, unicode_literals
+
+from colour.utilities.common import is_numba_installed
+from colour.utilities.verbose import warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['COMPUTATION_BACKENDS',
+           'get_computation_backend',
+           'set_computation_backend',
+           'is_numba_backend_enabled',
+           'jit']
+
+COMPUTATION_BACKENDS = ('NumPy', 'Numba')
+"""
+Supported computation backends.
+
+COMPUTATION_BACKENDS : tuple
+{'NumPy', 'Numba'}
+"""
+
+_COMPUTATION_BACKEND = ['NumPy']
+"""
+Current computation backend, stored in a list so that it can be mutated.
+
+_COMPUTATION_BACKEND : list
+"""
+
+
+def get_computation_backend():
+    """
+    Returns the current computation backend.
+
+    Returns
+    -------
+    unicode
+        Current computation backend.
+
+    Examples
+    --------
+    >>> get_computation_backend()
+    'NumPy'
+    """
+
+    return _COMPUTATION_BACKEND[0]
+
+
+def set_computation_backend(backend='NumPy'):
+    """
+    Sets the current computation backend.
+
+    Parameters
+    ----------
+    backend : unicode, optional
+        {'NumPy', 'Numba'},
+        Computation backend.
+
+    Returns
+    -------
+    unicode
+        Computation backend effectively set.
+
+    Raises
+    ------
+    ValueError
+        If the computation backend is not supported.
+
+    Notes
+    -----
+    -   If the *Numba* backend is requested while *Numba* is not installed,
+        a warning is issued and the *NumPy* backend is used instead.
+
+    Examples
+    --------
+    >>> set_computation_backend('NumPy')
+    'NumPy'
+    """
+
+    backends = dict((name.lower(), name) for name in COMPUTATION_BACKENDS)
+    if backend.lower() not in backends:
+        raise ValueError(
+            ('"{0}" computation backend is not supported, it must be one of '
+             '"{1}"!').format(backend, COMPUTATION_BACKENDS))
+
+    backend = backends[backend.lower()]
+    if backend == 'Numba' and not is_numba_installed():
+        warning('"Numba" is not installed, falling back to "NumPy" '
+                'computation backend!')
+        backend = 'NumPy'
+
+    _COMPUTATION_BACKEND[0] = backend
+
+    return backend
+
+
+def is_numba_backend_enabled():
+    """
+    Returns if the *Numba* computation backend is enabled.
+
+    Returns
+    -------
+    bool
+        Is *Numba* computation backend enabled.
+
+    Examples
+    --------
+    >>> is_numba_backend_enabled()
+    False
+    """
+
+    return _COMPUTATION_BACKEND[0] == 'Numba'
+
+
+def jit(function):
+    """
+    Decorator compiling given function with *Numba* in *nopython* mode and
+    releasing the *GIL*. The function is returned untouched if *Numba* is not
+    installed.
+
+    Parameters
+    ----------
+    function : object
+        Function to compile.
+
+    Returns
+    -------
+    object
+
+    Examples
+    --------
+    >>> @jit
+    ... def f(x):
+    ...     return x * 2
+    >>> f(2)
+    4
+    """
+
+    if not is_numba_installed():
+        return function
+
+    import numba
+
+    return numba.njit(nogil=True, error_model='numpy')(function)
@@ -31,6 +31,7 @@ __all__ = ['handle_numpy_errors',
            'ignore_python_warnings',
            'batch',
            'is_openimageio_installed',
+           'is_numba_installed',
            'is_iterable',
            'is_string',
            'is_numeric',
@@ -185,6 +186,37 @@ def is_openimageio_installed(raise_exception=False):
         return False
 
 
+def is_numba_installed(raise_exception=False):
+    """
+    Returns if *Numba* is installed and available.
+
+    Parameters
+    ----------
+    raise_exception : bool
+        Raise exception if *Numba* is unavailable.
+
+    Returns
+    -------
+    bool
+        Is *Numba* installed.
+
+    Raises
+    ------
+    ImportError
+        If *Numba* is not installed.
+    """
+
+    try:
+        import numba  # noqa
+
+        return True
+    except ImportError as error:
+        if raise_exception:
+            raise ImportError(('"Numba" related Api features '
+                               'are not available: "{0}".').format(error))
+        return False
+
+
 def is_iterable(x):
     """
     Returns if given :math:`x` variable is iterable.
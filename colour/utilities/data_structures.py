@@ -18,6 +18,7 @@ Defines various data structures classes:
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 from collections import Mapping, MutableMapping
 
 from colour.utilities import is_numeric
@@ -61,6 +62,7 @@ class ArbitraryPrecisionMapping(MutableMapping):
     __contains__
     __iter__
     __len__
+    set_items
 
     Examples
     --------
@@ -135,6 +137,17 @@ class ArbitraryPrecisionMapping(MutableMapping):
         """
 
         if is_numeric(item):
+            if (isinstance(item, (float, np.floating)) and
+                    self._key_decimals is not None and
+                    self._key_decimals >= 0):
+                # Rounding as :func:`numpy.around` definition does so that
+                # the keys match those set by :meth:`set_items` method.
+                factor = 10.0 ** self._key_decimals
+                try:
+                    return round(item * factor) / factor
+                except (OverflowError, ValueError):
+                    pass
+
             return round(item, self._key_decimals)
         else:
             return item
@@ -236,6 +249,33 @@ class ArbitraryPrecisionMapping(MutableMapping):
 
         return iter(self._data)
 
+    def set_items(self, items, values):
+        """
+        Sets given numeric items (rounded) with given values at once.
+
+        Parameters
+        ----------
+        items : array_like
+            Numeric items.
+        values : array_like
+            Values, their count must match the items count.
+
+        Examples
+        --------
+        >>> apm = ArbitraryPrecisionMapping(key_decimals=7)
+        >>> apm.set_items(np.array([0.1999999998, 0.3]), ('Nemo', 'John'))
+        >>> apm[0.2]
+        'Nemo'
+        """
+
+        items = np.ravel(items)
+        if self._key_decimals is None or self._key_decimals < 0:
+            for item, value in zip(items.tolist(), values):
+                self[item] = value
+        else:
+            self._data.update(
+                zip(np.around(items, self._key_decimals).tolist(), values))
+
     def __len__(self):
         """
         Returns the items count.
@@ -21,7 +21,9 @@ from colour.utilities import (
     tsplit,
     row_as_diagonal,
     dot_vector,
-    dot_matrix)
+    dot_matrix,
+    unique_rows,
+    string_to_values)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
@@ -40,7 +42,9 @@ __all__ = ['TestAsNumeric',
            'TestTsplit',
            'TestRowAsDiagonal',
            'TestDotVector',
-           'TestDotMatrix']
+           'TestDotMatrix',
+           'TestUniqueRows',
+           'TestStringToValues']
 
 
 class TestAsNumeric(unittest.TestCase):
@@ -439,5 +443,60 @@ class TestDotMatrix(unittest.TestCase):
             decimal=7)
 
 
+class TestUniqueRows(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.unique_rows` definition unit tests
+    methods.
+    """
+
+    def test_unique_rows(self):
+        """
+        Tests :func:`colour.utilities.array.unique_rows` definition.
+        """
+
+        a = np.random.RandomState(0).randint(0, 4, (100, 2)) * 0.5
+        rows, indices = unique_rows(a)
+
+        np.testing.assert_equal(rows, np.array(sorted(set(map(tuple, a)))))
+        np.testing.assert_equal(rows[indices], a)
+
+        rows, indices = unique_rows(np.empty((0, 2)))
+        self.assertEqual(rows.shape, (0, 2))
+        self.assertEqual(indices.shape, (0,))
+
+
+class TestStringToValues(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.string_to_values` definition units
+    tests methods.
+    """
+
+    def test_string_to_values(self):
+        """
+        Tests :func:`colour.utilities.array.string_to_values` definition.
+        """
+
+        np.testing.assert_equal(
+            string_to_values('1.5, 2, 3e-1', ','),
+            np.array([1.5, 2, 0.3]))
+
+        np.testing.assert_equal(
+            string_to_values('1.5   2\t3e-1\n4', ' '),
+            np.array([1.5, 2, 0.3, 4]))
+
+    def test_invalid_string_to_values(self):
+        """
+        Tests :func:`colour.utilities.array.string_to_values` definition
+        invalid values handling.
+        """
+
+        for string in ('1.5, a, 3e-1', '1.5, 2, 3e-1, z'):
+            values = string_to_values(string, ',')
+            self.assertTrue(values is None or values.size != 3)
+
+        for string in ('1.5, , 3e-1', '1.5, 2, ', ' , 2, 3e-1', ''):
+            self.assertIsNone(string_to_values(string, ','))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.backend` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models import XYZ_to_Lab
+from colour.utilities import (
+    get_computation_backend,
+    set_computation_backend,
+    is_numba_backend_enabled,
+    is_numba_installed,
+    ignore_python_warnings)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestSetComputationBackend']
+
+
+class TestSetComputationBackend(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.backend.set_computation_backend`
+    definition unit tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        set_computation_backend('NumPy')
+
+    @ignore_python_warnings
+    def test_set_computation_backend(self):
+        """
+        Tests :func:`colour.utilities.backend.set_computation_backend`
+        definition.
+        """
+
+        self.assertEqual(set_computation_backend('NumPy'), 'NumPy')
+        self.assertEqual(get_computation_backend(), 'NumPy')
+        self.assertFalse(is_numba_backend_enabled())
+
+        backend = 'Numba' if is_numba_installed() else 'NumPy'
+        self.assertEqual(set_computation_backend('numba'), backend)
+        self.assertEqual(get_computation_backend(), backend)
+        self.assertEqual(is_numba_backend_enabled(), backend == 'Numba')
+
+        self.assertRaises(ValueError, set_computation_backend, 'CUDA')
+        self.assertEqual(get_computation_backend(), backend)
+
+    @ignore_python_warnings
+    def test_computation_backends_consistency(self):
+        """
+        Tests the consistency of the colour models transformations across
+        the computation backends.
+        """
+
+        XYZ = np.reshape(np.random.RandomState(4).random_sample(48),
+                         (4, 4, 3))
+
+        set_computation_backend('NumPy')
+        Lab = XYZ_to_Lab(XYZ)
+
+        set_computation_backend('Numba')
+        np.testing.assert_almost_equal(XYZ_to_Lab(XYZ), Lab, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Defines unit tests for :mod:`colour.utilities.data_structures` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import pickle
 import unittest
 
@@ -55,7 +56,8 @@ ArbitraryPrecisionMapping` class units tests methods.
                             '__delitem__',
                             '__contains__',
                             '__iter__',
-                            '__len__')
+                            '__len__',
+                            'set_items')
 
         for method in required_methods:
             self.assertIn(method, dir(ArbitraryPrecisionMapping))
@@ -75,6 +77,25 @@ ArbitraryPrecisionMapping.__setitem__` method.
 
         self.assertListEqual(list(mapping.keys()), [0.2])
 
+    def test_set_items(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+ArbitraryPrecisionMapping.set_items` method.
+        """
+
+        mapping = ArbitraryPrecisionMapping(key_decimals=7)
+        mapping.set_items(np.array([0.1999999998, 0.3]), ('Nemo', 'John'))
+
+        self.assertListEqual(sorted(mapping.keys()), [0.2, 0.3])
+        self.assertEqual(mapping[0.2], 'Nemo')
+
+        items = np.random.RandomState(0).uniform(300, 900, 1000)
+        mapping = ArbitraryPrecisionMapping(key_decimals=10)
+        mapping.set_items(items, range(1000))
+        for i, item in enumerate(items):
+            self.assertEqual(mapping[item], i)
+            self.assertEqual(mapping[float(item)], i)
+
     def test__getitem__(self):
         """
         Tests :meth:`colour.utilities.data_structures.\
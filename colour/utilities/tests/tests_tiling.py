@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.tiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.appearance import XYZ_to_CIECAM02
+from colour.difference import delta_E
+from colour.models import XYZ_to_Lab
+from colour.utilities import (
+    ignore_numpy_errors,
+    tiles,
+    tiled_imap,
+    tiled_apply)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestTiles',
+           'TestTiledImap',
+           'TestTiledApply']
+
+SAMPLES = np.reshape(np.random.RandomState(4).random_sample(105), (7, 5, 3))
+
+
+class TestTiles(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.tiles` definition unit tests
+    methods.
+    """
+
+    def test_tiles(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiles` definition.
+        """
+
+        self.assertListEqual(
+            tiles(10, 5),
+            [slice(0, 5), slice(5, 10)])
+
+        self.assertListEqual(
+            tiles(3, 5),
+            [slice(0, 3)])
+
+        self.assertListEqual(tiles(0, 5), [])
+
+
+class TestTiledImap(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.tiled_imap` definition unit tests
+    methods.
+    """
+
+    def test_tiled_imap(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_imap` definition.
+        """
+
+        Lab = np.reshape(XYZ_to_Lab(SAMPLES), (-1, 3))
+        for tile_size in (1, 4, 35, 64):
+            for threads in (1, 3):
+                results = list(tiled_imap(XYZ_to_Lab,
+                                          SAMPLES,
+                                          tile_size=tile_size,
+                                          threads=threads))
+                self.assertListEqual([tile for tile, _Lab in results],
+                                     tiles(35, tile_size))
+                for tile, Lab_t in results:
+                    np.testing.assert_almost_equal(
+                        Lab_t, Lab[tile], decimal=7)
+
+        d_E = np.ravel(delta_E(SAMPLES, SAMPLES[::-1], method='CIE 1976'))
+        for tile, d_E_t in tiled_imap(delta_E,
+                                      (SAMPLES, SAMPLES[::-1]),
+                                      tile_size=4,
+                                      threads=2,
+                                      method='CIE 1976'):
+            np.testing.assert_almost_equal(d_E_t, d_E[tile], decimal=7)
+
+        self.assertListEqual(
+            list(tiled_imap(XYZ_to_Lab, np.zeros((0, 3)))), [])
+
+    def test_raise_exception_tiled_imap(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_imap` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError,
+                          list,
+                          tiled_imap(delta_E, (SAMPLES, SAMPLES[1:])))
+
+
+class TestTiledApply(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.tiling.tiled_apply` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self.__temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self.__temporary_directory)
+
+    def test_tiled_apply(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_apply` definition.
+        """
+
+        Lab = XYZ_to_Lab(SAMPLES)
+        for tile_size in (1, 4, 35, 64):
+            for threads in (1, 3):
+                np.testing.assert_almost_equal(
+                    tiled_apply(XYZ_to_Lab,
+                                SAMPLES,
+                                tile_size=tile_size,
+                                threads=threads),
+                    Lab,
+                    decimal=7)
+
+        np.testing.assert_almost_equal(
+            tiled_apply(XYZ_to_Lab, SAMPLES[0, 0]),
+            Lab[0, 0],
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            tiled_apply(delta_E,
+                        (Lab, Lab[::-1]),
+                        tile_size=4,
+                        method='CIE 2000'),
+            delta_E(Lab, Lab[::-1], method='CIE 2000'),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_tiled_apply_specification(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_apply` definition with a
+        transformation returning a *namedtuple*.
+        """
+
+        XYZ = SAMPLES * 100
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        specification = XYZ_to_CIECAM02(XYZ, XYZ_w, 318.31, 20.0)
+        tiled_specification = tiled_apply(XYZ_to_CIECAM02,
+                                          XYZ,
+                                          tile_size=4,
+                                          threads=2,
+                                          XYZ_w=XYZ_w,
+                                          L_A=318.31,
+                                          Y_b=20.0)
+
+        self.assertIsInstance(tiled_specification, type(specification))
+        for field, tiled_field in zip(specification, tiled_specification):
+            if field is None:
+                self.assertIsNone(tiled_field)
+            else:
+                np.testing.assert_almost_equal(tiled_field, field, decimal=7)
+
+    def test_tiled_apply_out(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_apply` definition *out*
+        argument.
+        """
+
+        out = np.zeros(SAMPLES.shape)
+        self.assertIs(tiled_apply(XYZ_to_Lab, SAMPLES, 4, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ_to_Lab(SAMPLES), decimal=7)
+
+        path = os.path.join(self.__temporary_directory, 'Lab.dat')
+        out = np.memmap(path, dtype=np.float_, mode='w+', shape=SAMPLES.shape)
+        tiled_apply(XYZ_to_Lab, SAMPLES, 4, out=out, threads=2)
+        out.flush()
+        np.testing.assert_almost_equal(
+            np.fromfile(path).reshape(SAMPLES.shape),
+            XYZ_to_Lab(SAMPLES),
+            decimal=7)
+        del out
+
+    def test_raise_exception_tiled_apply(self):
+        """
+        Tests :func:`colour.utilities.tiling.tiled_apply` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError,
+                          tiled_apply,
+                          delta_E,
+                          (SAMPLES, SAMPLES[1:]))
+
+        self.assertRaises(ValueError,
+                          tiled_apply,
+                          XYZ_to_Lab,
+                          SAMPLES,
+                          out=np.zeros((7, 5, 4)))
+
+        self.assertRaises(ValueError,
+                          tiled_apply,
+                          XYZ_to_Lab,
+                          SAMPLES,
+                          out=np.zeros((5, 7, 3)).transpose((1, 0, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
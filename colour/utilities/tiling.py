@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tiled Execution
+===============
+
+Defines the tiled execution objects streaming colour transformations over
+large arrays:
+
+-   :attr:`DEFAULT_TILE_SIZE`
+-   :func:`tiles`
+-   :func:`tiled_imap`
+-   :func:`tiled_apply`
+
+Converting large images at once materialises every intermediate array of the
+transformation at full image size. Processing the image in tiles bounds the
+memory footprint to a few tiles and keeps the intermediate arrays in cache.
+As *Numpy* releases the *GIL* in most of its routines, the tiles can also be
+processed concurrently by a thread pool.
+"""
+
+from __future__ import division, unicode_literals
+
+import multiprocessing
+import numpy as np
+from multiprocessing.pool import ThreadPool
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DEFAULT_TILE_SIZE',
+           'tiles',
+           'tiled_imap',
+           'tiled_apply']
+
+DEFAULT_TILE_SIZE = 65536
+"""
+Default tile size in pixels, i.e. count of elements along the flattened
+leading dimensions of the processed arrays.
+
+DEFAULT_TILE_SIZE : integer
+"""
+
+
+def tiles(size, tile_size=DEFAULT_TILE_SIZE):
+    """
+    Returns the slices splitting given size into tiles.
+
+    Parameters
+    ----------
+    size : integer
+        Size to split.
+    tile_size : integer, optional
+        Tiles size.
+
+    Returns
+    -------
+    list
+        Tiles slices.
+
+    Examples
+    --------
+    >>> tiles(10, 4)
+    [slice(0, 4, None), slice(4, 8, None), slice(8, 10, None)]
+    """
+
+    tile_size = max(int(tile_size), 1)
+
+    return [slice(i, min(i + tile_size, size))
+            for i in range(0, size, tile_size)]
+
+
+def _flatten_leading(a, shape):
+    """
+    Reshapes given array so that its leading dimensions matching given shape
+    are flattened into a single dimension, a view is returned if possible.
+    """
+
+    return np.reshape(a, (int(np.prod(shape)),) + np.shape(a)[len(shape):])
+
+
+def _tiled_arrays(a):
+    """
+    Returns given array, or arrays, with their leading dimensions flattened
+    into a single dimension and their leading shape.
+    """
+
+    arrays = tuple(a) if isinstance(a, tuple) else (a,)
+    arrays = [np.asarray(array) for array in arrays]
+
+    shape = arrays[0].shape[:-1]
+    for array in arrays[1:]:
+        if array.shape[:-1] != shape:
+            raise ValueError(
+                ('Arrays leading shapes "{0}" and "{1}" do not '
+                 'match!').format(shape, array.shape[:-1]))
+
+    return [_flatten_leading(array, shape) for array in arrays], shape
+
+
+def tiled_imap(function,
+               a,
+               tile_size=DEFAULT_TILE_SIZE,
+               threads=1,
+               **kwargs):
+    """
+    Applies given colour transformation to given array, or arrays, in tiles
+    along the leading dimensions and yields the tiles outputs in order, e.g.
+    to reduce them without storing the whole transformation output.
+
+    Parameters
+    ----------
+    function : object
+        Colour transformation processing arrays of shape (..., n).
+    a : array_like or tuple
+        Array of shape (..., n) or tuple of arrays with identical leading
+        shape passed as positional arguments to the transformation.
+    tile_size : integer, optional
+        Tiles size in pixels, i.e. count of elements along the flattened
+        leading dimensions.
+    threads : integer, optional
+        Threads count processing the tiles concurrently, default to
+        :func:`multiprocessing.cpu_count` definition if *None*.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the transformation.
+
+    Yields
+    ------
+    tuple
+        Tile slice along the flattened leading dimensions and transformation
+        output of the tile.
+
+    Raises
+    ------
+    ValueError
+        If the arrays leading shapes do not match.
+
+    See Also
+    --------
+    tiled_apply
+
+    Examples
+    --------
+    >>> from colour import delta_E
+    >>> Lab_1 = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...                   [100.00000000, 21.57210357, 272.22819350],
+    ...                   [50.00000000, 8.32281957, -73.58297716]])
+    >>> Lab_2 = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...                   [100.00000000, 74.05216981, 276.45318193],
+    ...                   [50.00000000, 8.32281957, -73.58297716]])
+    >>> for tile, d_E in tiled_imap(
+    ...         delta_E, (Lab_1, Lab_2), tile_size=2, method='CIE 1976'):
+    ...     print(tile, np.around(d_E, 4))
+    slice(0, 2, None) [ 451.7133   52.6499]
+    slice(2, 3, None) [ 0.]
+    """
+
+    arrays, _shape = _tiled_arrays(a)
+    slices = tiles(arrays[0].shape[0], tile_size)
+
+    def process(tile):
+        """
+        Processes given tile.
+        """
+
+        return tile, function(*[array[tile] for array in arrays], **kwargs)
+
+    threads = threads if threads else multiprocessing.cpu_count()
+    if threads == 1 or len(slices) <= 1:
+        for tile in slices:
+            yield process(tile)
+    else:
+        pool = ThreadPool(processes=threads)
+        try:
+            for result in pool.imap(process, slices):
+                yield result
+        finally:
+            pool.close()
+            pool.join()
+
+
+def tiled_apply(function,
+                a,
+                tile_size=DEFAULT_TILE_SIZE,
+                out=None,
+                threads=1,
+                **kwargs):
+    """
+    Applies given colour transformation to given array, or arrays, in tiles
+    along the leading dimensions.
+
+    Parameters
+    ----------
+    function : object
+        Colour transformation processing arrays of shape (..., n) into arrays
+        of shape (..., k) or (...), e.g. :func:`colour.XYZ_to_RGB`. A
+        transformation returning a *namedtuple* of arrays, e.g.
+        :func:`colour.XYZ_to_CIECAM02`, is also supported.
+    a : array_like or tuple
+        Array of shape (..., n) or tuple of arrays with identical leading
+        shape, e.g. the two *CIE Lab* colourspace arrays processed by
+        :func:`colour.delta_E`. The arrays are passed as positional arguments
+        to the transformation.
+    tile_size : integer, optional
+        Tiles size in pixels, i.e. count of elements along the flattened
+        leading dimensions.
+    out : ndarray or tuple, optional
+        Preallocated *C-contiguous* array of shape (..., k), e.g.
+        :class:`numpy.memmap` class instance, receiving the transformation
+        output. A tuple of arrays is expected for a transformation returning a
+        *namedtuple*.
+    threads : integer, optional
+        Threads count processing the tiles concurrently, default to
+        :func:`multiprocessing.cpu_count` definition if *None*.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the transformation.
+
+    Returns
+    -------
+    ndarray or tuple
+        Transformation output, *out* argument if given.
+
+    Raises
+    ------
+    ValueError
+        If the arrays leading shapes do not match, or if the output array is
+        not *C-contiguous* or does not have the expected shape.
+
+    Notes
+    -----
+    -   The transformation must process the elements independently, i.e. the
+        output element at a given location must only depend on the input
+        elements at that location.
+    -   The arrays are read tile by tile, memory-mapped arrays are thus never
+        loaded entirely in memory.
+    -   The *namedtuple* fields that are *None* for the first tile are
+        assumed to be *None* for all the tiles and are left as is.
+
+    Examples
+    --------
+    >>> from colour import XYZ_to_Lab, delta_E
+    >>> XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (4, 1))
+    >>> tiled_apply(XYZ_to_Lab, XYZ, tile_size=3)  # doctest: +ELLIPSIS
+    array([[ 37.9856291..., -23.6230288...,  -4.4141703...],
+           [ 37.9856291..., -23.6230288...,  -4.4141703...],
+           [ 37.9856291..., -23.6230288...,  -4.4141703...],
+           [ 37.9856291..., -23.6230288...,  -4.4141703...]])
+    >>> Lab_1 = np.array([[100.00000000, 21.57210357, 272.22819350]])
+    >>> Lab_2 = np.array([[100.00000000, 426.67945353, 72.39590835]])
+    >>> tiled_apply(  # doctest: +ELLIPSIS
+    ...     delta_E, (Lab_1, Lab_2), method='CIE 1976')
+    array([ 451.7133019...])
+    """
+
+    arrays, shape = _tiled_arrays(a)
+    size = arrays[0].shape[0]
+    if size == 0:
+        return function(*a if isinstance(a, tuple) else (a,), **kwargs)
+
+    slices = tiles(size, tile_size)
+
+    def process(tile):
+        """
+        Processes given tile.
+        """
+
+        return function(*[array[tile] for array in arrays], **kwargs)
+
+    first = process(slices[0])
+
+    is_tuple = isinstance(first, tuple)
+    outputs = list(first) if is_tuple else [first]
+    if out is None:
+        out = [None if output is None else
+               np.empty(shape + np.shape(output)[1:],
+                        dtype=np.asarray(output).dtype)
+               for output in outputs]
+        out = type(first)(*out) if is_tuple else out[0]
+
+    out_arrays = list(out) if is_tuple else [out]
+    for output, out_array in zip(outputs, out_arrays):
+        if output is None:
+            continue
+
+        expected = shape + np.shape(output)[1:]
+        if out_array.shape != expected:
+            raise ValueError(
+                ('Output array shape "{0}" does not match expected shape '
+                 '"{1}"!').format(out_array.shape, expected))
+        if not out_array.flags.c_contiguous:
+            raise ValueError('Output array must be "C-contiguous"!')
+
+    flat_out = [None if output is None else
+                _flatten_leading(out_array, shape)
+                for output, out_array in zip(outputs, out_arrays)]
+
+    def write(tile, result):
+        """
+        Writes given tile result into the output arrays.
+        """
+
+        results = list(result) if is_tuple else [result]
+        for flat_array, result in zip(flat_out, results):
+            if flat_array is not None:
+                flat_array[tile] = result
+
+    def process_and_write(tile):
+        """
+        Processes given tile and writes the result into the output arrays.
+        """
+
+        write(tile, process(tile))
+
+    write(slices[0], first)
+
+    threads = threads if threads else multiprocessing.cpu_count()
+    if threads == 1 or len(slices) == 1:
+        for tile in slices[1:]:
+            process_and_write(tile)
+    else:
+        pool = ThreadPool(processes=threads)
+        try:
+            pool.map(process_and_write, slices[1:])
+        finally:
+            pool.close()
+            pool.join()
+
+    return out
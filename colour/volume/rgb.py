@@ -163,6 +163,11 @@ def RGB_colourspace_limits(colourspace,
     ndarray
         *RGB* colourspace volume limits.
 
+    Notes
+    -----
+    -   The limits are memoised by the colourspace for given *illuminant*,
+        a copy of them is returned.
+
     Examples
     --------
     >>> from colour import sRGB_COLOURSPACE as sRGB
@@ -172,19 +177,28 @@ def RGB_colourspace_limits(colourspace,
            [-114.7846271...,   96.7135199...]])
     """
 
-    Lab = []
-    for combination in list(itertools.product([0, 1], repeat=3)):
-        Lab.append(XYZ_to_Lab(RGB_to_XYZ(combination,
-                                         colourspace.whitepoint,
-                                         illuminant,
-                                         colourspace.RGB_to_XYZ_matrix)))
-    Lab = np.array(Lab)
+    def compute_limits(colourspace):
+        """
+        Computes given *RGB* colourspace volume limits.
+        """
+
+        Lab = []
+        for combination in list(itertools.product([0, 1], repeat=3)):
+            Lab.append(XYZ_to_Lab(RGB_to_XYZ(combination,
+                                             colourspace.whitepoint,
+                                             illuminant,
+                                             colourspace.RGB_to_XYZ_matrix)))
+        Lab = np.array(Lab)
+
+        limits = []
+        for i in np.arange(3):
+            limits.append((np.min(Lab[..., i]), np.max(Lab[..., i])))
 
-    limits = []
-    for i in np.arange(3):
-        limits.append((np.min(Lab[..., i]), np.max(Lab[..., i])))
+        return np.array(limits)
 
-    return np.array(limits)
+    return colourspace.cached(
+        ('RGB_colourspace_limits', tuple(np.ravel(illuminant).tolist())),
+        compute_limits)
 
 
 def RGB_colourspace_volume_MonteCarlo(
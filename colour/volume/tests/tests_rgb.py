@@ -83,6 +83,14 @@ class TestRGB_colourspaceLimits(unittest.TestCase):
                       [-309.6704667, 184.8212395]]),
             decimal=7)
 
+        limits = RGB_colourspace_limits(REC_709_COLOURSPACE)
+        self.assertIsNot(RGB_colourspace_limits(REC_709_COLOURSPACE), limits)
+        limits -= 1
+        np.testing.assert_almost_equal(
+            RGB_colourspace_limits(REC_709_COLOURSPACE),
+            limits + 1,
+            decimal=7)
+
 
 class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
     """
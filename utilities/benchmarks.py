@@ -0,0 +1,635 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks Utility
+==================
+
+Measures the throughput of various *Colour* definitions on image sized
+inputs.
+
+Usage
+-----
+>>> python utilities/benchmarks.py [suite [suite ...]]  # doctest: +SKIP
+"""
+
+from __future__ import division, unicode_literals
+
+import multiprocessing
+import sys
+import timeit
+import warnings
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+from collections import OrderedDict
+
+import numpy as np
+
+import colour
+from colour.models.rgb.deprecated import (
+    RGB_to_HSV,
+    HSV_to_RGB,
+    RGB_to_HSL,
+    HSL_to_RGB,
+    RGB_to_CMY,
+    CMY_to_RGB,
+    CMY_to_CMYK,
+    CMYK_to_CMY)
+from colour.utilities import (
+    ignore_numpy_errors,
+    is_numba_installed,
+    message_box,
+    set_computation_backend,
+    tiled_apply)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013 - 2015 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['IMAGE_SHAPE',
+           'UHD_IMAGE_SHAPE',
+           'random_image',
+           'megapixels_throughput',
+           'peak_memory',
+           'print_throughput',
+           'benchmark_models',
+           'benchmark_deprecated',
+           'benchmark_tiling',
+           'benchmark_ciecam02',
+           'benchmark_hunt',
+           'benchmark_nearest',
+           'benchmark_delta_E_CIE2000',
+           'benchmark_adaptation',
+           'benchmark_smits1999',
+           'BENCHMARKS',
+           'run_benchmarks']
+
+IMAGE_SHAPE = (1080, 1920, 3)
+"""
+Default benchmark image shape.
+
+IMAGE_SHAPE : tuple
+"""
+
+UHD_IMAGE_SHAPE = (2160, 3840, 3)
+"""
+*4K UHD* benchmark image shape.
+
+UHD_IMAGE_SHAPE : tuple
+"""
+
+
+def random_image(shape=IMAGE_SHAPE, seed=4):
+    """
+    Returns a reproducible random image in domain [0, 1].
+
+    Parameters
+    ----------
+    shape : tuple, optional
+        Image shape.
+    seed : int, optional
+        Random generator seed.
+
+    Returns
+    -------
+    ndarray
+        Random image.
+    """
+
+    return np.random.RandomState(seed).random_sample(shape)
+
+
+@ignore_numpy_errors
+def megapixels_throughput(function, image, repeat=3):
+    """
+    Returns the throughput of given function on given image in megapixels
+    per second, the best of given repeat count is kept.
+
+    Parameters
+    ----------
+    function : object
+        Function processing the image, called with the image as single
+        argument.
+    image : ndarray
+        Image to process.
+    repeat : int, optional
+        Repeat count.
+
+    Returns
+    -------
+    numeric
+        Throughput in megapixels per second.
+    """
+
+    # Warming up, e.g. *Numba* kernels compilation.
+    function(image[:1, :1])
+
+    timer = timeit.Timer(lambda: function(image))
+    duration = min(timer.repeat(repeat=repeat, number=1))
+
+    return image[..., 0].size / 1e6 / duration
+
+
+@ignore_numpy_errors
+def peak_memory(function, image):
+    """
+    Returns the peak memory allocated by given function on given image in
+    mebibytes.
+
+    Parameters
+    ----------
+    function : object
+        Function processing the image, called with the image as single
+        argument.
+    image : ndarray
+        Image to process.
+
+    Returns
+    -------
+    numeric
+        Peak memory in mebibytes, *nan* if :mod:`tracemalloc` module is not
+        available.
+    """
+
+    if tracemalloc is None:
+        return np.nan
+
+    tracemalloc.start()
+    try:
+        function(image)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak / 2 ** 20
+
+
+def print_throughput(name, throughputs, memories=None):
+    """
+    Prints given named throughputs.
+
+    Parameters
+    ----------
+    name : unicode
+        Benchmarked definition name.
+    throughputs : dict
+        Throughputs in megapixels per second keyed by variant, the first
+        variant is used as reference for the speedups.
+    memories : dict, optional
+        Peak memories in mebibytes keyed by variant.
+    """
+
+    reference = None
+    for variant, throughput in throughputs.items():
+        reference = throughput if reference is None else reference
+        line = '{0:<32}{1:<16}{2:>10.2f} Mpx/s{3:>10.2f}x'.format(
+            name, variant, throughput, throughput / reference)
+        if memories is not None:
+            line += '{0:>12.1f} MiB'.format(memories[variant])
+        print(line)
+
+
+def benchmark_models(image=None):
+    """
+    Benchmarks the colour models transformations with the *NumPy* and
+    *Numba* computation backends.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image() if image is None else image
+
+    message_box('Colour Models - Computation Backends')
+
+    definitions = (colour.XYZ_to_Lab,
+                   colour.Lab_to_XYZ,
+                   colour.XYZ_to_Luv,
+                   colour.Luv_to_XYZ,
+                   colour.XYZ_to_IPT,
+                   colour.IPT_to_XYZ,
+                   colour.XYZ_to_Hunter_Lab,
+                   colour.Hunter_Lab_to_XYZ,
+                   RGB_to_HSV,
+                   HSV_to_RGB,
+                   RGB_to_HSL,
+                   HSL_to_RGB)
+
+    backends = ['NumPy']
+    if is_numba_installed():
+        backends.append('Numba')
+
+    try:
+        for definition in definitions:
+            throughputs = OrderedDict()
+            for backend in backends:
+                set_computation_backend(backend)
+                throughputs[backend] = megapixels_throughput(definition, image)
+            print_throughput(definition.__name__, throughputs)
+    finally:
+        set_computation_backend('NumPy')
+
+
+def benchmark_deprecated(image=None):
+    """
+    Benchmarks the deprecated colour models transformations on a *4K UHD*
+    image.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image(UHD_IMAGE_SHAPE) if image is None else image
+
+    message_box('Deprecated Colour Models - 4K UHD')
+
+    definitions = (RGB_to_HSV,
+                   HSV_to_RGB,
+                   RGB_to_HSL,
+                   HSL_to_RGB,
+                   RGB_to_CMY,
+                   CMY_to_RGB,
+                   CMY_to_CMYK)
+
+    for definition in definitions:
+        print_throughput(
+            definition.__name__,
+            {'NumPy': megapixels_throughput(definition, image)})
+
+    CMYK = CMY_to_CMYK(image)
+    print_throughput(
+        CMYK_to_CMY.__name__,
+        {'NumPy': megapixels_throughput(CMYK_to_CMY, CMYK)})
+
+
+def benchmark_tiling(image=None):
+    """
+    Benchmarks various colour transformations applied at once and with
+    :func:`colour.utilities.tiled_apply` definition.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image(UHD_IMAGE_SHAPE) if image is None else image
+
+    message_box('Tiled Execution - 4K UHD')
+
+    XYZ_w = np.array([95.05, 100.00, 108.88])
+    sRGB = colour.sRGB_COLOURSPACE
+    definitions = (
+        ('XYZ_to_RGB',
+         lambda x: colour.XYZ_to_RGB(
+             x, sRGB.whitepoint, sRGB.whitepoint, sRGB.XYZ_to_RGB_matrix)),
+        ('XYZ_to_CIECAM02',
+         lambda x: colour.XYZ_to_CIECAM02(x * 100, XYZ_w, 318.31, 20.0)),
+        ('delta_E_CIE2000',
+         lambda x: colour.delta_E_CIE2000(x * 100, x[::-1] * 100)))
+
+    threads = multiprocessing.cpu_count()
+    for name, definition in definitions:
+        throughputs = OrderedDict()
+        throughputs['Direct'] = megapixels_throughput(definition, image)
+        throughputs['Tiled'] = megapixels_throughput(
+            lambda x: tiled_apply(definition, x), image)
+        throughputs['Tiled {0} Threads'.format(threads)] = (
+            megapixels_throughput(
+                lambda x: tiled_apply(definition, x, threads=threads),
+                image))
+        print_throughput(name, throughputs)
+
+
+def benchmark_ciecam02(image=None):
+    """
+    Benchmarks the *CIECAM02* colour appearance model reference
+    implementation against :class:`colour.appearance.CIECAM02_Model` class
+    fused image mode, reporting throughput and peak memory.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image(UHD_IMAGE_SHAPE) if image is None else image
+    XYZ = image * 50 + 5
+
+    message_box('CIECAM02 Colour Appearance Model - Fused Image Mode')
+
+    XYZ_w = np.array([95.05, 100.00, 108.88])
+    model = colour.CIECAM02_Model(XYZ_w, 318.31, 20.0)
+
+    definitions = OrderedDict((
+        ('Reference',
+         lambda x: colour.XYZ_to_CIECAM02(x, XYZ_w, 318.31, 20.0)),
+        ('Fused', model.forward_image),
+        ('Fused J, h', lambda x: model.forward_image(x, ('J', 'h')))))
+
+    throughputs = OrderedDict()
+    memories = OrderedDict()
+    for variant, definition in definitions.items():
+        throughputs[variant] = megapixels_throughput(definition, XYZ)
+        memories[variant] = peak_memory(definition, XYZ)
+    print_throughput('XYZ_to_CIECAM02', throughputs, memories)
+
+    specification = model.forward(XYZ)
+    JCh = colour.utilities.tstack(
+        (specification.J, specification.C, specification.h))
+
+    definitions = OrderedDict((
+        ('Reference',
+         lambda x: colour.CIECAM02_to_XYZ(
+             x[..., 0], x[..., 1], x[..., 2], XYZ_w, 318.31, 20.0)),
+        ('Fused',
+         lambda x: model.reverse_image(x[..., 0], x[..., 1], x[..., 2]))))
+
+    throughputs = OrderedDict()
+    memories = OrderedDict()
+    for variant, definition in definitions.items():
+        throughputs[variant] = megapixels_throughput(definition, JCh)
+        memories[variant] = peak_memory(definition, JCh)
+    print_throughput('CIECAM02_to_XYZ', throughputs, memories)
+
+
+def benchmark_hunt(image=None):
+    """
+    Benchmarks the *Hunt* colour appearance model with scalar and per-pixel
+    viewing conditions, i.e. adapting field *luminance* and background maps,
+    reporting throughput and peak memory.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image() if image is None else image
+    XYZ = image * 50 + 5
+
+    message_box('Hunt Colour Appearance Model - Viewing Conditions')
+
+    XYZ_w = np.array([95.05, 100.00, 108.88])
+    XYZ_b = XYZ_w * (0.8 + 0.2 * image[..., 0:1])
+    L_A = 10 + 300 * image[..., 1]
+    CCT_w = 4000 + 3000 * image[..., 2]
+    surround = colour.HUNT_VIEWING_CONDITIONS['Normal Scenes']
+
+    definitions = OrderedDict((
+        ('Scalar',
+         lambda x: colour.XYZ_to_Hunt(
+             x, XYZ_w, XYZ_w, 318.31, surround, CCT_w=6504.0)),
+        ('Per-Pixel',
+         lambda x: colour.XYZ_to_Hunt(
+             x, XYZ_w, XYZ_b, L_A, surround, CCT_w=CCT_w))))
+
+    throughputs = OrderedDict()
+    memories = OrderedDict()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for variant, definition in definitions.items():
+            throughputs[variant] = megapixels_throughput(definition, XYZ)
+            memories[variant] = peak_memory(definition, XYZ)
+    print_throughput('XYZ_to_Hunt', throughputs, memories)
+
+
+def benchmark_nearest(image=None):
+    """
+    Benchmarks the nearest library colours search of samples among a library
+    of 10000 colours, exhaustively and with :class:`colour.Delta_E_Index`
+    class, reporting throughput in mega-samples per second.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Samples image to process.
+    """
+
+    image = random_image((256, 256, 3)) if image is None else image
+    Lab = image * np.array([100, 160, 160]) - np.array([0, 80, 80])
+    library = (random_image((10000, 3), seed=8) *
+               np.array([100, 160, 160]) - np.array([0, 80, 80]))
+
+    message_box('Nearest Colours - 10000 Colours Library')
+
+    index = colour.Delta_E_Index(library)
+    threads = multiprocessing.cpu_count()
+
+    throughputs = OrderedDict()
+    throughputs['Exhaustive'] = megapixels_throughput(
+        lambda x: colour.delta_E_nearest(x, library, k=3),
+        Lab[:16],
+        repeat=1)
+    throughputs['Index'] = megapixels_throughput(
+        lambda x: index.query(x, k=3), Lab)
+    throughputs['Index {0} Threads'.format(threads)] = megapixels_throughput(
+        lambda x: index.query(x, k=3, threads=threads), Lab)
+    print_throughput('delta_E_nearest', throughputs)
+
+
+def benchmark_delta_E_CIE2000(image=None):
+    """
+    Benchmarks :func:`colour.delta_E_CIE2000` definition in double and single
+    precision, reporting throughput and peak memory.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image() if image is None else image
+    Lab_1 = image * np.array([100, 256, 256]) - np.array([0, 128, 128])
+    Lab_2 = Lab_1[::-1].copy()
+
+    message_box('CIE 2000 Colour Difference')
+
+    definitions = OrderedDict((
+        ('float64', lambda x: colour.delta_E_CIE2000(x, Lab_2)),
+        ('float32',
+         lambda x: colour.delta_E_CIE2000(x, Lab_2, dtype=np.float32))))
+
+    throughputs = OrderedDict()
+    memories = OrderedDict()
+    for variant, definition in definitions.items():
+        throughputs[variant] = megapixels_throughput(definition, Lab_1)
+        memories[variant] = peak_memory(definition, Lab_1)
+    print_throughput('delta_E_CIE2000', throughputs, memories)
+
+
+def benchmark_adaptation(image=None):
+    """
+    Benchmarks the *CMCCAT2000*, *CIE 1994* and *Fairchild (1990)* chromatic
+    adaptation models definitions against their adapter objects, reporting
+    throughput.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image() if image is None else image
+    XYZ = image * 50 + 5
+
+    message_box('Chromatic Adaptation - Definitions and Adapters')
+
+    XYZ_w = np.array([111.15, 100.00, 35.20])
+    XYZ_wr = np.array([94.81, 100.00, 107.30])
+    xy_o1 = np.array([0.4476, 0.4074])
+    xy_o2 = np.array([0.3127, 0.3290])
+
+    cmccat2000 = colour.CMCCAT2000_Adapter(XYZ_w, XYZ_wr, 200, 200)
+    cie1994 = colour.CIE1994_Adapter(xy_o1, xy_o2, 20, 1000, 1000)
+    fairchild1990 = colour.Fairchild1990_Adapter(XYZ_w, XYZ_wr, 200)
+
+    models = OrderedDict((
+        ('CMCCAT2000', OrderedDict((
+            ('Definition',
+             lambda x: colour.chromatic_adaptation_CMCCAT2000(
+                 x, XYZ_w, XYZ_wr, 200, 200)),
+            ('Adapter', cmccat2000.forward)))),
+        ('CIE 1994', OrderedDict((
+            ('Definition',
+             lambda x: colour.chromatic_adaptation_CIE1994(
+                 x, xy_o1, xy_o2, 20, 1000, 1000)),
+            ('Adapter', cie1994.forward)))),
+        ('Fairchild 1990', OrderedDict((
+            ('Definition',
+             lambda x: colour.chromatic_adaptation_Fairchild1990(
+                 x, XYZ_w, XYZ_wr, 200)),
+            ('Adapter', fairchild1990.forward))))))
+
+    for model, definitions in models.items():
+        throughputs = OrderedDict()
+        for variant, definition in definitions.items():
+            throughputs[variant] = megapixels_throughput(definition, XYZ)
+        print_throughput(model, throughputs)
+
+
+def benchmark_smits1999(image=None):
+    """
+    Benchmarks :func:`colour.RGB_to_spectral_Smits1999` definition against
+    :func:`colour.RGB_to_spectral_image_Smits1999` definition, reporting
+    throughput.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process, the per-pixel definition only processes its first
+        row.
+    """
+
+    image = random_image() if image is None else image
+
+    message_box('Smits (1999) - Reflectance Recovery')
+
+    def per_pixel(RGB):
+        """
+        Recovers the spectral power distributions of given *RGB* colourspace
+        array pixel by pixel.
+        """
+
+        return [colour.RGB_to_spectral_Smits1999(RGB_p)
+                for RGB_p in np.reshape(RGB, (-1, 3))]
+
+    throughputs = OrderedDict((
+        ('Per-Pixel', megapixels_throughput(per_pixel, image[:1], 1)),
+        ('Image',
+         megapixels_throughput(colour.RGB_to_spectral_image_Smits1999,
+                               image)),
+        ('Image - Threads',
+         megapixels_throughput(
+             lambda x: colour.RGB_to_spectral_image_Smits1999(
+                 x, threads=multiprocessing.cpu_count()),
+             image))))
+    print_throughput('RGB_to_spectral', throughputs)
+
+
+def benchmark_fitting(image=None):
+    """
+    Benchmarks :func:`colour.characterisation.apply_colour_fitting_matrix`
+    definition against the full image expansion and fitting, reporting
+    throughput and peak memory.
+
+    Parameters
+    ----------
+    image : ndarray, optional
+        Image to process.
+    """
+
+    image = random_image() if image is None else image
+
+    message_box('Colour Fitting - Root-Polynomial Degree 3')
+
+    M = np.random.RandomState(4).random_sample((3, 13))
+
+    def full_image(RGB):
+        """
+        Fits given *RGB* colourspace array expanded at once.
+        """
+
+        return np.dot(colour.characterisation.polynomial_expansion(
+            RGB, 'Root-Polynomial', 3), np.transpose(M))
+
+    variants = OrderedDict((
+        ('Full Image', full_image),
+        ('Tiled',
+         lambda x: colour.characterisation.apply_colour_fitting_matrix(
+             x, M, 'Root-Polynomial', 3)),
+        ('Tiled - Threads',
+         lambda x: colour.characterisation.apply_colour_fitting_matrix(
+             x, M, 'Root-Polynomial', 3,
+             threads=multiprocessing.cpu_count()))))
+
+    print_throughput(
+        'apply_colour_fitting_matrix',
+        OrderedDict((variant, megapixels_throughput(function, image))
+                    for variant, function in variants.items()),
+        OrderedDict((variant, peak_memory(function, image))
+                    for variant, function in variants.items()))
+
+
+BENCHMARKS = OrderedDict((('models', benchmark_models),
+                          ('deprecated', benchmark_deprecated),
+                          ('tiling', benchmark_tiling),
+                          ('ciecam02', benchmark_ciecam02),
+                          ('hunt', benchmark_hunt),
+                          ('nearest', benchmark_nearest),
+                          ('delta_E_CIE2000', benchmark_delta_E_CIE2000),
+                          ('adaptation', benchmark_adaptation),
+                          ('smits1999', benchmark_smits1999),
+                          ('fitting', benchmark_fitting)))
+"""
+Benchmarks suites.
+
+BENCHMARKS : OrderedDict
+"""
+
+
+def run_benchmarks(suites=None):
+    """
+    Runs given benchmarks suites.
+
+    Parameters
+    ----------
+    suites : array_like, optional
+        Benchmarks suites to run, all the suites are run if not given.
+    """
+
+    for suite in (suites or BENCHMARKS.keys()):
+        BENCHMARKS[suite]()
+
+
+if __name__ == '__main__':
+    run_benchmarks(sys.argv[1:])